@@ -59,6 +59,23 @@ class Apply:
         self.roll.apply(function, raw=raw)
 
 
+class AggregateList:
+    params = (
+        [("rolling", {"window": 10}), ("rolling", {"window": 1000}), ("expanding", {})],
+        [["sum", "mean"], ["mean", "std"], ["count", "sum", "mean", "std", "sem"]],
+    )
+    param_names = ["window_kwargs", "funcs"]
+
+    def setup(self, window_kwargs, funcs):
+        N = 10**5
+        window, kwargs = window_kwargs
+        ser = pd.Series(100 * np.random.random(N))
+        self.window = getattr(ser, window)(**kwargs)
+
+    def time_agg(self, window_kwargs, funcs):
+        self.window.agg(funcs)
+
+
 class NumbaEngineMethods:
     params = (
         ["DataFrame", "Series"],
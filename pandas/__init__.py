@@ -113,7 +113,10 @@ from pandas.core.dtypes.dtypes import SparseDtype
 from pandas.tseries.api import infer_freq
 from pandas.tseries import offsets
 
-from pandas.core.computation.api import eval
+from pandas.core.computation.api import (
+    compile_expr,
+    eval,
+)
 
 from pandas.core.reshape.api import (
     concat,
@@ -275,6 +278,7 @@ __all__ = [
     "arrays",
     "bdate_range",
     "col",
+    "compile_expr",
     "concat",
     "crosstab",
     "cut",
@@ -93,6 +93,12 @@ def group_var(
     name: str = ...,
     skipna: bool = ...,
 ) -> None: ...
+def group_moments(
+    out: np.ndarray,  # float64_t[:, ::1]
+    nobs: np.ndarray,  # int64_t[::1]
+    values: np.ndarray,  # const float64_t[:]
+    labels: np.ndarray,  # const intp_t[::1]
+) -> None: ...
 def group_skew(
     out: np.ndarray,  # float64_t[:, ::1]
     counts: np.ndarray,  # int64_t[::1]
@@ -1006,6 +1006,86 @@ def group_var(
                         out[i, j] /= (ct - ddof)
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_moments(
+    float64_t[:, ::1] out,
+    int64_t[::1] nobs,
+    const float64_t[:] values,
+    const intp_t[::1] labels,
+) -> None:
+    """
+    Compute the sum, mean and sum of squared deviations of every group in
+    a single pass, skipping NaN values.
+
+    The sum and mean use Kahan summation like group_sum and group_mean, and
+    the squared deviations Welford's algorithm like group_var, so that the
+    results match these functions.
+
+    Parameters
+    ----------
+    out : np.ndarray[float64_t, ndim=2]
+        Array of shape (3, ngroups) to store the sums, the means and the sums
+        of squared deviations from the mean in.
+    nobs : np.ndarray[int64]
+        Input as a zeroed array, populated by the number of non-NaN values of
+        every group.
+    values : np.ndarray[float64_t]
+        Values to aggregate.
+    labels : np.ndarray[np.intp]
+        Labels to group by.
+    """
+    cdef:
+        Py_ssize_t i, lab, N = len(values), ngroups = len(nobs)
+        float64_t val, y, t, oldmean
+        float64_t[::1] sum_comp, mean_sum, mean_comp, welford_mean
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    sum_comp = np.zeros(ngroups, dtype=np.float64)
+    mean_sum = np.zeros(ngroups, dtype=np.float64)
+    mean_comp = np.zeros(ngroups, dtype=np.float64)
+    welford_mean = np.zeros(ngroups, dtype=np.float64)
+    out[:, :] = 0.0
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            val = values[i]
+            if lab < 0 or val != val:
+                continue
+            nobs[lab] += 1
+
+            # group_sum
+            y = val - sum_comp[lab]
+            t = out[0, lab] + y
+            sum_comp[lab] = t - out[0, lab] - y
+            if not isfinite(sum_comp[lab]):
+                sum_comp[lab] = 0
+            out[0, lab] = t
+
+            # group_mean
+            y = val - mean_comp[lab]
+            t = mean_sum[lab] + y
+            mean_comp[lab] = t - mean_sum[lab] - y
+            if mean_comp[lab] != mean_comp[lab]:
+                mean_comp[lab] = 0.
+            mean_sum[lab] = t
+
+            # group_var
+            oldmean = welford_mean[lab]
+            welford_mean[lab] += (val - oldmean) / nobs[lab]
+            out[2, lab] += (val - welford_mean[lab]) * (val - oldmean)
+
+        for i in range(ngroups):
+            if nobs[i] == 0:
+                out[1, i] = NAN
+            else:
+                out[1, i] = mean_sum[i] / nobs[i]
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 @cython.cdivision(True)
@@ -13,6 +13,11 @@ def unique_label_indices(
     labels: np.ndarray,  # const int64_t[:]
 ) -> np.ndarray: ...
 
+def factorize_rows(
+    codes: np.ndarray,  # const int64_t[:, ::1]
+    xnull: bool,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
+
 class Factorizer:
     count: int
     uniques: Any
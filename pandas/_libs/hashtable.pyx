@@ -69,6 +69,130 @@ else:
     raise ValueError(np.dtype(np.intp))
 
 
+cdef inline uint64_t _hash_row(
+    const int64_t[:, ::1] codes, Py_ssize_t i, Py_ssize_t nkeys
+) noexcept nogil:
+    cdef:
+        Py_ssize_t j
+        uint64_t h = 0
+
+    for j in range(nkeys):
+        h = (h + <uint64_t>codes[j, i]) * <uint64_t>0x9E3779B97F4A7C15
+        h ^= h >> 32
+    # splitmix64 finalizer
+    h ^= h >> 30
+    h *= <uint64_t>0xBF58476D1CE4E5B9
+    h ^= h >> 27
+    h *= <uint64_t>0x94D049BB133111EB
+    h ^= h >> 31
+    return h
+
+
+cdef inline bint _rows_equal(
+    const int64_t[:, ::1] codes, Py_ssize_t a, Py_ssize_t b, Py_ssize_t nkeys
+) noexcept nogil:
+    cdef:
+        Py_ssize_t j
+
+    for j in range(nkeys):
+        if codes[j, a] != codes[j, b]:
+            return False
+    return True
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def factorize_rows(const int64_t[:, ::1] codes, bint xnull):
+    """
+    Label the distinct rows of several columns of codes in a single pass.
+
+    The rows are hashed as tuples of codes, so unlike combining the codes
+    into a single int64 key the number of possible combinations can't
+    overflow.
+
+    Parameters
+    ----------
+    codes : ndarray[int64_t, ndim=2]
+        One row of codes per key, each of the length of the data.
+    xnull : bool
+        If True, positions where any of the codes is -1 are labelled -1.
+
+    Returns
+    -------
+    labels : ndarray[intp_t]
+        Labels in the order of first appearance.
+    first_rows : ndarray[intp_t]
+        The position of the first occurrence of every label.
+    """
+    cdef:
+        Py_ssize_t i, j, g, slot, nkeys = codes.shape[0], n = codes.shape[1]
+        Py_ssize_t ngroups = 0, capacity = 1024
+        uint64_t h
+        bint missing
+        intp_t *table
+        intp_t *new_table
+        ndarray[intp_t] labels = np.empty(n, dtype=np.intp)
+        ndarray[intp_t] first_rows = np.empty(n, dtype=np.intp)
+        ndarray[uint64_t] hashes = np.empty(n, dtype=np.uint64)
+
+    while capacity < 2 * min(n, SIZE_HINT_LIMIT):
+        capacity *= 2
+    table = <intp_t *>malloc(capacity * sizeof(intp_t))
+    if table is NULL:
+        raise MemoryError()
+    try:
+        with nogil:
+            for slot in range(capacity):
+                table[slot] = -1
+            for i in range(n):
+                if xnull:
+                    missing = False
+                    for j in range(nkeys):
+                        if codes[j, i] == -1:
+                            missing = True
+                            break
+                    if missing:
+                        labels[i] = -1
+                        continue
+
+                h = _hash_row(codes, i, nkeys)
+                slot = h & (capacity - 1)
+                while True:
+                    g = table[slot]
+                    if g == -1:
+                        table[slot] = ngroups
+                        first_rows[ngroups] = i
+                        hashes[ngroups] = h
+                        labels[i] = ngroups
+                        ngroups += 1
+                        break
+                    if hashes[g] == h and _rows_equal(codes, first_rows[g], i, nkeys):
+                        labels[i] = g
+                        break
+                    slot = (slot + 1) & (capacity - 1)
+
+                if 2 * ngroups > capacity:
+                    # keep the table at most half full
+                    new_table = <intp_t *>malloc(2 * capacity * sizeof(intp_t))
+                    if new_table is NULL:
+                        with gil:
+                            raise MemoryError()
+                    free(table)
+                    table = new_table
+                    capacity *= 2
+                    for slot in range(capacity):
+                        table[slot] = -1
+                    for g in range(ngroups):
+                        slot = hashes[g] & (capacity - 1)
+                        while table[slot] != -1:
+                            slot = (slot + 1) & (capacity - 1)
+                        table[slot] = g
+    finally:
+        free(table)
+
+    return labels, first_rows[:ngroups].copy()
+
+
 cdef class Factorizer:
     cdef readonly:
         Py_ssize_t count
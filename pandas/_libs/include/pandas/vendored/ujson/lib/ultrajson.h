@@ -323,4 +323,14 @@ typedef struct __JSONObjectDecoder {
 
 EXPORTFUNCTION JSOBJ JSON_DecodeObject(JSONObjectDecoder *dec,
                                        const char *buffer, size_t cbBuffer);
+
+/*
+Decode a buffer of JSON values separated by line breaks, as if they were the
+items of an array: the values are passed to dec.arrayAddItem with the array
+returned by dec.newArray, and dec.endArray is called once all values are
+decoded. Unlike JSON_DecodeObject, this doesn't switch LC_NUMERIC to "C" for
+dec.preciseFloat, which is left to the caller.
+*/
+EXPORTFUNCTION JSOBJ JSON_DecodeLines(JSONObjectDecoder *dec,
+                                      const char *buffer, size_t cbBuffer);
 EXPORTFUNCTION void encode(JSOBJ, JSONObjectEncoder *, const char *, size_t);
@@ -3,6 +3,8 @@ from typing import (
     Any,
 )
 
+import numpy as np
+
 def ujson_dumps(
     obj: Any,
     ensure_ascii: bool = ...,
@@ -21,3 +23,20 @@ def ujson_loads(
     dtype: None = ...,
     labelled: bool = ...,
 ) -> Any: ...
+def ujson_loads_lines(
+    obj: str | bytes,
+    precise_float: bool = ...,
+) -> (
+    tuple[
+        int,
+        dict[
+            str,
+            tuple[
+                np.ndarray,  # ndarray[uint8]
+                np.ndarray,  # ndarray[int64]
+                np.ndarray | None,  # ndarray[object]
+            ],
+        ],
+    ]
+    | None
+): ...
@@ -158,6 +158,9 @@ def tuples_to_object_array(
 # TODO: can we be more specific about rows?
 def to_object_array(rows: object, min_width: int = ...) -> ndarray_obj_2d: ...
 def dicts_to_array(dicts: list, columns: list) -> ndarray_obj_2d: ...
+def nested_dicts_to_array(
+    dicts: list, names: list[str], sep: str, max_level: int = ...
+) -> ndarray_obj_2d: ...
 def maybe_booleans_to_slice(
     mask: npt.NDArray[np.uint8],
 ) -> slice | npt.NDArray[np.uint8]: ...
@@ -171,6 +174,27 @@ def is_all_arraylike(obj: list) -> bool: ...
 # Functions which in reality take memoryviews
 
 def memory_usage_of_objects(arr: np.ndarray) -> int: ...  # object[:]  # np.int64
+
+class StringMethod:
+    def __call__(self, val: Any) -> Any: ...
+
+class StrLen(StringMethod): ...
+
+class StrContains(StringMethod):
+    def __init__(self, sub: Any) -> None: ...
+
+class StrFind(StringMethod):
+    def __init__(
+        self,
+        sub: Any,
+        start: int | None = ...,
+        end: int | None = ...,
+        reverse: bool = ...,
+    ) -> None: ...
+
+class StrStartsWith(StringMethod):
+    def __init__(self, pat: Any, suffix: bool = ...) -> None: ...
+
 @overload
 def map_infer_mask(
     arr: np.ndarray,
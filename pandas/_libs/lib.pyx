@@ -27,12 +27,20 @@ from cpython.object cimport (
     PyObject,
     PyObject_RichCompareBool,
 )
+from cpython.pyport cimport PY_SSIZE_T_MAX
 from cpython.ref cimport Py_INCREF
 from cpython.sequence cimport PySequence_Check
 from cpython.tuple cimport (
     PyTuple_New,
     PyTuple_SET_ITEM,
 )
+from cpython.unicode cimport (
+    PyUnicode_Check,
+    PyUnicode_Contains,
+    PyUnicode_Find,
+    PyUnicode_GET_LENGTH,
+    PyUnicode_Tailmatch,
+)
 from cython cimport (
     Py_ssize_t,
     floating,
@@ -392,6 +400,83 @@ def dicts_to_array(dicts: list, columns: list):
     return result
 
 
+cdef object _missing_key = object()
+
+
+cdef object _get_flat_key(dict d, str key):
+    # keys are flattened as strings, see pandas.io.json._normalize.nested_to_record
+    val = d.get(key, _missing_key)
+    if val is _missing_key:
+        for k, v in d.items():
+            if not isinstance(k, str) and str(k) == key:
+                return v
+    return val
+
+
+cdef object _lookup_flat_name(dict d, str name, str sep, int level, int max_level):
+    cdef:
+        Py_ssize_t pos
+
+    if max_level < 0 or level < max_level:
+        # any sep may join the keys of nested dicts, try the outermost first
+        pos = name.find(sep)
+        while pos != -1:
+            val = _get_flat_key(d, name[:pos])
+            if isinstance(val, dict):
+                val = _lookup_flat_name(
+                    val, name[pos + len(sep):], sep, level + 1, max_level
+                )
+                if val is not _missing_key:
+                    return val
+            pos = name.find(sep, pos + 1)
+
+    val = _get_flat_key(d, name)
+    if isinstance(val, dict) and (max_level < 0 or level < max_level):
+        # nested dicts are flattened into other columns
+        return _missing_key
+    return val
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def nested_dicts_to_array(list dicts, list names, str sep, int max_level=-1):
+    """
+    Look up the columns of flattened nested dicts.
+
+    Parameters
+    ----------
+    dicts : list of dict
+    names : list of str
+        The column names, i.e. the keys of the nested dicts joined by ``sep``
+        as in ``nested_to_record``.
+    sep : str
+    max_level : int, default -1
+        The depth up to which dicts are nested dicts rather than values, -1
+        for no limit.
+
+    Returns
+    -------
+    ndarray[object, ndim=2]
+        NaN where a column is missing.
+    """
+    cdef:
+        Py_ssize_t i, j, k, n
+        ndarray[object, ndim=2] result
+        object val, onan = np.nan
+
+    k = len(names)
+    n = len(dicts)
+
+    result = np.empty((n, k), dtype="O")
+
+    for i in range(n):
+        for j in range(k):
+            val = _lookup_flat_name(dicts[i], names[j], sep, 0, max_level)
+            result[i, j] = onan if val is _missing_key else val
+
+    return result
+
+
 def fast_zip(list ndarrays) -> ndarray[object]:
     """
     For zipping multiple ndarrays into an ndarray of tuples.
@@ -2970,6 +3055,95 @@ NoDefault = Literal[_NoDefault.no_default]
 NoDefault.__module__ = "pandas.api.typing"
 
 
+cdef class StringMethod:
+    """
+    A str method compiled for map_infer_mask.
+
+    map_infer_mask applies the method to str values through the C API,
+    without calling back into Python for every element. Other values are
+    passed to ``__call__``, which behaves like the Python method.
+    """
+
+    cdef object apply(self, object val):
+        raise NotImplementedError
+
+    def __call__(self, val):
+        raise NotImplementedError
+
+
+cdef class StrLen(StringMethod):
+    cdef object apply(self, object val):
+        return PyUnicode_GET_LENGTH(val)
+
+    def __call__(self, val):
+        return len(val)
+
+
+cdef class StrContains(StringMethod):
+    # CPython's substring search, which is a mix of Boyer-Moore-Horspool and
+    #  the Two-Way algorithm, is much faster than an escaped regex
+    cdef:
+        object sub
+
+    def __init__(self, object sub):
+        self.sub = sub
+
+    cdef object apply(self, object val):
+        return PyUnicode_Contains(val, self.sub) == 1
+
+    def __call__(self, val):
+        return self.sub in val
+
+
+cdef class StrFind(StringMethod):
+    cdef:
+        object sub
+        Py_ssize_t start, end
+        bint reverse
+
+    def __init__(self, object sub, object start=0, object end=None,
+                 bint reverse=False):
+        self.sub = sub
+        self.start = 0 if start is None else start
+        self.end = PY_SSIZE_T_MAX if end is None else end
+        self.reverse = reverse
+
+    cdef object apply(self, object val):
+        return PyUnicode_Find(
+            val, self.sub, self.start, self.end, -1 if self.reverse else 1
+        )
+
+    def __call__(self, val):
+        if self.reverse:
+            return val.rfind(self.sub, self.start, self.end)
+        return val.find(self.sub, self.start, self.end)
+
+
+cdef class StrStartsWith(StringMethod):
+    cdef:
+        object pat
+        tuple pats
+        bint suffix
+
+    def __init__(self, object pat, bint suffix=False):
+        self.pat = pat
+        self.pats = pat if isinstance(pat, tuple) else (pat,)
+        self.suffix = suffix
+
+    cdef object apply(self, object val):
+        for pat in self.pats:
+            if PyUnicode_Tailmatch(
+                val, pat, 0, PY_SSIZE_T_MAX, 1 if self.suffix else -1
+            ):
+                return True
+        return False
+
+    def __call__(self, val):
+        if self.suffix:
+            return val.endswith(self.pat)
+        return val.startswith(self.pat)
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def map_infer_mask(
@@ -2988,6 +3162,7 @@ def map_infer_mask(
     ----------
     arr : ndarray
     f : function
+        A StringMethod is applied to str values without calling into Python.
     mask : ndarray
         uint8 dtype ndarray indicating values not to apply `f` to.
     convert : bool, default True
@@ -3008,6 +3183,7 @@ def map_infer_mask(
         object val
 
         ndarray result = np.empty(n, dtype=dtype)
+        StringMethod method = f if isinstance(f, StringMethod) else None
 
         flatiter arr_it = PyArray_IterNew(arr)
         flatiter result_it = PyArray_IterNew(result)
@@ -3020,7 +3196,10 @@ def map_infer_mask(
                 val = na_value
         else:
             val = PyArray_GETITEM(arr, PyArray_ITER_DATA(arr_it))
-            val = f(val)
+            if method is not None and PyUnicode_Check(val):
+                val = method.apply(val)
+            else:
+                val = f(val)
 
             if cnp.PyArray_IsZeroDim(val):
                 # unbox 0-dim arrays, GH#690
@@ -1219,3 +1219,75 @@ JSOBJ JSON_DecodeObject(JSONObjectDecoder *dec, const char *buffer,
 
   return ret;
 }
+
+JSOBJ JSON_DecodeLines(JSONObjectDecoder *dec, const char *buffer,
+                       size_t cbBuffer) {
+  struct DecoderState ds;
+  wchar_t escBuffer[(JSON_MAX_STACK_BUFFER_SIZE / sizeof(wchar_t))];
+  JSOBJ ret;
+  JSOBJ item;
+  char *offset;
+  int newline;
+
+  ds.start = (char *)buffer;
+  ds.end = ds.start + cbBuffer;
+
+  ds.escStart = escBuffer;
+  ds.escEnd = ds.escStart + (JSON_MAX_STACK_BUFFER_SIZE / sizeof(wchar_t));
+  ds.escHeap = 0;
+  ds.prv = dec->prv;
+  ds.dec = dec;
+  ds.dec->errorStr = NULL;
+  ds.dec->errorOffset = NULL;
+  ds.objDepth = 0;
+
+  ret = dec->newArray(ds.prv, dec);
+  if (ret == NULL) {
+    return NULL;
+  }
+
+  SkipWhitespace(&ds);
+
+  while (ds.start < ds.end) {
+    item = decode_any(&ds);
+
+    if (item == NULL) {
+      dec->releaseObject(ds.prv, ret, dec);
+      ret = NULL;
+      break;
+    }
+
+    if (!dec->arrayAddItem(ds.prv, ret, item)) {
+      dec->releaseObject(ds.prv, ret, dec);
+      ret = NULL;
+      break;
+    }
+
+    // values must be separated by at least one line break
+    newline = 0;
+    for (offset = ds.start; offset < ds.end; offset++) {
+      if (*offset == '\n') {
+        newline = 1;
+      } else if (*offset != ' ' && *offset != '\t' && *offset != '\r') {
+        break;
+      }
+    }
+    ds.start = offset;
+
+    if (ds.start < ds.end && !newline) {
+      dec->releaseObject(ds.prv, ret, dec);
+      ret = SetError(&ds, -1, "Trailing data");
+      break;
+    }
+  }
+
+  if (ds.escHeap) {
+    dec->free(ds.escStart);
+  }
+
+  if (ret != NULL) {
+    ret = dec->endArray(ds.prv, ret);
+  }
+
+  return ret;
+}
@@ -41,7 +41,12 @@ https://www.opensource.apple.com/source/tcl/tcl-14/tcl/license.terms
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
+#define NO_IMPORT_ARRAY
+#define PY_ARRAY_UNIQUE_SYMBOL UJSON_NUMPY
 #include "pandas/vendored/ujson/lib/ultrajson.h"
+#include <locale.h>
+#include <numpy/arrayobject.h>
+#include <string.h>
 
 static int Object_objectAddKey(void *Py_UNUSED(prv), JSOBJ obj, JSOBJ name,
                                JSOBJ value) {
@@ -169,3 +174,556 @@ PyObject *JSONToObj(PyObject *Py_UNUSED(self), PyObject *args,
 
   return ret;
 }
+
+/*
+Decoding of newline delimited JSON objects into columns.
+
+Every key of the objects gets a column with a tag and an 8 byte value per
+row, so numbers and booleans are stored without creating Python objects and
+strings are kept in an arena until the column arrays are built. Only nested
+objects and arrays are decoded to Python objects while parsing, for which the
+GIL is acquired, so the parsing can mostly run with the GIL released.
+
+The tags must be kept in sync with pandas/io/json/_json.py.
+*/
+
+enum LinesTag {
+  LINES_MISSING = 0,
+  LINES_NULL,
+  LINES_INT,
+  LINES_UINT,
+  LINES_DOUBLE,
+  LINES_FALSE,
+  LINES_TRUE,
+  LINES_STRING,
+  LINES_OBJECT,
+};
+
+enum LinesFailure {
+  LINES_OK = 0,
+  LINES_NO_MEMORY,
+  // a line is not an object, which the caller has to decode otherwise
+  LINES_UNSUPPORTED,
+};
+
+typedef struct {
+  wchar_t *name;
+  Py_ssize_t nameLen;
+  JSUINT8 *tags;
+  // int64 or float64 bits, arena offsets or PyObject pointers by tag
+  JSINT64 *values;
+  int hasObjects;
+} LinesColumn;
+
+typedef struct {
+  LinesColumn *columns;
+  Py_ssize_t nColumns;
+  Py_ssize_t columnsCapacity;
+  Py_ssize_t nRows;
+  Py_ssize_t rowsCapacity;
+  // every string is stored as its length followed by its characters
+  char *arena;
+  size_t arenaSize;
+  size_t arenaCapacity;
+  // 1 between the lines, 2 in an object of a line and more in nested values
+  int depth;
+  int expectKey;
+  Py_ssize_t key;
+  Py_ssize_t nextKey;
+  JSUINT8 pendingTag;
+  JSINT64 pendingValue;
+  int failure;
+  int hasGil;
+  PyGILState_STATE gilState;
+} LinesDecoder;
+
+// placeholders returned to the decoder for what isn't a Python object
+static char LINES_ROWS, LINES_ROW, LINES_KEY, LINES_SCALAR;
+
+static int Lines_isPlaceholder(JSOBJ obj) {
+  return obj == &LINES_ROWS || obj == &LINES_ROW || obj == &LINES_KEY ||
+         obj == &LINES_SCALAR;
+}
+
+static JSOBJ Lines_fail(LinesDecoder *ld, int failure) {
+  if (ld->failure == LINES_OK) {
+    ld->failure = failure;
+  }
+  return NULL;
+}
+
+static void Lines_acquireGil(LinesDecoder *ld) {
+  ld->gilState = PyGILState_Ensure();
+  ld->hasGil = 1;
+}
+
+static void Lines_releaseGil(LinesDecoder *ld) {
+  if (ld->hasGil) {
+    ld->hasGil = 0;
+    PyGILState_Release(ld->gilState);
+  }
+}
+
+static void Lines_decref(JSOBJ obj) {
+  if (obj == NULL || Lines_isPlaceholder(obj)) {
+    return;
+  }
+  PyGILState_STATE state = PyGILState_Ensure();
+  Py_DECREF((PyObject *)obj);
+  PyGILState_Release(state);
+}
+
+static int Lines_growRows(LinesDecoder *ld) {
+  Py_ssize_t capacity = ld->rowsCapacity ? 2 * ld->rowsCapacity : 1024;
+  Py_ssize_t added = capacity - ld->rowsCapacity;
+
+  for (Py_ssize_t i = 0; i < ld->nColumns; i++) {
+    LinesColumn *col = &ld->columns[i];
+    JSUINT8 *tags = PyMem_RawRealloc(col->tags, capacity);
+    if (tags == NULL) {
+      return 0;
+    }
+    col->tags = tags;
+    memset(tags + ld->rowsCapacity, LINES_MISSING, added);
+
+    JSINT64 *values = PyMem_RawRealloc(col->values, capacity * sizeof(JSINT64));
+    if (values == NULL) {
+      return 0;
+    }
+    col->values = values;
+    memset(values + ld->rowsCapacity, 0, added * sizeof(JSINT64));
+  }
+  ld->rowsCapacity = capacity;
+  return 1;
+}
+
+static Py_ssize_t Lines_addColumn(LinesDecoder *ld, const wchar_t *name,
+                                  Py_ssize_t len) {
+  if (ld->nColumns == ld->columnsCapacity) {
+    Py_ssize_t capacity = ld->columnsCapacity ? 2 * ld->columnsCapacity : 16;
+    LinesColumn *columns =
+        PyMem_RawRealloc(ld->columns, capacity * sizeof(LinesColumn));
+    if (columns == NULL) {
+      return -1;
+    }
+    ld->columns = columns;
+    ld->columnsCapacity = capacity;
+  }
+
+  LinesColumn *col = &ld->columns[ld->nColumns];
+  col->name = PyMem_RawMalloc(len * sizeof(wchar_t));
+  col->nameLen = len;
+  col->tags = PyMem_RawCalloc(ld->rowsCapacity, 1);
+  col->values = PyMem_RawCalloc(ld->rowsCapacity, sizeof(JSINT64));
+  col->hasObjects = 0;
+  if (col->name == NULL || col->tags == NULL || col->values == NULL) {
+    PyMem_RawFree(col->name);
+    PyMem_RawFree(col->tags);
+    PyMem_RawFree(col->values);
+    return -1;
+  }
+  memcpy(col->name, name, len * sizeof(wchar_t));
+  return ld->nColumns++;
+}
+
+static int Lines_isColumn(const LinesColumn *col, const wchar_t *name,
+                          Py_ssize_t len) {
+  return col->nameLen == len && wmemcmp(col->name, name, len) == 0;
+}
+
+static Py_ssize_t Lines_findColumn(LinesDecoder *ld, const wchar_t *name,
+                                   Py_ssize_t len) {
+  // the keys are usually in the same order on every line
+  if (ld->nextKey < ld->nColumns &&
+      Lines_isColumn(&ld->columns[ld->nextKey], name, len)) {
+    return ld->nextKey;
+  }
+  for (Py_ssize_t i = 0; i < ld->nColumns; i++) {
+    if (Lines_isColumn(&ld->columns[i], name, len)) {
+      return i;
+    }
+  }
+  return Lines_addColumn(ld, name, len);
+}
+
+static JSOBJ Lines_setPending(LinesDecoder *ld, JSUINT8 tag, JSINT64 value) {
+  if (ld->depth != 2) {
+    return Lines_fail(ld, LINES_UNSUPPORTED);
+  }
+  ld->pendingTag = tag;
+  ld->pendingValue = value;
+  return &LINES_SCALAR;
+}
+
+static JSOBJ Lines_setPendingDouble(LinesDecoder *ld, double value) {
+  JSINT64 bits;
+  memcpy(&bits, &value, sizeof(bits));
+  return Lines_setPending(ld, LINES_DOUBLE, bits);
+}
+
+static JSOBJ Lines_newString(void *prv, wchar_t *start, wchar_t *end) {
+  LinesDecoder *ld = prv;
+  Py_ssize_t len = end - start;
+
+  if (ld->depth > 2) {
+    return Object_newString(prv, start, end);
+  } else if (ld->depth == 2 && ld->expectKey) {
+    Py_ssize_t key = Lines_findColumn(ld, start, len);
+    if (key < 0) {
+      return Lines_fail(ld, LINES_NO_MEMORY);
+    }
+    ld->key = key;
+    ld->nextKey = key + 1;
+    ld->expectKey = 0;
+    return &LINES_KEY;
+  } else if (ld->depth != 2) {
+    return Lines_fail(ld, LINES_UNSUPPORTED);
+  }
+
+  size_t align = sizeof(Py_ssize_t);
+  size_t offset = (ld->arenaSize + align - 1) / align * align;
+  size_t size = offset + sizeof(Py_ssize_t) + len * sizeof(wchar_t);
+  if (size > ld->arenaCapacity) {
+    size_t capacity = ld->arenaCapacity ? ld->arenaCapacity : 1 << 16;
+    while (capacity < size) {
+      capacity *= 2;
+    }
+    char *arena = PyMem_RawRealloc(ld->arena, capacity);
+    if (arena == NULL) {
+      return Lines_fail(ld, LINES_NO_MEMORY);
+    }
+    ld->arena = arena;
+    ld->arenaCapacity = capacity;
+  }
+  memcpy(ld->arena + offset, &len, sizeof(Py_ssize_t));
+  memcpy(ld->arena + offset + sizeof(Py_ssize_t), start, len * sizeof(wchar_t));
+  ld->arenaSize = size;
+  return Lines_setPending(ld, LINES_STRING, (JSINT64)offset);
+}
+
+static int Lines_objectAddKey(void *prv, JSOBJ obj, JSOBJ name, JSOBJ value) {
+  LinesDecoder *ld = prv;
+
+  if (obj != &LINES_ROW) {
+    if (obj == NULL) {
+      Lines_decref(name);
+      Lines_decref(value);
+      return 0;
+    }
+    return Object_objectAddKey(prv, obj, name, value);
+  }
+
+  LinesColumn *col = &ld->columns[ld->key];
+  Py_ssize_t row = ld->nRows;
+  if (col->tags[row] == LINES_OBJECT) {
+    // a repeated key replaces the earlier value, like in a dict
+    Lines_decref((JSOBJ)(intptr_t)col->values[row]);
+  }
+  if (value == &LINES_SCALAR) {
+    col->tags[row] = ld->pendingTag;
+    col->values[row] = ld->pendingValue;
+  } else {
+    col->tags[row] = LINES_OBJECT;
+    col->values[row] = (JSINT64)(intptr_t)value;
+  }
+  if (col->tags[row] >= LINES_STRING) {
+    col->hasObjects = 1;
+  }
+  ld->expectKey = 1;
+  return 1;
+}
+
+static int Lines_arrayAddItem(void *prv, JSOBJ obj, JSOBJ value) {
+  LinesDecoder *ld = prv;
+
+  if (obj == &LINES_ROWS) {
+    ld->nRows++;
+    return 1;
+  } else if (obj == NULL) {
+    Lines_decref(value);
+    return 0;
+  }
+  return Object_arrayAddItem(prv, obj, value);
+}
+
+static JSOBJ Lines_newTrue(void *prv) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newTrue(prv)
+                       : Lines_setPending(ld, LINES_TRUE, 1);
+}
+
+static JSOBJ Lines_newFalse(void *prv) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newFalse(prv)
+                       : Lines_setPending(ld, LINES_FALSE, 0);
+}
+
+static JSOBJ Lines_newNull(void *prv) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newNull(prv)
+                       : Lines_setPending(ld, LINES_NULL, 0);
+}
+
+static JSOBJ Lines_newPosInf(void *prv) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newPosInf(prv)
+                       : Lines_setPendingDouble(ld, Py_HUGE_VAL);
+}
+
+static JSOBJ Lines_newNegInf(void *prv) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newNegInf(prv)
+                       : Lines_setPendingDouble(ld, -Py_HUGE_VAL);
+}
+
+static JSOBJ Lines_newInteger(void *prv, JSINT32 value) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newInteger(prv, value)
+                       : Lines_setPending(ld, LINES_INT, value);
+}
+
+static JSOBJ Lines_newLong(void *prv, JSINT64 value) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newLong(prv, value)
+                       : Lines_setPending(ld, LINES_INT, value);
+}
+
+static JSOBJ Lines_newUnsignedLong(void *prv, JSUINT64 value) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newUnsignedLong(prv, value)
+                       : Lines_setPending(ld, LINES_UINT, (JSINT64)value);
+}
+
+static JSOBJ Lines_newDouble(void *prv, double value) {
+  LinesDecoder *ld = prv;
+  return ld->depth > 2 ? Object_newDouble(prv, value)
+                       : Lines_setPendingDouble(ld, value);
+}
+
+static JSOBJ Lines_newObject(void *prv, void *decoder) {
+  LinesDecoder *ld = prv;
+
+  if (ld->depth == 1) {
+    if (ld->nRows == ld->rowsCapacity && !Lines_growRows(ld)) {
+      return Lines_fail(ld, LINES_NO_MEMORY);
+    }
+    ld->depth = 2;
+    ld->expectKey = 1;
+    ld->nextKey = 0;
+    return &LINES_ROW;
+  } else if (ld->depth == 2) {
+    Lines_acquireGil(ld);
+  }
+  ld->depth++;
+  return Object_newObject(prv, decoder);
+}
+
+static JSOBJ Lines_newArray(void *prv, void *decoder) {
+  LinesDecoder *ld = prv;
+
+  if (ld->depth == 0) {
+    ld->depth = 1;
+    return &LINES_ROWS;
+  } else if (ld->depth == 1) {
+    return Lines_fail(ld, LINES_UNSUPPORTED);
+  } else if (ld->depth == 2) {
+    Lines_acquireGil(ld);
+  }
+  ld->depth++;
+  return Object_newArray(prv, decoder);
+}
+
+static JSOBJ Lines_endContainer(void *prv, JSOBJ obj) {
+  LinesDecoder *ld = prv;
+
+  if (obj == NULL) {
+    return NULL;
+  }
+  ld->depth--;
+  if (ld->depth == 2) {
+    // a nested value of a line is complete
+    Lines_releaseGil(ld);
+  }
+  return obj;
+}
+
+static void Lines_releaseObject(void *Py_UNUSED(prv), JSOBJ obj,
+                                void *Py_UNUSED(decoder)) {
+  Lines_decref(obj);
+}
+
+static void Lines_free(LinesDecoder *ld) {
+  Py_ssize_t nRows = Py_MIN(ld->nRows + 1, ld->rowsCapacity);
+
+  for (Py_ssize_t i = 0; i < ld->nColumns; i++) {
+    LinesColumn *col = &ld->columns[i];
+    for (Py_ssize_t row = 0; col->hasObjects && row < nRows; row++) {
+      if (col->tags[row] == LINES_OBJECT) {
+        Py_XDECREF((PyObject *)(intptr_t)col->values[row]);
+      }
+    }
+    PyMem_RawFree(col->name);
+    PyMem_RawFree(col->tags);
+    PyMem_RawFree(col->values);
+  }
+  PyMem_RawFree(ld->columns);
+  PyMem_RawFree(ld->arena);
+}
+
+static PyObject *Lines_objects(LinesDecoder *ld, LinesColumn *col) {
+  npy_intp n = ld->nRows;
+  PyObject *objects = PyArray_SimpleNew(1, &n, NPY_OBJECT);
+  if (objects == NULL) {
+    return NULL;
+  }
+
+  PyObject **data = PyArray_DATA((PyArrayObject *)objects);
+  for (npy_intp row = 0; row < n; row++) {
+    PyObject *item;
+    if (col->tags[row] == LINES_STRING) {
+      Py_ssize_t len;
+      char *start = ld->arena + col->values[row];
+      memcpy(&len, start, sizeof(Py_ssize_t));
+      item =
+          PyUnicode_FromWideChar((wchar_t *)(start + sizeof(Py_ssize_t)), len);
+      if (item == NULL) {
+        Py_DECREF(objects);
+        return NULL;
+      }
+    } else if (col->tags[row] == LINES_OBJECT) {
+      item = (PyObject *)(intptr_t)col->values[row];
+      col->values[row] = 0;
+    } else {
+      item = Py_None;
+      Py_INCREF(item);
+    }
+    data[row] = item;
+  }
+  return objects;
+}
+
+static PyObject *Lines_toColumns(LinesDecoder *ld) {
+  npy_intp n = ld->nRows;
+  PyObject *result = PyDict_New();
+  if (result == NULL) {
+    return NULL;
+  }
+
+  for (Py_ssize_t i = 0; i < ld->nColumns; i++) {
+    LinesColumn *col = &ld->columns[i];
+    PyObject *objects = NULL, *tags = NULL, *values = NULL, *item = NULL;
+    PyObject *name = NULL;
+
+    if (col->hasObjects) {
+      // the objects are taken out of the values first
+      objects = Lines_objects(ld, col);
+    } else {
+      objects = Py_None;
+      Py_INCREF(objects);
+    }
+    tags = PyArray_SimpleNew(1, &n, NPY_UINT8);
+    values = PyArray_SimpleNew(1, &n, NPY_INT64);
+    if (objects != NULL && tags != NULL && values != NULL) {
+      memcpy(PyArray_DATA((PyArrayObject *)tags), col->tags, n);
+      memcpy(PyArray_DATA((PyArrayObject *)values), col->values,
+             n * sizeof(JSINT64));
+      item = PyTuple_Pack(3, tags, values, objects);
+      name = PyUnicode_FromWideChar(col->name, col->nameLen);
+    }
+    Py_XDECREF(objects);
+    Py_XDECREF(tags);
+    Py_XDECREF(values);
+    if (item == NULL || name == NULL || PyDict_SetItem(result, name, item)) {
+      Py_XDECREF(item);
+      Py_XDECREF(name);
+      Py_DECREF(result);
+      return NULL;
+    }
+    Py_DECREF(item);
+    Py_DECREF(name);
+  }
+  return result;
+}
+
+PyObject *JSONLinesToColumns(PyObject *Py_UNUSED(self), PyObject *args,
+                             PyObject *kwargs) {
+  LinesDecoder ld = {0};
+  JSONObjectDecoder dec = {.newString = Lines_newString,
+                           .objectAddKey = Lines_objectAddKey,
+                           .arrayAddItem = Lines_arrayAddItem,
+                           .newTrue = Lines_newTrue,
+                           .newFalse = Lines_newFalse,
+                           .newNull = Lines_newNull,
+                           .newPosInf = Lines_newPosInf,
+                           .newNegInf = Lines_newNegInf,
+                           .newObject = Lines_newObject,
+                           .endObject = Lines_endContainer,
+                           .newArray = Lines_newArray,
+                           .endArray = Lines_endContainer,
+                           .newInt = Lines_newInteger,
+                           .newLong = Lines_newLong,
+                           .newUnsignedLong = Lines_newUnsignedLong,
+                           .newDouble = Lines_newDouble,
+                           .releaseObject = Lines_releaseObject,
+                           .malloc = PyMem_RawMalloc,
+                           .free = PyMem_RawFree,
+                           .realloc = PyMem_RawRealloc,
+                           .errorStr = NULL,
+                           .errorOffset = NULL,
+                           .preciseFloat = 0,
+                           .prv = &ld};
+
+  char *kwlist[] = {"obj", "precise_float", NULL};
+  char *buf;
+  Py_ssize_t len;
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "s#|b", kwlist, &buf, &len,
+                                   &dec.preciseFloat)) {
+    return NULL;
+  }
+
+  // strtod of precise floats depends on the locale, which is switched while
+  // holding the GIL so no other decoder can see it in between
+  char *saved_locale = NULL;
+  char *locale = setlocale(LC_NUMERIC, NULL);
+  if (dec.preciseFloat && locale != NULL && strcmp(locale, "C")) {
+    saved_locale = PyMem_RawMalloc(strlen(locale) + 1);
+    if (saved_locale == NULL) {
+      return PyErr_NoMemory();
+    }
+    strcpy(saved_locale, locale);
+    setlocale(LC_NUMERIC, "C");
+  }
+
+  JSOBJ ret;
+  if (saved_locale == NULL) {
+    Py_BEGIN_ALLOW_THREADS;
+    ret = JSON_DecodeLines(&dec, buf, len);
+    Lines_releaseGil(&ld);
+    Py_END_ALLOW_THREADS;
+  } else {
+    ret = JSON_DecodeLines(&dec, buf, len);
+    Lines_releaseGil(&ld);
+    setlocale(LC_NUMERIC, saved_locale);
+    PyMem_RawFree(saved_locale);
+  }
+
+  PyObject *result = NULL;
+  if (ret != NULL) {
+    PyObject *columns = Lines_toColumns(&ld);
+    if (columns != NULL) {
+      result = Py_BuildValue("(nN)", ld.nRows, columns);
+    }
+  } else if (PyErr_Occurred()) {
+    result = NULL;
+  } else if (ld.failure == LINES_UNSUPPORTED) {
+    result = Py_None;
+    Py_INCREF(result);
+  } else if (dec.errorStr) {
+    PyErr_Format(PyExc_ValueError, "%s", dec.errorStr);
+  } else {
+    PyErr_NoMemory();
+  }
+
+  Lines_free(&ld);
+  return result;
+}
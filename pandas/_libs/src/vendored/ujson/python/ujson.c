@@ -50,6 +50,7 @@ void *initObjToJSON(void);
 
 /* JSONToObj */
 PyObject *JSONToObj(PyObject *self, PyObject *args, PyObject *kwargs);
+PyObject *JSONLinesToColumns(PyObject *self, PyObject *args, PyObject *kwargs);
 
 #define ENCODER_HELP_TEXT                                                      \
   "Use ensure_ascii=false to output UTF-8. Pass in double_precision to "       \
@@ -64,6 +65,10 @@ static PyMethodDef ujsonMethods[] = {
      METH_VARARGS | METH_KEYWORDS,
      "Converts JSON as string to dict object structure. Use precise_float=True "
      "to use high precision float decoder."},
+    {"ujson_loads_lines", (PyCFunction)(void (*)(void))JSONLinesToColumns,
+     METH_VARARGS | METH_KEYWORDS,
+     "Converts newline delimited JSON objects to the number of lines and the "
+     "tagged values of every key. Returns None if a line is not an object."},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
 
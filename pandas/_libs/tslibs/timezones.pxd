@@ -3,9 +3,11 @@ from cpython.datetime cimport (
     timedelta,
     tzinfo,
 )
+from numpy cimport int64_t
 
 
 cdef tzinfo utc_stdlib
+cdef int64_t zoneinfo_horizon
 
 cpdef bint is_utc(tzinfo tz)
 cdef bint is_tzlocal(tzinfo tz)
@@ -20,4 +22,6 @@ cpdef tzinfo maybe_get_tz(object tz)
 cdef timedelta get_utcoffset(tzinfo tz, datetime obj)
 cpdef bint is_fixed_offset(tzinfo tz)
 
+cdef object tz_cache_key(tzinfo tz)
 cdef object get_dst_info(tzinfo tz)
+cdef object get_zoneinfo_dst_info(tzinfo tz)
@@ -4,6 +4,14 @@ from datetime import (
 )
 import zoneinfo
 
+try:
+    # the pure-python implementation, whose transitions are readable; this
+    #  is an implementation detail of CPython, see
+    #  _get_utc_trans_times_from_zoneinfo
+    from zoneinfo._zoneinfo import ZoneInfo as _PyZoneInfo
+except ImportError:
+    _PyZoneInfo = None
+
 from pandas.compat._optional import import_optional_dependency
 
 from cpython.datetime cimport (
@@ -177,6 +185,14 @@ def _p_tz_cache_key(tz: tzinfo):
 # Timezone data caches, key is the pytz string or dateutil file name.
 dst_cache = {}
 
+# Transition tables of zoneinfo timezones, key is the zone key.
+zoneinfo_dst_cache = {}
+
+# The transitions given by the TZ string of a zoneinfo tz file are listed up
+#  to this year, later times are converted using the tzinfo API instead.
+cdef int ZONEINFO_TRANS_YEAR = 2200
+cdef int64_t zoneinfo_horizon = np.datetime64("2200-12-01", "ns").astype(np.int64)
+
 
 cdef object tz_cache_key(tzinfo tz):
     """
@@ -256,6 +272,97 @@ cdef object _get_utc_trans_times_from_dateutil_tz(tzinfo tz):
     return new_trans
 
 
+cdef object _get_utc_trans_times_from_zoneinfo(tzinfo tz):
+    """
+    Transition times (UTC) and UTC offsets of a zoneinfo timezone, in seconds.
+
+    The C implementation of ZoneInfo does not expose its transitions, so the
+    zone is loaded again with the pure-python implementation. Transitions
+    after the last one listed in the tz file follow from its TZ string, these
+    are listed up to ZONEINFO_TRANS_YEAR.
+
+    Returns None if the zone is not given by a tz file with transitions, or
+    if the internals of the pure-python implementation are not available, in
+    which case the tzinfo API is used instead.
+    """
+    cdef:
+        int64_t lower = (NPY_NAT + 1) // 1_000_000_000 + 1
+
+    if _PyZoneInfo is None:
+        return None
+
+    try:
+        zone = _PyZoneInfo.no_cache(tz.key)
+        trans = list(zone._trans_utc)
+        offsets = [int(tti.utcoff.total_seconds()) for tti in zone._ttinfos]
+        rule = zone._tz_after
+        before = zone._tti_before
+        before = None if before is None else int(before.utcoff.total_seconds())
+        if hasattr(rule, "transitions"):
+            # transitions following from the TZ string
+            std = int(rule.std.utcoff.total_seconds())
+            dst = int(rule.dst.utcoff.total_seconds())
+        else:
+            # a fixed offset after the last transition
+            rule = None
+    except (AttributeError, TypeError, ValueError, zoneinfo.ZoneInfoNotFoundError):
+        return None
+
+    if not trans or before is None:
+        # TZ string alone, would need listing its transitions for all years
+        return None
+
+    while trans and trans[0] < lower:
+        # out of bounds for nanoseconds, only its offset matters
+        trans.pop(0)
+        before = offsets.pop(0)
+
+    if rule is not None:
+        last = trans[-1] if trans else lower
+        first_year = np.datetime64(last, "s").astype("M8[Y]").astype(np.int64) + 1970
+        for year in range(first_year, ZONEINFO_TRANS_YEAR + 1):
+            start, end = rule.transitions(year)
+            for utc_trans, offset in sorted([(start - std, dst), (end - dst, std)]):
+                if utc_trans > last:
+                    trans.append(utc_trans)
+                    offsets.append(offset)
+                    last = utc_trans
+
+    return trans, [before] + offsets
+
+
+cdef object get_zoneinfo_dst_info(tzinfo tz):
+    """
+    get_dst_info for zoneinfo timezones.
+
+    Only the transitions up to zoneinfo_horizon are listed, so later times
+    must be converted using the tzinfo API.
+
+    Returns
+    -------
+    (ndarray[int64_t], ndarray[int64_t], str) or None
+        None if the transitions of the zone are not available, e.g. for
+        zones loaded from a file object or subclasses of ZoneInfo.
+    """
+    if type(tz) is not ZoneInfo or tz.key is None:
+        return None
+
+    cache_key = tz.key
+    if cache_key not in zoneinfo_dst_cache:
+        res = _get_utc_trans_times_from_zoneinfo(tz)
+        if res is not None:
+            trans_list, offsets = res
+            trans = np.empty(len(trans_list) + 1, dtype=np.int64)
+            trans[0] = NPY_NAT + 1
+            trans[1:] = trans_list
+            trans[1:] *= 1_000_000_000
+            deltas = np.array(offsets, dtype=np.int64) * 1_000_000_000
+            res = (trans, deltas, "zoneinfo")
+        zoneinfo_dst_cache[cache_key] = res
+
+    return zoneinfo_dst_cache[cache_key]
+
+
 cdef int64_t[::1] unbox_utcoffsets(object transinfo):
     cdef:
         Py_ssize_t i
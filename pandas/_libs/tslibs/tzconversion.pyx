@@ -11,6 +11,7 @@ from cpython.datetime cimport (
     tzinfo,
 )
 from cython cimport Py_ssize_t
+from libc.stdint cimport INT64_MAX
 
 import_datetime()
 
@@ -43,16 +44,65 @@ import_pandas_datetime()
 
 from pandas._libs.tslibs.timezones cimport (
     get_dst_info,
+    get_zoneinfo_dst_info,
     is_fixed_offset,
     is_tzlocal,
     is_utc,
     is_zoneinfo,
+    tz_cache_key,
     utc_stdlib,
+    zoneinfo_horizon,
 )
 
 
 cdef const int64_t[::1] _deltas_placeholder = np.array([], dtype=np.int64)
 
+# get_dst_info in non-nanosecond resolutions, key is (tz cache key, creso)
+cdef dict _dst_info_reso_cache = {}
+
+
+cdef object _get_dst_info_reso(tzinfo tz, NPY_DATETIMEUNIT creso):
+    """
+    get_dst_info with the transitions and offsets in the resolution creso.
+
+    Returns None for zoneinfo timezones whose transitions are not available.
+    """
+    cdef:
+        int64_t factor
+
+    if is_zoneinfo(tz):
+        info = get_zoneinfo_dst_info(tz)
+        if info is None:
+            return None
+        cache_key = ("zoneinfo" + tz.key, creso)
+    else:
+        info = get_dst_info(tz)
+        cache_key = (tz_cache_key(tz), creso)
+
+    if creso == NPY_DATETIMEUNIT.NPY_FR_ns:
+        return info
+
+    if cache_key in _dst_info_reso_cache:
+        return _dst_info_reso_cache[cache_key]
+
+    # NB: using floordiv here is implicitly assuming we will
+    #  never see trans or deltas that are not an integer number
+    #  of seconds.
+    if creso == NPY_DATETIMEUNIT.NPY_FR_us:
+        factor = 1_000
+    elif creso == NPY_DATETIMEUNIT.NPY_FR_ms:
+        factor = 1_000_000
+    elif creso == NPY_DATETIMEUNIT.NPY_FR_s:
+        factor = 1_000_000_000
+    else:
+        raise NotImplementedError(creso)
+
+    trans, deltas, typ = info
+    info = (np.asarray(trans) // factor, np.asarray(deltas) // factor, typ)
+    if cache_key[0] is not None:
+        _dst_info_reso_cache[cache_key] = info
+    return info
+
 
 @cython.freelist(16)
 @cython.final
@@ -66,6 +116,7 @@ cdef class Localizer:
     #    const int64_t[::1] deltas
     #    int64_t delta
     #    int64_t* tdata
+    #    int64_t horizon
 
     @cython.initializedcheck(False)
     @cython.boundscheck(False)
@@ -78,37 +129,27 @@ cdef class Localizer:
         self.delta = -1  # placeholder
         self.deltas = _deltas_placeholder
         self.tdata = NULL
+        self.horizon = INT64_MAX
 
         if is_utc(tz) or tz is None:
             self.use_utc = True
 
-        elif is_tzlocal(tz) or is_zoneinfo(tz):
+        elif is_tzlocal(tz):
             self.use_tzlocal = True
 
         else:
-            trans, deltas, typ = get_dst_info(tz)
-            if creso != NPY_DATETIMEUNIT.NPY_FR_ns:
-                # NB: using floordiv here is implicitly assuming we will
-                #  never see trans or deltas that are not an integer number
-                #  of seconds.
-                # TODO: avoid these np.array calls
-                if creso == NPY_DATETIMEUNIT.NPY_FR_us:
-                    trans = np.array(trans) // 1_000
-                    deltas = np.array(deltas) // 1_000
-                elif creso == NPY_DATETIMEUNIT.NPY_FR_ms:
-                    trans = np.array(trans) // 1_000_000
-                    deltas = np.array(deltas) // 1_000_000
-                elif creso == NPY_DATETIMEUNIT.NPY_FR_s:
-                    trans = np.array(trans) // 1_000_000_000
-                    deltas = np.array(deltas) // 1_000_000_000
-                else:
-                    raise NotImplementedError(creso)
+            info = _get_dst_info_reso(tz, creso)
+            if info is None:
+                # zoneinfo without available transitions
+                self.use_tzlocal = True
+                return
 
+            trans, deltas, typ = info
             self.trans = trans
             self.ntrans = self.trans.shape[0]
             self.deltas = deltas
 
-            if typ != "pytz" and typ != "dateutil":
+            if typ != "pytz" and typ != "dateutil" and typ != "zoneinfo":
                 # static/fixed; in this case we know that len(delta) == 1
                 self.use_fixed = True
                 self.delta = deltas[0]
@@ -116,6 +157,12 @@ cdef class Localizer:
                 self.use_dst = True
                 if typ == "pytz":
                     self.use_pytz = True
+                elif typ == "zoneinfo":
+                    # later times fall back to the tzinfo API
+                    self.horizon = zoneinfo_horizon // (
+                        periods_per_second(NPY_DATETIMEUNIT.NPY_FR_ns)
+                        // periods_per_second(creso)
+                    )
                 self.tdata = <int64_t*>cnp.PyArray_DATA(trans)
 
     @cython.boundscheck(False)
@@ -130,6 +177,10 @@ cdef class Localizer:
             )
         elif self.use_fixed:
             return utc_val + self.delta
+        elif utc_val >= self.horizon:
+            return utc_val + _tz_localize_using_tzinfo_api(
+                utc_val, self.tz, to_utc=False, creso=self._creso, fold=fold
+            )
         else:
             pos[0] = bisect_right_i8(self.tdata, utc_val, self.ntrans) - 1
             if fold is not NULL:
@@ -162,17 +213,8 @@ cdef int64_t tz_localize_to_utc_single(
         return val - _tz_localize_using_tzinfo_api(val, tz, to_utc=True, creso=creso)
 
     elif is_fixed_offset(tz):
-        _, deltas, _ = get_dst_info(tz)
+        _, deltas, _ = _get_dst_info_reso(tz, creso)
         delta = deltas[0]
-        # TODO: de-duplicate with Localizer.__init__
-        if creso != NPY_DATETIMEUNIT.NPY_FR_ns:
-            if creso == NPY_DATETIMEUNIT.NPY_FR_us:
-                delta = delta // 1000
-            elif creso == NPY_DATETIMEUNIT.NPY_FR_ms:
-                delta = delta // 1_000_000
-            elif creso == NPY_DATETIMEUNIT.NPY_FR_s:
-                delta = delta // 1_000_000_000
-
         return val - delta
 
     else:
@@ -311,7 +353,10 @@ timedelta-like}
 
     # Determine whether each date lies left of the DST transition (store in
     # result_a) or right of the DST transition (store in result_b)
-    if is_zoneinfo(tz):
+    if is_zoneinfo(tz) and (
+        info.use_tzlocal or vals.max() >= info.horizon - periods_per_day(creso)
+    ):
+        # transitions are not available or the values go beyond them
         is_zi = True
         result_a, result_b =_get_utc_bounds_zoneinfo(
             vals, tz, creso=creso
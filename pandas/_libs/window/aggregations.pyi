@@ -30,6 +30,17 @@ def roll_var(
     minp: int,  # int64_t
     ddof: int = ...,
 ) -> np.ndarray: ...  # np.ndarray[float]
+def roll_moments(
+    values: np.ndarray,  # const float64_t[:]
+    start: np.ndarray,  # np.ndarray[np.int64]
+    end: np.ndarray,  # np.ndarray[np.int64]
+    minp: int,  # int64_t
+    ddof: int = ...,
+    compute_count: bool = ...,
+    compute_sum: bool = ...,
+    compute_mean: bool = ...,
+    compute_var: bool = ...,
+) -> np.ndarray: ...  # np.ndarray[float, ndim=2]
 def roll_skew(
     values: np.ndarray,  # np.ndarray[np.float64]
     start: np.ndarray,  # np.ndarray[np.int64]
@@ -60,6 +71,17 @@ def roll_min(
     end: np.ndarray,  # np.ndarray[np.int64]
     minp: int,  # int64_t
 ) -> np.ndarray: ...  # np.ndarray[float]
+
+class WindowState:
+    def __init__(self, minp: int, expanding: bool = ...) -> None: ...
+    def update(
+        self,
+        values: np.ndarray,  # const float64_t[:]
+        offset: int,  # int64_t
+        start: np.ndarray,  # const int64_t[:]
+        end: np.ndarray,  # const int64_t[:]
+    ) -> dict[str, np.ndarray]: ...
+
 def roll_first(
     values: np.ndarray,  # np.ndarray[np.float64]
     start: np.ndarray,  # np.ndarray[np.int64]
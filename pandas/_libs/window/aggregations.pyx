@@ -484,6 +484,136 @@ def roll_var(const float64_t[:] values, ndarray[int64_t] start,
 
     return output
 
+
+def roll_moments(const float64_t[:] values, ndarray[int64_t] start,
+                 ndarray[int64_t] end, int64_t minp, int ddof=1,
+                 bint compute_count=True, bint compute_sum=True,
+                 bint compute_mean=True, bint compute_var=True) -> np.ndarray:
+    """
+    Rolling count, sum, mean and variance in a single pass over the windows.
+
+    Every statistic is identical to the result of ``roll_sum`` over the
+    non-null mask, ``roll_sum``, ``roll_mean`` and ``roll_var`` respectively,
+    as the same running state and recomputation rules are used.
+
+    Parameters
+    ----------
+    values : ndarray[float64_t]
+    start : ndarray[int64_t]
+    end : ndarray[int64_t]
+    minp : int64_t
+    ddof : int, default 1
+        Delta Degrees of Freedom of the variance.
+    compute_count, compute_sum, compute_mean, compute_var : bool, default True
+        Which statistics to compute. The running state of the variance is
+        only kept if it is computed.
+
+    Returns
+    -------
+    np.ndarray[float]
+        With a row per computed statistic, in the order count, sum, mean
+        and variance, and a column per window.
+    """
+    cdef:
+        float64_t val, compensation_add, compensation_remove, sum_x, prev_value
+        float64_t mean_x = 0, ssqdm_x = 0, nobs_var = 0
+        float64_t var_compensation_add = 0, var_compensation_remove = 0
+        int64_t s, e, num_consecutive_same_value, var_minp = max(minp, 1)
+        Py_ssize_t nobs, i, j, neg_ct, N = len(start)
+        Py_ssize_t count_row, sum_row, mean_row, var_row
+        ndarray[float64_t, ndim=2] output
+        bint is_monotonic_increasing_bounds
+        bint requires_recompute, numerically_unstable = False
+
+    # the row of every statistic, past the last row if it is not computed
+    count_row = 0
+    sum_row = count_row + compute_count
+    mean_row = sum_row + compute_sum
+    var_row = mean_row + compute_mean
+
+    is_monotonic_increasing_bounds = is_monotonic_increasing_start_end_bounds(
+        start, end
+    )
+    output = np.full((var_row + compute_var, N), NaN, dtype=np.float64)
+
+    with nogil:
+
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
+
+            requires_recompute = (
+                i == 0
+                or not is_monotonic_increasing_bounds
+                or s >= end[i - 1]
+            )
+
+            if requires_recompute:
+
+                # setup
+                compensation_add = compensation_remove = sum_x = 0
+                nobs = neg_ct = 0
+                prev_value = values[s]
+                num_consecutive_same_value = 0
+                for j in range(s, e):
+                    add_mean(values[j], &nobs, &sum_x, &neg_ct, &compensation_add,
+                             &num_consecutive_same_value, &prev_value)
+
+            else:
+
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = values[j]
+                    remove_mean(val, &nobs, &sum_x, &neg_ct, &compensation_remove)
+                    if compute_var:
+                        remove_var(val, &nobs_var, &mean_x, &ssqdm_x,
+                                   &var_compensation_remove, &numerically_unstable)
+
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = values[j]
+                    add_mean(val, &nobs, &sum_x, &neg_ct, &compensation_add,
+                             &num_consecutive_same_value, &prev_value)
+                    if compute_var:
+                        add_var(val, &nobs_var, &mean_x, &ssqdm_x,
+                                &var_compensation_add, &numerically_unstable)
+
+            if compute_var and (requires_recompute or numerically_unstable):
+
+                mean_x = ssqdm_x = nobs_var = 0
+                var_compensation_add = var_compensation_remove = 0
+                for j in range(s, e):
+                    add_var(values[j], &nobs_var, &mean_x, &ssqdm_x,
+                            &var_compensation_add, &numerically_unstable)
+                numerically_unstable = False
+
+            # the count is the sum over the non-null mask, for which every
+            #  value in the window is an observation
+            if compute_count and e - s >= minp:
+                output[count_row, i] = nobs
+            if compute_sum:
+                output[sum_row, i] = calc_sum(
+                    minp, nobs, sum_x, num_consecutive_same_value, prev_value
+                )
+            if compute_mean:
+                output[mean_row, i] = calc_mean(
+                    minp, nobs, neg_ct, sum_x, num_consecutive_same_value, prev_value
+                )
+            if compute_var:
+                output[var_row, i] = calc_var(var_minp, ddof, nobs_var, ssqdm_x)
+
+            if not is_monotonic_increasing_bounds:
+                nobs = 0
+                neg_ct = 0
+                sum_x = 0.0
+                compensation_remove = 0.0
+                nobs_var = 0.0
+                mean_x = 0.0
+                ssqdm_x = 0.0
+                var_compensation_remove = 0.0
+
+    return output
+
 # ----------------------------------------------------------------------
 # Rolling skewness
 
@@ -1153,6 +1283,207 @@ def _roll_min_max(
 
     return output
 
+# ----------------------------------------------------------------------
+# Rolling count, sum, mean, var, min and max over a stream of values
+
+
+cdef class WindowState:
+    """
+    State of roll_sum, roll_mean, roll_var, roll_min and roll_max after the
+    windows seen so far, for a stream of values of one column.
+
+    :meth:`update` continues the kernels with further windows, so its results
+    are those of the kernels over the whole stream, while it only takes time
+    proportional to the number of values entering and leaving the windows.
+
+    With ``expanding=True`` every window starts at the first value. No value
+    is then ever removed, the minimum and maximum are kept as running
+    extremes, and the variance is not recomputed over the whole stream when
+    it becomes numerically unstable, so no values need to be kept.
+    """
+
+    cdef:
+        int64_t minp
+        bint expanding
+        int64_t nwindows, last_start, last_end
+        # roll_sum and roll_mean
+        Py_ssize_t nobs, neg_ct
+        int64_t num_consecutive_same_value
+        float64_t sum_x, compensation_add, compensation_remove, prev_value
+        # roll_var
+        float64_t var_nobs, mean_x, ssqdm_x
+        float64_t var_compensation_add, var_compensation_remove
+        bint numerically_unstable
+        # roll_min and roll_max
+        deque[int64_t] min_candidates, max_candidates
+        float64_t running_min, running_max
+
+    def __cinit__(self, int64_t minp, bint expanding=False):
+        self.minp = minp
+        self.expanding = expanding
+        self.nwindows = self.last_start = self.last_end = 0
+        self.nobs = self.neg_ct = self.num_consecutive_same_value = 0
+        self.sum_x = self.compensation_add = self.compensation_remove = 0
+        self.prev_value = NaN
+        self.var_nobs = self.mean_x = self.ssqdm_x = 0
+        self.var_compensation_add = self.var_compensation_remove = 0
+        self.numerically_unstable = False
+        self.running_min = self.running_max = NaN
+
+    def update(
+        self,
+        const float64_t[:] values,
+        int64_t offset,
+        const int64_t[:] start,
+        const int64_t[:] end,
+    ) -> dict[str, np.ndarray]:
+        """
+        Compute the windows given by ``start`` and ``end``.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The values of the stream from position ``offset`` onwards. These
+            must include the values from the start of the previous window,
+            unless ``expanding`` is True, and up to the end of the last
+            window.
+        offset : int
+            The position of the first value of ``values`` in the stream.
+        start, end : np.ndarray[int64]
+            The bounds of the windows as positions in the stream, which must
+            not decrease.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The number of observations, sum, mean, sum of squared differences
+            from the mean, minimum and maximum of every window.
+        """
+        cdef:
+            Py_ssize_t i, N = len(start)
+            int64_t j, s, e, minp = self.minp, minp_extremes = max(self.minp, 1)
+            float64_t val
+            bint reset
+            ndarray[float64_t] nobs_out, sum_out, mean_out, ssqdm_out
+            ndarray[float64_t] min_out, max_out
+
+        nobs_out = np.empty(N, dtype=np.float64)
+        sum_out = np.empty(N, dtype=np.float64)
+        mean_out = np.empty(N, dtype=np.float64)
+        ssqdm_out = np.empty(N, dtype=np.float64)
+        min_out = np.empty(N, dtype=np.float64)
+        max_out = np.empty(N, dtype=np.float64)
+
+        with nogil:
+            for i in range(N):
+                s = start[i]
+                e = end[i]
+                reset = self.nwindows == 0 or s >= self.last_end
+
+                # roll_sum and roll_mean
+                if reset:
+                    if s - offset < len(values):
+                        self.prev_value = values[s - offset]
+                    else:
+                        # an empty window, prev_value is not used
+                        self.prev_value = NaN
+                    self.num_consecutive_same_value = 0
+                    self.sum_x = self.compensation_add = self.compensation_remove = 0
+                    self.nobs = self.neg_ct = 0
+                    for j in range(s, e):
+                        add_mean(values[j - offset], &self.nobs, &self.sum_x,
+                                 &self.neg_ct, &self.compensation_add,
+                                 &self.num_consecutive_same_value, &self.prev_value)
+                else:
+                    for j in range(self.last_start, s):
+                        remove_mean(values[j - offset], &self.nobs, &self.sum_x,
+                                    &self.neg_ct, &self.compensation_remove)
+                    for j in range(self.last_end, e):
+                        add_mean(values[j - offset], &self.nobs, &self.sum_x,
+                                 &self.neg_ct, &self.compensation_add,
+                                 &self.num_consecutive_same_value, &self.prev_value)
+                nobs_out[i] = self.nobs
+                sum_out[i] = calc_sum(minp, self.nobs, self.sum_x,
+                                      self.num_consecutive_same_value,
+                                      self.prev_value)
+                mean_out[i] = calc_mean(minp, self.nobs, self.neg_ct, self.sum_x,
+                                        self.num_consecutive_same_value,
+                                        self.prev_value)
+
+                # roll_var
+                if not reset:
+                    for j in range(self.last_start, s):
+                        remove_var(values[j - offset], &self.var_nobs, &self.mean_x,
+                                   &self.ssqdm_x, &self.var_compensation_remove,
+                                   &self.numerically_unstable)
+                    for j in range(self.last_end, e):
+                        add_var(values[j - offset], &self.var_nobs, &self.mean_x,
+                                &self.ssqdm_x, &self.var_compensation_add,
+                                &self.numerically_unstable)
+                if reset or (self.numerically_unstable and not self.expanding):
+                    self.var_nobs = self.mean_x = self.ssqdm_x = 0
+                    self.var_compensation_add = self.var_compensation_remove = 0
+                    for j in range(s, e):
+                        add_var(values[j - offset], &self.var_nobs, &self.mean_x,
+                                &self.ssqdm_x, &self.var_compensation_add,
+                                &self.numerically_unstable)
+                self.numerically_unstable = False
+                ssqdm_out[i] = self.ssqdm_x
+
+                # roll_min and roll_max
+                if self.expanding:
+                    for j in range(self.last_end, e):
+                        val = values[j - offset]
+                        if not isnan(val):
+                            # like the deques below, the last of equal values wins
+                            if isnan(self.running_min) or val <= self.running_min:
+                                self.running_min = val
+                            if isnan(self.running_max) or val >= self.running_max:
+                                self.running_max = val
+                    min_out[i] = self.running_min
+                    max_out[i] = self.running_max
+                else:
+                    for j in range(self.last_end, e):
+                        val = values[j - offset]
+                        if not isnan(val):
+                            while (not self.min_candidates.empty()
+                                    and val <= values[self.min_candidates.back()
+                                                      - offset]):
+                                self.min_candidates.pop_back()
+                            self.min_candidates.push_back(j)
+                            while (not self.max_candidates.empty()
+                                    and val >= values[self.max_candidates.back()
+                                                      - offset]):
+                                self.max_candidates.pop_back()
+                            self.max_candidates.push_back(j)
+                    while (not self.min_candidates.empty()
+                            and self.min_candidates.front() < s):
+                        self.min_candidates.pop_front()
+                    while (not self.max_candidates.empty()
+                            and self.max_candidates.front() < s):
+                        self.max_candidates.pop_front()
+                    if self.min_candidates.empty():
+                        min_out[i] = max_out[i] = NaN
+                    else:
+                        min_out[i] = values[self.min_candidates.front() - offset]
+                        max_out[i] = values[self.max_candidates.front() - offset]
+                if self.nobs < minp_extremes:
+                    min_out[i] = max_out[i] = NaN
+
+                self.last_start = s
+                self.last_end = e
+                self.nwindows += 1
+
+        return {
+            "nobs": nobs_out,
+            "sum": sum_out,
+            "mean": mean_out,
+            "ssqdm": ssqdm_out,
+            "min": min_out,
+            "max": max_out,
+        }
+
+
 # ----------------------------------------------------------------------
 # Rolling first, last
 
@@ -10,3 +10,11 @@ def calculate_variable_window_bounds(
     closed: str | None,
     index: np.ndarray,  # const int64_t[:]
 ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: ...
+def calculate_variable_offset_window_bounds(
+    num_values: int,  # int64_t
+    index: np.ndarray,  # const int64_t[:]
+    start_bounds: np.ndarray,  # const int64_t[:]
+    left_closed: bool,
+    right_closed: bool,
+    index_growth_sign: int,  # int64_t
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: ...
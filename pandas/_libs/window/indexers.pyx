@@ -7,6 +7,11 @@ from numpy cimport (
     ndarray,
 )
 
+from pandas._libs.util cimport get_nat
+
+cdef:
+    int64_t NPY_NAT = get_nat()
+
 # Cython routines for window indexers
 
 
@@ -149,3 +154,107 @@ def calculate_variable_window_bounds(
             if not right_closed and not center:
                 end[i] -= 1
     return start, end
+
+
+def calculate_variable_offset_window_bounds(
+    int64_t num_values,
+    const int64_t[:] index,
+    const int64_t[:] start_bounds,
+    bint left_closed,
+    bint right_closed,
+    int64_t index_growth_sign,
+):
+    """
+    Calculate window boundaries for rolling windows from a non-fixed offset.
+
+    Parameters
+    ----------
+    num_values : int64
+        total number of values
+
+    index : ndarray[int64]
+        time series index to roll over, NaT for missing values
+
+    start_bounds : ndarray[int64]
+        the left endpoint of the window ending at every value of the index,
+        i.e. the index shifted back by the offset
+
+    left_closed : bint
+        move the left endpoints back by one to include them in the window
+
+    right_closed : bint
+        include the right endpoint in the window
+
+    index_growth_sign : int64
+        -1 if the index is decreasing, 1 otherwise
+
+    Returns
+    -------
+    (ndarray[int64], ndarray[int64])
+    """
+    cdef:
+        ndarray[int64_t, ndim=1] start, end
+        int64_t start_bound, end_bound, prev_end
+        Py_ssize_t i, j, k, index_length = len(index)
+
+    if num_values <= 0:
+        return np.empty(0, dtype="int64"), np.empty(0, dtype="int64")
+
+    start = np.empty(num_values, dtype="int64")
+    start.fill(-1)
+    end = np.empty(num_values, dtype="int64")
+    end.fill(-1)
+
+    start[0] = 0
+
+    # right endpoint is closed
+    if right_closed:
+        end[0] = 1
+    # right endpoint is open
+    else:
+        end[0] = 0
+
+    with nogil:
+
+        # start is start of slice interval (including)
+        # end is end of slice interval (not including)
+        # comparisons involving NaT are False, like those of Timestamps
+        for i in range(1, num_values):
+            end_bound = index[i]
+            start_bound = start_bounds[i]
+
+            # left endpoint is closed
+            if left_closed and start_bound != NPY_NAT:
+                start_bound -= 1
+
+            # advance the start bound until we are
+            # within the constraint
+            start[i] = i
+            if start_bound != NPY_NAT:
+                for j in range(start[i - 1], i):
+                    if (
+                        index[j] != NPY_NAT
+                        and (index[j] - start_bound) * index_growth_sign > 0
+                    ):
+                        start[i] = j
+                        break
+
+            # end bound is previous end
+            # or current index
+            k = end[i - 1]
+            if k < 0:
+                k += index_length
+            prev_end = index[k]
+            if prev_end == NPY_NAT or end_bound == NPY_NAT:
+                end[i] = end[i - 1]
+            elif prev_end == end_bound and not right_closed:
+                end[i] = end[i - 1] + 1
+            elif (prev_end - end_bound) * index_growth_sign <= 0:
+                end[i] = i + 1
+            else:
+                end[i] = end[i - 1]
+
+            # right endpoint is open
+            if not right_closed:
+                end[i] -= 1
+    return start, end
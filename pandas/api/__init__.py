@@ -1,6 +1,7 @@
 """public toolkit API"""
 
 from pandas.api import (
+    accumulators,
     executors,
     extensions,
     indexers,
@@ -10,6 +11,7 @@ from pandas.api import (
 )
 
 __all__ = [
+    "accumulators",
     "executors",
     "extensions",
     "indexers",
@@ -0,0 +1,17 @@
+"""
+Public API for incremental accumulators over chunked data.
+"""
+
+from pandas.core.accumulators import (
+    HyperLogLog,
+    StreamingResampler,
+    TDigest,
+    ValueCounter,
+)
+
+__all__ = [
+    "HyperLogLog",
+    "StreamingResampler",
+    "TDigest",
+    "ValueCounter",
+]
@@ -7,6 +7,7 @@ from pandas._libs.lib import NoDefault
 from pandas._libs.missing import NAType
 
 from pandas.core.col import Expression
+from pandas.core.computation.eval import CompiledExpression
 from pandas.core.groupby import (
     DataFrameGroupBy,
     SeriesGroupBy,
@@ -36,6 +37,7 @@ from pandas.io.sas.sasreader import SASReader
 from pandas.io.stata import StataReader
 
 __all__ = [
+    "CompiledExpression",
     "DataFrameGroupBy",
     "DatetimeIndexResamplerGroupby",
     "Expanding",
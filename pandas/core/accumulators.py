@@ -0,0 +1,819 @@
+"""
+Incremental accumulators computing statistics over a sequence of chunks.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+)
+
+import numpy as np
+
+from pandas._libs import (
+    hashtable as htable,
+    iNaT,
+    lib,
+)
+from pandas._libs.tslibs import (
+    Tick,
+    Timestamp,
+)
+from pandas.util._decorators import set_module
+from pandas.util._validators import validate_percentile
+
+from pandas.core.dtypes.astype import astype_array
+from pandas.core.dtypes.base import ExtensionDtype
+from pandas.core.dtypes.cast import find_common_type
+from pandas.core.dtypes.common import (
+    is_list_like,
+    needs_i8_conversion,
+)
+from pandas.core.dtypes.dtypes import (
+    BaseMaskedDtype,
+    CategoricalDtype,
+    DatetimeTZDtype,
+)
+from pandas.core.dtypes.missing import notna
+
+from pandas.core import algorithms
+from pandas.core.array_algos import (
+    hyperloglog,
+    tdigest,
+)
+from pandas.core.arrays import (
+    BaseMaskedArray,
+    Categorical,
+)
+from pandas.core.construction import extract_array
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from pandas._typing import (
+        AggFuncType,
+        ArrayLike,
+        DtypeObj,
+        Frequency,
+        NDFrameT,
+        TimedeltaConvertibleTypes,
+        TimestampConvertibleTypes,
+        npt,
+    )
+
+    from pandas import (
+        Index,
+        Series,
+    )
+
+
+_factorizers = {
+    "int64": htable.Int64Factorizer,
+    "int32": htable.Int32Factorizer,
+    "int16": htable.Int16Factorizer,
+    "int8": htable.Int8Factorizer,
+    "uint64": htable.UInt64Factorizer,
+    "uint32": htable.UInt32Factorizer,
+    "uint16": htable.UInt16Factorizer,
+    "uint8": htable.UInt8Factorizer,
+    "float64": htable.Float64Factorizer,
+    "float32": htable.Float32Factorizer,
+    "complex128": htable.Complex128Factorizer,
+    "complex64": htable.Complex64Factorizer,
+    "object": htable.ObjectFactorizer,
+}
+
+
+def _get_hashable_values(
+    values: ArrayLike,
+) -> tuple[np.ndarray, npt.NDArray[np.bool_] | None, Any]:
+    """
+    Convert ``values`` to the ndarray, mask and na_value a Factorizer expects.
+    """
+    if isinstance(values, BaseMaskedArray):
+        return values._data, values._mask, None
+    if isinstance(values, np.ndarray) or needs_i8_conversion(values.dtype):
+        na_value = iNaT if needs_i8_conversion(values.dtype) else None
+        return algorithms._ensure_data(values), None, na_value
+    # other ExtensionArrays
+    data, na_value = values._values_for_factorize()
+    return data, None, na_value
+
+
+@set_module("pandas.api.accumulators")
+class ValueCounter:
+    """
+    Count unique values incrementally over a sequence of chunks.
+
+    The counter keeps a single hashtable alive across calls to
+    :meth:`update`, so every value is hashed exactly once. This allows
+    computing ``value_counts``, ``nunique`` and ``unique`` over data that
+    is only available in chunks, e.g. from ``read_csv(chunksize=...)``.
+
+    See Also
+    --------
+    Series.value_counts : Return a Series containing counts of unique values.
+    Series.nunique : Return number of unique elements in the object.
+    unique : Return unique values based on a hash table.
+
+    Examples
+    --------
+    >>> from pandas.api.accumulators import ValueCounter
+    >>> counter = ValueCounter()
+    >>> counter.update(pd.Series(["a", "b", "a"], name="letter"))
+    >>> counter.update(pd.Series(["c", "a", None], name="letter"))
+    >>> counter.result()
+    letter
+    a    3
+    b    1
+    c    1
+    Name: count, dtype: int64
+
+    >>> counter.nunique(dropna=False)
+    4
+    """
+
+    def __init__(self) -> None:
+        self._dtype: DtypeObj | None = None
+        self._original: ArrayLike | None = None
+        self._factorizer: htable.Factorizer | None = None
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._na_count = 0
+        # the number of uniques seen before the first missing value, which
+        #  is where the missing value is placed in the results
+        self._na_position: int | None = None
+        self._na_value: Any = None
+        self._name: Hashable = None
+
+    def update(self, values) -> None:
+        """
+        Add the values of a chunk to the counts.
+
+        Parameters
+        ----------
+        values : Series, Index, ExtensionArray or np.ndarray
+            The 1-dimensional chunk to count. Chunks whose dtype differs from
+            the previous chunks are cast to a common dtype.
+        """
+        if self._original is None:
+            self._name = getattr(values, "name", None)
+        values = algorithms._ensure_arraylike(values, func_name="update")
+        values = extract_array(values, extract_numpy=True, extract_range=True)
+        if values.ndim != 1:
+            raise ValueError("ValueCounter.update only accepts 1-dimensional input")
+
+        if self._dtype is None:
+            self._dtype = values.dtype
+        elif values.dtype != self._dtype:
+            dtype = find_common_type([self._dtype, values.dtype])
+            if dtype != self._dtype:
+                self._rehash(dtype)
+            values = astype_array(values, dtype)
+
+        if self._original is None:
+            # an empty array of the right type to reconstruct the uniques
+            self._original = values[:0]
+
+        data, mask, na_value = _get_hashable_values(values)
+        if self._factorizer is None:
+            self._factorizer = _factorizers[data.dtype.name](max(len(data), 1))
+        count_prior = self._factorizer.get_count()
+        codes = self._factorizer.factorize(
+            data, na_sentinel=-1, na_value=na_value, mask=mask
+        )
+
+        # shift by one so that missing values land in the first bin
+        counts = np.bincount(codes + 1, minlength=self._factorizer.get_count() + 1)
+        counts[1 : len(self._counts) + 1] += self._counts
+        self._counts = counts[1:]
+        if counts[0] and self._na_position is None:
+            first_na = int(np.argmax(codes == -1))
+            self._na_position = max(count_prior, codes[:first_na].max(initial=-1) + 1)
+            self._na_value = values[first_na]
+        self._na_count += int(counts[0])
+
+    def _rehash(self, dtype: DtypeObj) -> None:
+        """
+        Re-insert the uniques counted so far into a hashtable for ``dtype``.
+        """
+        uniques = astype_array(self._uniques(), dtype)
+        data, mask, na_value = _get_hashable_values(uniques)
+        factorizer = _factorizers[data.dtype.name](max(len(data), 1))
+        codes = factorizer.factorize(data, na_sentinel=-1, na_value=na_value, mask=mask)
+
+        # casting may map several uniques onto the same value
+        counts = np.zeros(factorizer.get_count(), dtype=np.int64)
+        np.add.at(counts, codes, self._counts)
+        self._counts = counts
+        self._factorizer = factorizer
+        self._dtype = dtype
+        self._original = uniques[:0]
+
+    def _uniques(self) -> ArrayLike:
+        """
+        Return the non-missing uniques in order of appearance.
+        """
+        assert self._dtype is not None
+        assert self._factorizer is not None
+        uniques = self._factorizer.uniques.to_array()
+        original = self._original
+        if isinstance(original, (BaseMaskedArray, np.ndarray)) or needs_i8_conversion(
+            self._dtype
+        ):
+            return algorithms._reconstruct_data(uniques, self._dtype, original)
+        return type(original)._from_factorized(uniques, original)
+
+    def _get_na_position(self, for_value_counts: bool) -> int:
+        assert self._na_position is not None
+        if for_value_counts and isinstance(self._dtype, BaseMaskedDtype):
+            # BaseMaskedArray.value_counts places NA last
+            return len(self._counts)
+        return self._na_position
+
+    def _index(self, dropna: bool, for_value_counts: bool) -> Index:
+        from pandas import Index
+
+        if self._dtype is None:
+            return Index([], dtype=object, name=self._name)
+        uniques = self._uniques()
+        idx = Index(uniques, dtype=uniques.dtype, name=self._name, copy=False)
+        if not dropna and self._na_count:
+            loc = self._get_na_position(for_value_counts)
+            idx = idx.insert(loc, self._na_value)
+        return idx
+
+    def result(
+        self,
+        normalize: bool = False,
+        sort: bool = True,
+        ascending: bool = False,
+        dropna: bool = True,
+    ) -> Series:
+        """
+        Return a Series containing the counts of the unique values seen so far.
+
+        The counts are the same as those of ``Series.value_counts`` on the
+        concatenation of all chunks passed to :meth:`update`. For categorical
+        data every category has an entry, even those with a count of 0.
+
+        Parameters
+        ----------
+        normalize : bool, default False
+            If True then the object returned will contain the relative
+            frequencies of the unique values.
+        sort : bool, default True
+            Sort by frequencies when True. Preserve the order of the data
+            when False.
+        ascending : bool, default False
+            Sort in ascending order.
+        dropna : bool, default True
+            Don't include counts of NaN.
+
+        Returns
+        -------
+        Series
+        """
+        from pandas import Series
+
+        if isinstance(self._dtype, CategoricalDtype):
+            result = self._categorical_counts(dropna)
+        else:
+            counts = self._counts
+            if not dropna and self._na_count:
+                loc = self._get_na_position(for_value_counts=True)
+                counts = np.insert(counts, loc, self._na_count)
+            index = self._index(dropna, for_value_counts=True)
+            result = Series(counts, index=index, copy=False)
+            if isinstance(self._dtype, ExtensionDtype):
+                # e.g. masked and string arrays return nullable counts
+                empty = self._dtype.construct_array_type()._from_sequence(
+                    [], dtype=self._dtype
+                )
+                result = result.astype(empty.value_counts().dtype)
+        result.name = "proportion" if normalize else "count"
+
+        if sort:
+            result = result.sort_values(ascending=ascending, kind="stable")
+        if normalize:
+            result = result / result.sum()
+        return result
+
+    def _categorical_counts(self, dropna: bool) -> Series:
+        """
+        Return the counts of all categories, like ``Categorical.value_counts``.
+        """
+        from pandas import (
+            CategoricalIndex,
+            Series,
+        )
+
+        uniques = self._uniques()
+        assert isinstance(uniques, Categorical)
+        ncat = len(uniques.categories)
+        counts = np.zeros(ncat, dtype=np.int64)
+        counts[uniques.codes] = self._counts
+        ix = np.arange(ncat)
+        if not dropna and self._na_count:
+            # Categorical.value_counts places NaN last
+            counts = np.append(counts, self._na_count)
+            ix = np.append(ix, -1)
+        cat = Categorical.from_codes(ix, dtype=uniques.dtype)
+        index = CategoricalIndex(cat, name=self._name)
+        return Series(counts, index=index, copy=False)
+
+    def nunique(self, dropna: bool = True) -> int:
+        """
+        Return the number of unique values seen so far.
+
+        Parameters
+        ----------
+        dropna : bool, default True
+            Don't include NaN in the count.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._counts) + int(not dropna and self._na_count > 0)
+
+    def unique(self) -> ArrayLike:
+        """
+        Return the unique values seen so far in order of appearance.
+
+        Missing values are included, like in :meth:`Series.unique`.
+
+        Returns
+        -------
+        np.ndarray or ExtensionArray
+        """
+        return self._index(dropna=False, for_value_counts=False)._values
+
+
+@set_module("pandas.api.accumulators")
+class HyperLogLog:
+    """
+    Mergeable sketch estimating the number of distinct values.
+
+    The sketch stores ``2 ** precision`` one-byte registers built from the
+    hashes of :func:`pandas.util.hash_array`, independent of the number of
+    values added. Sketches of the same precision can be merged, so sketches
+    of separate chunks, files or workers can be combined into one.
+
+    Parameters
+    ----------
+    precision : int, default 14
+        Number of hash bits used to select a register, between 4 and 18. The
+        relative standard error of the estimate is about
+        ``1.04 / sqrt(2 ** precision)``, i.e. 0.8% for the default.
+
+    See Also
+    --------
+    Series.nunique : Return number of unique elements in the object.
+    api.accumulators.ValueCounter : Exact counts of unique values over chunks.
+
+    Notes
+    -----
+    Values are hashed according to their dtype, so equal values of
+    different dtypes, e.g. ``1`` and ``1.0``, are counted separately.
+
+    Examples
+    --------
+    >>> from pandas.api.accumulators import HyperLogLog
+    >>> first = HyperLogLog()
+    >>> first.update(pd.Series(range(0, 60_000)))
+    >>> second = HyperLogLog()
+    >>> second.update(pd.Series(range(40_000, 100_000)))
+    >>> first.merge(second)
+    >>> first.result()
+    99781
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        hyperloglog.validate_precision(precision)
+        self.precision = precision
+        self._registers = np.zeros(1 << precision, dtype=np.uint8)
+        self._has_na = False
+
+    def update(self, values) -> None:
+        """
+        Add the values of a chunk to the sketch.
+
+        Parameters
+        ----------
+        values : Series, Index, ExtensionArray or np.ndarray
+            The 1-dimensional chunk to add.
+        """
+        values = algorithms._ensure_arraylike(values, func_name="update")
+        values = extract_array(values, extract_numpy=True, extract_range=True)
+        hashes, mask = hyperloglog.hash_values(values)
+        registers = hyperloglog.sketch(hashes[~mask], self.precision)
+        np.maximum(self._registers, registers, out=self._registers)
+        self._has_na = self._has_na or bool(mask.any())
+
+    def merge(self, other: HyperLogLog) -> None:
+        """
+        Add all values of another sketch to this sketch.
+
+        Parameters
+        ----------
+        other : HyperLogLog
+            A sketch with the same precision.
+        """
+        if not isinstance(other, HyperLogLog):
+            raise TypeError(
+                f"Can only merge HyperLogLog sketches, got {type(other).__name__}"
+            )
+        if other.precision != self.precision:
+            raise ValueError(
+                "Can only merge sketches with the same precision, got "
+                f"{self.precision} and {other.precision}"
+            )
+        np.maximum(self._registers, other._registers, out=self._registers)
+        self._has_na = self._has_na or other._has_na
+
+    def result(self, dropna: bool = True) -> int:
+        """
+        Return the estimated number of distinct values added so far.
+
+        Parameters
+        ----------
+        dropna : bool, default True
+            Don't include NaN in the count.
+
+        Returns
+        -------
+        int
+        """
+        result = round(hyperloglog.estimate(self._registers))
+        return result + int(not dropna and self._has_na)
+
+
+@set_module("pandas.api.accumulators")
+class TDigest:
+    """
+    Mergeable sketch estimating quantiles.
+
+    A t-digest summarizes the values added so far by a bounded number of
+    centroids, which are small near both tails and large near the median.
+    Quantiles estimated from the sketch have a small relative error, also
+    for extreme quantiles like the 99.9th percentile. Sketches can be merged,
+    so sketches of separate chunks, files or workers can be combined into
+    one.
+
+    Parameters
+    ----------
+    compression : float, default 200
+        Controls the number of centroids kept, which is about half of
+        ``compression``. Higher values give more accurate quantiles at the
+        cost of a larger sketch.
+
+    See Also
+    --------
+    Series.quantile : Return value at the given quantile.
+    api.accumulators.HyperLogLog : Mergeable sketch of the number of distinct
+        values.
+
+    Notes
+    -----
+    Only numeric data is supported. Missing values are ignored. The minimum
+    and maximum are tracked exactly, and quantiles are exact as long as
+    fewer than about ``compression / 2`` values have been added.
+
+    Examples
+    --------
+    >>> from pandas.api.accumulators import TDigest
+    >>> first = TDigest()
+    >>> first.update(pd.Series([1, 2, 3, 4]))
+    >>> second = TDigest()
+    >>> second.update(pd.Series([5, 6, 7, 8, np.nan]))
+    >>> first.merge(second)
+    >>> first.quantile(0.5)
+    4.5
+    >>> first.quantile([0.25, 0.75])
+    0.25    2.75
+    0.75    6.25
+    dtype: float64
+    """
+
+    def __init__(self, compression: float = tdigest.DEFAULT_COMPRESSION) -> None:
+        tdigest.validate_compression(compression)
+        self.compression = compression
+        self._means = np.zeros(0, dtype=np.float64)
+        self._weights = np.zeros(0, dtype=np.float64)
+        self._min = np.nan
+        self._max = np.nan
+
+    @property
+    def count(self) -> int:
+        """
+        The number of non-missing values added so far.
+        """
+        return round(self._weights.sum())
+
+    def update(self, values) -> None:
+        """
+        Add the values of a chunk to the sketch.
+
+        Parameters
+        ----------
+        values : Series, Index, ExtensionArray or np.ndarray
+            The 1-dimensional numeric chunk to add.
+        """
+        values = algorithms._ensure_arraylike(values, func_name="update")
+        values = extract_array(values, extract_numpy=True, extract_range=True)
+        values = tdigest.to_float(values, method="TDigest")
+        ids = np.zeros(len(values), dtype=np.intp)
+        means, weights, _, mins, maxs = tdigest.group_sketch(
+            values, ids, 1, self.compression
+        )
+        self._combine(means, weights, mins[0], maxs[0])
+
+    def merge(self, other: TDigest) -> None:
+        """
+        Add all values of another sketch to this sketch.
+
+        Parameters
+        ----------
+        other : TDigest
+            A sketch, possibly with a different compression.
+        """
+        if not isinstance(other, TDigest):
+            raise TypeError(
+                f"Can only merge TDigest sketches, got {type(other).__name__}"
+            )
+        self._combine(other._means, other._weights, other._min, other._max)
+
+    def _combine(
+        self,
+        means: npt.NDArray[np.float64],
+        weights: npt.NDArray[np.float64],
+        min_value: float,
+        max_value: float,
+    ) -> None:
+        means = np.concatenate([self._means, means])
+        weights = np.concatenate([self._weights, weights])
+        ids = np.zeros(len(means), dtype=np.intp)
+        self._means, self._weights, _ = tdigest.compress(
+            means, weights, ids, 1, self.compression
+        )
+        self._min = np.fmin(self._min, min_value)
+        self._max = np.fmax(self._max, max_value)
+
+    def quantile(self, q=0.5):
+        """
+        Return the estimated value at the given quantile.
+
+        Parameters
+        ----------
+        q : float or array-like, default 0.5 (50% quantile)
+            The quantile(s) to compute, which can lie in range: 0 <= q <= 1.
+
+        Returns
+        -------
+        float or Series
+            If ``q`` is an array, a Series will be returned where the
+            index is ``q`` and the values are the quantiles, otherwise
+            a float will be returned. The result is NaN if no values have
+            been added.
+        """
+        from pandas import (
+            Index,
+            Series,
+        )
+
+        validate_percentile(q)
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        ids = np.zeros(len(self._means), dtype=np.intp)
+        result = tdigest.group_quantile(
+            self._means,
+            self._weights,
+            ids,
+            np.array([self._min]),
+            np.array([self._max]),
+            qs,
+        )[0]
+        if is_list_like(q):
+            return Series(result, index=Index(qs, dtype=np.float64))
+        return float(result[0])
+
+
+@set_module("pandas.api.accumulators")
+class StreamingResampler:
+    """
+    Resample a time series that is only available in chunks.
+
+    The resampler aggregates every chunk passed to :meth:`update` into bins
+    like :meth:`DataFrame.resample`, but only returns the bins that are
+    complete, i.e. those ending before the last timestamp seen so far. The
+    rows of the last, still open bin are kept and combined with the next
+    chunk, so memory is bounded by the size of a chunk plus the rows of a
+    single bin, instead of the whole series.
+
+    Parameters
+    ----------
+    rule : DateOffset, Timedelta or str
+        The offset string or object representing target conversion.
+    func : function, str, list or dict
+        Function to use for aggregating the data of every bin, as accepted
+        by :meth:`.Resampler.aggregate`.
+    on : str, optional
+        For a DataFrame, column to use instead of index for resampling.
+        Column must be datetime-like.
+    closed : {'right', 'left'}, default None
+        Which side of bin interval is closed. The default is 'left'
+        for all frequency offsets except for 'ME', 'YE', 'QE', 'BME',
+        'BA', 'BQE', and 'W' which all have a default of 'right'.
+    label : {'right', 'left'}, default None
+        Which bin edge label to label bucket with. The default is 'left'
+        for all frequency offsets except for 'ME', 'YE', 'QE', 'BME',
+        'BA', 'BQE', and 'W' which all have a default of 'right'.
+    origin : Timestamp or str, default 'start_day'
+        The timestamp on which to adjust the grouping, see
+        :meth:`DataFrame.resample`. 'start' and 'start_day' refer to the
+        first timestamp of the first chunk. 'end' and 'end_day' are not
+        supported, because the end of the series is unknown.
+    offset : Timedelta or str, default is None
+        An offset timedelta added to the origin.
+
+    See Also
+    --------
+    DataFrame.resample : Resample time-series data.
+    api.accumulators.ValueCounter : Count unique values over chunked data.
+
+    Notes
+    -----
+    Chunks must be sorted by time, and every chunk must start at or after
+    the last timestamp of the previous chunk. Rows with a missing timestamp
+    are dropped, like in :meth:`DataFrame.resample`.
+
+    Examples
+    --------
+    >>> from pandas.api.accumulators import StreamingResampler
+    >>> index = pd.date_range("2020-01-01", periods=6, freq="20s")
+    >>> ser = pd.Series(range(6), index=index)
+    >>> resampler = StreamingResampler("1min", "sum")
+    >>> resampler.update(ser.iloc[:4])
+    2020-01-01    3
+    Freq: min, dtype: int64
+    >>> resampler.update(ser.iloc[4:])
+    Series([], Freq: min, dtype: int64)
+    >>> resampler.flush()
+    2020-01-01 00:01:00    12
+    Freq: min, dtype: int64
+    """
+
+    def __init__(
+        self,
+        rule: Frequency,
+        func: AggFuncType,
+        *,
+        on: Hashable | None = None,
+        closed: Literal["left", "right"] | None = None,
+        label: Literal["left", "right"] | None = None,
+        origin: Literal["epoch", "start", "start_day"]
+        | TimestampConvertibleTypes = "start_day",
+        offset: TimedeltaConvertibleTypes | None = None,
+    ) -> None:
+        from pandas.core.resample import TimeGrouper
+
+        if isinstance(origin, str) and origin in ("end", "end_day"):
+            raise ValueError(
+                f"origin='{origin}' is not supported by StreamingResampler, "
+                "because the end of the series is unknown"
+            )
+        # validates the arguments and resolves the defaults of closed and label
+        grouper = TimeGrouper(
+            freq=rule, closed=closed, label=label, origin=origin, offset=offset
+        )
+        self.freq = grouper.freq
+        self.func = func
+        self.on = on
+        self.closed = grouper.closed
+        self.label = grouper.label
+        self.origin = grouper.origin
+        self.offset = grouper.offset
+        self._reset()
+
+    def _reset(self) -> None:
+        # the rows of the last bin, which may still receive rows
+        self._pending: NDFrameT | None = None
+        self._last: Timestamp | None = None
+        # the origin only applies to Tick-like frequencies, which has been
+        #  warned about when creating the TimeGrouper
+        self._origin = self.origin if isinstance(self.freq, Tick) else "start_day"
+
+    def _resample(self, obj: NDFrameT):
+        return obj.resample(
+            self.freq,
+            on=self.on,
+            closed=self.closed,
+            label=self.label,
+            origin=self._origin,
+            offset=self.offset,
+        )
+
+    def update(self, chunk: NDFrameT) -> NDFrameT:
+        """
+        Add a chunk and return the bins that are complete.
+
+        Parameters
+        ----------
+        chunk : Series or DataFrame
+            The next rows of the series, with a DatetimeIndex or, if ``on``
+            is given, a datetime-like column.
+
+        Returns
+        -------
+        Series or DataFrame
+            The aggregated bins that end before the last timestamp of
+            ``chunk``, in the format of ``Resampler.aggregate(func)``. These
+            bins are not returned again.
+        """
+        from pandas import Index
+
+        times = chunk.index if self.on is None else Index(chunk[self.on])
+        if not (
+            lib.is_np_dtype(times.dtype, "M")
+            or isinstance(times.dtype, DatetimeTZDtype)
+        ):
+            raise TypeError(
+                "StreamingResampler only supports datetime64 data, got "
+                f"{'column' if self.on is not None else 'index'} of dtype "
+                f"{times.dtype}"
+            )
+        valid = notna(times)
+        if not valid.all():
+            # resample drops rows with a missing timestamp
+            chunk = chunk[valid]
+            times = times[valid]
+        if len(times):
+            if not times.is_monotonic_increasing or (
+                self._last is not None and times[0] < self._last
+            ):
+                raise ValueError("Chunks passed to update must be sorted by time")
+            self._last = times[-1]
+            if self._pending is None:
+                self._fix_origin(Timestamp(times[0]))
+
+        if self._pending is None:
+            data = chunk
+        else:
+            from pandas import concat
+
+            data = concat([self._pending, chunk])
+        resampler = self._resample(data)
+        result = resampler.aggregate(self.func)
+        if not len(data):
+            return result
+
+        # bins are complete once a later timestamp has been seen, so the bin
+        #  holding the last timestamp is kept back together with its rows
+        bins = resampler._grouper.bins
+        last = bins.searchsorted(len(data))
+        first = self._num_leading_bins(bins)
+        self._pending = data.iloc[bins[last - 1] if last else 0 :].copy()
+        return result.iloc[first:last]
+
+    def _num_leading_bins(self, bins: npt.NDArray[np.int64]) -> int:
+        """
+        Return the number of empty bins before the first pending row.
+
+        These bins have been returned before, unless no rows are pending yet.
+        """
+        if self._pending is None:
+            return 0
+        return int(bins.searchsorted(0, side="right"))
+
+    def _fix_origin(self, first: Timestamp) -> None:
+        """
+        Replace an origin relative to the first timestamp by a fixed origin.
+
+        Every chunk is resampled separately, so the bins of all chunks must
+        be aligned to the first timestamp of the series, not of the chunk.
+        """
+        if isinstance(self.freq, Tick) and self.origin == "start":
+            self._origin = first
+        elif isinstance(self.freq, Tick) and self.origin == "start_day":
+            self._origin = first.normalize()
+
+    def flush(self) -> NDFrameT | None:
+        """
+        Return the bins that are still open and reset the resampler.
+
+        Call this once the last chunk has been passed to :meth:`update`.
+
+        Returns
+        -------
+        Series or DataFrame or None
+            The aggregated bins of the rows that have not been returned by
+            :meth:`update`, or None if no rows are pending.
+        """
+        if self._pending is None:
+            return None
+        resampler = self._resample(self._pending)
+        result = resampler.aggregate(self.func)
+        result = result.iloc[self._num_leading_bins(resampler._grouper.bins) :]
+        self._reset()
+        return result
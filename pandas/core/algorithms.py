@@ -78,6 +78,11 @@ from pandas.core.construction import (
     extract_array,
 )
 from pandas.core.indexers import validate_indices
+from pandas.core.util.threads import (
+    chunk_slices,
+    get_num_threads,
+    map_threaded,
+)
 
 if TYPE_CHECKING:
     from pandas._typing import (
@@ -311,6 +316,136 @@ def _check_object_for_strings(values: np.ndarray) -> str:
     return ndtype
 
 
+# ------------------------ #
+# threaded hashtable algos #
+# ------------------------ #
+
+# Inputs shorter than this are always hashed on the calling thread, and no
+#  chunk handed to a worker thread is shorter than this either.
+_MINIMUM_PARALLEL_HASH_LEN = 1_000_000
+
+
+def _get_num_hash_chunks(values: np.ndarray, hashtable: type[htable.HashTable]) -> int:
+    """
+    Determine how many chunks to split ``values`` into for threaded hashing.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values as returned by ``_get_hashtable_algo``.
+    hashtable : HashTable subclass
+        The hashtable class that will be used for ``values``.
+
+    Returns
+    -------
+    int
+        1 if the values should be hashed on the calling thread.
+    """
+    if hashtable is htable.PyObjectHashTable:
+        # hashing arbitrary python objects holds the GIL throughout
+        return 1
+    return get_num_threads(len(values), _MINIMUM_PARALLEL_HASH_LEN)
+
+
+def _unique_parallel(
+    hashtable: type[htable.HashTable], values: np.ndarray, num_chunks: int
+) -> np.ndarray:
+    """
+    Threaded equivalent of ``hashtable(len(values)).unique(values)``.
+
+    Every chunk is reduced to its uniques on a worker thread. Concatenating
+    these in chunk order and taking the uniques once more keeps every value
+    at its first position in ``values``.
+    """
+
+    def _unique_chunk(slc: slice) -> np.ndarray:
+        chunk = values[slc]
+        return hashtable(len(chunk)).unique(chunk)
+
+    slices = chunk_slices(len(values), num_chunks)
+    chunk_uniques = np.concatenate(map_threaded(_unique_chunk, slices))
+    return hashtable(len(chunk_uniques)).unique(chunk_uniques)
+
+
+def _factorize_parallel(
+    hashtable: type[htable.HashTable],
+    values: np.ndarray,
+    num_chunks: int,
+    na_value: object = None,
+    mask: npt.NDArray[np.bool_] | None = None,
+    ignore_na: bool = True,
+) -> tuple[np.ndarray, npt.NDArray[np.intp]]:
+    """
+    Threaded equivalent of ``hashtable(len(values)).factorize(values, ...)``.
+
+    Every chunk is factorized on a worker thread. The per-chunk uniques are
+    then factorized once more (in chunk order, which preserves the order of
+    first appearance) and the chunk codes are remapped onto the merged uniques.
+    """
+
+    def _factorize_chunk(slc: slice) -> tuple[np.ndarray, np.ndarray]:
+        chunk = values[slc]
+        return hashtable(len(chunk)).factorize(
+            chunk,
+            na_sentinel=-1,
+            na_value=na_value,
+            mask=None if mask is None else mask[slc],
+            ignore_na=ignore_na,
+        )
+
+    slices = chunk_slices(len(values), num_chunks)
+    results = map_threaded(_factorize_chunk, slices)
+    chunk_uniques = [res[0] for res in results]
+    uniques, merged_codes = hashtable(sum(map(len, chunk_uniques))).factorize(
+        np.concatenate(chunk_uniques), na_sentinel=-1, ignore_na=False
+    )
+
+    offsets = np.cumsum([0] + [len(chunk) for chunk in chunk_uniques])
+    codes = np.empty(len(values), dtype=np.intp)
+
+    def _remap_chunk(slc: slice, chunk_codes: np.ndarray, start: int, stop: int):
+        # a trailing -1 makes the na_sentinel in the chunk codes map to itself
+        remap = np.append(merged_codes[start:stop], -1)
+        np.take(remap, chunk_codes, out=codes[slc])
+
+    map_threaded(
+        _remap_chunk, slices, [res[1] for res in results], offsets[:-1], offsets[1:]
+    )
+    return uniques, codes
+
+
+def _value_counts_parallel(
+    hashtable: type[htable.HashTable],
+    values: np.ndarray,
+    num_chunks: int,
+    dropna: bool,
+) -> tuple[np.ndarray, npt.NDArray[np.int64]]:
+    """
+    Threaded equivalent of ``htable.value_count(values, dropna)``.
+
+    Returns the unique values in order of appearance and their counts.
+    """
+
+    def _count_chunk(slc: slice) -> tuple[np.ndarray, np.ndarray]:
+        chunk = values[slc]
+        uniques, codes = hashtable(len(chunk)).factorize(
+            chunk, na_sentinel=-1, ignore_na=dropna
+        )
+        # shift by one so that dropped missing values land in the first bin
+        counts = np.bincount(codes + 1, minlength=len(uniques) + 1)[1:]
+        return uniques, counts
+
+    results = map_threaded(_count_chunk, chunk_slices(len(values), num_chunks))
+    chunk_uniques = np.concatenate([res[0] for res in results])
+    chunk_counts = np.concatenate([res[1] for res in results])
+    keys, merged_codes = hashtable(len(chunk_uniques)).factorize(
+        chunk_uniques, na_sentinel=-1, ignore_na=False
+    )
+    counts = np.zeros(len(keys), dtype=np.int64)
+    np.add.at(counts, merged_codes, chunk_counts)
+    return keys, counts
+
+
 # --------------- #
 # top-level algos #
 # --------------- #
@@ -469,13 +604,17 @@ def unique_with_mask(values, mask: npt.NDArray[np.bool_] | None = None):
     original = values
     hashtable, values = _get_hashtable_algo(values)
 
-    table = hashtable(len(values))
     if mask is None:
-        uniques = table.unique(values)
+        num_chunks = _get_num_hash_chunks(values, hashtable)
+        if num_chunks > 1:
+            uniques = _unique_parallel(hashtable, values, num_chunks)
+        else:
+            uniques = hashtable(len(values)).unique(values)
         uniques = _reconstruct_data(uniques, original.dtype, original)
         return uniques
 
     else:
+        table = hashtable(len(values))
         uniques, mask = table.unique(values, mask=mask)
         uniques = _reconstruct_data(uniques, original.dtype, original)
         assert mask is not None  # for mypy
@@ -631,14 +770,25 @@ def factorize_array(
 
     hash_klass, values = _get_hashtable_algo(values)
 
-    table = hash_klass(size_hint or len(values))
-    uniques, codes = table.factorize(
-        values,
-        na_sentinel=-1,
-        na_value=na_value,
-        mask=mask,
-        ignore_na=use_na_sentinel,
-    )
+    num_chunks = _get_num_hash_chunks(values, hash_klass)
+    if num_chunks > 1:
+        uniques, codes = _factorize_parallel(
+            hash_klass,
+            values,
+            num_chunks,
+            na_value=na_value,
+            mask=mask,
+            ignore_na=use_na_sentinel,
+        )
+    else:
+        table = hash_klass(size_hint or len(values))
+        uniques, codes = table.factorize(
+            values,
+            na_sentinel=-1,
+            na_value=na_value,
+            mask=mask,
+            ignore_na=use_na_sentinel,
+        )
 
     # re-cast e.g. i8->dt64/td64, uint8->bool
     uniques = _reconstruct_data(uniques, original.dtype, original)
@@ -949,7 +1099,16 @@ def value_counts_arraylike(
     original = values
     values = _ensure_data(values)
 
-    keys, counts, na_counter = htable.value_count(values, dropna, mask=mask)
+    num_chunks = 1
+    if mask is None:
+        hashtable = _hashtables[_check_object_for_strings(values)]
+        num_chunks = _get_num_hash_chunks(values, hashtable)
+
+    if num_chunks > 1:
+        keys, counts = _value_counts_parallel(hashtable, values, num_chunks, dropna)
+        na_counter = 0
+    else:
+        keys, counts, na_counter = htable.value_count(values, dropna, mask=mask)
 
     if needs_i8_conversion(original.dtype):
         # datetime, timedelta, or period
@@ -0,0 +1,196 @@
+"""
+HyperLogLog sketches for approximate distinct counts.
+
+The sketches are built from the 64-bit hashes produced by
+:func:`pandas.util.hash_array`. The first ``precision`` bits of a hash select
+one of ``2 ** precision`` registers, and every register keeps the maximum
+position of the leading one bit in the remaining bits. The relative standard
+error of the estimate is about ``1.04 / sqrt(2 ** precision)``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas.core.dtypes.common import is_integer
+from pandas.core.dtypes.missing import isna
+
+from pandas.core.util.hashing import hash_array
+
+if TYPE_CHECKING:
+    from pandas._typing import (
+        ArrayLike,
+        npt,
+    )
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+
+def validate_precision(precision: int) -> None:
+    """
+    Raise if ``precision`` is not a supported number of register index bits.
+    """
+    if not is_integer(precision) or not MIN_PRECISION <= precision <= MAX_PRECISION:
+        raise ValueError(
+            f"precision must be an integer between {MIN_PRECISION} and "
+            f"{MAX_PRECISION}, got {precision}"
+        )
+
+
+def hash_values(
+    values: ArrayLike,
+) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.bool_]]:
+    """
+    Hash ``values`` for sketching.
+
+    Returns
+    -------
+    hashes : np.ndarray[uint64]
+    mask : np.ndarray[bool]
+        True where ``values`` is missing. The hashes of missing values are
+        zero and should be excluded from the sketch.
+    """
+    if values.dtype.kind in "fc":
+        # -0.0 == 0.0, like the hashtables used by nunique, so they must hash
+        #  the same; adding zero turns -0.0 into 0.0
+        values = values + values.dtype.type(0)
+    mask = np.asarray(isna(values))
+    # categorize=False as factorizing first is the hashtable pass we avoid
+    hashes = hash_array(values, categorize=False)
+    # NaN with different payloads are all missing
+    hashes[mask] = 0
+    return hashes, mask
+
+
+def _bit_length(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.int64]:
+    # float64 represents 32-bit integers exactly, so frexp gives the exact
+    #  bit length of either half
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, np.frexp(high)[1] + 32, np.frexp(low)[1])
+
+
+def _registers_and_ranks(
+    hashes: npt.NDArray[np.uint64], precision: int
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.uint8]]:
+    """
+    Split hashes into their register index and the rank stored in the register.
+    """
+    nbits = 64 - precision
+    registers = (hashes >> np.uint64(nbits)).astype(np.intp)
+    remainder = hashes & np.uint64((1 << nbits) - 1)
+    ranks = (nbits + 1 - _bit_length(remainder)).astype(np.uint8)
+    return registers, ranks
+
+
+def _estimate(
+    inverse_sum: np.ndarray, zeros: np.ndarray, num_registers: int
+) -> np.ndarray:
+    """
+    HyperLogLog estimate with linear counting for small cardinalities.
+
+    Parameters
+    ----------
+    inverse_sum : np.ndarray[float64]
+        Sum of ``2 ** -register`` over all registers of every sketch.
+    zeros : np.ndarray[int64]
+        Number of empty registers of every sketch.
+    num_registers : int
+    """
+    alpha = 0.7213 / (1 + 1.079 / num_registers)
+    raw = alpha * num_registers**2 / inverse_sum
+    with np.errstate(divide="ignore"):
+        linear = num_registers * np.log(num_registers / zeros)
+    return np.where((raw <= 2.5 * num_registers) & (zeros > 0), linear, raw)
+
+
+def sketch(hashes: npt.NDArray[np.uint64], precision: int) -> npt.NDArray[np.uint8]:
+    """
+    Build the registers of a sketch of ``hashes``.
+
+    Sketches of the same precision are merged with ``np.maximum``.
+    """
+    out = np.zeros(1 << precision, dtype=np.uint8)
+    registers, ranks = _registers_and_ranks(hashes, precision)
+    np.maximum.at(out, registers, ranks)
+    return out
+
+
+def estimate(registers: npt.NDArray[np.uint8]) -> float:
+    """
+    Estimate the number of distinct values from the registers of a sketch.
+    """
+    inverse_sum = np.ldexp(1.0, -registers.astype(np.int64)).sum()
+    zeros = np.count_nonzero(registers == 0)
+    return float(_estimate(inverse_sum, zeros, len(registers)))
+
+
+def group_estimate(
+    hashes: npt.NDArray[np.uint64],
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    precision: int,
+) -> npt.NDArray[np.float64]:
+    """
+    Estimate the number of distinct hashes within each group.
+
+    Only the registers that are hit are materialized, so memory use is linear
+    in ``len(hashes)`` rather than in ``ngroups * 2 ** precision``.
+
+    Parameters
+    ----------
+    hashes : np.ndarray[uint64]
+    ids : np.ndarray[intp]
+        Group label of every hash, all in ``range(ngroups)``.
+    ngroups : int
+    precision : int
+
+    Returns
+    -------
+    np.ndarray[float64]
+    """
+    num_registers = 1 << precision
+    registers, ranks = _registers_and_ranks(hashes, precision)
+    keys = ids.astype(np.int64) * num_registers + registers
+
+    # keep the maximum rank of every (group, register) pair
+    order = np.lexsort((ranks, keys))
+    keys, ranks = keys[order], ranks[order]
+    last = np.append(keys[1:] != keys[:-1], True)
+    keys, ranks = keys[last], ranks[last]
+
+    groups = keys // num_registers
+    weights = np.ldexp(1.0, -ranks.astype(np.int64))
+    inverse_sum = np.bincount(groups, weights=weights, minlength=ngroups)
+    zeros = num_registers - np.bincount(groups, minlength=ngroups)
+    # every empty register contributes 2 ** 0
+    inverse_sum += zeros
+    return _estimate(inverse_sum, zeros, num_registers)
+
+
+def approx_nunique(values: ArrayLike, dropna: bool, precision: int) -> int:
+    """
+    Approximate number of distinct values in ``values``.
+
+    Parameters
+    ----------
+    values : np.ndarray or ExtensionArray
+    dropna : bool
+        Don't include missing values in the count.
+    precision : int
+        Number of bits of the hash used to select a register.
+
+    Returns
+    -------
+    int
+    """
+    validate_precision(precision)
+    hashes, mask = hash_values(values)
+    result = round(estimate(sketch(hashes[~mask], precision)))
+    if not dropna and mask.any():
+        # all missing values count as a single distinct value, exactly
+        result += 1
+    return result
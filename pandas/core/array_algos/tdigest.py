@@ -0,0 +1,321 @@
+"""
+t-digest sketches for approximate quantiles.
+
+A t-digest summarizes a distribution by a sorted list of centroids, i.e. the
+mean and weight of a run of neighbouring values. Centroids close to the
+median cover many values, while those in the tails cover only a few, so
+extreme quantiles remain accurate. The size of a sketch is bounded by
+``compression``, independent of the number of values added, and sketches
+are merged by compressing the union of their centroids.
+
+Every function here handles many groups at once: centroids carry the label
+of the group they belong to and are kept sorted by ``(group, mean)``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas.core.dtypes.common import (
+    is_bool_dtype,
+    is_number,
+    is_numeric_dtype,
+)
+
+from pandas.core.sorting import get_group_index_sorter
+
+if TYPE_CHECKING:
+    from pandas._typing import (
+        ArrayLike,
+        npt,
+    )
+
+DEFAULT_COMPRESSION = 200
+
+# the number of values sorted together when building a sketch
+_BUFFER_SIZE = 4096
+
+
+def validate_compression(compression: float) -> None:
+    """
+    Raise if ``compression`` is not a positive number.
+    """
+    if not is_number(compression) or not compression > 0:
+        raise ValueError(f"compression must be a positive number, got {compression}")
+
+
+def to_float(values: ArrayLike, method: str) -> npt.NDArray[np.float64]:
+    """
+    Convert numeric ``values`` to float64, with NaN for missing values.
+    """
+    if not (is_numeric_dtype(values.dtype) or is_bool_dtype(values.dtype)):
+        raise TypeError(
+            f"{method} only supports numeric data, got dtype {values.dtype}"
+        )
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def compress(
+    means: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    compression: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.intp]]:
+    """
+    Merge neighbouring centroids of every group.
+
+    A single value is a centroid of weight one, so this also builds sketches
+    from raw values.
+
+    Parameters
+    ----------
+    means : np.ndarray[float64]
+        Centroid means, without missing values.
+    weights : np.ndarray[float64]
+    ids : np.ndarray[intp]
+        Group label of every centroid, all in ``range(ngroups)``.
+    ngroups : int
+    compression : float
+
+    Returns
+    -------
+    means, weights, ids
+        The merged centroids, sorted by ``(ids, means)``.
+    """
+    order = np.lexsort((means, ids))
+    return _compress_sorted(
+        means[order], weights[order], ids[order], ngroups, compression
+    )
+
+
+def _compress_sorted(
+    means: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    compression: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.intp]]:
+    if not len(means):
+        return means, weights, ids
+
+    totals = np.bincount(ids, weights=weights, minlength=ngroups)
+    before = np.cumsum(totals) - totals
+    # fraction of the group's weight below the middle of every centroid
+    center = (np.cumsum(weights) - weights / 2 - before[ids]) / totals[ids]
+    # the logarithmic scale function gives buckets that shrink towards both
+    #  tails, keeping the relative error of extreme quantiles small
+    normalizer = compression / (4 * np.log(np.maximum(totals / compression, 1)) + 24)
+    with np.errstate(divide="ignore"):
+        buckets = np.floor(normalizer[ids] * np.log(center / (1 - center)))
+
+    starts = np.flatnonzero(
+        np.concatenate([[True], (ids[1:] != ids[:-1]) | (buckets[1:] != buckets[:-1])])
+    )
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(weights * means, starts) / merged_weights
+    return merged_means, merged_weights, ids[starts]
+
+
+def group_sketch(
+    values: npt.NDArray[np.float64],
+    ids: npt.NDArray[np.intp],
+    ngroups: int,
+    compression: float = DEFAULT_COMPRESSION,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build a sketch of the values of every group.
+
+    Missing values and values with a negative group label are skipped.
+
+    Like a t-digest is built from a stream, the values of every group are
+    split into buffers of at most ``_BUFFER_SIZE`` values. Only the values
+    within a buffer are sorted and compressed, after which the much fewer
+    centroids of all buffers of a group are merged, so that the values are
+    never sorted as a whole.
+
+    Returns
+    -------
+    means, weights, ids : np.ndarray
+        The centroids, see :func:`compress`.
+    mins, maxs : np.ndarray[float64]
+        The exact extremes of every group, NaN for empty groups.
+    """
+    valid = ~np.isnan(values) & (ids >= 0)
+    if not valid.all():
+        values, ids = values[valid], ids[valid]
+    counts = np.bincount(ids, minlength=ngroups)
+    mins = np.full(ngroups, np.nan)
+    maxs = np.full(ngroups, np.nan)
+    if not len(values):
+        empty = np.array([], dtype=np.float64)
+        return empty, empty, np.array([], dtype=np.intp), mins, maxs
+
+    # lay out the buffers as the rows of a table, padded with inf. Padding
+    #  every group to a whole number of buffers takes at most about the
+    #  memory of the values, even with many small groups.
+    width = int(min(_BUFFER_SIZE, max(2 * len(values) // ngroups, 16)))
+    nbuffers = -(-counts // width)
+    buffer_starts = np.cumsum(nbuffers) - nbuffers
+    table = np.full((nbuffers.sum(), width), np.inf)
+    if ngroups == 1:
+        table.ravel()[: len(values)] = values
+    else:
+        # the position of every value in the table, keeping the order of the
+        #  values within a group
+        sorter = get_group_index_sorter(ids, ngroups)
+        offsets = buffer_starts * width - (np.cumsum(counts) - counts)
+        positions = np.repeat(offsets, counts) + np.arange(len(values))
+        table.ravel()[positions] = values[sorter]
+    table.sort(axis=1)
+
+    lengths = np.full(len(table), width)
+    nonempty = np.flatnonzero(counts)
+    last_buffers = buffer_starts[nonempty] + nbuffers[nonempty] - 1
+    lengths[last_buffers] = counts[nonempty] - (nbuffers[nonempty] - 1) * width
+    # the buffers of a group follow each other and are sorted
+    mins[nonempty] = np.minimum.reduceat(table[:, 0], buffer_starts[nonempty])
+    maxs[nonempty] = np.maximum.reduceat(
+        table[np.arange(len(table)), lengths - 1], buffer_starts[nonempty]
+    )
+
+    values = table[np.arange(width) < lengths[:, np.newaxis]]
+    means, weights, buffer_ids = _compress_runs(values, lengths, compression)
+    ids = np.repeat(np.arange(ngroups), nbuffers)[buffer_ids]
+    # only groups with several buffers need their centroids merged
+    merge = nbuffers[ids] > 1
+    if merge.any():
+        merged = compress(
+            means[merge], weights[merge], ids[merge], ngroups, compression
+        )
+        means, weights, ids = (
+            np.concatenate([arr[~merge], merged_arr])
+            for arr, merged_arr in zip((means, weights, ids), merged, strict=True)
+        )
+        order = get_group_index_sorter(ids, ngroups)
+        means, weights, ids = means[order], weights[order], ids[order]
+    return means, weights, ids, mins, maxs
+
+
+def _compress_runs(
+    values: npt.NDArray[np.float64],
+    lengths: npt.NDArray[np.intp],
+    compression: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compress consecutive sorted runs of values of weight one.
+
+    Runs of at most ``compression`` values are kept as they are, with every
+    value its own centroid. Longer runs give the same centroids as
+    :func:`_compress_sorted` with a group per run: as all weights are one,
+    the first value of every bucket of the scale function follows from the
+    length of the run, so the buckets are found without computing the
+    bucket of every value.
+
+    Returns
+    -------
+    means, weights : np.ndarray[float64]
+    runs : np.ndarray[intp]
+        The run of every centroid.
+    """
+    value_runs = np.repeat(np.arange(len(lengths)), lengths)
+    run_starts = np.cumsum(lengths) - lengths
+    is_start = np.zeros(len(values), dtype=bool)
+    short = lengths <= compression
+    if short.any():
+        is_start[short[value_runs]] = True
+        lengths, run_starts = lengths[~short], run_starts[~short]
+
+    totals = lengths.astype(np.float64)
+    normalizer = compression / (4 * np.log(np.maximum(totals / compression, 1)) + 24)
+    # the buckets of the centers of the first and last value, see _compress_sorted
+    first = np.floor(normalizer * np.log(0.5 / (totals - 0.5)))
+    last = np.floor(normalizer * np.log((totals - 0.5) / 0.5))
+    nbuckets = (last - first + 1).astype(np.intp)
+    runs = np.repeat(np.arange(len(lengths)), nbuckets)
+    buckets = (
+        first[runs] + np.arange(len(runs)) - (np.cumsum(nbuckets) - nbuckets)[runs]
+    )
+
+    # the first value whose center is at least the lower bound of its bucket,
+    #  buckets without values share it with the next bucket
+    fractions = 1 / (1 + np.exp(-buckets / normalizer[runs]))
+    starts = np.ceil(totals[runs] * fractions - 0.5).astype(np.intp)
+    starts[buckets == first[runs]] = 0
+    is_start[starts + run_starts[runs]] = True
+
+    starts = np.flatnonzero(is_start)
+    weights = np.diff(np.append(starts, len(values))).astype(np.float64)
+    means = np.add.reduceat(values, starts) / weights
+    return means, weights, value_runs[starts]
+
+
+def group_quantile(
+    means: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    ids: npt.NDArray[np.intp],
+    mins: npt.NDArray[np.float64],
+    maxs: npt.NDArray[np.float64],
+    qs: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Estimate the quantiles ``qs`` of every group of a sketch.
+
+    The estimate interpolates linearly between the centers of neighbouring
+    centroids, like ``interpolation="linear"`` does between neighbouring
+    values, so it is exact as long as no values have been merged.
+
+    Returns
+    -------
+    np.ndarray[float64]
+        Of shape ``(ngroups, len(qs))``, with NaN for empty groups.
+    """
+    ngroups = len(mins)
+    totals = np.bincount(ids, weights=weights, minlength=ngroups)
+    # lay out the groups one after another on a single axis, leaving a gap
+    #  between them, so that one call to np.interp handles all of them
+    offsets = np.cumsum(totals + 1) - (totals + 1)
+    centers = np.cumsum(weights) - weights / 2
+    centers -= (np.cumsum(totals) - totals)[ids]
+
+    nonempty = np.flatnonzero(totals > 0)
+    if not len(nonempty):
+        return np.full((ngroups, len(qs)), np.nan)
+    # the centroids are sorted, so surrounding those of every group by its
+    #  extremes keeps the points sorted
+    counts = np.bincount(ids, minlength=ngroups)
+    slots = counts + 2 * (counts > 0)
+    slot_starts = np.cumsum(slots) - slots
+    positions = np.arange(len(ids)) + np.repeat(
+        slot_starts + 1 - (np.cumsum(counts) - counts), counts
+    )
+    first, last = slot_starts[nonempty], slot_starts[nonempty] + slots[nonempty] - 1
+    xs = np.empty(slots.sum())
+    ys = np.empty(slots.sum())
+    xs[first], ys[first] = 0.5, mins[nonempty]
+    xs[last], ys[last] = totals[nonempty] - 0.5, maxs[nonempty]
+    xs[positions], ys[positions] = centers, means
+    xs += np.repeat(offsets, slots)
+
+    ranks = qs[np.newaxis, :] * (totals[:, np.newaxis] - 1) + 0.5
+    ranks += offsets[:, np.newaxis]
+    result = np.interp(ranks.ravel(), xs, ys).reshape(ranks.shape)
+    result[totals == 0] = np.nan
+    return result
+
+
+def quantile(
+    values: npt.NDArray[np.float64],
+    qs: npt.NDArray[np.float64],
+    compression: float = DEFAULT_COMPRESSION,
+) -> npt.NDArray[np.float64]:
+    """
+    Approximate quantiles ``qs`` of ``values``, ignoring missing values.
+    """
+    ids = np.zeros(len(values), dtype=np.intp)
+    sketch = group_sketch(values, ids, 1, compression)
+    return group_quantile(*sketch, qs)[0]
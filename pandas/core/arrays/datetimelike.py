@@ -132,6 +132,7 @@ from pandas.core.arrays.arrow.array import ArrowExtensionArray
 from pandas.core.arrays.base import ExtensionArray
 from pandas.core.arrays.integer import IntegerArray
 import pandas.core.common as com
+from pandas.core.computation import expressions
 from pandas.core.construction import (
     array as pd_array,
     ensure_wrapped_if_datetimelike,
@@ -836,7 +837,7 @@ class DatetimeLikeArrayMixin(OpsMixin, NDArrayBackedExtensionArray):
         """
         return if each value is nan
         """
-        return self.asi8 == iNaT
+        return expressions.evaluate(operator.eq, self.asi8, iNaT)
 
     @property  # NB: override with cache_readonly in immutable subclasses
     def _hasna(self) -> bool:
@@ -1030,10 +1031,12 @@ class DatetimeLikeArrayMixin(OpsMixin, NDArrayBackedExtensionArray):
 
         other_vals = self._unbox(other)
         # GH#37462 comparison on i8 values is almost 2x faster than M8/m8
-        result = op(self._ndarray.view("i8"), other_vals.view("i8"))
+        result = expressions.evaluate(
+            op, self._ndarray.view("i8"), other_vals.view("i8")
+        )
 
         o_mask = isna(other)
-        mask = self._isnan | o_mask
+        mask = expressions.evaluate(operator.or_, self._isnan, o_mask)
         if mask.any():
             nat_result = op is operator.ne
             np.putmask(result, mask, nat_result)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -38,6 +39,7 @@ from pandas.core.dtypes.common import (
     is_bool,
     is_integer_dtype,
     is_list_like,
+    is_number,
     is_scalar,
     is_string_dtype,
     pandas_dtype,
@@ -76,6 +78,7 @@ from pandas.core.array_algos.transforms import shift
 from pandas.core.arraylike import OpsMixin
 from pandas.core.arrays._utils import to_numpy_dtype_inference
 from pandas.core.arrays.base import ExtensionArray
+from pandas.core.computation import expressions
 from pandas.core.construction import (
     array as pd_array,
     ensure_wrapped_if_datetimelike,
@@ -821,9 +824,9 @@ class BaseMaskedArray(OpsMixin, ExtensionArray):
                 # GH#45421 don't alter inplace
                 mask = mask | True
             elif is_list_like(other) and len(other) == len(mask):
-                mask = mask | isna(other)
+                mask = expressions.evaluate(operator.or_, mask, isna(other))
         else:
-            mask = self._mask | mask
+            mask = expressions.evaluate(operator.or_, self._mask, mask)
         return mask
 
     def _arith_method(self, other, op):
@@ -964,8 +967,14 @@ class BaseMaskedArray(OpsMixin, ExtensionArray):
                 # behavior today, so that should be fine to ignore.
                 warnings.filterwarnings("ignore", "elementwise", FutureWarning)
                 warnings.filterwarnings("ignore", "elementwise", DeprecationWarning)
-                method = getattr(self._data, f"__{op.__name__}__")
-                result = method(other)
+                if (
+                    isinstance(other, np.ndarray) and other.dtype.kind in "iufb"
+                ) or is_number(other):
+                    # multithreaded with numexpr for large arrays
+                    result = expressions.evaluate(op, self._data, other)
+                else:
+                    method = getattr(self._data, f"__{op.__name__}__")
+                    result = method(other)
 
                 if result is NotImplemented:
                     result = invalid_comparison(self._data, other, op)
@@ -54,6 +54,7 @@ from pandas.core import (
     ops,
 )
 from pandas.core.accessor import DirNamesMixin
+from pandas.core.array_algos import hyperloglog
 from pandas.core.arraylike import OpsMixin
 from pandas.core.arrays import ExtensionArray
 from pandas.core.construction import (
@@ -1186,7 +1187,9 @@ class IndexOpsMixin(OpsMixin):
         return result
 
     @final
-    def nunique(self, dropna: bool = True) -> int:
+    def nunique(
+        self, dropna: bool = True, approx: bool = False, precision: int = 14
+    ) -> int:
         """
         Return number of unique elements in the object.
 
@@ -1196,6 +1199,19 @@ class IndexOpsMixin(OpsMixin):
         ----------
         dropna : bool, default True
             Don't include NaN in the count.
+        approx : bool, default False
+            Estimate the count with a HyperLogLog sketch of the hashed values
+            instead of collecting the unique values in a hashtable. This uses
+            constant memory, at the cost of a relative standard error of about
+            ``1.04 / sqrt(2 ** precision)``.
+
+            .. versionadded:: 3.1.0
+        precision : int, default 14
+            Number of hash bits used to select one of the ``2 ** precision``
+            registers of the sketch, between 4 and 18. Only used when
+            ``approx=True``.
+
+            .. versionadded:: 3.1.0
 
         Returns
         -------
@@ -1206,6 +1222,8 @@ class IndexOpsMixin(OpsMixin):
         --------
         DataFrame.nunique: Method nunique for DataFrame.
         Series.count: Count non-NA/null observations in the Series.
+        api.accumulators.HyperLogLog : Mergeable sketch for approximate
+            distinct counts over chunked data.
 
         Examples
         --------
@@ -1220,7 +1238,12 @@ class IndexOpsMixin(OpsMixin):
 
         >>> s.nunique()
         4
+
+        >>> pd.Series(range(100_000)).nunique(approx=True)
+        99781
         """
+        if approx:
+            return hyperloglog.approx_nunique(self._values, dropna, precision)
         uniqs = self.unique()
         if dropna:
             uniqs = remove_na_arraylike(uniqs)
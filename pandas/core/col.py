@@ -4,13 +4,28 @@ from collections.abc import (
     Callable,
     Hashable,
 )
+import operator
 from typing import (
     TYPE_CHECKING,
     Any,
 )
 
+import numpy as np
+
+from pandas._config import get_option
+
+from pandas._libs import lib
+from pandas._libs.missing import is_matching_na
 from pandas.util._decorators import set_module
 
+from pandas.core.dtypes.generic import ABCSeries
+
+from pandas.core.computation import expressions
+from pandas.core.computation.check import NUMEXPR_INSTALLED
+
+if NUMEXPR_INSTALLED:
+    import numexpr as ne
+
 if TYPE_CHECKING:
     from pandas import (
         DataFrame,
@@ -88,13 +103,20 @@ class Expression:
         func: Callable[[DataFrame], Any],
         repr_str: str,
         needs_parenthese: bool = False,
+        op: str | None = None,
+        operands: tuple[Any, ...] = (),
     ) -> None:
         self._func = func
         self._repr_str = repr_str
         self._needs_parentheses = needs_parenthese
+        # The operator and operands the expression is built from, used by
+        # ExpressionEvaluator to fuse and deduplicate the expression tree.
+        # Expressions without an operator are evaluated with ``func``.
+        self._op = op
+        self._operands = operands
 
     def _eval_expression(self, df: DataFrame) -> Any:
-        return self._func(df)
+        return ExpressionEvaluator(df).evaluate(self)
 
     def _with_op(
         self, op: str, other: Any, repr_str: str, needs_parentheses: bool = True
@@ -106,12 +128,16 @@ class Expression:
                 ),
                 repr_str,
                 needs_parenthese=needs_parentheses,
+                op=op,
+                operands=(self, other),
             )
         else:
             return Expression(
                 lambda df: getattr(self._eval_expression(df), op)(other),
                 repr_str,
                 needs_parenthese=needs_parentheses,
+                op=op,
+                operands=(self, other),
             )
 
     def _maybe_wrap_parentheses(self, other: Any) -> tuple[str, str]:
@@ -228,6 +254,8 @@ class Expression:
             lambda df: ~self._eval_expression(df),
             f"~{self._repr_str}",
             needs_parenthese=True,
+            op="__invert__",
+            operands=(self,),
         )
 
     def __neg__(self) -> Expression:
@@ -239,6 +267,8 @@ class Expression:
             lambda df: -self._eval_expression(df),
             repr_str,
             needs_parenthese=True,
+            op="__neg__",
+            operands=(self,),
         )
 
     def __pos__(self) -> Expression:
@@ -250,6 +280,8 @@ class Expression:
             lambda df: +self._eval_expression(df),
             repr_str,
             needs_parenthese=True,
+            op="__pos__",
+            operands=(self,),
         )
 
     def __abs__(self) -> Expression:
@@ -257,6 +289,8 @@ class Expression:
             lambda df: abs(self._eval_expression(df)),
             f"abs({self._repr_str})",
             needs_parenthese=True,
+            op="__abs__",
+            operands=(self,),
         )
 
     def __array_ufunc__(
@@ -270,7 +304,7 @@ class Expression:
         args_str = _pretty_print_args_kwargs(*inputs, **kwargs)
         repr_str = f"{ufunc.__name__}({args_str})"
 
-        return Expression(func, repr_str)
+        return Expression(func, repr_str, operands=(*inputs, *kwargs.values()))
 
     def __getitem__(self, item: Any) -> Expression:
         return self._with_op(
@@ -285,7 +319,7 @@ class Expression:
         args_str = _pretty_print_args_kwargs(**kwargs)
         repr_str = func.__name__ + "(" + args_str + ")"
 
-        return Expression(wrapped, repr_str)
+        return Expression(wrapped, repr_str, operands=tuple(kwargs.values()))
 
     def __call__(self, *args: Any, **kwargs: Any) -> Expression:
         def func(df: DataFrame, *args: Any, **kwargs: Any) -> Any:
@@ -295,19 +329,269 @@ class Expression:
 
         args_str = _pretty_print_args_kwargs(*args, **kwargs)
         repr_str = f"{self._repr_str}({args_str})"
-        return Expression(lambda df: func(df, *args, **kwargs), repr_str)
+        return Expression(
+            lambda df: func(df, *args, **kwargs),
+            repr_str,
+            operands=(self, *args, *kwargs.values()),
+        )
 
     def __getattr__(self, name: str, /) -> Any:
         repr_str = f"{self!r}"
         if self._needs_parentheses:
             repr_str = f"({repr_str})"
         repr_str += f".{name}"
-        return Expression(lambda df: getattr(self._eval_expression(df), name), repr_str)
+        return Expression(
+            lambda df: getattr(self._eval_expression(df), name),
+            repr_str,
+            operands=(self,),
+        )
 
     def __repr__(self) -> str:
         return self._repr_str or "Expr(...)"
 
 
+_UNARY_OPS = {
+    "__neg__": operator.neg,
+    "__pos__": operator.pos,
+    "__invert__": operator.invert,
+    "__abs__": operator.abs,
+}
+
+# Operators which can be fused into a single numexpr or numba kernel, mapped
+# to whether they take booleans and whether they return booleans.
+_FUSED_BINARY_OPS: dict[str, tuple[bool, bool]] = {}
+for _op, _symbol in _OP_SYMBOLS.items():
+    if _symbol in ("&", "|"):
+        _FUSED_BINARY_OPS[_op] = (True, True)
+    elif _symbol in ("<", "<=", ">", ">=", "==", "!="):
+        _FUSED_BINARY_OPS[_op] = (False, True)
+    elif _symbol in ("+", "-", "*", "/"):
+        _FUSED_BINARY_OPS[_op] = (False, False)
+# numexpr's abs returns float64 for integers, so __abs__ is not fused
+_FUSED_UNARY_OPS = {"__neg__": "-", "__pos__": "+", "__invert__": "~"}
+_FUSED_DTYPES = {"int64", "float64", "bool"}
+
+# the minimum number of rows for which we fuse expressions, for smaller
+# frames the overhead of eval is larger than the saved temporaries
+_MIN_FUSED_ROWS = 10_000
+
+
+class _FusionError(Exception):
+    pass
+
+
+class _Fused:
+    """
+    Source of a lowered expression.
+
+    ``n_ops`` is the number of fused operators, ``name`` the name the result
+    gets when evaluated node-wise, ``lib.no_default`` for scalars.
+    """
+
+    def __init__(self, source: str, is_bool: bool, name: Any, n_ops: int = 0) -> None:
+        self.source = source
+        self.is_bool = is_bool
+        self.name = name
+        self.n_ops = n_ops
+
+
+def _result_name(left: Any, right: Any) -> Any:
+    if left is lib.no_default:
+        return right
+    elif right is lib.no_default:
+        return left
+    elif left == right or is_matching_na(left, right):
+        return left
+    return None
+
+
+class ExpressionEvaluator:
+    """
+    Evaluate Expressions against a DataFrame.
+
+    Arithmetic, comparison and logical operators on int64, float64 and bool
+    columns are fused into a single ``eval`` call with the numexpr (or numba,
+    if ``compute.use_numba`` is set) engine, so no intermediate Series is
+    created. Other operators are evaluated node-wise. Results are cached by
+    the structure of the expression, so repeated subexpressions, also across
+    the expressions of one :meth:`DataFrame.assign` call, are only evaluated
+    once.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The DataFrame to evaluate expressions against.
+    """
+
+    def __init__(self, df: DataFrame) -> None:
+        self.df = df
+        # key -> (result, referenced columns or None if unknown)
+        self._cache: dict[Hashable, tuple[Any, frozenset | None]] = {}
+        self._keys: dict[int, Hashable] = {}
+
+    def evaluate(self, expr: Expression) -> Any:
+        """
+        Evaluate an Expression, reusing cached results of its subexpressions.
+        """
+        key = self._key(expr)
+        if key in self._cache:
+            return self._cache[key][0]
+
+        result = self._evaluate_fused(expr)
+        if result is None:
+            result = self._evaluate_node(expr)
+        self._cache[key] = (result, _referenced_columns(expr))
+        return result
+
+    def invalidate(self, column: Hashable) -> None:
+        """
+        Drop cached results which depend on a column that was set.
+        """
+        self._cache = {
+            key: (result, columns)
+            for key, (result, columns) in self._cache.items()
+            if columns is not None and column not in columns
+        }
+
+    def _key(self, expr: Expression) -> Hashable:
+        if id(expr) not in self._keys:
+            if expr._op is None:
+                key: Hashable = ("id", id(expr))
+            else:
+                key = (expr._op, *(self._operand_key(x) for x in expr._operands))
+            self._keys[id(expr)] = key
+        return self._keys[id(expr)]
+
+    def _operand_key(self, operand: Any) -> Hashable:
+        if isinstance(operand, Expression):
+            return self._key(operand)
+        if lib.is_float(operand) or lib.is_complex(operand):
+            # equal floats may still give different results, e.g. 0.0 and -0.0
+            return (type(operand), np.asarray(operand).tobytes())
+        if operand is None or isinstance(operand, (str, bytes, int, np.integer)):
+            return (type(operand), operand)
+        # other values may compare equal and still behave differently, e.g.
+        #  Timestamps in different time zones. The operand is kept alive by the
+        #  expression holding it.
+        return ("id", id(operand))
+
+    def _evaluate_node(self, expr: Expression) -> Any:
+        op = expr._op
+        if op in _OP_SYMBOLS or op == "__getitem__":
+            left, right = expr._operands
+            if isinstance(right, Expression):
+                right = self.evaluate(right)
+            return getattr(self.evaluate(left), op)(right)
+        elif op in _UNARY_OPS:
+            return _UNARY_OPS[op](self.evaluate(expr._operands[0]))
+        return expr._func(self.df)
+
+    def _evaluate_fused(self, expr: Expression) -> Any:
+        if expr._op not in _FUSED_BINARY_OPS and expr._op not in _FUSED_UNARY_OPS:
+            return None
+        if len(self.df) < _MIN_FUSED_ROWS:
+            return None
+        if get_option("compute.use_numba"):
+            engine = "numba"
+        elif expressions.USE_NUMEXPR:
+            engine = "numexpr"
+        else:
+            return None
+
+        local_dict: dict[str, Any] = {}
+        try:
+            fused = self._lower(expr, local_dict)
+        except _FusionError:
+            return None
+        if fused.n_ops < 2:
+            # a single operator already uses numexpr for large inputs
+            return None
+
+        if engine == "numba":
+            from pandas.core.computation.eval import eval as _eval
+
+            result = _eval(
+                fused.source, engine="numba", local_dict=local_dict, global_dict={}
+            )
+            return result.rename(fused.name)
+
+        values = ne.evaluate(
+            fused.source,
+            local_dict={
+                name: value.to_numpy() if isinstance(value, ABCSeries) else value
+                for name, value in local_dict.items()
+            },
+            casting="safe",
+        )
+        return self.df._constructor_sliced(
+            values, index=self.df.index, name=fused.name, copy=False
+        )
+
+    def _lower(self, expr: Any, local_dict: dict[str, Any]) -> _Fused:
+        if isinstance(expr, Expression):
+            op = expr._op
+            if self._key(expr) not in self._cache:
+                if op in _FUSED_BINARY_OPS:
+                    return self._lower_binary(expr, local_dict)
+                elif op in _FUSED_UNARY_OPS:
+                    return self._lower_unary(expr, local_dict)
+            value = self.evaluate(expr)
+        else:
+            value = expr
+
+        name = f"_x{len(local_dict)}"
+        if isinstance(value, ABCSeries):
+            if value.dtype.name not in _FUSED_DTYPES or not value.index.is_(
+                self.df.index
+            ):
+                raise _FusionError
+            local_dict[name] = value
+            return _Fused(name, value.dtype.kind == "b", value.name)
+        elif (lib.is_integer(value) and -(2**63) <= value < 2**63) or lib.is_float(
+            value
+        ):
+            local_dict[name] = value
+            return _Fused(name, False, lib.no_default)
+        raise _FusionError
+
+    def _lower_binary(self, expr: Expression, local_dict: dict[str, Any]) -> _Fused:
+        takes_bool, returns_bool = _FUSED_BINARY_OPS[expr._op]
+        left, right = (self._lower(x, local_dict) for x in expr._operands)
+        if left.is_bool is not takes_bool or right.is_bool is not takes_bool:
+            raise _FusionError
+        if expr._op.startswith("__r"):
+            left, right = right, left
+        return _Fused(
+            f"({left.source} {_OP_SYMBOLS[expr._op]} {right.source})",
+            returns_bool,
+            _result_name(left.name, right.name),
+            left.n_ops + right.n_ops + 1,
+        )
+
+    def _lower_unary(self, expr: Expression, local_dict: dict[str, Any]) -> _Fused:
+        operand = self._lower(expr._operands[0], local_dict)
+        if operand.is_bool is not (expr._op == "__invert__"):
+            raise _FusionError
+        source = f"({_FUSED_UNARY_OPS[expr._op]}{operand.source})"
+        return _Fused(source, operand.is_bool, operand.name, operand.n_ops + 1)
+
+
+def _referenced_columns(expr: Expression) -> frozenset | None:
+    # the columns an expression depends on, None if unknown
+    if expr._op == "col":
+        return frozenset(expr._operands)
+    elif expr._op is None and not expr._operands:
+        return None
+    columns: frozenset = frozenset()
+    for operand in expr._operands:
+        if isinstance(operand, Expression):
+            operand_columns = _referenced_columns(operand)
+            if operand_columns is None:
+                return None
+            columns |= operand_columns
+    return columns
+
+
 @set_module("pandas")
 def col(col_name: Hashable) -> Expression:
     """
@@ -368,7 +652,7 @@ def col(col_name: Hashable) -> Expression:
             raise ValueError(msg)
         return df[col_name]
 
-    return Expression(func, f"col({col_name!r})")
+    return Expression(func, f"col({col_name!r})", op="col", operands=(col_name,))
 
 
 __all__ = ["Expression", "col"]
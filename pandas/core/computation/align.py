@@ -123,14 +123,18 @@ def _align_core(terms):
                 transpose = isinstance(ti, ABCSeries) and naxes > 1
                 reindexer = axes[naxes - 1] if transpose else items
 
+                if ti.axes[axis].is_(reindexer):
+                    # already aligned, e.g. all columns of the same frame
+                    continue
+
                 term_axis_size = len(ti.axes[axis])
                 reindexer_size = len(reindexer)
 
                 ordm = np.log10(max(1, abs(reindexer_size - term_axis_size)))
                 if (
-                    get_option("performance_warnings")
-                    and ordm >= 1
+                    ordm >= 1
                     and reindexer_size >= 10000
+                    and get_option("performance_warnings")
                 ):
                     w = (
                         f"Alignment difference on axis {axis} is larger "
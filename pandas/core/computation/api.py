@@ -1,2 +1,5 @@
-__all__ = ["eval"]
-from pandas.core.computation.eval import eval
+__all__ = ["compile_expr", "eval"]
+from pandas.core.computation.eval import (
+    compile_expr,
+    eval,
+)
@@ -5,10 +5,15 @@ Engine classes for :func:`~pandas.eval`
 from __future__ import annotations
 
 import abc
+from io import StringIO
+import tokenize
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from pandas.errors import NumExprClobberingError
 
+from pandas.core.base import PandasObject
 from pandas.core.computation.align import (
     align_terms,
     reconstruct_object,
@@ -16,6 +21,7 @@ from pandas.core.computation.align import (
 from pandas.core.computation.ops import (
     MATHOPS,
     REDUCTIONS,
+    is_term,
 )
 
 from pandas.io.formats import printing
@@ -23,7 +29,9 @@ from pandas.io.formats import printing
 if TYPE_CHECKING:
     from pandas.core.computation.expr import Expr
 
-_ne_builtins = frozenset(MATHOPS + REDUCTIONS)
+# where() is only added to eval as a function, variables named "where" are
+# still allowed and passed to numexpr under another name
+_ne_builtins = frozenset(MATHOPS + REDUCTIONS) - {"where"}
 
 
 def _check_ne_builtin_clash(expr: Expr) -> None:
@@ -112,6 +120,22 @@ class AbstractEngine(metaclass=abc.ABCMeta):
         """
 
 
+def _rename_variable(source: str, name: str, new_name: str) -> str:
+    """
+    Rename a variable in an expression, but not calls of a function by the
+    same name.
+    """
+    tokens = list(tokenize.generate_tokens(StringIO(source).readline))
+    for i, tok in enumerate(tokens):
+        if (
+            tok.type == tokenize.NAME
+            and tok.string == name
+            and tokens[i + 1].string != "("
+        ):
+            tokens[i] = tok._replace(string=new_name)
+    return tokenize.untokenize((tok.type, tok.string) for tok in tokens)
+
+
 class NumExprEngine(AbstractEngine):
     """NumExpr engine class"""
 
@@ -126,6 +150,13 @@ class NumExprEngine(AbstractEngine):
         env = self.expr.env
         scope = env.full_scope
         _check_ne_builtin_clash(self.expr)
+        if "where" in self.expr.names:
+            # numexpr reads any name "where" as its function
+            new_name = "_where"
+            while new_name in scope:
+                new_name = f"_{new_name}"
+            s = _rename_variable(s, "where", new_name)
+            scope = {**scope, new_name: scope["where"]}
         return ne.evaluate(s, local_dict=scope)
 
 
@@ -145,7 +176,47 @@ class PythonEngine(AbstractEngine):
         pass
 
 
+class NumbaEngine(AbstractEngine):
+    """
+    Evaluate an expression in a single fused loop compiled with numba.
+
+    Unlike chained operations, no temporary array is created for the
+    intermediate results, and masked arrays and datetime comparisons are
+    supported.
+    """
+
+    has_neg_frac = False
+
+    def evaluate(self):
+        terms = self.expr.terms
+        if is_term(terms) or terms.is_scalar:
+            # nothing to fuse
+            return self.expr()
+
+        self.result_type, self.aligned_axes, self.result_name = align_terms(terms)
+        res = self._evaluate()
+        if isinstance(res, np.ndarray):
+            return reconstruct_object(
+                self.result_type, res, self.aligned_axes, res.dtype, self.result_name
+            )
+
+        # masked result
+        typ = self.result_type
+        if isinstance(typ, type) and issubclass(typ, PandasObject):
+            kwargs = dict(self.aligned_axes or {})
+            if self.result_name is not None:
+                kwargs["name"] = self.result_name
+            return typ(res, **kwargs)
+        return res
+
+    def _evaluate(self):
+        from pandas.core.computation.numba_ import FusedExpression
+
+        return FusedExpression(self.expr.terms).evaluate()
+
+
 ENGINES: dict[str, type[AbstractEngine]] = {
     "numexpr": NumExprEngine,
     "python": PythonEngine,
+    "numba": NumbaEngine,
 }
@@ -11,6 +11,7 @@ from typing import (
 )
 import warnings
 
+from pandas.compat._optional import import_optional_dependency
 from pandas.util._decorators import set_module
 from pandas.util._exceptions import find_stack_level
 from pandas.util._validators import validate_bool_kwarg
@@ -24,6 +25,7 @@ from pandas.core.computation.engines import ENGINES
 from pandas.core.computation.expr import (
     PARSERS,
     Expr,
+    parse_expr,
 )
 from pandas.core.computation.parsing import tokenize_string
 from pandas.core.computation.scope import ensure_scope
@@ -32,6 +34,8 @@ from pandas.core.generic import NDFrame
 from pandas.io.formats.printing import pprint_thing
 
 if TYPE_CHECKING:
+    import ast
+
     from pandas.core.computation.ops import BinOp
 
 
@@ -49,7 +53,7 @@ def _check_engine(engine: str | None) -> str:
     KeyError
       * If an invalid engine is passed.
     ImportError
-      * If numexpr was requested but doesn't exist.
+      * If numexpr or numba was requested but doesn't exist.
 
     Returns
     -------
@@ -76,6 +80,8 @@ def _check_engine(engine: str | None) -> str:
             "'numexpr' is not installed or an unsupported version. Cannot use "
             "engine='numexpr' for query/eval if 'numexpr' is not installed"
         )
+    if engine == "numba":
+        import_optional_dependency("numba")
 
     return engine
 
@@ -175,9 +181,92 @@ def _check_for_locals(expr: str, stack_level: int, parser: str) -> None:
                 raise SyntaxError(msg)
 
 
+@set_module("pandas.api.typing")
+class CompiledExpression:
+    """
+    An expression parsed once for repeated evaluation.
+
+    Objects of this class are created by :func:`compile_expr` and can be
+    passed in place of an expression string to :func:`eval`,
+    :meth:`DataFrame.eval` and :meth:`DataFrame.query`. Names and ``@``
+    variables are still resolved at evaluation time, so the same compiled
+    expression can be evaluated against different frames and values.
+
+    See Also
+    --------
+    compile_expr : Parse an expression for repeated evaluation.
+    eval : Evaluate a Python expression as a string using various backends.
+    """
+
+    def __init__(self, expr: str, parser: str = "pandas") -> None:
+        if not isinstance(expr, str):
+            raise TypeError(f"expr must be a string to be compiled, {type(expr)} given")
+        _check_expression(expr)
+        _check_parser(parser)
+        self.expr = expr
+        self.parser = parser
+        lines = [e.strip() for e in expr.splitlines() if e.strip() != ""]
+        self._trees: list[tuple[str, ast.Module]] = [
+            (line, parse_expr(line, parser)) for line in lines
+        ]
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.expr!r}, parser={self.parser!r})"
+
+
+@set_module("pandas")
+def compile_expr(expr: str, parser: str = "pandas") -> CompiledExpression:
+    """
+    Parse an expression once for repeated evaluation.
+
+    Parsing the expression string is a large part of the cost of evaluating
+    a small expression. The returned object can be passed instead of the
+    string to :func:`eval`, :meth:`DataFrame.eval` and
+    :meth:`DataFrame.query`, which then skip the parsing step.
+
+    Parameters
+    ----------
+    expr : str
+        The expression to parse, with the same syntax as accepted by
+        :func:`eval`.
+    parser : {'pandas', 'python'}, default 'pandas'
+        The parser to use to construct the syntax tree from the expression.
+
+    Returns
+    -------
+    CompiledExpression
+        The parsed expression.
+
+    Raises
+    ------
+    SyntaxError
+        If the expression is not valid.
+
+    See Also
+    --------
+    eval : Evaluate a Python expression as a string using various backends.
+    DataFrame.query : Query the columns of a DataFrame with a boolean expression.
+
+    Examples
+    --------
+    >>> expr = pd.compile_expr("a > @threshold and b < 3")
+    >>> df = pd.DataFrame({"a": [1, 2, 3], "b": [1, 2, 5]})
+    >>> threshold = 1
+    >>> df.query(expr)
+       a  b
+    1  2  2
+    >>> threshold = 0
+    >>> df.query(expr)
+       a  b
+    0  1  1
+    1  2  2
+    """
+    return CompiledExpression(expr, parser=parser)
+
+
 @set_module("pandas")
 def eval(
-    expr: str | BinOp,  # we leave BinOp out of the docstr bc it isn't for users
+    expr: str | CompiledExpression | BinOp,  # BinOp is not for users
     parser: str = "pandas",
     engine: str | None = None,
     local_dict=None,
@@ -197,7 +286,7 @@ def eval(
 
     Parameters
     ----------
-    expr : str
+    expr : str or CompiledExpression
         The expression to evaluate. This string cannot contain any Python
         `statements
         <https://docs.python.org/3/reference/simple_stmts.html#simple-statements>`__,
@@ -219,6 +308,7 @@ def eval(
         - Absolute Value ``abs``
         - Square root ``sqrt``
         - Exponential ``exp`` and Exponential minus one ``expm1``
+        - Conditional ``where(condition, x, y)``
 
         See the numexpr engine `documentation
         <https://numexpr.readthedocs.io/en/latest/user_guide.html#supported-functions>`__
@@ -231,14 +321,19 @@ def eval(
         Additionally, the ``'pandas'`` parser allows the use of :keyword:`and`,
         :keyword:`or`, and :keyword:`not` with the same semantics as the
         corresponding bitwise operators.
+
+        An expression parsed once with :func:`compile_expr` can be passed
+        to skip parsing when the same expression is evaluated repeatedly.
     parser : {'pandas', 'python'}, default 'pandas'
         The parser to use to construct the syntax tree from the expression. The
         default of ``'pandas'`` parses code slightly different than standard
         Python. Alternatively, you can parse an expression using the
         ``'python'`` parser to retain strict Python semantics.  See the
         :ref:`enhancing performance <enhancingperf.eval>` documentation for
-        more details.
-    engine : {'python', 'numexpr'}, optional, default None
+        more details. Ignored if ``expr`` is a
+        :class:`~pandas.api.typing.CompiledExpression`,
+        which was parsed with its own parser.
+    engine : {'python', 'numexpr', 'numba'}, optional, default None
 
         The engine used to evaluate the expression. Supported engines are
 
@@ -248,6 +343,11 @@ def eval(
           expressions with large frames.
         - ``'python'`` : Performs operations as if you had ``eval``'d in top
           level python. This engine is generally not that useful.
+        - ``'numba'`` : Compiles the expression into a single parallel loop
+          with numba, without temporary arrays for intermediate results.
+          Also supports nullable (masked) arrays and datetime comparisons.
+
+          .. versionadded:: 3.1.0
 
         More backends may be available in the future.
     local_dict : dict or None, optional
@@ -306,6 +406,7 @@ def eval(
             of a frame.
     DataFrame.eval : Evaluate a string describing operations on
             DataFrame columns.
+    compile_expr : Parse an expression once for repeated evaluation.
 
     Notes
     -----
@@ -332,8 +433,11 @@ def eval(
     """
     inplace = validate_bool_kwarg(inplace, "inplace")
 
-    exprs: list[str | BinOp]
-    if isinstance(expr, str):
+    exprs: list[str | BinOp] | list[tuple[str, ast.Module]]
+    if isinstance(expr, CompiledExpression):
+        parser = expr.parser
+        exprs = expr._trees
+    elif isinstance(expr, str):
         _check_expression(expr)
         exprs = [e.strip() for e in expr.splitlines() if e.strip() != ""]
     else:
@@ -355,7 +459,10 @@ def eval(
     target_modified = False
 
     for expr in exprs:
-        expr = _convert_expression(expr)
+        if isinstance(expr, tuple):
+            expr, tree = expr
+        else:
+            expr = tree = _convert_expression(expr)
         _check_for_locals(expr, level, parser)
 
         # get our (possibly passed-in) scope
@@ -367,7 +474,7 @@ def eval(
             target=target,
         )
 
-        parsed_expr = Expr(expr, engine=engine, parser=parser, env=env)
+        parsed_expr = Expr(tree, engine=engine, parser=parser, env=env)
 
         if engine == "numexpr" and (
             (
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import ast
 from functools import (
+    lru_cache,
     partial,
     reduce,
 )
@@ -174,6 +175,24 @@ def _preparse(
     )
 
 
+@lru_cache(maxsize=256)
+def _parse(source: str, preparser: Callable[[str], str]) -> ast.Module:
+    """
+    Preparse and parse an expression into an abstract syntax tree.
+
+    The trees don't depend on the data the expression is evaluated on and
+    are never modified by the visitors, so they are cached for expressions
+    that are evaluated repeatedly.
+    """
+    clean = preparser(source)
+    try:
+        return ast.fix_missing_locations(ast.parse(clean))
+    except SyntaxError as e:
+        if any(iskeyword(x) for x in clean.split()):
+            e.msg = "Python keyword not valid identifier in numexpr query"
+        raise e
+
+
 def _is_type(t):
     """
     Factory for a type checking function of type ``t`` or tuple of types.
@@ -407,13 +426,7 @@ class BaseExprVisitor(ast.NodeVisitor):
 
     def visit(self, node, **kwargs):
         if isinstance(node, str):
-            clean = self.preparser(node)
-            try:
-                node = ast.fix_missing_locations(ast.parse(clean))
-            except SyntaxError as e:
-                if any(iskeyword(x) for x in clean.split()):
-                    e.msg = "Python keyword not valid identifier in numexpr query"
-                raise e
+            node = _parse(node, self.preparser)
 
         method = f"visit_{type(node).__name__}"
         visitor = getattr(self, method)
@@ -519,8 +532,9 @@ class BaseExprVisitor(ast.NodeVisitor):
             or getattr(rhs, "is_datetime", False)
         ):
             # all date ops must be done in python bc numexpr doesn't work
-            # well with NaT
-            return self._maybe_eval(res, self.binary_ops)
+            # well with NaT, the numba engine handles NaT in comparisons
+            if not (self.engine == "numba" and res.op in CMP_OPS_SYMS):
+                return self._maybe_eval(res, self.binary_ops)
 
         if res.op in eval_in_python:
             # "in"/"not in" ops are always evaluated in python
@@ -792,7 +806,8 @@ class Expr:
 
     Parameters
     ----------
-    expr : str
+    expr : str or ast.Module
+        The expression source or its already parsed syntax tree.
     engine : str, optional, default 'numexpr'
     parser : str, optional, default 'pandas'
     env : Scope, optional, default None
@@ -848,3 +863,11 @@ class Expr:
 
 
 PARSERS = {"python": PythonExprVisitor, "pandas": PandasExprVisitor}
+
+
+def parse_expr(expr: str, parser: str = "pandas") -> ast.Module:
+    """
+    Parse a single line expression with the preparser of ``parser``.
+    """
+    visitor = PARSERS[parser](None, None, parser)
+    return _parse(expr, visitor.preparser)
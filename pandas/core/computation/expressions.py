@@ -115,6 +115,10 @@ def _evaluate_numexpr(op, op_str, left_op, right_op):
             # numexpr raises eg for array ** array with integers
             # (https://github.com/pydata/numexpr/issues/379)
             pass
+        except ValueError:
+            # numexpr raises for Python integers out of the int64 bounds,
+            #  which numpy compares and casts to object
+            pass
         except NotImplementedError:
             if _bool_arith_fallback(op_str, left_op, right_op):
                 pass
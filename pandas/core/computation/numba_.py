@@ -0,0 +1,336 @@
+"""Fused numba kernels for eval with engine='numba'"""
+
+from __future__ import annotations
+
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+import numpy as np
+
+from pandas._libs.tslibs import (
+    NaT,
+    Timestamp,
+    iNaT,
+)
+from pandas.compat._optional import import_optional_dependency
+
+from pandas.core.dtypes.dtypes import BaseMaskedDtype
+
+from pandas.core.arrays import (
+    BaseMaskedArray,
+    DatetimeArray,
+)
+import pandas.core.common as com
+from pandas.core.computation.ops import (
+    CMP_OPS_SYMS,
+    BinOp,
+    MathCall,
+    Term,
+    UnaryOp,
+    _binary_ops_dict,
+    _unary_ops_dict,
+)
+from pandas.core.construction import extract_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_UNIT_ORDER = {"s": 0, "ms": 1, "us": 2, "ns": 3}
+
+
+class _Node:
+    """
+    Element-wise source of a lowered term or operator.
+
+    ``code`` and ``mask`` are expressions of the loop index ``i``, ``mask``
+    is None if the node can't be missing. ``sample`` is an empty array (or
+    scalar) with the dtype numpy would give the node, ``tz`` is None for
+    non-datetime nodes and otherwise whether the datetimes are tz-aware.
+    """
+
+    def __init__(self, code: str, mask: str | None, sample, tz: bool | None = None):
+        self.code = code
+        self.mask = mask
+        self.sample = sample
+        self.tz = tz
+
+    @property
+    def is_bool(self) -> bool:
+        return np.result_type(self.sample).kind == "b"
+
+
+def _or(*masks: str | None) -> str | None:
+    masks = tuple(mask for mask in masks if mask is not None)
+    if not masks:
+        return None
+    return " or ".join(masks) if len(masks) == 1 else f"({' or '.join(masks)})"
+
+
+class FusedExpression:
+    """
+    Lower an aligned expression tree to a single element-wise expression.
+
+    Parameters
+    ----------
+    terms : Term or Op
+        The aligned terms of a parsed :class:`~pandas.core.computation.expr.Expr`.
+
+    Raises
+    ------
+    NotImplementedError
+        If the expression contains values or operations the fused kernel
+        doesn't support.
+    TypeError
+        If tz-naive and tz-aware datetimes are compared.
+    """
+
+    def __init__(self, terms) -> None:
+        self.arrays: list[np.ndarray] = []
+        self.scalars: list[Any] = []
+        self._names: dict[Any, _Node] = {}
+        self._unit = self._datetime_unit(terms)
+        node = self._lower(terms)
+        self.code = node.code
+        self.mask = node.mask
+        self.dtype = np.result_type(node.sample)
+
+    @property
+    def arg_names(self) -> tuple[str, ...]:
+        arrays = [f"x{i}" for i in range(len(self.arrays))]
+        scalars = [f"s{i}" for i in range(len(self.scalars))]
+        return tuple(arrays + scalars)
+
+    @staticmethod
+    def _datetime_unit(terms) -> str:
+        # compare all datetimes in the finest unit, which is exact
+        units = ["s"]
+        for term in com.flatten(terms):
+            value = term.value
+            if isinstance(value, (Timestamp, DatetimeArray)):
+                units.append(value.unit)
+            elif isinstance(value, np.ndarray) and value.dtype.kind == "M":
+                units.append(np.datetime_data(value.dtype)[0])
+        return max(units, key=lambda unit: _UNIT_ORDER.get(unit, 3))
+
+    def _add_array(self, values: np.ndarray) -> str:
+        self.arrays.append(values)
+        return f"x{len(self.arrays) - 1}[i]"
+
+    def _add_scalar(self, value) -> str:
+        self.scalars.append(value)
+        return f"s{len(self.scalars) - 1}"
+
+    def _lower(self, node) -> _Node:
+        if isinstance(node, Term):
+            key = node.name if isinstance(node.name, str) else id(node)
+            if key not in self._names:
+                self._names[key] = self._lower_term(node.value)
+            return self._names[key]
+        elif isinstance(node, UnaryOp):
+            return self._lower_unary(node)
+        elif isinstance(node, BinOp):
+            return self._lower_binary(node)
+        elif isinstance(node, MathCall):
+            return self._lower_call(node)
+        raise NotImplementedError(
+            f"{type(node).__name__} is not supported with engine='numba'"
+        )
+
+    def _lower_term(self, value) -> _Node:
+        # operands of a single unary operator are not unwrapped by alignment
+        value = extract_array(value, extract_numpy=True)
+        if value is NaT or isinstance(value, (Timestamp, np.datetime64)):
+            value = Timestamp(value)
+            if value is NaT:
+                return _Node(self._add_scalar(iNaT), None, None, tz=False)
+            code = self._add_scalar(value.as_unit(self._unit)._value)
+            return _Node(code, None, None, tz=value.tz is not None)
+        elif isinstance(value, (bool, int, float, complex, np.number, np.bool_)):
+            return _Node(self._add_scalar(value), None, value)
+        elif isinstance(value, DatetimeArray):
+            code = self._add_array(value.as_unit(self._unit).asi8)
+            return _Node(code, None, None, tz=value.tz is not None)
+        elif isinstance(value, BaseMaskedArray):
+            code = self._add_array(value._data)
+            mask = self._add_array(value._mask)
+            return _Node(code, mask, value._data[:0])
+        elif isinstance(value, np.ndarray) and value.dtype.kind == "M":
+            values = value.astype(f"M8[{self._unit}]", copy=False).view("i8")
+            return _Node(self._add_array(values), None, None, tz=False)
+        elif isinstance(value, np.ndarray) and value.dtype.kind in "biufc":
+            return _Node(self._add_array(value), None, value.ravel()[:0])
+        dtype = getattr(value, "dtype", type(value).__name__)
+        raise NotImplementedError(
+            f"values of type {dtype} are not supported with engine='numba'"
+        )
+
+    def _lower_unary(self, node: UnaryOp) -> _Node:
+        operand = self._lower(node.operand)
+        self._check_not_datetime(node, operand)
+        if node.op == "+":
+            code = operand.code
+        elif node.op == "-":
+            code = f"(-{operand.code})"
+        elif operand.is_bool:
+            # ~ of a bool is an int in numba, like in Python
+            code = f"(not {operand.code})"
+        else:
+            code = f"(~{operand.code})"
+        sample = _unary_ops_dict[node.op](operand.sample)
+        return _Node(code, operand.mask, sample)
+
+    def _lower_call(self, node: MathCall) -> _Node:
+        args = [self._lower(arg) for arg in node.operands]
+        for arg in args:
+            self._check_not_datetime(node, arg)
+        if node.op == "where":
+            cond, left, right = args
+            code = f"({left.code} if {cond.code} else {right.code})"
+            mask = _or(cond.mask, _where_mask(cond, left, right))
+        else:
+            func = "abs" if node.op == "abs" else f"np.{node.op}"
+            code = f"{func}({', '.join(arg.code for arg in args)})"
+            mask = _or(*(arg.mask for arg in args))
+        sample = node.func.func(*(arg.sample for arg in args))
+        return _Node(code, mask, sample)
+
+    def _lower_binary(self, node: BinOp) -> _Node:
+        left, right = self._lower(node.lhs), self._lower(node.rhs)
+        op = node.op
+        if left.tz is not None or right.tz is not None:
+            return self._lower_datetime_comparison(node, left, right)
+        if op not in _binary_ops_dict or op in ("in", "not in"):
+            raise NotImplementedError(
+                f"operator {op!r} is not supported with engine='numba'"
+            )
+
+        code = f"({left.code} {op} {right.code})"
+        lm, rm = left.mask, right.mask
+        if lm is None and rm is None:
+            mask = None
+        elif op in ("&", "|") and left.is_bool and right.is_bool:
+            # Kleene logic: True | NA is True and False & NA is False
+            lv, rv = left.code, right.code
+            if op == "|":
+                lv, rv = f"(not {lv})", f"(not {rv})"
+            mask = _or(
+                f"({lm} and {rm})" if lm and rm else None,
+                f"({lm} and {rv})" if lm else None,
+                f"({rm} and {lv})" if rm else None,
+            )
+        elif op == "**":
+            # 1 ** NA and NA ** 0 are 1
+            known = [
+                f"({left.code} == 1{f' and not {lm}' if lm else ''})",
+                f"({right.code} == 0{f' and not {rm}' if rm else ''})",
+            ]
+            mask = f"({_or(lm, rm)} and not ({' or '.join(known)}))"
+        else:
+            mask = _or(lm, rm)
+        sample = _binary_ops_dict[op](left.sample, right.sample)
+        return _Node(code, mask, sample)
+
+    def _lower_datetime_comparison(
+        self, node: BinOp, left: _Node, right: _Node
+    ) -> _Node:
+        if node.op not in CMP_OPS_SYMS or left.tz is None or right.tz is None:
+            raise NotImplementedError(
+                f"operator {node.op!r} on datetimes is not supported with "
+                "engine='numba'"
+            )
+        if left.tz != right.tz:
+            raise TypeError(
+                "Cannot compare tz-naive and tz-aware datetime-like objects."
+            )
+        lv, rv = left.code, right.code
+        if node.op == "!=":
+            code = f"({lv} == {iNaT} or {rv} == {iNaT} or {lv} != {rv})"
+        else:
+            # comparisons with NaT are always False
+            code = f"({lv} != {iNaT} and {rv} != {iNaT} and {lv} {node.op} {rv})"
+        return _Node(code, None, np.empty(0, dtype=bool))
+
+    @staticmethod
+    def _check_not_datetime(node, operand: _Node) -> None:
+        if operand.tz is not None:
+            raise NotImplementedError(
+                f"{node!r} on datetimes is not supported with engine='numba'"
+            )
+
+    def evaluate(self) -> np.ndarray | BaseMaskedArray:
+        """
+        Evaluate the expression with a fused numba kernel.
+        """
+        shape = np.broadcast_shapes(*(arr.shape for arr in self.arrays))
+        arrays = [
+            arr
+            if arr.shape == shape and arr.ndim == 1
+            # a copy if broadcasting or raveling a non-contiguous array
+            else np.broadcast_to(arr, shape).ravel()
+            for arr in self.arrays
+        ]
+        size = int(np.prod(shape))
+        out = np.empty(size, dtype=self.dtype)
+        out_mask = np.empty(size if self.mask is not None else 0, dtype=bool)
+        kernel = generate_numba_eval_func(self.code, self.mask, self.arg_names)
+        kernel(out, out_mask, *arrays, *self.scalars)
+        out = out.reshape(shape)
+        if self.mask is None:
+            return out
+        dtype = BaseMaskedDtype.from_numpy_dtype(out.dtype)
+        return dtype.construct_array_type()(out, out_mask.reshape(shape))
+
+
+def _where_mask(cond: _Node, left: _Node, right: _Node) -> str | None:
+    if left.mask is None and right.mask is None:
+        return None
+    return f"({left.mask or 'False'} if {cond.code} else {right.mask or 'False'})"
+
+
+@functools.cache
+def generate_numba_eval_func(
+    code: str, mask: str | None, arg_names: tuple[str, ...]
+) -> Callable[..., None]:
+    """
+    Generate a numba jitted kernel evaluating an element-wise expression.
+
+    The kernel loops once over all elements in parallel and writes the result
+    of ``code``, and of ``mask`` if given, to the preallocated output arrays,
+    so no temporary arrays are created for the intermediate operations.
+
+    Parameters
+    ----------
+    code : str
+        Expression computing the element ``i`` of the result.
+    mask : str or None
+        Expression computing whether the element ``i`` of the result is
+        missing, or None if the result can't be missing.
+    arg_names : tuple of str
+        Names of the arrays and scalars referred to in ``code`` and ``mask``.
+
+    Returns
+    -------
+    Numba function
+    """
+    if TYPE_CHECKING:
+        import numba
+    else:
+        numba = import_optional_dependency("numba")
+
+    source = [
+        f"def fused_eval(out, out_mask, {', '.join(arg_names)}):",
+        "    for i in numba.prange(len(out)):",
+        f"        out[i] = {code}",
+    ]
+    if mask is not None:
+        source.append(f"        out_mask[i] = {mask}")
+    namespace: dict[str, Any] = {"np": np, "numba": numba}
+    # the source only contains operators, argument names and numpy functions
+    # from MATHOPS, never names or values from the expression
+    exec("\n".join(source), namespace)  # noqa: S102
+    return numba.jit(nopython=True, nogil=True, parallel=True, error_model="numpy")(
+        namespace["fused_eval"]
+    )
@@ -66,8 +66,9 @@ _unary_math_ops = (
     "ceil",
 )
 _binary_math_ops = ("arctan2",)
+_ternary_math_ops = ("where",)
 
-MATHOPS = _unary_math_ops + _binary_math_ops
+MATHOPS = _unary_math_ops + _binary_math_ops + _ternary_math_ops
 
 
 LOCAL_TAG = "__pd_eval_local_"
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 from io import StringIO
 from keyword import iskeyword
 import token
@@ -124,11 +125,23 @@ def clean_column_name(name: Hashable) -> Hashable:
     name : hashable
         Returns the name after tokenizing and cleaning.
     """
+    if isinstance(name, str):
+        # all column names are cleaned on every call to DataFrame.eval
+        return _clean_str_column_name(name)
+    return _clean_column_name(name)
+
+
+@lru_cache(maxsize=4096)
+def _clean_str_column_name(name: str) -> str:
+    return _clean_column_name(name)
+
+
+def _clean_column_name(name: Hashable) -> Hashable:
     try:
         # Escape backticks
-        name = name.replace("`", "``") if isinstance(name, str) else name
+        escaped = name.replace("`", "``") if isinstance(name, str) else name
 
-        tokenized = tokenize_string(f"`{name}`")
+        tokenized = tokenize_string(f"`{escaped}`")
         tokval = next(tokenized)[1]
         return create_valid_python_identifier(tokval)
     except SyntaxError:
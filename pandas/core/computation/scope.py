@@ -5,6 +5,7 @@ Module for scope operations
 from __future__ import annotations
 
 from collections import ChainMap
+from collections.abc import MutableMapping
 import datetime
 import inspect
 from io import StringIO
@@ -12,13 +13,22 @@ import itertools
 import pprint
 import struct
 import sys
-from typing import TypeVar
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+)
 
 import numpy as np
 
 from pandas._libs.tslibs import Timestamp
 from pandas.errors import UndefinedVariableError
 
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterator,
+    )
+
 _KT = TypeVar("_KT")
 _VT = TypeVar("_VT")
 
@@ -52,6 +62,48 @@ class DeepChainMap(ChainMap[_KT, _VT]):
         raise KeyError(key)
 
 
+class LazyResolvers(MutableMapping[_KT, _VT]):
+    """
+    Mapping of resolvers whose values are only created when looked up.
+
+    DataFrame.eval exposes every column and index level by name, but an
+    expression typically refers to a few of them.
+
+    Parameters
+    ----------
+    factories : dict
+        Callables without arguments creating the value of each key.
+    """
+
+    def __init__(self, factories: dict[_KT, Callable[[], _VT]]) -> None:
+        self._factories = factories
+        self._values: dict[_KT, _VT] = {}
+
+    def __getitem__(self, key: _KT) -> _VT:
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = self._factories[key]()
+            return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        self._factories[key] = lambda: value
+        self._values[key] = value
+
+    def __delitem__(self, key: _KT) -> None:
+        del self._factories[key]
+        self._values.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
 def ensure_scope(
     level: int, global_dict=None, local_dict=None, resolvers=(), target=None
 ) -> Scope:
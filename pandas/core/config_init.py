@@ -74,6 +74,17 @@ def use_numba_cb(key: str) -> None:
     numba_.set_use_numba(cf.get_option(key))
 
 
+num_threads_doc = """
+: int
+    The number of threads pandas may use for select operations on large
+    inputs (e.g. hashtable-based ``factorize``, ``unique`` and
+    ``value_counts``, rolling and expanding window aggregations with the
+    cython engine, or ``read_json`` with ``lines=True``). 1 disables the
+    threaded code paths and 0 uses all available cores, the default is 1
+    Valid values: non-negative integers
+"""
+
+
 with cf.config_prefix("compute"):
     cf.register_option(
         "use_bottleneck",
@@ -88,6 +99,7 @@ with cf.config_prefix("compute"):
     cf.register_option(
         "use_numba", False, use_numba_doc, validator=is_bool, cb=use_numba_cb
     )
+    cf.register_option("num_threads", 1, num_threads_doc, validator=is_nonnegative_int)
 #
 # options from the "display" namespace
 
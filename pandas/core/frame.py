@@ -124,6 +124,7 @@ from pandas.core import (
 )
 from pandas.core.accessor import Accessor
 from pandas.core.apply import reconstruct_and_relabel_result
+from pandas.core.array_algos import tdigest
 from pandas.core.array_algos.take import take_2d_multi
 from pandas.core.arraylike import OpsMixin
 from pandas.core.arrays import (
@@ -135,6 +136,10 @@ from pandas.core.arrays import (
 )
 from pandas.core.arrays.sparse import SparseFrameAccessor
 from pandas.core.arrays.string_ import StringDtype
+from pandas.core.col import (
+    Expression,
+    ExpressionEvaluator,
+)
 from pandas.core.construction import (
     ensure_wrapped_if_datetimelike,
     sanitize_array,
@@ -254,6 +259,7 @@ if TYPE_CHECKING:
         npt,
     )
 
+    from pandas.core.computation.eval import CompiledExpression
     from pandas.core.groupby.generic import DataFrameGroupBy
     from pandas.core.interchange.dataframe_protocol import DataFrame as DataFrameXchg
     from pandas.core.internals.managers import SingleBlockManager
@@ -4804,10 +4810,10 @@ class DataFrame(NDFrame, OpsMixin):
     @overload
     def query(
         self,
-        expr: str,
+        expr: str | CompiledExpression,
         *,
         parser: Literal["pandas", "python"] = ...,
-        engine: Literal["python", "numexpr"] | None = ...,
+        engine: Literal["python", "numexpr", "numba"] | None = ...,
         local_dict: dict[str, Any] | None = ...,
         global_dict: dict[str, Any] | None = ...,
         resolvers: list[Mapping] | None = ...,
@@ -4818,10 +4824,10 @@ class DataFrame(NDFrame, OpsMixin):
     @overload
     def query(
         self,
-        expr: str,
+        expr: str | CompiledExpression,
         *,
         parser: Literal["pandas", "python"] = ...,
-        engine: Literal["python", "numexpr"] | None = ...,
+        engine: Literal["python", "numexpr", "numba"] | None = ...,
         local_dict: dict[str, Any] | None = ...,
         global_dict: dict[str, Any] | None = ...,
         resolvers: list[Mapping] | None = ...,
@@ -4832,10 +4838,10 @@ class DataFrame(NDFrame, OpsMixin):
     @overload
     def query(
         self,
-        expr: str,
+        expr: str | CompiledExpression,
         *,
         parser: Literal["pandas", "python"] = ...,
-        engine: Literal["python", "numexpr"] | None = ...,
+        engine: Literal["python", "numexpr", "numba"] | None = ...,
         local_dict: dict[str, Any] | None = ...,
         global_dict: dict[str, Any] | None = ...,
         resolvers: list[Mapping] | None = ...,
@@ -4845,10 +4851,10 @@ class DataFrame(NDFrame, OpsMixin):
 
     def query(
         self,
-        expr: str,
+        expr: str | CompiledExpression,
         *,
         parser: Literal["pandas", "python"] = "pandas",
-        engine: Literal["python", "numexpr"] | None = None,
+        engine: Literal["python", "numexpr", "numba"] | None = None,
         local_dict: dict[str, Any] | None = None,
         global_dict: dict[str, Any] | None = None,
         resolvers: list[Mapping] | None = None,
@@ -4865,8 +4871,9 @@ class DataFrame(NDFrame, OpsMixin):
 
         Parameters
         ----------
-        expr : str
-            The query string to evaluate.
+        expr : str or CompiledExpression
+            The query string to evaluate, or an expression parsed once with
+            :func:`compile_expr` to skip parsing on repeated queries.
 
             See the documentation for :func:`eval` for details of
             supported operations and functions in the query string.
@@ -4880,7 +4887,7 @@ class DataFrame(NDFrame, OpsMixin):
             ``'python'`` parser to retain strict Python semantics.  See the
             :ref:`enhancing performance <enhancingperf.eval>` documentation for
             more details.
-        engine : {'python', 'numexpr'}, default 'numexpr'
+        engine : {'python', 'numexpr', 'numba'}, default 'numexpr'
 
             The engine used to evaluate the expression. Supported engines are
 
@@ -4889,6 +4896,11 @@ class DataFrame(NDFrame, OpsMixin):
               numexpr for large speed ups in complex expressions with large frames.
             - ``'python'`` : Performs operations as if you had ``eval``'d in top
               level python. This engine is generally not that useful.
+            - ``'numba'`` : Compiles the expression into a single parallel loop
+              with numba, also supporting nullable dtypes and datetime
+              comparisons.
+
+              .. versionadded:: 3.1.0
 
             More backends may be available in the future.
         local_dict : dict or None, optional
@@ -5016,8 +5028,10 @@ class DataFrame(NDFrame, OpsMixin):
         0  1  10   10
         1  2   8    9
         """
+        from pandas.core.computation.eval import CompiledExpression
+
         inplace = validate_bool_kwarg(inplace, "inplace")
-        if not isinstance(expr, str):
+        if not isinstance(expr, (str, CompiledExpression)):
             msg = f"expr must be a string to be evaluated, {type(expr)} given"
             raise ValueError(msg)
 
@@ -5046,12 +5060,18 @@ class DataFrame(NDFrame, OpsMixin):
             return result
 
     @overload
-    def eval(self, expr: str, *, inplace: Literal[False] = ..., **kwargs) -> Any: ...
+    def eval(
+        self, expr: str | CompiledExpression, *, inplace: Literal[False] = ..., **kwargs
+    ) -> Any: ...
 
     @overload
-    def eval(self, expr: str, *, inplace: Literal[True], **kwargs) -> None: ...
+    def eval(
+        self, expr: str | CompiledExpression, *, inplace: Literal[True], **kwargs
+    ) -> None: ...
 
-    def eval(self, expr: str, *, inplace: bool = False, **kwargs) -> Any | None:
+    def eval(
+        self, expr: str | CompiledExpression, *, inplace: bool = False, **kwargs
+    ) -> Any | None:
         """
         Evaluate a string describing operations on DataFrame columns.
 
@@ -5066,8 +5086,9 @@ class DataFrame(NDFrame, OpsMixin):
 
         Parameters
         ----------
-        expr : str
-            The expression string to evaluate.
+        expr : str or CompiledExpression
+            The expression string to evaluate, or an expression parsed once
+            with :func:`compile_expr`.
 
             You can refer to variables
             in the environment by prefixing them with an '@' character like
@@ -5499,6 +5520,11 @@ class DataFrame(NDFrame, OpsMixin):
         Later items in '\*\*kwargs' may refer to newly created or modified
         columns in 'df'; items are computed and assigned into 'df' in order.
 
+        Arithmetic, comparison and logical operations of :func:`pandas.col`
+        expressions on large DataFrames are evaluated in a single pass with
+        numexpr (or numba, if the ``compute.use_numba`` option is set), and
+        subexpressions repeated across the items are only computed once.
+
         Examples
         --------
         >>> df = pd.DataFrame({"temp_c": [17.0, 25.0]}, index=["Portland", "Berkeley"])
@@ -5541,9 +5567,14 @@ class DataFrame(NDFrame, OpsMixin):
         Berkeley    25.0    77.0  298.15
         """
         data = self.copy(deep=False)
+        evaluator = ExpressionEvaluator(data)
 
         for k, v in kwargs.items():
-            data[k] = com.apply_if_callable(v, data)
+            if isinstance(v, Expression):
+                data[k] = evaluator.evaluate(v)
+            else:
+                data[k] = com.apply_if_callable(v, data)
+            evaluator.invalidate(k)
         return data
 
     def _sanitize_column(self, value) -> tuple[ArrayLike, BlockValuesRefs | None]:
@@ -17606,7 +17637,13 @@ class DataFrame(NDFrame, OpsMixin):
         data = self._get_numeric_data() if numeric_only else self
         return NDFrame.cumprod(data, axis, skipna, *args, **kwargs)
 
-    def nunique(self, axis: Axis = 0, dropna: bool = True) -> Series:
+    def nunique(
+        self,
+        axis: Axis = 0,
+        dropna: bool = True,
+        approx: bool = False,
+        precision: int = 14,
+    ) -> Series:
         """
         Count number of distinct elements in specified axis.
 
@@ -17620,6 +17657,15 @@ class DataFrame(NDFrame, OpsMixin):
             column-wise.
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the counts with HyperLogLog sketches, see
+            :meth:`Series.nunique`.
+
+            .. versionadded:: 3.1.0
+        precision : int, default 14
+            Precision of the sketches when ``approx=True``, between 4 and 18.
+
+            .. versionadded:: 3.1.0
 
         Returns
         -------
@@ -17645,7 +17691,9 @@ class DataFrame(NDFrame, OpsMixin):
         2    2
         dtype: int64
         """
-        return self.apply(Series.nunique, axis=axis, dropna=dropna)
+        return self.apply(
+            Series.nunique, axis=axis, dropna=dropna, approx=approx, precision=precision
+        )
 
     def idxmin(
         self, axis: Axis = 0, skipna: bool = True, numeric_only: bool = False
@@ -17963,7 +18011,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = ...,
         numeric_only: bool = ...,
         interpolation: QuantileInterpolation = ...,
-        method: Literal["single", "table"] = ...,
+        method: Literal["single", "table", "tdigest"] = ...,
     ) -> Series: ...
 
     @overload
@@ -17973,7 +18021,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = ...,
         numeric_only: bool = ...,
         interpolation: QuantileInterpolation = ...,
-        method: Literal["single", "table"] = ...,
+        method: Literal["single", "table", "tdigest"] = ...,
     ) -> Series | DataFrame: ...
 
     @overload
@@ -17983,7 +18031,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = ...,
         numeric_only: bool = ...,
         interpolation: QuantileInterpolation = ...,
-        method: Literal["single", "table"] = ...,
+        method: Literal["single", "table", "tdigest"] = ...,
     ) -> Series | DataFrame: ...
 
     def quantile(
@@ -17992,7 +18040,7 @@ class DataFrame(NDFrame, OpsMixin):
         axis: Axis = 0,
         numeric_only: bool = False,
         interpolation: QuantileInterpolation = "linear",
-        method: Literal["single", "table"] = "single",
+        method: Literal["single", "table", "tdigest"] = "single",
     ) -> Series | DataFrame:
         """
         Return values at the given quantile over requested axis.
@@ -18019,10 +18067,16 @@ class DataFrame(NDFrame, OpsMixin):
             * higher: `j`.
             * nearest: `i` or `j` whichever is nearest.
             * midpoint: (`i` + `j`) / 2.
-        method : {'single', 'table'}, default 'single'
+        method : {'single', 'table', 'tdigest'}, default 'single'
             Whether to compute quantiles per-column ('single') or over all columns
             ('table'). When 'table', the only allowed interpolation methods are
-            'nearest', 'lower', and 'higher'.
+            'nearest', 'lower', and 'higher'. When 'tdigest', quantiles are
+            estimated per-column from a t-digest sketch, which only sorts the
+            values in buffers of a few thousand but only supports numeric data;
+            ``interpolation`` is ignored and the result is always float.
+
+            .. versionchanged:: 3.1.0
+                Added the 'tdigest' method.
 
         Returns
         -------
@@ -18094,7 +18148,7 @@ class DataFrame(NDFrame, OpsMixin):
                 interpolation=interpolation,
                 method=method,
             )
-            if method == "single":
+            if method in ("single", "tdigest"):
                 res = res_df.iloc[0]
             else:
                 # cannot directly iloc over sparse arrays
@@ -18126,13 +18180,22 @@ class DataFrame(NDFrame, OpsMixin):
             res = self._constructor([], index=q, columns=cols, dtype=dtype)
             return res.__finalize__(self, method="quantile")
 
-        valid_method = {"single", "table"}
+        valid_method = {"single", "table", "tdigest"}
         if method not in valid_method:
             raise ValueError(
                 f"Invalid method: {method}. Method must be in {valid_method}."
             )
         if method == "single":
             res = data._mgr.quantile(qs=q, interpolation=interpolation)
+        elif method == "tdigest":
+            arrays = [
+                tdigest.quantile(tdigest.to_float(arr, "method='tdigest'"), q._values)
+                for arr in data._iter_column_arrays()
+            ]
+            result = self._constructor(
+                np.column_stack(arrays), index=q, columns=data.columns
+            )
+            return result.__finalize__(self, method="quantile")
         elif method == "table":
             valid_interpolation = {"nearest", "lower", "higher"}
             if interpolation not in valid_interpolation:
@@ -201,6 +201,7 @@ if TYPE_CHECKING:
         HDFStore,
         Series,
     )
+    from pandas.core.computation.scope import LazyResolvers
     from pandas.core.indexers.objects import BaseIndexer
     from pandas.core.resample import Resampler
 
@@ -530,12 +531,22 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
         return axis
 
     @final
-    def _get_axis_resolvers(self, axis: str) -> dict[str, Series | MultiIndex]:
-        # index or columns
+    def _get_axis_resolvers(
+        self, axis: str
+    ) -> dict[str, Callable[[], Series | MultiIndex]]:
+        # index or columns; the resolvers are created lazily, see LazyResolvers
         axis_index = getattr(self, axis)
         d = {}
         prefix = axis[0]
 
+        def level_resolver(level) -> Callable[[], Series]:
+            def resolver() -> Series:
+                s = axis_index.get_level_values(level).to_series()
+                s.index = axis_index
+                return s
+
+            return resolver
+
         for i, name in enumerate(axis_index.names):
             if name is not None:
                 key = level = name
@@ -546,57 +557,64 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
                 key = f"{prefix}level_{i}"
                 level = i
 
-            level_values = axis_index.get_level_values(level)
-            s = level_values.to_series()
-            s.index = axis_index
-            d[key] = s
+            d[key] = level_resolver(level)
 
         # put the index/columns itself in the dict
         if isinstance(axis_index, MultiIndex):
-            dindex = axis_index
+            d[axis] = lambda: axis_index
         else:
-            dindex = axis_index.to_series()
-
-        d[axis] = dindex
+            d[axis] = axis_index.to_series
         return d
 
     @final
-    def _get_index_resolvers(self) -> dict[Hashable, Series | MultiIndex]:
+    def _get_index_resolvers(self) -> LazyResolvers[Hashable, Series | MultiIndex]:
         from pandas.core.computation.parsing import clean_column_name
+        from pandas.core.computation.scope import LazyResolvers
 
-        d: dict[str, Series | MultiIndex] = {}
+        d: dict[str, Callable[[], Series | MultiIndex]] = {}
         for axis_name in self._AXIS_ORDERS:
             d.update(self._get_axis_resolvers(axis_name))
 
-        return {clean_column_name(k): v for k, v in d.items() if not isinstance(k, int)}
+        return LazyResolvers(
+            {clean_column_name(k): v for k, v in d.items() if not isinstance(k, int)}
+        )
 
     @final
-    def _get_cleaned_column_resolvers(self) -> dict[Hashable, Series]:
+    def _get_cleaned_column_resolvers(self) -> LazyResolvers[Hashable, Series]:
         """
         Return the special character free column resolvers of a DataFrame.
 
         Column names with special characters are 'cleaned up' so that they can
-        be referred to by backtick quoting.
+        be referred to by backtick quoting. The Series of each column is only
+        created when the column is referred to.
         Used in :meth:`DataFrame.eval`.
         """
         from pandas.core.computation.parsing import clean_column_name
+        from pandas.core.computation.scope import LazyResolvers
         from pandas.core.series import Series
 
         if isinstance(self, ABCSeries):
-            return {clean_column_name(self.name): self}
+            return LazyResolvers({clean_column_name(self.name): lambda: self})
 
-        dtypes = self.dtypes
-        return {
-            clean_column_name(k): Series(
-                v, copy=False, index=self.index, name=k, dtype=dtype
-            ).__finalize__(self)
-            for k, v, dtype in zip(
-                self.columns,
-                self._iter_column_arrays(),
-                dtypes,
-                strict=True,
-            )
-        }
+        def column_resolver(loc: int) -> Callable[[], Series]:
+            def resolver() -> Series:
+                values = self._get_column_array(loc)  # type: ignore[attr-defined]
+                return Series(
+                    values,
+                    copy=False,
+                    index=self.index,
+                    name=self.columns[loc],
+                    dtype=values.dtype,
+                ).__finalize__(self)
+
+            return resolver
+
+        return LazyResolvers(
+            {
+                clean_column_name(k): column_resolver(loc)
+                for loc, k in enumerate(self.columns)
+            }
+        )
 
     @final
     @property
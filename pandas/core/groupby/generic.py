@@ -24,6 +24,7 @@ import warnings
 
 import numpy as np
 
+from pandas._libs import groupby as libgroupby
 from pandas._libs.hashtable import duplicated
 from pandas.errors import (
     Pandas4Warning,
@@ -58,6 +59,7 @@ from pandas.core.apply import (
     reconstruct_func,
     validate_func_kwargs,
 )
+from pandas.core.array_algos import hyperloglog
 import pandas.core.common as com
 from pandas.core.frame import DataFrame
 from pandas.core.groupby import base
@@ -92,6 +94,7 @@ if TYPE_CHECKING:
         Manager,
         SingleBlockManager,
         TakeIndexer,
+        npt,
     )
 
     from pandas import Categorical
@@ -183,6 +186,10 @@ class NamedAgg:
         raise IndexError("index out of range")
 
 
+# Aggregations computed together by SeriesGroupBy._aggregate_fused
+_MOMENT_AGGREGATIONS = frozenset(["count", "sum", "mean", "var", "std", "sem"])
+
+
 @set_module("pandas.api.typing")
 class SeriesGroupBy(GroupBy[Series]):
     def _wrap_agged_manager(self, mgr: Manager) -> Series:
@@ -509,6 +516,7 @@ class SeriesGroupBy(GroupBy[Series]):
         if isinstance(arg, dict):
             raise SpecificationError("nested renamer is not supported")
 
+        funcs = [x[1] if isinstance(x, (tuple, list)) else x for x in arg]
         if any(isinstance(x, (tuple, list)) for x in arg):
             arg = ((x, x) if not isinstance(x, (tuple, list)) else x for x in arg)
         else:
@@ -518,11 +526,18 @@ class SeriesGroupBy(GroupBy[Series]):
 
         results: dict[base.OutputKey, DataFrame | Series] = {}
         with com.temp_setattr(self, "as_index", True):
+            if args or kwargs.keys() - {"engine", "engine_kwargs"}:
+                fused = {}
+            else:
+                fused = self._aggregate_fused(funcs, kwargs.get("engine"))
             # Combine results using the index, need to adjust index after
             # if as_index=False (GH#50724)
             for idx, (name, func) in enumerate(arg):
                 key = base.OutputKey(label=name, position=idx)
-                results[key] = self.aggregate(func, *args, **kwargs)
+                if isinstance(func, str) and func in fused:
+                    results[key] = fused[func]
+                else:
+                    results[key] = self.aggregate(func, *args, **kwargs)
 
         if any(isinstance(x, DataFrame) for x in results.values()):
             from pandas import concat
@@ -538,6 +553,52 @@ class SeriesGroupBy(GroupBy[Series]):
 
         return output
 
+    def _aggregate_fused(self, funcs: list, engine=None) -> dict[str, Series]:
+        """
+        Compute the reductions among ``funcs`` that share a kernel together.
+
+        count, sum, mean, var, std and sem are computed by a single pass of
+        ``group_moments`` over the values. The results are the same as those
+        of the separate reductions with their default arguments.
+
+        Returns
+        -------
+        dict[str, Series]
+            The results by name, empty if no reductions could be fused.
+        """
+        values = self._obj_with_exclusions._values
+        if (
+            not isinstance(values, np.ndarray)
+            or values.dtype != np.float64
+            or maybe_use_numba(engine)
+        ):
+            return {}
+        names = {func for func in funcs if isinstance(func, str)}
+        moments = names & _MOMENT_AGGREGATIONS
+        if len(moments) < 2:
+            return {}
+
+        ids = self._grouper.ids
+        ngroups = self._grouper.ngroups
+        out = np.empty((3, ngroups), dtype=np.float64)
+        nobs = np.zeros(ngroups, dtype=np.int64)
+        libgroupby.group_moments(out, nobs, values, ids)
+        sums, means, ssd = out
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # like group_var, NaN for groups with at most ddof values
+            var = np.where(nobs > 1, ssd / (nobs - 1), np.nan)
+        arrays = {"count": nobs, "sum": sums, "mean": means, "var": var}
+        arrays["std"] = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            arrays["sem"] = np.sqrt(var / nobs)
+
+        results = {}
+        for name in moments:
+            result = self.obj._constructor(arrays[name], name=self.obj.name)
+            result = self._wrap_aggregated_output(result)
+            results[name] = result.__finalize__(self.obj, method="groupby")
+        return results
+
     def _wrap_applied_output(
         self,
         data: Series,
@@ -872,7 +933,9 @@ class SeriesGroupBy(GroupBy[Series]):
         filtered = self._apply_filter(indices, dropna)
         return filtered
 
-    def nunique(self, dropna: bool = True) -> Series | DataFrame:
+    def nunique(
+        self, dropna: bool = True, approx: bool = False, precision: int = 14
+    ) -> Series | DataFrame:
         """
         Return number of unique elements in the group.
 
@@ -880,6 +943,15 @@ class SeriesGroupBy(GroupBy[Series]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the counts with a HyperLogLog sketch per group instead of
+            hashing every (group, value) pair, see :meth:`Series.nunique`.
+
+            .. versionadded:: 3.1.0
+        precision : int, default 14
+            Precision of the sketches when ``approx=True``, between 4 and 18.
+
+            .. versionadded:: 3.1.0
 
         Returns
         -------
@@ -908,28 +980,33 @@ class SeriesGroupBy(GroupBy[Series]):
         ids = self._grouper.ids
         ngroups = self._grouper.ngroups
         val = self.obj._values
-        codes, uniques = algorithms.factorize(val, use_na_sentinel=dropna, sort=False)
-
-        if self._grouper.has_dropped_na:
-            mask = ids >= 0
-            ids = ids[mask]
-            codes = codes[mask]
-
-        group_index = get_group_index(
-            labels=[ids, codes],
-            shape=(ngroups, len(uniques)),
-            sort=False,
-            xnull=dropna,
-        )
+        if approx:
+            res = self._approx_nunique(ids, ngroups, val, dropna, precision)
+        else:
+            codes, uniques = algorithms.factorize(
+                val, use_na_sentinel=dropna, sort=False
+            )
 
-        if dropna:
-            mask = group_index >= 0
-            if (~mask).any():
+            if self._grouper.has_dropped_na:
+                mask = ids >= 0
                 ids = ids[mask]
-                group_index = group_index[mask]
+                codes = codes[mask]
 
-        mask = duplicated(group_index, "first")
-        res = np.bincount(ids[~mask], minlength=ngroups)
+            group_index = get_group_index(
+                labels=[ids, codes],
+                shape=(ngroups, len(uniques)),
+                sort=False,
+                xnull=dropna,
+            )
+
+            if dropna:
+                mask = group_index >= 0
+                if (~mask).any():
+                    ids = ids[mask]
+                    group_index = group_index[mask]
+
+            mask = duplicated(group_index, "first")
+            res = np.bincount(ids[~mask], minlength=ngroups)
         res = ensure_int64(res)
 
         ri = self._grouper.result_index
@@ -941,6 +1018,24 @@ class SeriesGroupBy(GroupBy[Series]):
             result.index = default_index(len(result))
         return result
 
+    @staticmethod
+    def _approx_nunique(
+        ids: npt.NDArray[np.intp],
+        ngroups: int,
+        values: ArrayLike,
+        dropna: bool,
+        precision: int,
+    ) -> np.ndarray:
+        hyperloglog.validate_precision(precision)
+        hashes, na_mask = hyperloglog.hash_values(values)
+        mask = (ids >= 0) & ~na_mask
+        res = hyperloglog.group_estimate(hashes[mask], ids[mask], ngroups, precision)
+        res = np.rint(res).astype(np.int64)
+        if not dropna:
+            # all missing values of a group count as a single distinct value
+            res += np.bincount(ids[(ids >= 0) & na_mask], minlength=ngroups) > 0
+        return res
+
     def describe(self, percentiles=None, include=None, exclude=None) -> Series:
         """
         Generate descriptive statistics.
@@ -2891,7 +2986,9 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
             res_df = self._insert_inaxis_grouper(res_df)
         return res_df
 
-    def nunique(self, dropna: bool = True) -> DataFrame:
+    def nunique(
+        self, dropna: bool = True, approx: bool = False, precision: int = 14
+    ) -> DataFrame:
         """
         Return DataFrame with counts of unique elements in each position.
 
@@ -2899,6 +2996,15 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         ----------
         dropna : bool, default True
             Don't include NaN in the counts.
+        approx : bool, default False
+            Estimate the counts with HyperLogLog sketches, see
+            :meth:`.SeriesGroupBy.nunique`.
+
+            .. versionadded:: 3.1.0
+        precision : int, default 14
+            Precision of the sketches when ``approx=True``, between 4 and 18.
+
+            .. versionadded:: 3.1.0
 
         Returns
         -------
@@ -2943,7 +3049,9 @@ class DataFrameGroupBy(GroupBy[DataFrame]):
         4   ham       5      x
         5   ham       5      y
         """
-        return self._apply_to_column_groupbys(lambda sgb: sgb.nunique(dropna))
+        return self._apply_to_column_groupbys(
+            lambda sgb: sgb.nunique(dropna, approx=approx, precision=precision)
+        )
 
     def idxmax(
         self,
@@ -95,6 +95,7 @@ from pandas.core import (
     sample,
 )
 from pandas.core._numba import executor
+from pandas.core.array_algos import tdigest
 from pandas.core.arrays import (
     ArrowExtensionArray,
     BaseMaskedArray,
@@ -4524,6 +4525,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             "linear", "lower", "higher", "nearest", "midpoint"
         ] = "linear",
         numeric_only: bool = False,
+        method: Literal["single", "tdigest"] = "single",
     ):
         """
         Return group values at the given quantile, a la numpy.percentile.
@@ -4541,6 +4543,15 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
                 numeric_only now defaults to ``False``.
 
+        method : {'single', 'tdigest'}, default 'single'
+            Whether to compute exact quantiles ('single') or to estimate them
+            from a t-digest sketch of every group ('tdigest'). The sketch only
+            sorts the values in buffers of a few thousand and only supports
+            numeric data; ``interpolation`` is ignored and the result is
+            always float.
+
+            .. versionadded:: 3.1.0
+
         Returns
         -------
         Series or DataFrame
@@ -4564,7 +4575,15 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         a    2.0
         b    3.0
         """
+        valid_method = {"single", "tdigest"}
+        if method not in valid_method:
+            raise ValueError(
+                f"Invalid method: {method}. Method must be in {valid_method}."
+            )
         mgr = self._get_data_to_aggregate(numeric_only=numeric_only, name="quantile")
+        if method == "tdigest":
+            return self._tdigest_quantile(mgr, q)
+
         obj = self._wrap_agged_manager(mgr)
         splitter = self._grouper._get_splitter(obj)
         sdata = splitter._sorted_data
@@ -4737,6 +4756,35 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         res = self._wrap_agged_manager(res_mgr)
         return self._wrap_aggregated_output(res, qs=pass_qs)
 
+    @final
+    def _tdigest_quantile(self, mgr, q):
+        """
+        Estimate group quantiles from a t-digest sketch of every group.
+        """
+        if is_scalar(q):
+            qs = np.array([q], dtype=np.float64)
+            pass_qs: None | np.ndarray = None
+        else:
+            qs = np.asarray(q, dtype=np.float64)
+            pass_qs = qs
+
+        # values in dropped NA groups have a negative label and are skipped
+        ids = self._grouper.ids
+        ngroups = self._grouper.ngroups
+
+        def blk_func(values: ArrayLike) -> ArrayLike:
+            rows = [values] if values.ndim == 1 else list(values)
+            out = np.empty((len(rows), ngroups * len(qs)), dtype=np.float64)
+            for i, row in enumerate(rows):
+                vals = tdigest.to_float(row, method="method='tdigest'")
+                sketch = tdigest.group_sketch(vals, ids, ngroups)
+                out[i] = tdigest.group_quantile(*sketch, qs).ravel()
+            return out[0] if values.ndim == 1 else out
+
+        res_mgr = mgr.grouped_reduce(blk_func)
+        res = self._wrap_agged_manager(res_mgr)
+        return self._wrap_aggregated_output(res, qs=pass_qs)
+
     @final
     def ngroup(self, ascending: bool = True):
         """
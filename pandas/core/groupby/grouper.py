@@ -37,6 +37,7 @@ from pandas.core.arrays import (
     ExtensionArray,
 )
 import pandas.core.common as com
+from pandas.core.construction import extract_array
 from pandas.core.frame import DataFrame
 from pandas.core.groupby import ops
 from pandas.core.groupby.categorical import recode_for_groupby
@@ -46,6 +47,7 @@ from pandas.core.indexes.api import (
     default_index,
 )
 from pandas.core.series import Series
+from pandas.core.sorting import factorize_sorted
 
 from pandas.io.formats.printing import (
     PrettyDict,
@@ -675,12 +677,23 @@ class Grouping:
             codes = cat.codes
             uniques = self._uniques
         else:
-            # GH35667, replace dropna=False with use_na_sentinel=False
-            # error: Incompatible types in assignment (expression has type "Union[
-            # ndarray[Any, Any], Index]", variable has type "Categorical")
-            codes, uniques = algorithms.factorize(  # type: ignore[assignment]
-                self.grouping_vector, sort=self._sort, use_na_sentinel=self._dropna
-            )
+            factorized = None
+            if getattr(self.grouping_vector, "freq", None) is None:
+                # keys that are already sorted are grouped by their runs of
+                # equal values without hashing them
+                factorized = factorize_sorted(
+                    extract_array(self.grouping_vector, extract_numpy=True),
+                    sort=self._sort,
+                )
+            if factorized is not None:
+                codes, uniques = factorized
+            else:
+                # GH35667, replace dropna=False with use_na_sentinel=False
+                # error: Incompatible types in assignment (expression has type
+                # "Union[ndarray[Any, Any], Index]", variable has type "Categorical")
+                codes, uniques = algorithms.factorize(  # type: ignore[assignment]
+                    self.grouping_vector, sort=self._sort, use_na_sentinel=self._dropna
+                )
         return codes, uniques
 
     @cache_readonly
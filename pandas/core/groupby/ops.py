@@ -65,11 +65,13 @@ from pandas.core.indexes.api import (
 )
 from pandas.core.series import Series
 from pandas.core.sorting import (
+    compress_group_codes,
     compress_group_index,
     decons_obs_group_ids,
     get_group_index,
     get_group_index_sorter,
     get_indexer_dict,
+    is_int64_overflow_possible,
 )
 
 if TYPE_CHECKING:
@@ -656,7 +658,7 @@ class BaseGrouper:
             data,
             self.ngroups,
             sorted_ids=self._sorted_ids,
-            sort_idx=self.result_ilocs,
+            sort_idx=None if self._is_sorted else self.result_ilocs,
         )
 
     @cache_readonly
@@ -695,6 +697,10 @@ class BaseGrouper:
         # any gaps that then occur because of them.
         ids = self.ids
 
+        if self._is_sorted:
+            # e.g. grouping by the keys a frame is sorted by
+            return np.arange(len(ids), dtype=np.intp)
+
         if self.has_dropped_na:
             mask = np.where(ids >= 0)
             # Count how many gaps are caused by previous null values for each position
@@ -760,6 +766,13 @@ class BaseGrouper:
         # return if my group orderings are monotonic
         return Index(self.ids, copy=False).is_monotonic_increasing
 
+    @final
+    @cache_readonly
+    def _is_sorted(self) -> bool:
+        # whether the rows are already ordered by group, in which case the
+        # groups are contiguous slices of the input
+        return self.is_monotonic and not self.has_dropped_na
+
     @final
     @cache_readonly
     def has_dropped_na(self) -> bool:
@@ -900,12 +913,19 @@ class BaseGrouper:
         consistent_sorting = all(sorts[0] == sort for sort in sorts[1:])
         sort_in_compress = sorts[0] if consistent_sorting else False
         shape = tuple(len(level) for level in levels)
-        group_index = get_group_index(codes, shape, sort=True, xnull=True)
-        ob_ids, obs_group_ids = compress_group_index(group_index, sort=sort_in_compress)
-        ob_ids = ensure_platform_int(ob_ids)
-        ob_index_codes = decons_obs_group_ids(
-            ob_ids, obs_group_ids, shape, codes, xnull=True
-        )
+        if is_int64_overflow_possible(shape):
+            ob_ids, ob_index_codes = compress_group_codes(
+                codes, shape, sort=sort_in_compress, xnull=True
+            )
+        else:
+            group_index = get_group_index(codes, shape, sort=True, xnull=True)
+            ob_ids, obs_group_ids = compress_group_index(
+                group_index, sort=sort_in_compress
+            )
+            ob_ids = ensure_platform_int(ob_ids)
+            ob_index_codes = decons_obs_group_ids(
+                ob_ids, obs_group_ids, shape, codes, xnull=True
+            )
         ob_index = MultiIndex(
             levels=levels,
             codes=ob_index_codes,
@@ -1069,6 +1089,8 @@ class BaseGrouper:
     @final
     @cache_readonly
     def _sorted_ids(self) -> npt.NDArray[np.intp]:
+        if self._is_sorted:
+            return self.ids
         result = self.ids.take(self.result_ilocs)
         if getattr(self, "dropna", True):
             # BinGrouper has no dropna
@@ -1248,7 +1270,7 @@ class DataSplitter(Generic[NDFrameT]):
         data: NDFrameT,
         ngroups: int,
         *,
-        sort_idx: npt.NDArray[np.intp],
+        sort_idx: npt.NDArray[np.intp] | None,
         sorted_ids: npt.NDArray[np.intp],
     ) -> None:
         self.data = data
@@ -1270,6 +1292,9 @@ class DataSplitter(Generic[NDFrameT]):
 
     @cache_readonly
     def _sorted_data(self) -> NDFrameT:
+        if self._sort_idx is None:
+            # the data is already sorted by group
+            return self.data
         return self.data.take(self._sort_idx, axis=0)
 
     def _chop(self, sdata, slice_obj: slice) -> NDFrame:
@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import warnings
 
 import numpy as np
 
 from pandas._libs.tslibs import BaseOffset
-from pandas._libs.window.indexers import calculate_variable_window_bounds
+from pandas._libs.window.indexers import (
+    calculate_variable_offset_window_bounds,
+    calculate_variable_window_bounds,
+)
+from pandas.errors import PerformanceWarning
 from pandas.util._decorators import set_module
 
 from pandas.core.dtypes.common import ensure_platform_int
 
 from pandas.core.indexes.datetimes import DatetimeIndex
 
-from pandas.tseries.offsets import Nano
-
 
 @set_module("pandas.api.indexers")
 class BaseIndexer:
@@ -344,55 +346,28 @@ class VariableOffsetWindowIndexer(BaseIndexer):
             index_growth_sign = 1
         offset_diff = index_growth_sign * self.offset
 
-        start = np.empty(num_values, dtype="int64")
-        start.fill(-1)
-        end = np.empty(num_values, dtype="int64")
-        end.fill(-1)
-
-        start[0] = 0
-
-        # right endpoint is closed
-        if right_closed:
-            end[0] = 1
-        # right endpoint is open
-        else:
-            end[0] = 0
-
-        zero = timedelta(0)
-        # start is start of slice interval (including)
-        # end is end of slice interval (not including)
-        for i in range(1, num_values):
-            end_bound = self.index[i]
-            start_bound = end_bound - offset_diff
-
-            # left endpoint is closed
-            if left_closed:
-                start_bound -= Nano(1)
-
-            # advance the start bound until we are
-            # within the constraint
-            start[i] = i
-            for j in range(start[i - 1], i):
-                start_diff = (self.index[j] - start_bound) * index_growth_sign
-                if start_diff > zero:
-                    start[i] = j
-                    break
-
-            # end bound is previous end
-            # or current index
-            end_diff = (self.index[end[i - 1]] - end_bound) * index_growth_sign
-            if end_diff == zero and not right_closed:
-                end[i] = end[i - 1] + 1
-            elif end_diff <= zero:
-                end[i] = i + 1
-            else:
-                end[i] = end[i - 1]
-
-            # right endpoint is open
-            if not right_closed:
-                end[i] -= 1
-
-        return start, end
+        index = self.index
+        with warnings.catch_warnings():
+            # offsets without a vectorized implementation are applied to
+            #  one value after another
+            warnings.simplefilter("ignore", PerformanceWarning)
+            start_bounds = index[:num_values] - offset_diff
+        if start_bounds.unit != index.unit:
+            # the offset has a finer resolution than the index
+            index = index.as_unit(start_bounds.unit)
+
+        # the left endpoint is included by moving it back by one nanosecond,
+        #  which for coarser units only makes a difference, of one unit, for
+        #  increasing indexes
+        shift_left = left_closed and (index_growth_sign == 1 or index.unit == "ns")
+        return calculate_variable_offset_window_bounds(
+            num_values,
+            index.asi8,
+            start_bounds.asi8,
+            shift_left,
+            right_closed,
+            index_growth_sign,
+        )
 
 
 class ExpandingIndexer(BaseIndexer):
@@ -1987,6 +1987,14 @@ class Resampler(BaseGroupBy, PandasObject):
         2023-01-01    1.5
         2023-02-01    3.5
         Freq: MS, dtype: float64
+
+        Pass ``method="tdigest"`` to estimate the quantiles from a t-digest
+        sketch of every group.
+
+        >>> ser.resample("MS").quantile(0.25, method="tdigest")
+        2023-01-01    1.5
+        2023-02-01    3.5
+        Freq: MS, dtype: float64
         """
         return self._downsample("quantile", q=q, **kwargs)
 
@@ -2136,11 +2144,64 @@ class DatetimeIndexResampler(Resampler):
             assert obj.index.freq == self.freq, (obj.index.freq, self.freq)
             return obj
 
+        result = self._downsample_equal_bins(obj, how, **kwargs)
+        if result is not None:
+            return self._wrap_result(result)
+
         # we are downsampling
         # we want to call the actual grouper method here
         result = obj.groupby(self._grouper).aggregate(how, **kwargs)
         return self._wrap_result(result)
 
+    def _downsample_equal_bins(self, obj: NDFrameT, how, **kwargs) -> NDFrameT | None:
+        """
+        Downsample by reshaping the values if all bins have the same length.
+
+        On a regular index, e.g. when downsampling 1-second data to 1-minute
+        bins, all bins but the first and the last one hold the same number
+        of rows. The values of these bins are then reduced as a 2-D view of
+        shape ``(n_bins, rows_per_bin)`` instead of by group labels.
+
+        Returns None if this does not apply.
+        """
+        if (
+            how not in _EQUAL_BIN_REDUCTIONS
+            or not set(kwargs) <= {"numeric_only", "min_count"}
+            or kwargs.get("min_count", 0) > 1
+            or self.ax.hasnans
+        ):
+            return None
+        bins = self._grouper.bins
+        counts = np.diff(bins, prepend=0)
+        if (
+            len(counts) < 3
+            or counts[1] < 2
+            or counts.min() == 0
+            or not (counts[1:-1] == counts[1]).all()
+        ):
+            return None
+
+        if isinstance(obj, ABCSeries):
+            arrays = [obj._values]
+        else:
+            arrays = [obj._ixs(i, axis=1)._values for i in range(obj.shape[1])]
+        if not arrays or not all(
+            isinstance(values, np.ndarray) and values.dtype in (np.int64, np.float64)
+            for values in arrays
+        ):
+            return None
+        if how == "sum" and any(values.dtype == np.float64 for values in arrays):
+            # float sums are left to the compensated groupby kernels
+            return None
+
+        results = [_reduce_equal_bins(values, counts, how) for values in arrays]
+        index = self._grouper.binlabels
+        if isinstance(obj, ABCSeries):
+            return obj._constructor(results[0], index=index, name=obj.name)
+        result = obj._constructor(dict(enumerate(results)), index=index)
+        result.columns = obj.columns
+        return result
+
     def _adjust_binner_for_upsample(self, binner):
         """
         Adjust our binner when upsampling.
@@ -3115,6 +3176,57 @@ def _adjust_dates_anchored(
     return fresult, lresult
 
 
+# Reductions that DatetimeIndexResampler._downsample_equal_bins computes
+_EQUAL_BIN_REDUCTIONS = frozenset(["sum", "min", "max"])
+
+
+def _reduce_equal_bins(
+    values: np.ndarray,
+    counts: npt.NDArray[np.int64],
+    how: str,
+) -> np.ndarray:
+    """
+    Reduce consecutive runs of int64 or float64 values.
+
+    ``counts`` holds the number of values of every run, all of which are the
+    same except for the first and the last one. The runs in between are
+    reduced as a single 2-D view of the values, the first and last ones
+    separately. Only reductions that are exact, i.e. that do not depend on
+    the summation order, are handled here. Missing values are skipped, like
+    in the cython groupby kernels.
+    """
+    head, size, tail = counts[0], counts[1], counts[-1]
+    middle = values[head : len(values) - tail]
+    pieces = [
+        values[:head].reshape(1, head),
+        middle.reshape(len(middle) // size, size),
+        values[len(values) - tail :].reshape(1, tail),
+    ]
+    with warnings.catch_warnings():
+        # the minimum and maximum of all-NaN bins are NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.concatenate([_reduce_rows(piece, how) for piece in pieces])
+
+
+def _reduce_rows(values: np.ndarray, how: str) -> np.ndarray:
+    if how == "sum":
+        return values.sum(axis=1)
+    elif how == "min":
+        result = values.min(axis=1)
+    else:
+        result = values.max(axis=1)
+
+    if values.dtype.kind == "f":
+        # the reductions above propagate NaN, recompute the rows holding it
+        mask = np.isnan(result)
+        if mask.any():
+            if how == "min":
+                result[mask] = np.nanmin(values[mask], axis=1)
+            else:
+                result[mask] = np.nanmax(values[mask], axis=1)
+    return result
+
+
 def asfreq(
     obj: NDFrameT,
     freq,
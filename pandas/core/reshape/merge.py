@@ -83,6 +83,7 @@ from pandas.core.construction import (
 )
 from pandas.core.indexes.api import default_index
 from pandas.core.sorting import (
+    compress_group_codes,
     get_group_index,
     is_int64_overflow_possible,
 )
@@ -3013,35 +3014,27 @@ def _get_join_keys(
     shape: Shape,
     sort: bool,
 ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
-    # how many levels can be done without overflow
-    nlev = next(
-        lev
-        for lev in range(len(shape), 0, -1)
-        if not is_int64_overflow_possible(shape[:lev])
-    )
-
-    # get keys for the first `nlev` levels
-    stride = np.prod(shape[1:nlev], dtype="i8")
+    if is_int64_overflow_possible(shape):
+        # label the rows of codes of both sides in a single hashtable pass
+        labels = [
+            np.concatenate([lab, rab]) for lab, rab in zip(llab, rlab, strict=True)
+        ]
+        ids, _ = compress_group_codes(labels, shape, sort=sort, xnull=False)
+        ids = ensure_int64(ids)
+        return ids[: len(llab[0])], ids[len(llab[0]) :]
+
+    # get keys for all levels
+    stride = np.prod(shape[1:], dtype="i8")
     lkey = stride * llab[0].astype("i8", subok=False, copy=False)
     rkey = stride * rlab[0].astype("i8", subok=False, copy=False)
 
-    for i in range(1, nlev):
+    for i in range(1, len(shape)):
         with np.errstate(divide="ignore"):
             stride //= shape[i]
         lkey += llab[i] * stride
         rkey += rlab[i] * stride
 
-    if nlev == len(shape):  # all done!
-        return lkey, rkey
-
-    # densify current keys to avoid overflow
-    lkey, rkey, count = _factorize_keys(lkey, rkey, sort=sort)
-
-    llab = [lkey, *llab[nlev:]]
-    rlab = [rkey, *rlab[nlev:]]
-    shape = (count, *shape[nlev:])
-
-    return _get_join_keys(llab, rlab, shape, sort)
+    return lkey, rkey
 
 
 def _should_fill(lname, rname) -> bool:
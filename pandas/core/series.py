@@ -2759,7 +2759,10 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
 
     @overload
     def quantile(
-        self, q: float = ..., interpolation: QuantileInterpolation = ...
+        self,
+        q: float = ...,
+        interpolation: QuantileInterpolation = ...,
+        method: Literal["single", "tdigest"] = ...,
     ) -> float: ...
 
     @overload
@@ -2767,6 +2770,7 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         self,
         q: Sequence[float] | AnyArrayLike,
         interpolation: QuantileInterpolation = ...,
+        method: Literal["single", "tdigest"] = ...,
     ) -> Series: ...
 
     @overload
@@ -2774,12 +2778,14 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         self,
         q: float | Sequence[float] | AnyArrayLike = ...,
         interpolation: QuantileInterpolation = ...,
+        method: Literal["single", "tdigest"] = ...,
     ) -> float | Series: ...
 
     def quantile(
         self,
         q: float | Sequence[float] | AnyArrayLike = 0.5,
         interpolation: QuantileInterpolation = "linear",
+        method: Literal["single", "tdigest"] = "single",
     ) -> float | Series:
         """
         Return value at the given quantile.
@@ -2798,6 +2804,13 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
                 * higher: `j`.
                 * nearest: `i` or `j` whichever is nearest.
                 * midpoint: (`i` + `j`) / 2.
+        method : {'single', 'tdigest'}, default 'single'
+            Whether to compute the exact quantiles ('single') or to estimate
+            them from a t-digest sketch ('tdigest'). The sketch only sorts
+            the values in buffers of a few thousand and only supports numeric
+            data; ``interpolation`` is ignored and the result is always float.
+
+            .. versionadded:: 3.1.0
 
         Returns
         -------
@@ -2809,6 +2822,7 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         See Also
         --------
         core.window.Rolling.quantile : Calculate the rolling quantile.
+        api.accumulators.TDigest : Estimate quantiles over chunked data.
         numpy.percentile : Returns the q-th percentile(s) of the array elements.
 
         Examples
@@ -2828,7 +2842,9 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         #  about 2D cases.
         df = self.to_frame()
 
-        result = df.quantile(q=q, interpolation=interpolation, numeric_only=False)
+        result = df.quantile(
+            q=q, interpolation=interpolation, numeric_only=False, method=method
+        )
         if result.ndim == 2:
             result = result.iloc[:, 0]
 
@@ -22,8 +22,10 @@ from pandas.core.dtypes.common import (
     ensure_platform_int,
 )
 from pandas.core.dtypes.generic import (
+    ABCDatetimeArray,
     ABCMultiIndex,
     ABCRangeIndex,
+    ABCTimedeltaArray,
 )
 from pandas.core.dtypes.missing import isna
 
@@ -166,6 +168,12 @@ def get_group_index(
         # so that all output values are non-negative
         return (lab + 1, size + 1) if (lab == -1).any() else (lab, size)
 
+    if is_int64_overflow_possible(shape):
+        # hash the rows of labels at once rather than compressing the
+        # flat ids of the levels that fit in int64 repeatedly
+        comp_ids, _ = compress_group_codes(labels, shape, sort=sort, xnull=xnull)
+        return ensure_int64(comp_ids)
+
     labels = [ensure_int64(x) for x in labels]
     lshape = list(shape)
     if not xnull:
@@ -299,6 +307,61 @@ def decons_obs_group_ids(
     return [lab[indexer].astype(np.intp, subok=False, copy=True) for lab in labels]
 
 
+def compress_group_codes(
+    labels: Sequence[npt.NDArray[np.signedinteger]],
+    shape: Shape,
+    sort: bool,
+    xnull: bool,
+) -> tuple[npt.NDArray[np.intp], list[npt.NDArray[np.intp]]]:
+    """
+    Label the observed combinations of several label arrays in one pass.
+
+    Equivalent to ``get_group_index``, ``compress_group_index`` and
+    ``decons_obs_group_ids``, but the rows of labels are hashed directly
+    instead of being combined into int64 offsets first, which takes
+    repeated compress passes when the offsets could overflow.
+
+    Parameters
+    ----------
+    labels : sequence of arrays
+        Integers identifying levels at each location
+    shape : tuple[int, ...]
+        Number of unique levels at each location
+    sort : bool
+        If the observed groups should be in lexical order of the labels,
+        rather than in order of first appearance
+    xnull : bool
+        If true nulls are excluded. i.e. -1 values in the labels are
+        passed through.
+
+    Returns
+    -------
+    comp_ids : np.ndarray[np.intp]
+    obs_labels : list of np.ndarray[np.intp]
+        The labels of every observed group.
+    """
+    codes = np.vstack([ensure_int64(lab) for lab in labels])
+    comp_ids, first_rows = hashtable.factorize_rows(codes, xnull)
+    obs_labels = [ensure_platform_int(lab.take(first_rows)) for lab in codes]
+
+    if sort and len(first_rows) > 0:
+        # least significant digit radix sort of the observed groups, -1
+        # labels sort first like in get_group_index
+        sorter = np.arange(len(first_rows), dtype=np.intp)
+        for lab, size in zip(obs_labels[::-1], shape[::-1], strict=True):
+            indexer, _ = algos.groupsort_indexer(lab.take(sorter), size)
+            sorter = sorter.take(indexer)
+        obs_labels = [lab.take(sorter) for lab in obs_labels]
+
+        reverse_indexer = np.empty(len(sorter), dtype=np.intp)
+        reverse_indexer.put(sorter, np.arange(len(sorter)))
+        mask = comp_ids < 0
+        comp_ids = reverse_indexer.take(comp_ids)
+        np.putmask(comp_ids, mask, -1)
+
+    return comp_ids, obs_labels
+
+
 def lexsort_indexer(
     keys: Sequence[ArrayLike | Index | Series],
     orders=None,
@@ -672,6 +735,62 @@ def get_group_index_sorter(
     return ensure_platform_int(sorter)
 
 
+def factorize_sorted(
+    values: ArrayLike, sort: bool = True
+) -> tuple[npt.NDArray[np.intp], ArrayLike] | None:
+    """
+    Factorize values that are already sorted without hashing them.
+
+    The codes are derived from the positions where consecutive values
+    change, like the bins of a ``BinGrouper``.
+
+    Parameters
+    ----------
+    values : np.ndarray or DatetimeArray or TimedeltaArray
+    sort : bool, default True
+        Whether the uniques of decreasing values are returned in increasing
+        order.
+
+    Returns
+    -------
+    codes : np.ndarray[np.intp]
+    uniques : np.ndarray or DatetimeArray or TimedeltaArray
+        Same as ``algorithms.factorize(values, sort=sort)``, or None if
+        ``values`` are empty, not monotonic, contain missing values or are
+        not of a numeric or datetimelike dtype.
+    """
+    if len(values) == 0:
+        return None
+    dtype = values.dtype
+    if isinstance(values, (ABCDatetimeArray, ABCTimedeltaArray)) or (
+        isinstance(values, np.ndarray) and dtype.kind in "mM"
+    ):
+        arr = values.view("i8")
+        timelike = True
+    elif isinstance(values, np.ndarray) and (
+        dtype.kind in "iu" or dtype in (np.float32, np.float64)
+    ):
+        arr = values
+        timelike = False
+    else:
+        return None
+    is_increasing, is_decreasing, _ = algos.is_monotonic(arr, timelike)
+    if not (is_increasing or is_decreasing):
+        return None
+
+    unique_mask = np.empty(len(arr), dtype=bool)
+    unique_mask[0] = True
+    np.not_equal(arr[1:], arr[:-1], out=unique_mask[1:])
+    starts = np.flatnonzero(unique_mask)
+    counts = np.diff(starts, append=len(arr))
+    group_codes = np.arange(len(starts), dtype=np.intp)
+    uniques = values.take(starts)
+    if sort and not is_increasing:
+        group_codes = group_codes[::-1]
+        uniques = uniques[::-1]
+    return np.repeat(group_codes, counts), uniques
+
+
 def compress_group_index(
     group_index: npt.NDArray[np.int64], sort: bool = True
 ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
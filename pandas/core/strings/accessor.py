@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import codecs
-from functools import wraps
+import csv
+from functools import (
+    lru_cache,
+    wraps,
+)
+from io import BytesIO
 import re
 from typing import (
     TYPE_CHECKING,
@@ -20,6 +25,7 @@ from pandas.util._exceptions import find_stack_level
 from pandas.core.dtypes.common import (
     ensure_object,
     is_bool_dtype,
+    is_dict_like,
     is_extension_array_dtype,
     is_integer,
     is_list_like,
@@ -49,6 +55,7 @@ if TYPE_CHECKING:
         Callable,
         Hashable,
         Iterator,
+        Sequence,
     )
 
     from pandas._typing import (
@@ -78,6 +85,23 @@ _cpython_optimized_encoders = (
 _cpython_optimized_decoders = (*_cpython_optimized_encoders, "utf-16", "utf-32")
 
 
+# methods whose arguments or results aren't aligned element-wise with the data
+_ROW_ALIGNED_METHODS = frozenset({"cat", "extractall", "repeat"})
+# methods not going through Categorical._str_map, which already only maps the
+# categories
+_EXPANDING_METHODS = frozenset(
+    {
+        "extract",
+        "get_dummies",
+        "partition",
+        "rpartition",
+        "rsplit",
+        "split",
+        "split_to_frame",
+    }
+)
+
+
 def forbid_nonstring_types(
     forbidden: list[str] | None, name: str | None = None
 ) -> Callable[[F], F]:
@@ -120,6 +144,11 @@ def forbid_nonstring_types(
     ------
     TypeError
         If the inferred type of the underlying data is in `forbidden`.
+
+    Notes
+    -----
+    For dictionary-encoded data the wrapped method is applied to the distinct
+    values only, see :meth:`StringMethods._apply_to_uniques`.
     """
     # deal with None
     forbidden = [] if forbidden is None else forbidden
@@ -139,6 +168,10 @@ def forbid_nonstring_types(
                     f"inferred dtype '{self._inferred_dtype}'."
                 )
                 raise TypeError(msg)
+            if func_name not in _ROW_ALIGNED_METHODS:
+                result = self._apply_to_uniques(func_name, *args, **kwargs)
+                if result is not None:
+                    return result
             return func(self, *args, **kwargs)
 
         wrapper.__name__ = func_name
@@ -250,6 +283,73 @@ class StringMethods(NoNewAttributesMixin):
             )
         return inferred_dtype
 
+    def _apply_to_uniques(self, name: str, *args, **kwargs):
+        """
+        Apply a string method to the distinct values of dictionary-encoded data.
+
+        For pyarrow dictionary arrays and, for methods expanding to a
+        DataFrame, categorical data with repeated values, the method ``name``
+        is applied to a Series or Index holding each value in use (and a
+        missing value if there is one) once, and the rows of its result are
+        taken with the codes. This avoids materializing the strings for every
+        element.
+
+        Returns
+        -------
+        Series, DataFrame, Index, np.ndarray or None
+            None if the data is not dictionary-encoded or has no repeated
+            values.
+        """
+        from pandas import (
+            Index,
+            Series,
+        )
+
+        arr = self._orig.array
+        if self._is_categorical:
+            if name not in _EXPANDING_METHODS:
+                return None
+            codes = arr.codes
+            n_values = len(arr.categories)
+        elif isinstance(arr.dtype, ArrowDtype):
+            import pyarrow as pa
+
+            if not pa.types.is_dictionary(arr.dtype.pyarrow_dtype):
+                return None
+            codes, values = arr.factorize()
+            n_values = len(values)
+        else:
+            return None
+
+        # codes in use, shifted by one so missing values are at position 0
+        used = np.flatnonzero(np.bincount(codes + 1, minlength=n_values + 1))
+        if len(used) == len(codes):
+            return None
+        if self._is_categorical:
+            uniques = type(arr).from_codes(used - 1, dtype=arr.dtype)
+        else:
+            uniques = values.take(used - 1, allow_fill=True)
+        lookup = np.empty(n_values + 1, dtype=np.intp)
+        lookup[used] = np.arange(len(used))
+        indexer = lookup[codes + 1]
+
+        is_index = isinstance(self._orig, ABCIndex)
+        box = Index if is_index else Series
+        result = getattr(box(uniques, name=self._orig.name).str, name)(*args, **kwargs)
+        result = result.take(indexer)
+        if not isinstance(result, (ABCSeries, ABCDataFrame)):
+            return result
+        if is_index:
+            result = result.reset_index(drop=True)
+        else:
+            result.index = self._orig.index
+        result_name = result.name if result.ndim == 1 else None
+        result = result.__finalize__(self._orig, method="str")
+        if result.ndim == 1:
+            # __finalize__ copies over the original name
+            result.name = result_name
+        return result
+
     def __getitem__(self, key):
         result = self._data.array._str_getitem(key)
         return self._wrap_result(result)
@@ -1211,6 +1311,138 @@ class StringMethods(NoNewAttributesMixin):
             result, expand=expand, returns_string=expand, dtype=dtype
         )
 
+    @forbid_nonstring_types(["bytes", "mixed", "mixed-integer"])
+    def split_to_frame(
+        self, sep: str = ",", dtype=None, names: Sequence[Hashable] | None = None
+    ) -> DataFrame:
+        """
+        Split strings of delimited fields into typed columns of a DataFrame.
+
+        The strings are parsed with the C parser of :func:`read_csv`, as if
+        each string was a line of a CSV file, so the fields are converted
+        straight to the dtype of their column instead of going through
+        ``split(expand=True)`` and an object DataFrame first.
+
+        Parameters
+        ----------
+        sep : str, default ","
+            Single ASCII character separating the fields.
+        dtype : dtype or dict of {Hashable : dtype}, optional
+            Data type(s) to apply to the columns, see the ``dtype`` keyword
+            of :func:`read_csv`. By default the dtype of each column is
+            inferred like in :func:`read_csv`.
+        names : Sequence of Hashable, optional
+            Column labels. By default the columns are labeled with their
+            position, and there are as many columns as fields in the longest
+            string.
+
+        Returns
+        -------
+        DataFrame
+            One row for each element and one column for each field. Empty
+            fields, fields missing from shorter strings and the fields of
+            missing elements are missing values.
+
+        Raises
+        ------
+        ValueError
+            If ``sep`` isn't a single ASCII character, a string contains a line
+            break or has more fields than ``names``.
+
+        See Also
+        --------
+        Series.str.split : Split strings around given separator/delimiter.
+        read_csv : Read a comma-separated values (csv) file into DataFrame.
+
+        Notes
+        -----
+        Quote characters have no special meaning, every occurrence of
+        ``sep`` starts a new field.
+
+        Examples
+        --------
+        >>> s = pd.Series(["a|1|2.5", "b|2|", np.nan, "c|3|1e3"])
+        >>> s.str.split_to_frame("|", names=["key", "id", "value"])
+           key   id   value
+        0    a  1.0     2.5
+        1    b  2.0     NaN
+        2  NaN  NaN     NaN
+        3    c  3.0  1000.0
+
+        >>> s.str.split_to_frame("|", dtype={1: "Int64"})
+             0     1       2
+        0    a     1     2.5
+        1    b     2     NaN
+        2  NaN  <NA>     NaN
+        3    c     3  1000.0
+        """
+        from pandas import DataFrame
+
+        from pandas.io.parsers import read_csv
+
+        if (
+            not isinstance(sep, str)
+            or len(sep) != 1
+            or not sep.isascii()
+            or sep in "\r\n"
+        ):
+            raise ValueError(
+                "sep must be a single ASCII character other than a line break"
+            )
+
+        values = np.asarray(self._data, dtype=object)
+        mask = isna(values)
+        if mask.any():
+            values = values.copy()
+            values[mask] = ""
+        # each string is parsed as one line
+        data = "".join(["\n".join(values), "\n" if len(values) else ""])
+        data = data.encode("utf-8")
+        buf = np.frombuffer(data, dtype=np.uint8)
+        line_ends = np.flatnonzero(buf == ord("\n"))
+        if len(line_ends) != len(values) or b"\r" in data:
+            raise ValueError("split_to_frame does not support strings with line breaks")
+
+        seps_before_end = np.searchsorted(np.flatnonzero(buf == ord(sep)), line_ends)
+        n_fields = int(np.diff(seps_before_end, prepend=0).max(initial=-1)) + 1
+        if names is None:
+            names = range(n_fields)
+        elif len(names) < n_fields:
+            raise ValueError(
+                f"Strings have up to {n_fields} fields, but {len(names)} names "
+                "were given"
+            )
+
+        if not len(values):
+            result = DataFrame(columns=names, dtype=object)
+        else:
+            result = read_csv(
+                BytesIO(data),
+                sep=sep,
+                header=None,
+                names=names,
+                index_col=False,
+                dtype=dtype,
+                engine="c",
+                quoting=csv.QUOTE_NONE,
+                skip_blank_lines=False,
+                keep_default_na=False,
+                na_values=[""],
+                low_memory=False,
+                encoding="utf-8",
+            )
+            if dtype is None or is_dict_like(dtype):
+                # columns of strings keep the dtype of the data, like with split
+                str_dtype = _result_dtype(self._orig)
+                for col in result.columns:
+                    if (dtype is None or col not in dtype) and is_string_dtype(
+                        result[col].dtype
+                    ):
+                        result[col] = result[col].astype(str_dtype)
+        if isinstance(self._orig, ABCSeries):
+            result.index = self._orig.index
+        return result.__finalize__(self._orig, method="str")
+
     def get(self, i):
         """
         Extract element from each component at specified position or with specified key.
@@ -1286,6 +1518,9 @@ class StringMethods(NoNewAttributesMixin):
         1    Goodbye
         dtype: object
         """
+        result = self._apply_to_uniques("get", i)
+        if result is not None:
+            return result
         result = self._data.array._str_get(i)
         return self._wrap_result(result)
 
@@ -1496,6 +1731,94 @@ class StringMethods(NoNewAttributesMixin):
         result = self._data.array._str_contains(pat, case, flags, na, regex)
         return self._wrap_result(result, fill_value=na, returns_string=False)
 
+    @forbid_nonstring_types(["bytes"])
+    def contains_any(
+        self,
+        patterns,
+        case: bool = True,
+        flags: int = 0,
+        na=lib.no_default,
+        regex: bool = True,
+    ):
+        r"""
+        Test if any of several patterns is contained within each string.
+
+        All patterns are combined into a single regular expression, so the
+        strings are scanned once instead of once per pattern. Literal patterns
+        (``regex=False``) are combined into a prefix tree, which lets the
+        regular expression engine match all of them in a single pass.
+
+        Parameters
+        ----------
+        patterns : list-like of str
+            Character sequences or regular expressions. As the regular
+            expressions are combined into one, they cannot use named groups,
+            backreferences or inline flags at the start, e.g. ``(?i)``; use
+            ``flags`` or scoped flags such as ``(?i:...)`` instead.
+        case : bool, default True
+            If True, case sensitive.
+        flags : int, default 0 (no flags)
+            Flags to pass through to the re module, e.g. re.IGNORECASE.
+        na : scalar, optional
+            Fill value for missing values. The default depends on dtype of the
+            array. For the ``"str"`` dtype, ``False`` is used. For object
+            dtype, ``numpy.nan`` is used. For the nullable ``StringDtype``,
+            ``pandas.NA`` is used.
+        regex : bool, default True
+            If True, assumes the patterns are regular expressions.
+
+            If False, treats the patterns as literal strings.
+
+        Returns
+        -------
+        Series or Index of boolean values
+            A Series or Index of boolean values indicating whether any of
+            the given patterns is contained within the string of each
+            element of the Series or Index.
+
+        See Also
+        --------
+        Series.str.contains : Test if a single pattern is contained within
+            each string.
+        Series.str.extract_any : Extract the first match of any of several
+            patterns.
+
+        Examples
+        --------
+        >>> s = pd.Series(["Mouse", "dog", "house and parrot", "23", np.nan])
+        >>> s.str.contains_any(["og", "parrot"], regex=False)
+        0    False
+        1     True
+        2     True
+        3    False
+        4    False
+        dtype: bool
+
+        Specifying case sensitivity using `case`.
+
+        >>> s.str.contains_any(["MOUSE", "DOG"], case=False, regex=False)
+        0     True
+        1     True
+        2    False
+        3    False
+        4    False
+        dtype: bool
+
+        Using regular expressions.
+
+        >>> s.str.contains_any([r"^\d+$", "^d"])
+        0    False
+        1     True
+        2    False
+        3     True
+        4    False
+        dtype: bool
+        """
+        patterns = _validate_patterns(patterns, case, regex, flags)
+        pat = _combine_patterns(patterns, regex)
+        result = self._data.array._str_contains(pat, case, flags, na, True)
+        return self._wrap_result(result, fill_value=na, returns_string=False)
+
     @forbid_nonstring_types(["bytes"])
     def match(
         self,
@@ -2291,6 +2614,9 @@ class StringMethods(NoNewAttributesMixin):
         2    cm
         dtype: str
         """
+        result = self._apply_to_uniques("slice", start, stop, step)
+        if result is not None:
+            return result
         result = self._data.array._str_slice(start, stop, step)
         return self._wrap_result(result)
 
@@ -3456,6 +3782,77 @@ class StringMethods(NoNewAttributesMixin):
             result = self._data.array._str_extract(pat, flags=flags, expand=returns_df)
         return self._wrap_result(result, name=name, dtype=result_dtype)
 
+    @forbid_nonstring_types(["bytes"])
+    def extract_any(
+        self,
+        patterns,
+        case: bool = True,
+        flags: int = 0,
+        regex: bool = True,
+    ) -> Series | Index:
+        r"""
+        Extract the first match of any of several patterns.
+
+        All patterns are combined into a single regular expression, so the
+        strings are scanned once instead of once per pattern. For each
+        string, the leftmost match is returned. If several literal patterns
+        (``regex=False``) match at the same position, the longest one is
+        returned; regular expressions are tried in the order given.
+
+        Parameters
+        ----------
+        patterns : list-like of str
+            Character sequences or regular expressions. As the regular
+            expressions are combined into one, they cannot use named groups,
+            backreferences or inline flags at the start, e.g. ``(?i)``; use
+            ``flags`` or scoped flags such as ``(?i:...)`` instead.
+        case : bool, default True
+            If True, case sensitive.
+        flags : int, default 0 (no flags)
+            Flags from the ``re`` module, e.g. ``re.IGNORECASE``, that
+            modify regular expression matching for things like case,
+            spaces, etc. For more details, see :mod:`re`.
+        regex : bool, default True
+            If True, assumes the patterns are regular expressions.
+
+            If False, treats the patterns as literal strings.
+
+        Returns
+        -------
+        Series or Index
+            The matched substring of each element, missing if none of the
+            patterns matches.
+
+        See Also
+        --------
+        Series.str.extract : Extract capture groups of a single pattern.
+        Series.str.contains_any : Test if any of several patterns is contained
+            within each string.
+
+        Examples
+        --------
+        >>> s = pd.Series(["a cat", "a catalog", "dog", "bird"])
+        >>> s.str.extract_any(["cat", "catalog", "dog"], regex=False)
+        0        cat
+        1    catalog
+        2        dog
+        3        NaN
+        dtype: str
+
+        >>> s.str.extract_any([r"c\w+", r"\w+g"])
+        0        cat
+        1    catalog
+        2        dog
+        3        NaN
+        dtype: str
+        """
+        if not case:
+            flags |= re.IGNORECASE
+        pat = _combine_patterns(_validate_patterns(patterns, case, regex, flags), regex)
+        result_dtype = _result_dtype(self._data)
+        result = self._data.array._str_extract(f"({pat})", flags=flags, expand=False)
+        return self._wrap_result(result, dtype=result_dtype)
+
     @forbid_nonstring_types(["bytes"])
     def extractall(self, pat, flags: int = 0) -> DataFrame:
         r"""
@@ -3843,6 +4240,9 @@ class StringMethods(NoNewAttributesMixin):
         5    3.0
         dtype: float64
         """
+        result = self._apply_to_uniques("len")
+        if result is not None:
+            return result
         result = self._data.array._str_len()
         return self._wrap_result(result, returns_string=False)
 
@@ -4844,6 +5244,83 @@ def _get_group_names(regex: re.Pattern) -> list[Hashable] | range:
     return result
 
 
+def _validate_patterns(
+    patterns, case: bool, regex: bool, flags: int
+) -> tuple[str, ...]:
+    if isinstance(patterns, str) or not is_list_like(patterns):
+        raise TypeError(
+            f"patterns must be a list-like of strings, not {type(patterns).__name__}"
+        )
+    patterns = tuple(patterns)
+    if not patterns:
+        raise ValueError("patterns must not be empty")
+    if not all(isinstance(pat, str) for pat in patterns):
+        raise TypeError("patterns must be a list-like of strings")
+    if regex:
+        default_flags = re.compile("", flags=flags).flags
+        for pat in patterns:
+            compiled = re.compile(pat, flags=flags)
+            if (
+                compiled.flags != default_flags
+                or compiled.groupindex
+                or (compiled.groups and re.search(r"\\[1-9]|\(\?\(", pat))
+            ):
+                # these refer to the whole expression or to group numbers,
+                #  which change once the patterns are combined
+                raise ValueError(
+                    "patterns cannot use named groups, backreferences or inline "
+                    f"flags at the start, got {pat!r}. Pass flags with 'flags' "
+                    "or use scoped inline flags such as '(?i:...)' instead."
+                )
+    if not case and not regex:
+        # the prefix tree for literals shouldn't branch on case
+        patterns = tuple(pat.lower() for pat in patterns)
+    return patterns
+
+
+@lru_cache(maxsize=128)
+def _combine_patterns(patterns: tuple[str, ...], regex: bool) -> str:
+    """
+    Combine several patterns into a single regular expression.
+
+    Regular expressions are joined as alternatives. Literals are inserted
+    into a prefix tree which is turned into a regular expression matching
+    the longest of the literals starting at a position, so all literals can
+    be matched in one pass without backtracking over each of them.
+    """
+    if regex:
+        return "|".join(f"(?:{pat})" for pat in patterns)
+
+    trie: dict = {}
+    for literal in patterns:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_to_regex(trie)
+
+
+def _trie_to_regex(node: dict) -> str:
+    prefix = []
+    # collapse chains of nodes with a single child to limit the recursion
+    while len(node) == 1 and "" not in node:
+        ((char, node),) = node.items()
+        prefix.append(re.escape(char))
+    branches = [
+        re.escape(char) + _trie_to_regex(child) for char, child in node.items() if char
+    ]
+    if not branches:
+        body = ""
+    elif len(branches) == 1:
+        body = f"(?:{branches[0]})"
+    else:
+        body = f"(?:{'|'.join(branches)})"
+    if body and "" in node:
+        # a literal ends here, longer literals are tried first
+        body += "?"
+    return "".join(prefix) + body
+
+
 def str_extractall(arr, pat, flags: int = 0) -> DataFrame:
     regex = re.compile(pat, flags=flags)
     # the regex must contain capture groups.
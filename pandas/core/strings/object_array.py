@@ -153,7 +153,7 @@ class ObjectStringArrayMixin:
 
             f = lambda x: pat.search(x) is not None
         elif case:
-            f = lambda x: pat in x
+            f = lib.StrContains(pat)
         else:
             upper_pat = pat.upper()
             f = lambda x: upper_pat in x.upper()
@@ -161,12 +161,12 @@ class ObjectStringArrayMixin:
 
     def _str_startswith(self, pat, na=lib.no_default):
         validate_na_arg(na, name="na")
-        f = lambda x: x.startswith(pat)
+        f = lib.StrStartsWith(pat)
         return self._str_map(f, na_value=na, dtype=np.dtype(bool))
 
     def _str_endswith(self, pat, na=lib.no_default):
         validate_na_arg(na, name="na")
-        f = lambda x: x.endswith(pat)
+        f = lib.StrStartsWith(pat, suffix=True)
         return self._str_map(f, na_value=na, dtype=np.dtype(bool))
 
     def _str_replace(
@@ -278,17 +278,10 @@ class ObjectStringArrayMixin:
         return self._str_find_(sub, start, end, side="right")
 
     def _str_find_(self, sub, start, end, side):
-        if side == "left":
-            method = "find"
-        elif side == "right":
-            method = "rfind"
-        else:  # pragma: no cover
+        if side not in ("left", "right"):  # pragma: no cover
             raise ValueError("Invalid side")
 
-        if end is None:
-            f = lambda x: getattr(x, method)(sub, start)
-        else:
-            f = lambda x: getattr(x, method)(sub, start, end)
+        f = lib.StrFind(sub, start, end, reverse=side == "right")
         return self._str_map(f, dtype="int64")
 
     def _str_findall(self, pat, flags: int = 0):
@@ -330,7 +323,7 @@ class ObjectStringArrayMixin:
         return self._str_map(lambda x: x.rpartition(sep), dtype="object")
 
     def _str_len(self):
-        return self._str_map(len, dtype="int64")
+        return self._str_map(lib.StrLen(), dtype="int64")
 
     def _str_slice(self, start=None, stop=None, step=None):
         obj = slice(start, stop, step)
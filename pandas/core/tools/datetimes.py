@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from collections import abc
 from datetime import date
-from functools import partial
+from functools import (
+    lru_cache,
+    partial,
+)
 from itertools import islice
+import threading
 from typing import (
     TYPE_CHECKING,
     TypeAlias,
@@ -27,6 +31,7 @@ from pandas._libs.tslibs import (
     Timestamp,
     astype_overflowsafe,
     get_supported_dtype,
+    iNaT,
     is_supported_dtype,
     timezones as libtimezones,
 )
@@ -52,6 +57,7 @@ from pandas.core.dtypes.common import (
     is_integer_dtype,
     is_list_like,
     is_numeric_dtype,
+    is_object_dtype,
 )
 from pandas.core.dtypes.dtypes import (
     ArrowDtype,
@@ -61,6 +67,7 @@ from pandas.core.dtypes.generic import (
     ABCDataFrame,
     ABCSeries,
 )
+from pandas.core.dtypes.missing import isna
 
 from pandas.arrays import (
     DatetimeArray,
@@ -74,6 +81,7 @@ from pandas.core.arrays.datetimes import (
     objects_to_datetime64,
     tz_to_dtype,
 )
+from pandas.core.arrays.string_ import StringDtype
 from pandas.core.construction import extract_array
 from pandas.core.indexes.base import Index
 from pandas.core.indexes.datetimes import DatetimeIndex
@@ -86,7 +94,10 @@ if TYPE_CHECKING:
 
     from pandas._libs.tslibs.nattype import NaTType
     from pandas._libs.tslibs.timedeltas import UnitChoices
-    from pandas._typing import TimeUnit
+    from pandas._typing import (
+        TimeUnit,
+        npt,
+    )
 
     from pandas import (
         DataFrame,
@@ -130,13 +141,32 @@ start_caching_at = 50
 # ---------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
+def _guess_datetime_format_and_warnings(
+    dt_str: str, dayfirst: bool | None
+) -> tuple[str | None, tuple[tuple[Warning | str, type[Warning]], ...]]:
+    # guessing is a dateutil parse, so remember the formats of recent strings
+    #  along with the warnings to repeat on every call
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        guessed_format = guess_datetime_format(dt_str, dayfirst=dayfirst)
+    return guessed_format, tuple((w.message, w.category) for w in record)
+
+
+def _guess_datetime_format_cached(dt_str: str, dayfirst: bool | None) -> str | None:
+    guessed_format, caught = _guess_datetime_format_and_warnings(dt_str, dayfirst)
+    for message, category in caught:
+        warnings.warn(message, category, stacklevel=find_stack_level())
+    return guessed_format
+
+
 def _guess_datetime_format_for_array(arr, dayfirst: bool | None = False) -> str | None:
     # Try to guess the format based on the first non-NaN element, return None if can't
     if (first_non_null := tslib.first_non_null(arr)) != -1:
         if type(first_non_nan_element := arr[first_non_null]) is str:
             # GH#32264 np.str_ object
-            guessed_format = guess_datetime_format(
-                first_non_nan_element, dayfirst=dayfirst
+            guessed_format = _guess_datetime_format_cached(
+                first_non_nan_element, dayfirst
             )
             if guessed_format is not None:
                 return guessed_format
@@ -213,6 +243,214 @@ def should_cache(
     return do_caching
 
 
+# resolutions a parsed string can require, in increasing order; only NaT
+#  requires no more than seconds
+_PARSED_RESOS = ("s", "us", "ns")
+
+
+class _ParsedStringsTable:
+    """
+    Strings parsed with one set of options, with their parsed values.
+    """
+
+    def __init__(self) -> None:
+        self.keys = Index([], dtype=object)
+        self.values = np.array([], dtype=np.int64)
+        # position in _PARSED_RESOS of the resolution every value requires
+        self.resos = np.array([], dtype=np.intp)
+        self.last_used = np.array([], dtype=np.int64)
+        self.tz = None
+
+
+class _DatetimeParseCache:
+    """
+    Bounded LRU cache of strings parsed by ``to_datetime``, shared across calls.
+
+    Streaming ingestion, e.g. ``read_csv(chunksize=..., parse_dates=...)``,
+    sees the same timestamps in many chunks. Remembering the parsed values
+    across calls means every distinct string is only parsed once. Lookups
+    and inserts are vectorized over the unique values of a call.
+
+    The result is the same as parsing all strings of a call at once: every
+    entry records the resolution its value requires, so the resolution of
+    the result does not depend on earlier calls.
+    """
+
+    # maximum number of strings remembered per set of parsing options
+    maxsize = 100_000
+    # maximum number of sets of parsing options
+    maxtables = 8
+
+    def __init__(self) -> None:
+        self._tables: dict[tuple, _ParsedStringsTable] = {}
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+    def should_use(
+        self, arg: ArrayConvertible, format: str | None, convert_listlike: partial
+    ) -> bool:
+        """
+        Decide whether to look up the strings of a call in the cache.
+
+        Looking up and remembering strings costs about as much as hashing
+        them twice, which only pays off if some strings have been parsed
+        before. The cache is used for the first call with a set of options,
+        and afterwards only if a sample of ``arg`` contains remembered
+        strings.
+        """
+        options = convert_listlike.keywords
+        if self.maxsize == 0 or options["unit"] is not None:
+            return False
+
+        base = (format, *sorted(options.items()))
+        with self._lock:
+            tables = [table for key, table in self._tables.items() if key[:-1] == base]
+        if not tables:
+            return True
+        sample = np.array(list(islice(arg, 500)), dtype=object)
+        hits = max(
+            np.count_nonzero(table.keys.get_indexer(sample) >= 0) for table in tables
+        )
+        return hits > len(sample) * 0.2
+
+    def convert(
+        self, uniques: np.ndarray, format: str | None, convert_listlike: partial
+    ) -> Index | None:
+        """
+        Convert the unique values of a call, parsing only unseen strings.
+
+        Returns None unless ``uniques`` are strings. Falls back to
+        ``convert_listlike(uniques, format)`` whenever combining remembered
+        and newly parsed values might differ from parsing all values at once.
+        """
+        options = convert_listlike.keywords
+        null = isna(uniques)
+        if null.all() or not lib.is_string_array(uniques, skipna=True):
+            return None
+
+        key = (format, *sorted(options.items()))
+        if format is None:
+            # guess once, here, so that the format is based on the first
+            #  value of the call rather than the first unseen value
+            format = _guess_datetime_format_for_array(
+                uniques, dayfirst=options["dayfirst"]
+            )
+            if format is None:
+                format = "mixed"
+        key += (format,)
+        with self._lock:
+            self._clock += 1
+            table = self._tables.pop(key, None) or _ParsedStringsTable()
+            # reinsert to mark the table as most recently used
+            self._tables[key] = table
+            if len(self._tables) > self.maxtables:
+                del self._tables[next(iter(self._tables))]
+
+            indexer = table.keys.get_indexer(uniques)
+            indexer[null] = -1
+            hits = indexer >= 0
+            table.last_used[indexer[hits]] = self._clock
+            values = np.full(len(uniques), iNaT, dtype=np.int64)
+            resos = np.zeros(len(uniques), dtype=np.intp)
+            values[hits] = table.values[indexer[hits]]
+            resos[hits] = table.resos[indexer[hits]]
+            tz = table.tz
+
+        miss_values = uniques[~hits & ~null]
+        record: list[warnings.WarningMessage] = []
+        if len(miss_values):
+            try:
+                with warnings.catch_warnings(record=True) as record:
+                    warnings.simplefilter("always")
+                    parsed = convert_listlike(miss_values, format)
+            except (ValueError, TypeError):
+                # raise the same error as when parsing all values at once
+                return convert_listlike(uniques, format)
+            for caught in record:
+                warnings.warn(
+                    caught.message, caught.category, stacklevel=find_stack_level()
+                )
+            if not (
+                isinstance(parsed, DatetimeIndex)
+                and parsed.unit in _PARSED_RESOS
+                and (not hits.any() or parsed.tz == tz)
+            ):
+                return convert_listlike(uniques, format)
+            tz = parsed.tz
+
+            reso = _PARSED_RESOS.index(parsed.unit)
+            miss_resos = np.full(len(parsed), reso, dtype=np.intp)
+            miss_resos[parsed.isna()] = 0
+            values[~hits & ~null] = parsed.asi8
+            resos[~hits & ~null] = miss_resos
+
+        unit = _PARSED_RESOS[resos.max()]
+        result = np.empty(len(uniques), dtype=f"M8[{unit}]")
+        try:
+            for reso, res_unit in enumerate(_PARSED_RESOS):
+                where = resos == reso
+                if where.any():
+                    result[where] = astype_overflowsafe(
+                        values[where].view(f"M8[{res_unit}]"), result.dtype
+                    )
+        except OutOfBoundsDatetime:
+            # parsing all values at once decides whether to raise or coerce
+            return convert_listlike(uniques, format)
+
+        if len(miss_values) and not record:
+            # strings that warn are not remembered, so that they warn every time
+            self._insert(key, table, miss_values, parsed, miss_resos)
+        dtype = tz_to_dtype(tz, unit)
+        dta = DatetimeArray._simple_new(result, dtype=dtype)
+        return DatetimeIndex._simple_new(dta)
+
+    def _insert(
+        self,
+        key: tuple,
+        table: _ParsedStringsTable,
+        strings: np.ndarray,
+        parsed: DatetimeIndex,
+        resos: npt.NDArray[np.intp],
+    ) -> None:
+        values = parsed.asi8[: self.maxsize]
+        strings, resos = strings[: self.maxsize], resos[: self.maxsize]
+        if parsed.unit == "ns":
+            # a nanosecond value divisible by 1000 may stem from a string with
+            #  trailing zeros that requires nanoseconds, or not; skip those
+            keep = (values % 1000 != 0) | (values == iNaT)
+            strings, values, resos = strings[keep], values[keep], resos[keep]
+
+        with self._lock:
+            if self._tables.get(key) is not table:
+                # evicted or cleared in the meantime
+                return
+            if parsed.tz != table.tz:
+                # strings with a different offset than before; start over
+                table = self._tables[key] = _ParsedStringsTable()
+            table.keys = table.keys.append(Index(strings, dtype=object))
+            table.values = np.concatenate([table.values, values])
+            table.resos = np.concatenate([table.resos, resos])
+            table.last_used = np.concatenate(
+                [table.last_used, np.full(len(strings), self._clock)]
+            )
+            table.tz = parsed.tz
+            if len(table.keys) > self.maxsize:
+                keep = np.sort(
+                    np.argsort(table.last_used, kind="stable")[-self.maxsize :]
+                )
+                table.keys = table.keys.take(keep)
+                table.values = table.values[keep]
+                table.resos = table.resos[keep]
+                table.last_used = table.last_used[keep]
+
+
+_parse_cache = _DatetimeParseCache()
+
+
 def _maybe_cache(
     arg: ArrayConvertible,
     format: str | None,
@@ -242,16 +480,32 @@ def _maybe_cache(
     cache_array = Series(dtype=object)
 
     if cache:
+        dtype = getattr(arg, "dtype", None)
+        # strings may have been parsed by earlier calls, even if they are
+        #  not repeated within this call
+        maybe_strings = len(arg) > start_caching_at and (
+            isinstance(dtype, StringDtype) or is_object_dtype(dtype)
+        )
         # Perform a quicker unique check
-        if not should_cache(arg):
+        repeated = should_cache(arg)
+        use_parse_cache = maybe_strings and (
+            repeated or _parse_cache.should_use(arg, format, convert_listlike)
+        )
+        if not (use_parse_cache or repeated):
             return cache_array
 
         if not isinstance(arg, (np.ndarray, ExtensionArray, Index, ABCSeries)):
             arg = np.array(arg)
 
         unique_dates = unique(arg)
-        if len(unique_dates) < len(arg):
+        cache_dates = None
+        if use_parse_cache:
+            cache_dates = _parse_cache.convert(
+                np.asarray(unique_dates, dtype=object), format, convert_listlike
+            )
+        if cache_dates is None and repeated and len(unique_dates) < len(arg):
             cache_dates = convert_listlike(unique_dates, format)
+        if cache_dates is not None:
             # GH#45319
             try:
                 cache_array = Series(cache_dates, index=unique_dates, copy=False)
@@ -805,6 +1059,12 @@ def to_datetime(
         out-of-bounds values will render the cache unusable and may slow down
         parsing.
 
+        .. versionchanged:: 3.1.0
+            Parsed strings are also remembered across calls, in a bounded
+            cache shared by the whole process, so that strings repeating
+            across calls, e.g. across the chunks of
+            ``read_csv(chunksize=..., parse_dates=...)``, are parsed once.
+
     Returns
     -------
     datetime
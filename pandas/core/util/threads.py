@@ -0,0 +1,60 @@
+"""Common utilities for spreading operations over several threads"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pandas._config import get_option
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def get_num_threads(length: int, minimum_length: int) -> int:
+    """
+    Determine how many threads to spread an operation on ``length`` elements
+    over, according to the ``compute.num_threads`` option.
+
+    Parameters
+    ----------
+    length : int
+        Number of elements the operation works on.
+    minimum_length : int
+        Inputs shorter than twice this are processed on the calling thread,
+        and no thread is handed fewer elements than this.
+
+    Returns
+    -------
+    int
+        1 if the operation should run on the calling thread.
+    """
+    if length < 2 * minimum_length:
+        return 1
+
+    num_threads = get_option("compute.num_threads")
+    if num_threads == 0:
+        num_threads = os.cpu_count() or 1
+    return max(min(num_threads, length // minimum_length), 1)
+
+
+def chunk_slices(n: int, num_chunks: int) -> list[slice]:
+    """
+    Split ``range(n)`` into ``num_chunks`` contiguous slices of similar length.
+    """
+    bounds = np.linspace(0, n, num_chunks + 1, dtype=np.intp)
+    return [slice(start, stop) for start, stop in itertools.pairwise(bounds)]
+
+
+def map_threaded(func: Callable, *iterables) -> list:
+    """
+    Call ``func`` on every element of ``iterables`` on its own thread and
+    return the results in order.
+    """
+    iterables = tuple(list(iterable) for iterable in iterables)
+    with ThreadPoolExecutor(max_workers=len(iterables[0])) as pool:
+        return list(pool.map(func, *iterables))
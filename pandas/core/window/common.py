@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import cast
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    cast,
+)
 
 import numpy as np
 
@@ -13,6 +18,17 @@ from pandas.core.dtypes.generic import (
 )
 
 from pandas.core.indexes.api import MultiIndex
+from pandas.core.util.threads import (
+    get_num_threads,
+    map_threaded,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Inputs shorter than this are always aggregated on the calling thread, and no
+#  slice handed to a worker thread is shorter than this either.
+_MINIMUM_PARALLEL_WINDOW_LEN = 100_000
 
 
 def flex_binary_moment(arg1, arg2, f, pairwise: bool = False):
@@ -169,3 +185,64 @@ def prep_binary(arg1, arg2):
     Y = arg2 + 0 * arg1
 
     return X, Y
+
+
+def get_num_window_threads(name: str, num_values: int) -> int:
+    """
+    Determine how many threads to spread a Cython window aggregation over.
+
+    Parameters
+    ----------
+    name : str
+        Name of the aggregation.
+    num_values : int
+        Total number of values that are aggregated.
+
+    Returns
+    -------
+    int
+        1 if the aggregation should run on the calling thread.
+    """
+    if name == "apply":
+        # user defined functions hold the GIL throughout
+        return 1
+    return get_num_threads(num_values, _MINIMUM_PARALLEL_WINDOW_LEN)
+
+
+def apply_threaded(
+    func: Callable[..., np.ndarray],
+    num_threads: int,
+    values: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    min_periods: int,
+    *args: Any,
+) -> np.ndarray:
+    """
+    Threaded equivalent of ``func(values, start, end, min_periods, *args)``.
+
+    The windows are only split where a window does not overlap the previous
+    one, e.g. between the groups of a groupby window. The Cython kernels
+    start from scratch at such windows anyway, so the result is identical to
+    that of a single call.
+    """
+    n = len(start)
+    if n < 2 or not ((np.diff(start) >= 0).all() and (np.diff(end) >= 0).all()):
+        # the kernels recompute every window of non-monotonic bounds, which
+        #  a split could change
+        return func(values, start, end, min_periods, *args)
+
+    breaks = np.flatnonzero(start[1:] >= end[:-1]) + 1
+    if not len(breaks):
+        return func(values, start, end, min_periods, *args)
+    targets = np.linspace(0, n, num_threads + 1)[1:-1]
+    positions = np.searchsorted(breaks, targets).clip(max=len(breaks) - 1)
+    cuts = np.unique(breaks[positions])
+    slices = [slice(lo, hi) for lo, hi in itertools.pairwise([0, *cuts.tolist(), n])]
+
+    def run(slc: slice) -> np.ndarray:
+        return func(values, start[slc], end[slc], min_periods, *args)
+
+    # kernels returning several statistics lay out the windows along the
+    #  last axis
+    return np.concatenate(map_threaded(run, slices), axis=-1)
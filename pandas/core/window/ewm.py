@@ -987,6 +987,9 @@ class ExponentialMovingWindowGroupby(BaseWindowGroupby, ExponentialMovingWindow)
     """
 
     _attributes = ExponentialMovingWindow._attributes + BaseWindowGroupby._attributes
+    # the ewm kernels compute a whole group per window, so the columns are
+    #  spread across threads instead
+    _thread_group_slices = False
 
     def __init__(self, obj, *args, _grouper=None, **kwargs) -> None:
         super().__init__(obj, *args, _grouper=_grouper, **kwargs)
@@ -17,6 +17,11 @@ from pandas.core.indexers.objects import (
     ExpandingIndexer,
     GroupbyIndexer,
 )
+from pandas.core.window.online import (
+    ExpandingState,
+    online_result,
+    online_values,
+)
 from pandas.core.window.rolling import (
     BaseWindowGroupby,
     RollingAndExpandingMixin,
@@ -25,6 +30,8 @@ from pandas.core.window.rolling import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import numpy as np
+
     from pandas._typing import (
         P,
         QuantileInterpolation,
@@ -129,6 +136,50 @@ class Expanding(RollingAndExpandingMixin):
         """
         return ExpandingIndexer()
 
+    def online(self) -> OnlineExpanding:
+        """
+        Return an ``OnlineExpanding`` object to calculate expanding window
+        aggregations in an online method.
+
+        The aggregations of the returned object accept new rows with the
+        ``update`` argument and only calculate the results for these rows,
+        from running statistics of all the rows seen before.
+
+        All aggregations share these rows: to compute several of them for
+        the same new rows, pass the same object as ``update`` to each.
+
+        .. versionadded:: 3.1.0
+
+        Returns
+        -------
+        OnlineExpanding
+
+        See Also
+        --------
+        Rolling.online : Online rolling window calculations.
+        ExponentialMovingWindow.online : Online exponentially weighted calculations.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"a": range(5), "b": range(5, 10)})
+        >>> online_expanding = df.head(2).expanding().online()
+        >>> online_expanding.sum()
+             a     b
+        0  0.0   5.0
+        1  1.0  11.0
+        >>> online_expanding.sum(update=df.tail(3))
+              a     b
+        2   3.0  18.0
+        3   6.0  26.0
+        4  10.0  35.0
+        """
+        return OnlineExpanding(
+            obj=self.obj,
+            min_periods=self.min_periods,
+            method=self.method,
+            selection=self._selection,
+        )
+
     def aggregate(self, func=None, *args, **kwargs):
         """
         Aggregate using one or more operations over the specified axis.
@@ -1410,3 +1461,226 @@ class ExpandingGroupby(BaseWindowGroupby, Expanding):
             window_indexer=ExpandingIndexer,
         )
         return window_indexer
+
+
+class OnlineExpanding(Expanding):
+    """
+    Expanding window calculations over data that arrives in chunks.
+
+    See :meth:`Expanding.online`.
+    """
+
+    def __init__(
+        self,
+        obj: NDFrame,
+        min_periods: int = 1,
+        method: str = "single",
+        selection=None,
+    ) -> None:
+        if method != "single":
+            raise NotImplementedError(
+                "method='table' is not implemented with online operations."
+            )
+        super().__init__(
+            obj=obj,
+            min_periods=min_periods,
+            method=method,
+            selection=selection,
+        )
+        self._state = ExpandingState(self.min_periods)
+        # empty object with the columns of the data seen so far
+        self._seen: NDFrame | None = None
+        # the last update, None for the data the object was created with, and
+        # its statistics, which all aggregations of these rows share
+        self._last_update: NDFrame | None = None
+        self._last_stats: dict[str, np.ndarray] = {}
+
+    def reset(self) -> None:
+        """
+        Reset the state captured by `update` calls.
+        """
+        self._state.reset()
+        self._seen = None
+        self._last_update = None
+        self._last_stats = {}
+
+    def _online_apply(self, name: str, update: NDFrame | None, **kwargs):
+        if update is None and self._seen is not None and self._last_update is None:
+            # another aggregation of the data the object was created with
+            obj, stats = self._selected_obj, self._last_stats
+        elif update is not None and update is self._last_update:
+            # another aggregation of the last update
+            obj, stats = update, self._last_stats
+        else:
+            if update is None:
+                self.reset()
+                obj = self._selected_obj
+            else:
+                if self._seen is None:
+                    raise ValueError(
+                        f"Must call {name} with update=None first before passing update"
+                    )
+                obj = update
+                if obj.ndim != self._seen.ndim or (
+                    obj.ndim == 2 and not obj.columns.equals(self._seen.columns)
+                ):
+                    raise ValueError("update must have the same columns as the data")
+
+            stats = self._state.update(online_values(self, obj))
+            self._seen = obj.iloc[:0]
+            self._last_update, self._last_stats = update, stats
+
+        result = online_result(name, stats, self.min_periods, **kwargs)
+
+        if obj.ndim == 1:
+            return obj._constructor(result[:, 0], index=obj.index, name=obj.name)
+        return obj._constructor(result, index=obj.index, columns=obj.columns)
+
+    def aggregate(self, func=None, *args, **kwargs):
+        raise NotImplementedError("aggregate is not implemented.")
+
+    def count(self, *, update=None):
+        """
+        Calculate the online expanding count of non NaN observations.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("count", update)
+
+    def sum(self, *, update=None):
+        """
+        Calculate the online expanding sum.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("sum", update)
+
+    def mean(self, *, update=None):
+        """
+        Calculate the online expanding mean.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("mean", update)
+
+    def var(self, ddof: int = 1, *, update=None):
+        """
+        Calculate the online expanding variance.
+
+        Parameters
+        ----------
+        ddof : int, default 1
+            Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` represents the number of elements.
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("var", update, ddof=ddof)
+
+    def std(self, ddof: int = 1, *, update=None):
+        """
+        Calculate the online expanding standard deviation.
+
+        Parameters
+        ----------
+        ddof : int, default 1
+            Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` represents the number of elements.
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("std", update, ddof=ddof)
+
+    def min(self, *, update=None):
+        """
+        Calculate the online expanding minimum.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("min", update)
+
+    def max(self, *, update=None):
+        """
+        Calculate the online expanding maximum.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("max", update)
@@ -4,7 +4,15 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+import pandas._libs.window.aggregations as window_aggregations
 from pandas.compat._optional import import_optional_dependency
+from pandas.errors import DataError
+
+from pandas.core.window.common import zsqrt
+
+if TYPE_CHECKING:
+    from pandas.core.generic import NDFrame
+    from pandas.core.window.rolling import BaseWindow
 
 
 def generate_online_numba_ewma_func(
@@ -115,3 +123,280 @@ class EWMMeanState:
     def reset(self) -> None:
         self.old_wt = np.ones(self.shape[-1])
         self.last_ewm = None
+
+
+class ExpandingState:
+    """
+    Running statistics of every column over all the rows seen so far.
+
+    The state of the window kernels of every column is kept between updates,
+    including the compensation of the Kahan summation, so that adding rows
+    takes time proportional to the number of added rows. The variance is not
+    recomputed when it becomes numerically unstable, see ``WindowState``.
+    """
+
+    def __init__(self, min_periods: int) -> None:
+        self.min_periods = min_periods
+        self.reset()
+
+    def update(self, values: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Add the rows of the 2D float64 ``values``.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The number of rows, and the number of observations, sum, mean,
+            sum of squared differences from the mean, minimum and maximum of
+            every column after each of the added rows.
+        """
+        nrows, ncols = values.shape
+        if self._states is None:
+            self._states = [
+                window_aggregations.WindowState(self.min_periods, expanding=True)
+                for _ in range(ncols)
+            ]
+        end = np.arange(self.nrows + 1, self.nrows + nrows + 1, dtype=np.int64)
+        start = np.zeros(nrows, dtype=np.int64)
+        stats = _update_columns(self._states, values, self.nrows, start, end)
+        self.nrows += nrows
+        stats["nrows"] = end
+        return stats
+
+    def reset(self) -> None:
+        self.nrows = 0
+        self._states: list[window_aggregations.WindowState] | None = None
+
+
+class RollingState:
+    """
+    Rolling window statistics of every column over a stream of rows.
+
+    The state of the window kernels of every column is kept between updates,
+    together with the rows that can still be part of a window, so that
+    adding rows takes time proportional to the number of added rows and
+    gives the same results as the kernels over all the rows.
+
+    Parameters
+    ----------
+    window_size : int
+        The number of rows of a window, or the length of a window in units of
+        the index if ``variable`` is True.
+    min_periods : int
+    closed : str or None
+    variable : bool
+        Whether the windows are given by the values of the index, see
+        ``calculate_variable_window_bounds``.
+    """
+
+    def __init__(
+        self, window_size: int, min_periods: int, closed: str | None, variable: bool
+    ) -> None:
+        self.window_size = int(window_size)
+        self.min_periods = min_periods
+        self.closed = "right" if closed is None else closed
+        self.variable = variable
+        self.reset()
+
+    def update(
+        self, values: np.ndarray, index: np.ndarray | None = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Add the rows of the 2D float64 ``values``.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+        index : np.ndarray[int64], optional
+            The index values of the rows, required if ``variable`` is True.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The number of rows, and the number of observations, sum, mean,
+            sum of squared differences from the mean, minimum and maximum of
+            every column in the window ending at each of the added rows.
+        """
+        nrows = len(values)
+        if self.variable:
+            assert index is not None
+            index = self._signed_index(index)
+        self._append(values, index)
+
+        if self.variable:
+            start, end = self._variable_window_bounds(nrows)
+        else:
+            # see FixedWindowIndexer
+            offset = -1 if self.window_size == 0 else 0
+            end = np.arange(1 + offset, nrows + 1 + offset, dtype=np.int64)
+            end += self.nrows
+            start = end - self.window_size
+            if self.closed in ["left", "both"]:
+                start -= 1
+            if self.closed in ["left", "neither"]:
+                end -= 1
+            np.maximum(start, 0, out=start)
+            np.maximum(end, 0, out=end)
+
+        values = self._values[:, : self.nrows + nrows - self._offset]
+        stats = _update_columns(self._states, values.T, self._offset, start, end)
+        self.nrows += nrows
+        if nrows:
+            self._start = int(start[-1])
+        stats["nrows"] = end - start
+        return stats
+
+    def _signed_index(self, index: np.ndarray) -> np.ndarray:
+        """
+        Validate the new index values and orient them to be increasing.
+        """
+        if self._sign == 0 and len(index):
+            # the direction of the index is not known while all values
+            #  seen are equal, for which both directions give the same windows
+            first = index[0] if self._first is None else self._first
+            self._first = first
+            changes = index[index != first]
+            if len(changes):
+                self._sign = 1 if changes[0] > first else -1
+                if self._sign == -1:
+                    # so far stored as increasing
+                    self._index[: self.nrows - self._offset] *= -1
+        sign = self._sign or 1
+        signed = index * sign
+        used = self.nrows - self._offset
+        previous = self._index[used - 1 : used] if used else self._index[:0]
+        if (np.diff(np.concatenate([previous, signed])) < 0).any():
+            raise ValueError("index values must be monotonic")
+        return signed
+
+    def _append(self, values: np.ndarray, index: np.ndarray | None) -> None:
+        """
+        Append rows to the rows still needed, dropping the rows before the
+        start of the last window.
+        """
+        nrows, ncols = values.shape
+        if self._states is None:
+            self._states = [
+                window_aggregations.WindowState(self.min_periods) for _ in range(ncols)
+            ]
+            self._values = np.empty((ncols, 0))
+            self._index = np.empty(0, dtype=np.int64)
+        keep = self._start - self._offset
+        used = self.nrows - self._offset
+        if used + nrows > self._values.shape[1]:
+            # grow geometrically so that rows are copied a constant number of
+            #  times on average
+            capacity = max(2 * (used - keep + nrows), 64)
+            buffer = np.empty((ncols, capacity))
+            buffer[:, : used - keep] = self._values[:, keep:used]
+            self._values = buffer
+            if self.variable:
+                index_buffer = np.empty(capacity, dtype=np.int64)
+                index_buffer[: used - keep] = self._index[keep:used]
+                self._index = index_buffer
+            self._offset = self._start
+            used -= keep
+        self._values[:, used : used + nrows] = values.T
+        if self.variable:
+            self._index[used : used + nrows] = index
+
+    def _variable_window_bounds(self, nrows: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Incremental ``calculate_variable_window_bounds`` for the added rows.
+
+        The index is increasing, so the scans for the bounds of a window
+        starting from those of the previous window are binary searches.
+        """
+        begin = self._start - self._offset
+        stop = self.nrows + nrows - self._offset
+        index = self._index[begin:stop]
+        new = index[self.nrows - self._start :]
+        positions = np.arange(self.nrows, self.nrows + nrows, dtype=np.int64)
+
+        start_bound = new - self.window_size
+        if self.closed in ["left", "both"]:
+            start_bound -= 1
+        start = np.searchsorted(index, start_bound, side="right") + self._start
+        start = np.minimum(start, positions)
+
+        if self.closed in ["right", "both"]:
+            end = positions + 1
+        else:
+            # rows with the same index value as the current one are excluded
+            end = np.searchsorted(index, new, side="left") + self._start
+        return start.astype(np.int64, copy=False), end.astype(np.int64, copy=False)
+
+    def reset(self) -> None:
+        self.nrows = 0
+        self._states: list[window_aggregations.WindowState] | None = None
+        # the rows from the start of the last window onwards, the first at
+        #  position _offset in the stream
+        self._values = np.empty((0, 0))
+        self._index = np.empty(0, dtype=np.int64)
+        self._offset = 0
+        self._start = 0
+        # 1 if the index is increasing, -1 if decreasing, 0 if not known yet
+        self._sign = 0
+        self._first = None
+
+
+def online_values(window: BaseWindow, obj: NDFrame) -> np.ndarray:
+    """
+    Convert ``obj`` to a 2D float64 array with a column per column of obj.
+    """
+    obj = window._create_data(obj)
+    arrays = [obj._values] if obj.ndim == 1 else list(obj._iter_column_arrays())
+    try:
+        values = [window._prep_values(arr) for arr in arrays]
+    except (TypeError, NotImplementedError) as err:
+        raise DataError("No numeric types to aggregate") from err
+    if not values:
+        return np.empty((len(obj), 0))
+    return np.column_stack(values)
+
+
+def online_result(
+    name: str, stats: dict[str, np.ndarray], min_periods: int, **kwargs
+) -> np.ndarray:
+    """
+    Compute the aggregation ``name`` from the window statistics of
+    ``ExpandingState.update`` or ``RollingState.update``.
+    """
+    nobs = stats["nobs"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if name == "count":
+            # like count of the window kernels, which sums notna
+            rows = stats["nrows"][:, np.newaxis]
+            return np.where(rows >= min_periods, nobs, np.nan)
+        elif name in ("var", "std"):
+            # see calc_var
+            ddof = kwargs["ddof"]
+            mask = (nobs >= max(min_periods, 1)) & (nobs > ddof)
+            result = np.where(mask, stats["ssqdm"] / (nobs - ddof), np.nan)
+            if name == "std":
+                result = zsqrt(result)
+            return result
+        # sum, mean, min and max, the statistics are shared by all aggregations
+        return stats[name].copy()
+
+
+def _update_columns(
+    states: list[window_aggregations.WindowState] | None,
+    values: np.ndarray,
+    offset: int,
+    start: np.ndarray,
+    end: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Continue the window kernels of every column of the 2D ``values``.
+    """
+    assert states is not None
+    nrows = len(start)
+    columns = [
+        state.update(np.ascontiguousarray(values[:, j]), offset, start, end)
+        for j, state in enumerate(states)
+    ]
+    keys = ["nobs", "sum", "mean", "ssqdm", "min", "max"]
+    if not columns:
+        return {key: np.empty((nrows, 0)) for key in keys}
+    return {key: np.column_stack([col[key] for col in columns]) for key in keys}
@@ -9,6 +9,7 @@ import copy
 from datetime import timedelta
 from functools import partial
 import inspect
+import itertools
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -59,6 +60,7 @@ from pandas.core.indexers.objects import (
     BaseIndexer,
     FixedWindowIndexer,
     GroupbyIndexer,
+    VariableOffsetWindowIndexer,
     VariableWindowIndexer,
 )
 from pandas.core.indexes.api import (
@@ -74,8 +76,14 @@ from pandas.core.util.numba_ import (
     maybe_use_numba,
     prepare_function_arguments,
 )
+from pandas.core.util.threads import (
+    chunk_slices,
+    map_threaded,
+)
 from pandas.core.window.common import (
+    apply_threaded,
     flex_binary_moment,
+    get_num_window_threads,
     zsqrt,
 )
 from pandas.core.window.numba_ import (
@@ -83,6 +91,11 @@ from pandas.core.window.numba_ import (
     generate_numba_apply_func,
     generate_numba_table_func,
 )
+from pandas.core.window.online import (
+    RollingState,
+    online_result,
+    online_values,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -112,6 +125,19 @@ if TYPE_CHECKING:
 
 from pandas.core.arrays.datetimelike import dtype_to_unit
 
+# Aggregations that a list passed to Rolling.aggregate or Expanding.aggregate
+#  computes with a single call to roll_moments
+_MOMENT_AGGREGATIONS = frozenset(["count", "sum", "mean", "var", "std", "sem"])
+
+
+# Indexers whose window bounds are costly to compute, see
+#  BaseWindow._get_window_bounds
+_CACHED_INDEXERS = (
+    VariableWindowIndexer,
+    VariableOffsetWindowIndexer,
+    GroupbyIndexer,
+)
+
 
 class BaseWindow(SelectionMixin):
     """Provides utilities for performing windowing operations."""
@@ -119,6 +145,9 @@ class BaseWindow(SelectionMixin):
     _attributes: list[str] = []
     exclusions: frozenset[Hashable] = frozenset()
     _on: Index
+    # whether _apply spreads the slices of the groups across threads, rather
+    #  than the columns, when "compute.num_threads" allows it
+    _thread_group_slices: bool = False
 
     def __init__(
         self,
@@ -157,6 +186,11 @@ class BaseWindow(SelectionMixin):
             )
 
         self._selection = selection
+        # window bounds of the costly indexers, keyed by the number of values
+        #  and min_periods, shared by every aggregation of this object
+        self._window_bounds: dict[
+            tuple[int, int | None], tuple[np.ndarray, np.ndarray]
+        ] = {}
         self._validate()
 
     def _validate(self) -> None:
@@ -294,6 +328,9 @@ class BaseWindow(SelectionMixin):
 
         selection = self._infer_selection(key, subset)
         new_win = type(self)(subset, selection=selection, **kwargs)
+        if subset.index is self.obj.index:
+            # selecting columns leaves the windows unchanged
+            new_win._window_bounds = self._window_bounds
         return new_win
 
     def __getattr__(self, attr: str):
@@ -339,6 +376,35 @@ class BaseWindow(SelectionMixin):
             result = obj.iloc[slice(s, e)]
             yield result
 
+    def _get_window_bounds(
+        self,
+        window_indexer: BaseIndexer,
+        num_values: int,
+        min_periods: int | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute and check the bounds of the windows over ``num_values`` values.
+
+        The bounds of the variable and groupby indexers are cached, so that
+        further aggregations of this object reuse them.
+        """
+        key = (num_values, min_periods)
+        cache = type(window_indexer) in _CACHED_INDEXERS
+        if cache and key in self._window_bounds:
+            return self._window_bounds[key]
+
+        start, end = window_indexer.get_window_bounds(
+            num_values=num_values,
+            min_periods=min_periods,
+            center=self.center,
+            closed=self.closed,
+            step=self.step,
+        )
+        self._check_window_bounds(start, end, num_values)
+        if cache:
+            self._window_bounds[key] = (start, end)
+        return start, end
+
     def _prep_values(self, values: ArrayLike) -> np.ndarray:
         """Convert input to numpy arrays for Cython routines"""
         if needs_i8_conversion(values.dtype):
@@ -462,7 +528,7 @@ class BaseWindow(SelectionMixin):
             obj._mgr = obj._mgr.consolidate()
 
         taker = []
-        res_values = []
+        arrays = []
         for i, arr in enumerate(obj._iter_column_arrays()):
             # GH#42736 operate column-wise instead of block-wise
             # As of 2.0, hfunc will raise for nuisance columns
@@ -472,10 +538,25 @@ class BaseWindow(SelectionMixin):
                 raise DataError(
                     f"Cannot aggregate non-numeric type: {arr.dtype}"
                 ) from err
-            res = homogeneous_func(arr)
-            res_values.append(res)
+            arrays.append(arr)
             taker.append(i)
 
+        num_threads = 1
+        if not self._thread_group_slices:
+            num_threads = min(
+                get_num_window_threads(name, len(obj) * len(arrays)), len(arrays)
+            )
+        if num_threads > 1:
+            # the Cython kernels release the GIL, so columns can be
+            #  aggregated concurrently
+            chunks = map_threaded(
+                lambda slc: [homogeneous_func(arr) for arr in arrays[slc]],
+                chunk_slices(len(arrays), num_threads),
+            )
+            res_values = list(itertools.chain.from_iterable(chunks))
+        else:
+            res_values = [homogeneous_func(arr) for arr in arrays]
+
         index = self._slice_axis_for_step(
             obj.index, res_values[0] if len(res_values) > 0 else None
         )
@@ -575,14 +656,9 @@ class BaseWindow(SelectionMixin):
                 return values.copy()
 
             def calc(x):
-                start, end = window_indexer.get_window_bounds(
-                    num_values=len(x),
-                    min_periods=min_periods,
-                    center=self.center,
-                    closed=self.closed,
-                    step=self.step,
+                start, end = self._get_window_bounds(
+                    window_indexer, len(x), min_periods
                 )
-                self._check_window_bounds(start, end, len(x))
 
                 return func(x, start, end, min_periods, *numba_args)
 
@@ -612,14 +688,7 @@ class BaseWindow(SelectionMixin):
         values = self._prep_values(obj.to_numpy())
         if values.ndim == 1:
             values = values.reshape(-1, 1)
-        start, end = window_indexer.get_window_bounds(
-            num_values=len(values),
-            min_periods=min_periods,
-            center=self.center,
-            closed=self.closed,
-            step=self.step,
-        )
-        self._check_window_bounds(start, end, len(values))
+        start, end = self._get_window_bounds(window_indexer, len(values), min_periods)
         # For now, map everything to float to match the Cython impl
         # even though it is wrong
         # TODO: Could preserve correct dtypes in future
@@ -644,8 +713,21 @@ class BaseWindow(SelectionMixin):
             out = obj._constructor(result, index=index, columns=columns)
             return self._resolve_output(out, obj)
 
+    def _aggregate_fused(self, func) -> list[Series] | None:
+        """
+        Compute a list of aggregations of a Series at once.
+
+        Returns None if ``func`` cannot be computed at once, in which case the
+        aggregations are computed one after another.
+        """
+        return None
+
     def aggregate(self, func=None, *args, **kwargs):
         relabeling, func, columns, order = reconstruct_func(func, **kwargs)
+        if not args and not kwargs:
+            results = self._aggregate_fused(func)
+            if results is not None:
+                return concat(results, keys=func, axis=1, sort=False)
         result = ResamplerWindowApply(self, func, args=args, kwargs=kwargs).agg()
         if isinstance(result, ABCDataFrame) and relabeling:
             result = result.iloc[:, order]
@@ -665,6 +747,7 @@ class BaseWindowGroupby(BaseWindow):
     _grouper: BaseGrouper
     _as_index: bool
     _attributes: list[str] = ["_grouper"]
+    _thread_group_slices = True
 
     def __init__(
         self,
@@ -697,6 +780,10 @@ class BaseWindowGroupby(BaseWindow):
         numba_args: tuple[Any, ...] = (),
         **kwargs,
     ) -> DataFrame | Series:
+        if self._thread_group_slices:
+            num_threads = get_num_window_threads(name, len(self._selected_obj))
+            if num_threads > 1:
+                func = partial(apply_threaded, func, num_threads)
         result = super()._apply(
             func,
             name,
@@ -704,6 +791,19 @@ class BaseWindowGroupby(BaseWindow):
             numba_args,
             **kwargs,
         )
+        return self._restore_group_index(result)
+
+    def _aggregate_fused(self, func) -> list[Series] | None:
+        results = super()._aggregate_fused(func)
+        if results is None:
+            return None
+        return [self._restore_group_index(result) for result in results]
+
+    def _restore_group_index(self, result: NDFrameT) -> NDFrameT:
+        """
+        Replace the index of a result computed over the rows sorted by group
+        with the group labels and the original index.
+        """
         # Reconstruct the resulting MultiIndex
         # 1st set of levels = group by labels
         # 2nd set of levels = original DataFrame/Series index
@@ -1519,6 +1619,74 @@ class Window(BaseWindow):
 
 
 class RollingAndExpandingMixin(BaseWindow):
+    def _aggregate_fused(self, func) -> list[Series] | None:
+        if (
+            self._selected_obj.ndim != 1
+            or self.method != "single"
+            or maybe_use_numba(None)
+            or not isinstance(func, list)
+            or len(func) < 2
+            or len(set(func)) != len(func)
+            or not all(
+                isinstance(name, str) and name in _MOMENT_AGGREGATIONS for name in func
+            )
+        ):
+            return None
+
+        obj = self._create_data(self._selected_obj)
+        try:
+            values = self._prep_values(obj._values)
+        except (TypeError, NotImplementedError):
+            # let the aggregations raise one after another
+            return None
+        if values.size == 0:
+            return None
+
+        window_indexer = self._get_window_indexer()
+        min_periods = (
+            self.min_periods
+            if self.min_periods is not None
+            else window_indexer.window_size
+        )
+        start, end = self._get_window_bounds(window_indexer, len(values), min_periods)
+
+        num_threads = 1
+        if self._thread_group_slices:
+            num_threads = get_num_window_threads("aggregate", len(values))
+
+        def calc(window_func: Callable[..., np.ndarray]) -> np.ndarray:
+            if num_threads > 1:
+                return apply_threaded(
+                    window_func, num_threads, values, start, end, min_periods
+                )
+            return window_func(values, start, end, min_periods)
+
+        # the moments share their running state, so they are computed in a
+        #  single pass over the windows, keeping only the state they need
+        names = set(func)
+        computed = {
+            "count": bool(names & {"count", "sem"}),
+            "sum": "sum" in names,
+            "mean": "mean" in names,
+            "var": bool(names & {"var", "std", "sem"}),
+        }
+        window_func = partial(
+            window_aggregations.roll_moments,
+            **{f"compute_{name}": flag for name, flag in computed.items()},
+        )
+        with np.errstate(all="ignore"):
+            rows = iter(calc(window_func))
+            results = {name: next(rows) for name, flag in computed.items() if flag}
+            if "var" in results:
+                results["std"] = zsqrt(results["var"])
+            if "sem" in names:
+                results["sem"] = results["std"] / results["count"] ** 0.5
+
+        index = self._slice_axis_for_step(obj.index, results[func[0]])
+        return [
+            obj._constructor(results[name], index=index, name=obj.name) for name in func
+        ]
+
     def count(self, numeric_only: bool = False):
         window_func = window_aggregations.roll_sum
         return self._apply(window_func, name="count", numeric_only=numeric_only)
@@ -1876,14 +2044,9 @@ class RollingAndExpandingMixin(BaseWindow):
                 if self.min_periods is not None
                 else window_indexer.window_size
             )
-            start, end = window_indexer.get_window_bounds(
-                num_values=len(x_array),
-                min_periods=min_periods,
-                center=self.center,
-                closed=self.closed,
-                step=self.step,
+            start, end = self._get_window_bounds(
+                window_indexer, len(x_array), min_periods
             )
-            self._check_window_bounds(start, end, len(x_array))
 
             with np.errstate(all="ignore"):
                 mean_x_y = window_aggregations.roll_mean(
@@ -1923,14 +2086,9 @@ class RollingAndExpandingMixin(BaseWindow):
                 if self.min_periods is not None
                 else window_indexer.window_size
             )
-            start, end = window_indexer.get_window_bounds(
-                num_values=len(x_array),
-                min_periods=min_periods,
-                center=self.center,
-                closed=self.closed,
-                step=self.step,
+            start, end = self._get_window_bounds(
+                window_indexer, len(x_array), min_periods
             )
-            self._check_window_bounds(start, end, len(x_array))
 
             with np.errstate(all="ignore"):
                 mean_x_y = window_aggregations.roll_mean(
@@ -2037,6 +2195,63 @@ class Rolling(RollingAndExpandingMixin):
             on = "index"
         raise ValueError(f"{on} {msg}")
 
+    def online(self) -> OnlineRolling:
+        """
+        Return an ``OnlineRolling`` object to calculate rolling window
+        aggregations in an online method.
+
+        The aggregations of the returned object accept new rows with the
+        ``update`` argument and only calculate the results for these rows.
+        Only the last rows that can still be part of a window are kept, so the
+        cost of an update depends on the window size and the number of new
+        rows, not on the number of rows seen before.
+
+        All aggregations share these rows: to compute several of them for
+        the same new rows, pass the same object as ``update`` to each.
+
+        .. versionadded:: 3.1.0
+
+        Returns
+        -------
+        OnlineRolling
+
+        See Also
+        --------
+        Expanding.online : Online expanding window calculations.
+        ExponentialMovingWindow.online : Online exponentially weighted calculations.
+
+        Notes
+        -----
+        Online calculations are not implemented for centered windows, windows
+        with a ``step``, windows over an ``on`` column, ``method='table'`` or
+        windows defined by a :class:`~pandas.api.indexers.BaseIndexer`.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"a": range(5), "b": range(5, 10)})
+        >>> online_rolling = df.head(3).rolling(2).online()
+        >>> online_rolling.sum()
+             a     b
+        0  NaN   NaN
+        1  1.0  11.0
+        2  3.0  13.0
+        >>> online_rolling.sum(update=df.tail(2))
+             a     b
+        3  5.0  15.0
+        4  7.0  17.0
+        """
+        return OnlineRolling(
+            obj=self.obj,
+            window=self.window,
+            min_periods=self.min_periods,
+            center=self.center,
+            on=self.on,
+            closed=self.closed,
+            step=self.step,
+            method=self.method,
+            selection=self._selection,
+        )
+
     def aggregate(self, func=None, *args, **kwargs):
         """
         Aggregate using one or more operations over the specified axis.
@@ -3514,3 +3729,264 @@ class RollingGroupby(BaseWindowGroupby, Rolling):
                     f"Each group within {on} must be monotonic. "
                     f"Sort the values in {on} first."
                 )
+
+
+class OnlineRolling(Rolling):
+    """
+    Rolling window calculations over data that arrives in chunks.
+
+    See :meth:`Rolling.online`.
+    """
+
+    def __init__(
+        self,
+        obj: NDFrame,
+        window=None,
+        min_periods: int | None = None,
+        center: bool | None = False,
+        on: str | Index | None = None,
+        closed: str | None = None,
+        step: int | None = None,
+        method: str = "single",
+        *,
+        selection=None,
+    ) -> None:
+        if center:
+            raise NotImplementedError(
+                "center is not implemented with online operations."
+            )
+        if step is not None:
+            raise NotImplementedError("step is not implemented with online operations.")
+        if on is not None:
+            raise NotImplementedError("on is not implemented with online operations.")
+        if method != "single":
+            raise NotImplementedError(
+                "method='table' is not implemented with online operations."
+            )
+        if isinstance(window, BaseIndexer):
+            raise NotImplementedError(
+                "BaseIndexer subclasses are not implemented with online operations."
+            )
+        super().__init__(
+            obj=obj,
+            window=window,
+            min_periods=min_periods,
+            closed=closed,
+            selection=selection,
+        )
+        self._state = RollingState(
+            self.window if self._win_freq_i8 is None else self._win_freq_i8,
+            self.min_periods if self.min_periods is not None else self.window,
+            self.closed,
+            variable=self._win_freq_i8 is not None,
+        )
+        # empty object with the columns of the data seen so far
+        self._seen: NDFrame | None = None
+        # the last update, None for the data the object was created with, and
+        # its statistics, which all aggregations of these rows share
+        self._last_update: NDFrame | None = None
+        self._last_stats: dict[str, np.ndarray] = {}
+
+    def reset(self) -> None:
+        """
+        Reset the state captured by `update` calls.
+        """
+        self._state.reset()
+        self._seen = None
+        self._last_update = None
+        self._last_stats = {}
+
+    def _online_index(self, obj: NDFrame) -> npt.NDArray[np.int64] | None:
+        """
+        Return the index of ``obj`` as int64 in the units of the window.
+        """
+        if self._win_freq_i8 is None:
+            return None
+        index = obj.index.astype(self._on.dtype, copy=False)
+        if index.hasnans:
+            self._raise_monotonic_error("values must not have NaT")
+        if isinstance(index, (PeriodIndex, DatetimeIndex, TimedeltaIndex)):
+            return index.asi8
+        return index.to_numpy(dtype=np.int64)
+
+    def _online_apply(self, name: str, update: NDFrame | None, **kwargs):
+        if update is None and self._seen is not None and self._last_update is None:
+            # another aggregation of the data the object was created with
+            obj, stats = self._selected_obj, self._last_stats
+        elif update is not None and update is self._last_update:
+            # another aggregation of the last update
+            obj, stats = update, self._last_stats
+        else:
+            if update is None:
+                self.reset()
+                obj = self._selected_obj
+            else:
+                if self._seen is None:
+                    raise ValueError(
+                        f"Must call {name} with update=None first before passing update"
+                    )
+                obj = update
+                if obj.ndim != self._seen.ndim or (
+                    obj.ndim == 2 and not obj.columns.equals(self._seen.columns)
+                ):
+                    raise ValueError("update must have the same columns as the data")
+
+            stats = self._state.update(
+                online_values(self, obj), self._online_index(obj)
+            )
+            self._seen = obj.iloc[:0]
+            self._last_update, self._last_stats = update, stats
+
+        result = online_result(name, stats, self._state.min_periods, **kwargs)
+        if obj.ndim == 1:
+            return obj._constructor(result[:, 0], index=obj.index, name=obj.name)
+        return obj._constructor(result, index=obj.index, columns=obj.columns)
+
+    def aggregate(self, func=None, *args, **kwargs):
+        raise NotImplementedError("aggregate is not implemented.")
+
+    def count(self, *, update=None):
+        """
+        Calculate the online rolling count of non NaN observations.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("count", update)
+
+    def sum(self, *, update=None):
+        """
+        Calculate the online rolling sum.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("sum", update)
+
+    def mean(self, *, update=None):
+        """
+        Calculate the online rolling mean.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("mean", update)
+
+    def var(self, ddof: int = 1, *, update=None):
+        """
+        Calculate the online rolling variance.
+
+        Parameters
+        ----------
+        ddof : int, default 1
+            Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` represents the number of elements.
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("var", update, ddof=ddof)
+
+    def std(self, ddof: int = 1, *, update=None):
+        """
+        Calculate the online rolling standard deviation.
+
+        Parameters
+        ----------
+        ddof : int, default 1
+            Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` represents the number of elements.
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("std", update, ddof=ddof)
+
+    def min(self, *, update=None):
+        """
+        Calculate the online rolling minimum.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("min", update)
+
+    def max(self, *, update=None):
+        """
+        Calculate the online rolling maximum.
+
+        Parameters
+        ----------
+        update : DataFrame or Series, default None
+            New rows to continue the calculation from the rows seen before.
+            ``update`` needs to be ``None`` the first time the aggregation is
+            calculated, which (re)starts the calculation from the data the
+            object was created with. Calling other aggregations with the same
+            ``update`` object, or with ``None`` before any update, computes
+            them over the same rows rather than adding the rows again.
+
+        Returns
+        -------
+        DataFrame or Series
+        """
+        return self._online_apply("max", update)
@@ -5,7 +5,11 @@ from abc import (
     abstractmethod,
 )
 from collections import abc
-from itertools import islice
+from functools import partial
+from itertools import (
+    islice,
+    pairwise,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,6 +30,7 @@ from pandas._libs import lib
 from pandas._libs.json import (
     ujson_dumps,
     ujson_loads,
+    ujson_loads_lines,
 )
 from pandas._libs.tslibs import iNaT
 from pandas.compat._optional import import_optional_dependency
@@ -53,7 +58,16 @@ from pandas import (
     notna,
     to_datetime,
 )
+from pandas.core.indexes.api import (
+    default_index,
+    ensure_index,
+)
+from pandas.core.internals.construction import convert_object_array
 from pandas.core.reshape.concat import concat
+from pandas.core.util.threads import (
+    get_num_threads,
+    map_threaded,
+)
 
 from pandas.io._util import arrow_table_to_pandas
 from pandas.io.common import (
@@ -80,6 +94,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from pandas._typing import (
+        ArrayLike,
         CompressionOptions,
         DtypeArg,
         DtypeBackend,
@@ -964,14 +979,6 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
         filepath_or_buffer = self.handles.handle
         return filepath_or_buffer
 
-    def _combine_lines(self, lines) -> str:
-        """
-        Combines a list of JSON objects into one JSON object.
-        """
-        return (
-            f"[{','.join([line for line in (line.strip() for line in lines) if line])}]"
-        )
-
     @overload
     def read(self: JsonReader[Literal["frame"]]) -> DataFrame: ...
 
@@ -1030,15 +1037,12 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
                 if chunks:
                     obj = concat(chunks)
                 else:
-                    obj = self._get_object_parser(self._combine_lines([]))
+                    obj = self._get_object_parser("", lines=True)
             elif self.nrows is not None:
                 lines = list(islice(self.data, self.nrows))
-                lines_json = self._combine_lines(lines)
-                obj = self._get_object_parser(lines_json)
+                obj = self._get_object_parser("".join(lines), lines=True)
             else:
-                data = ensure_str(self.data)
-                data_lines = data.split("\n")
-                obj = self._get_object_parser(self._combine_lines(data_lines))
+                obj = self._get_object_parser(ensure_str(self.data), lines=True)
         else:
             obj = self._get_object_parser(self.data)
         if self.dtype_backend is not lib.no_default:
@@ -1049,14 +1053,16 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
         else:
             return obj
 
-    def _get_object_parser(self, json: str) -> DataFrame | Series:
+    def _get_object_parser(self, json: str, lines: bool = False) -> DataFrame | Series:
         """
-        Parses a json document into a pandas object.
+        Parses a json document, or newline delimited values if ``lines``, into a
+        pandas object.
         """
         typ = self.typ
         dtype = self.dtype
         kwargs = {
             "orient": self.orient,
+            "lines": lines,
             "dtype": self.dtype,
             "convert_axes": self.convert_axes,
             "convert_dates": self.convert_dates,
@@ -1118,8 +1124,7 @@ class JsonReader(abc.Iterator, Generic[FrameSeriesStrT]):
             raise StopIteration
 
         try:
-            lines_json = self._combine_lines(lines)
-            obj = self._get_object_parser(lines_json)
+            obj = self._get_object_parser("".join(lines), lines=True)
 
             # Make sure that the returned objects have the right index.
             obj.index = range(self.nrows_seen, self.nrows_seen + len(obj))
@@ -1172,8 +1177,10 @@ class Parser:
         precise_float: bool = False,
         date_unit=None,
         dtype_backend: DtypeBackend | lib.NoDefault = lib.no_default,
+        lines: bool = False,
     ) -> None:
         self.json = json
+        self.lines = lines
 
         if orient is None:
             orient = self._default_orient
@@ -1397,7 +1404,8 @@ class SeriesParser(Parser):
     _split_keys = ("name", "index", "data")
 
     def _parse(self) -> Series:
-        data = ujson_loads(self.json, precise_float=self.precise_float)
+        json = _combine_lines(self.json) if self.lines else self.json
+        data = ujson_loads(json, precise_float=self.precise_float)
 
         if self.orient == "split":
             decoded = {str(k): v for k, v in data.items()}
@@ -1419,6 +1427,13 @@ class FrameParser(Parser):
         json = self.json
         orient = self.orient
 
+        if self.lines:
+            if orient not in ("split", "index", "table"):
+                obj = _read_lines(json, precise_float=self.precise_float)
+                if obj is not None:
+                    return obj
+            json = _combine_lines(json)
+
         if orient == "split":
             decoded = {
                 str(k): v
@@ -1491,3 +1506,145 @@ def _should_convert_dates(
     ):
         return True
     return False
+
+
+def _combine_lines(text: str) -> str:
+    """
+    Combines newline delimited JSON values into one JSON array.
+    """
+    lines = (line.strip() for line in text.split("\n"))
+    return f"[{','.join([line for line in lines if line])}]"
+
+
+# tags of the values decoded by ujson_loads_lines, see JSONtoObj.c
+(
+    _LINES_MISSING,
+    _LINES_NULL,
+    _LINES_INT,
+    _LINES_UINT,
+    _LINES_DOUBLE,
+    _LINES_FALSE,
+    _LINES_TRUE,
+    _LINES_STRING,
+    _LINES_OBJECT,
+) = range(9)
+
+# the minimum number of characters decoded per thread
+_MINIMUM_PARALLEL_LINES_LEN = 1 << 22
+
+
+def _split_lines(text: str, num_chunks: int) -> list[str]:
+    """
+    Split ``text`` at line breaks into ``num_chunks`` parts of similar length.
+    """
+    bounds = [0]
+    for i in range(1, num_chunks):
+        stop = text.find("\n", max(len(text) * i // num_chunks, bounds[-1]))
+        if stop == -1:
+            break
+        bounds.append(stop + 1)
+    bounds.append(len(text))
+    return [text[start:stop] for start, stop in pairwise(bounds)]
+
+
+def _read_lines(text: str, precise_float: bool) -> DataFrame | None:
+    """
+    Decode newline delimited JSON objects straight into columns.
+
+    Equivalent to ``DataFrame(ujson_loads(_combine_lines(text)))``, but the
+    lines are decoded into a tag and a value for every key, without creating
+    a dict for every line or an object for every number. Large inputs are
+    decoded on several threads according to the ``compute.num_threads``
+    option, as most of the decoding releases the GIL.
+
+    Returns None if a line is not a JSON object.
+    """
+    num_threads = get_num_threads(len(text), _MINIMUM_PARALLEL_LINES_LEN)
+    decode = partial(ujson_loads_lines, precise_float=precise_float)
+    if num_threads > 1:
+        parts = map_threaded(decode, _split_lines(text, num_threads))
+    else:
+        parts = [decode(text)]
+    if any(part is None for part in parts):
+        return None
+
+    nrows = sum(n for n, _ in parts)
+    if nrows == 0:
+        return DataFrame([], dtype=None)
+    keys = list(dict.fromkeys(key for _, columns in parts for key in columns))
+    if len(parts) == 1:
+        columns = parts[0][1]
+    else:
+        columns = {key: _concat_lines_values(parts, key) for key in keys}
+
+    arrays = [_lines_to_array(*columns[key]) for key in keys]
+    return DataFrame._from_arrays(
+        arrays, ensure_index(keys), default_index(nrows), verify_integrity=False
+    )
+
+
+def _concat_lines_values(
+    parts: list[tuple[int, dict]], key: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """
+    Concatenate the tagged values of ``key`` in the decoded parts of the lines.
+    """
+    tags, values, objects = [], [], []
+    for n, columns in parts:
+        if key in columns:
+            part_tags, part_values, part_objects = columns[key]
+        else:
+            part_tags = np.full(n, _LINES_MISSING, dtype=np.uint8)
+            part_values = np.zeros(n, dtype=np.int64)
+            part_objects = None
+        tags.append(part_tags)
+        values.append(part_values)
+        objects.append(part_objects)
+
+    if all(part_objects is None for part_objects in objects):
+        return np.concatenate(tags), np.concatenate(values), None
+    objects = [
+        np.full(len(part_tags), None, dtype=object)
+        if part_objects is None
+        else part_objects
+        for part_tags, part_objects in zip(tags, objects, strict=True)
+    ]
+    return np.concatenate(tags), np.concatenate(values), np.concatenate(objects)
+
+
+def _lines_to_array(
+    tags: np.ndarray, values: np.ndarray, objects: np.ndarray | None
+) -> ArrayLike:
+    """
+    Convert the tagged values of a key to the array DataFrame would infer.
+    """
+    n = len(tags)
+    counts = np.bincount(tags, minlength=_LINES_OBJECT + 1)
+    numbers = counts[_LINES_INT] + counts[_LINES_DOUBLE]
+    if counts[_LINES_INT] == n:
+        return values
+    elif counts[_LINES_FALSE] + counts[_LINES_TRUE] == n:
+        return tags == _LINES_TRUE
+    elif numbers and numbers + counts[_LINES_NULL] + counts[_LINES_MISSING] == n:
+        result = values.view(np.float64).copy()
+        is_int = tags == _LINES_INT
+        result[is_int] = values[is_int]
+        result[tags <= _LINES_NULL] = np.nan
+        return result
+
+    result = np.empty(n, dtype=object)
+    result[tags == _LINES_MISSING] = np.nan
+    for tag, typed_values in (
+        (_LINES_INT, values),
+        (_LINES_UINT, values.view(np.uint64)),
+        (_LINES_DOUBLE, values.view(np.float64)),
+    ):
+        if counts[tag]:
+            mask = tags == tag
+            result[mask] = typed_values[mask]
+    result[tags == _LINES_FALSE] = False
+    result[tags == _LINES_TRUE] = True
+    if objects is not None:
+        mask = tags >= _LINES_STRING
+        result[mask] = objects[mask]
+    return convert_object_array([result], dtype=None)[0]
@@ -16,19 +16,30 @@ from typing import (
 
 import numpy as np
 
+from pandas._libs import lib
 from pandas._libs.writers import convert_json_to_lines
 from pandas.util._decorators import set_module
 
+from pandas.core.dtypes.astype import astype_array
+from pandas.core.dtypes.common import (
+    is_dict_like,
+    is_list_like,
+    pandas_dtype,
+)
+
 import pandas as pd
 from pandas import (
     DataFrame,
     Series,
 )
+from pandas.core.indexes.api import default_index
+from pandas.core.internals.construction import convert_object_array
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from pandas._typing import (
+        Dtype,
         IgnoreRaise,
         Scalar,
     )
@@ -298,6 +309,79 @@ def _validate_meta(meta: str | list[str | list[str]] | None) -> None:
             )
 
 
+def _validate_schema(
+    schema: dict[str, Dtype | None] | list[str],
+) -> dict[str, Dtype | None]:
+    """
+    Validate the schema argument of json_normalize.
+
+    Returns
+    -------
+    dict
+        The dtype of each column, None if it should be inferred.
+    """
+    if is_dict_like(schema):
+        schema = {
+            name: None if dtype is None else pandas_dtype(dtype)
+            for name, dtype in schema.items()
+        }
+    elif is_list_like(schema) and not isinstance(schema, str):
+        schema = dict.fromkeys(schema)
+    else:
+        raise TypeError(
+            "schema must be a dict of column names and dtypes or a list of "
+            f"column names, not {type(schema).__name__}"
+        )
+    for name in schema:
+        if not isinstance(name, str):
+            raise TypeError(
+                "All column names in 'schema' must be strings. "
+                f"Found {type(name).__name__}: {name!r}"
+            )
+    return schema
+
+
+def _records_to_frame(
+    records: list,
+    schema: dict[str, Dtype | None],
+    sep: str,
+    max_level: int | None,
+    prefix: str | None,
+    index=None,
+) -> DataFrame:
+    """
+    Build the columns of a schema from records in a single pass.
+
+    The column names are looked up in the nested records as
+    ``nested_to_record`` would flatten them, so no flattened copy of the
+    records is created. Columns without dtype are inferred like in the
+    DataFrame constructor.
+    """
+    names = []
+    for name in schema:
+        if prefix is not None:
+            if not name.startswith(prefix):
+                raise ValueError(
+                    f"Column {name!r} in 'schema' doesn't start with the "
+                    f"record_prefix {prefix!r}"
+                )
+            name = name[len(prefix) :]
+        names.append(name)
+
+    content = lib.nested_dicts_to_array(
+        records, names, sep, -1 if max_level is None else max_level
+    )
+    arrays = [
+        convert_object_array([values], dtype=None)[0]
+        if dtype is None
+        else astype_array(values, dtype)
+        for values, dtype in zip(content.T, schema.values(), strict=True)
+    ]
+    if index is None:
+        index = default_index(len(records))
+    return DataFrame._from_arrays(arrays, columns=list(schema), index=index)
+
+
 @set_module("pandas")
 def json_normalize(
     data: dict | list[dict] | Series,
@@ -308,6 +392,7 @@ def json_normalize(
     errors: IgnoreRaise = "raise",
     sep: str = ".",
     max_level: int | None = None,
+    schema: dict[str, Dtype | None] | list[str] | None = None,
 ) -> DataFrame:
     """
     Normalize semi-structured JSON data into a flat table.
@@ -344,6 +429,17 @@ def json_normalize(
     max_level : int, default None
         Max number of levels(depth of dict) to normalize.
         if None, normalizes all levels.
+    schema : dict of {str : dtype} or list of str, default None
+        The columns of the result, with their dtypes. Columns with dtype
+        ``None``, or all columns if a list is passed, have their dtype
+        inferred. Column names are split on ``sep`` into the path of keys
+        to look up in each record, including ``record_prefix`` if given.
+        ``meta`` columns are always included, but their dtypes can be given
+        in the schema as well. Keys that are not in the schema are ignored
+        and the records are not flattened one by one, which is much faster
+        for many records.
+
+        .. versionadded:: 3.1.0
 
     Returns
     -------
@@ -467,8 +563,23 @@ def json_normalize(
     1          2
 
     Returns normalized data with columns prefixed with the given string.
+
+    Passing a schema selects the columns and their dtypes up front.
+
+    >>> data = [
+    ...     {"id": 1, "user": {"name": "Cole", "age": 30}, "tags": ["a"]},
+    ...     {"id": 2, "user": {"name": "Faye"}},
+    ... ]
+    >>> pd.json_normalize(
+    ...     data, schema={"id": "int32", "user.name": None, "user.age": "Int64"}
+    ... )
+       id user.name  user.age
+    0   1      Cole        30
+    1   2      Faye      <NA>
     """
     _validate_meta(meta)
+    if schema is not None:
+        schema = _validate_schema(schema)
 
     def _pull_field(
         js: dict[str, Any], spec: list | str, extract_record: bool = False
@@ -524,7 +635,7 @@ def json_normalize(
     else:
         index = None
 
-    if isinstance(data, list) and not data:
+    if isinstance(data, list) and not data and schema is None:
         return DataFrame()
     elif isinstance(data, dict):
         # A bit of a hackjob
@@ -543,6 +654,9 @@ def json_normalize(
     else:
         raise NotImplementedError
 
+    if schema is not None and record_path is None:
+        return _records_to_frame(data, schema, sep, max_level, record_prefix, index)
+
     # check to see if a simple recursive function is possible to
     # improve performance (see #15621) but only for cases such
     # as pd.Dataframe(data) or pd.Dataframe(data, sep)
@@ -578,13 +692,14 @@ def json_normalize(
         meta = [meta]
 
     _meta = [m if isinstance(m, list) else [m] for m in meta]
+    meta_keys = [sep.join(val) for val in _meta]
+    meta_columns = {f"{meta_prefix or ''}{key}" for key in meta_keys}
 
     # Disastrously inefficient for now
     records: list = []
     lengths = []
 
     meta_vals: DefaultDict = defaultdict(list)
-    meta_keys = [sep.join(val) for val in _meta]
 
     def _recursive_extract(data, path, seen_meta, level: int = 0) -> None:
         if isinstance(data, dict):
@@ -599,12 +714,13 @@ def json_normalize(
         else:
             for obj in data:
                 recs = _pull_records(obj, path[0])
-                recs = [
-                    nested_to_record(r, sep=sep, max_level=max_level)
-                    if isinstance(r, dict)
-                    else r
-                    for r in recs
-                ]
+                if schema is None:
+                    recs = [
+                        nested_to_record(r, sep=sep, max_level=max_level)
+                        if isinstance(r, dict)
+                        else r
+                        for r in recs
+                    ]
 
                 # For repeating the metadata later
                 lengths.append(len(recs))
@@ -618,10 +734,15 @@ def json_normalize(
 
     _recursive_extract(data, record_path, {}, level=0)
 
-    result = DataFrame(records)
-
-    if record_prefix is not None:
-        result = result.rename(columns=lambda x: f"{record_prefix}{x}")
+    if schema is not None:
+        record_schema = {k: v for k, v in schema.items() if k not in meta_columns}
+        result = _records_to_frame(
+            records, record_schema, sep, max_level, record_prefix
+        )
+    else:
+        result = DataFrame(records)
+        if record_prefix is not None:
+            result = result.rename(columns=lambda x: f"{record_prefix}{x}")
 
     # Data types, a problem
     for k, v in meta_vals.items():
@@ -642,7 +763,10 @@ def json_normalize(
             for i, val in enumerate(v):
                 values[i] = val
 
-        result[k] = values.repeat(lengths)
+        values = values.repeat(lengths)
+        if schema is not None and schema.get(k) is not None:
+            values = astype_array(values, schema[k])
+        result[k] = values
     if index is not None:
         result.index = index.repeat(lengths)
     return result
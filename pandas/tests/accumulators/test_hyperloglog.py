@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from pandas import Series
+import pandas._testing as tm
+from pandas.api.accumulators import HyperLogLog
+
+
+def test_estimate_accuracy():
+    sketch = HyperLogLog()
+    for start in range(0, 200_000, 50_000):
+        sketch.update(Series(np.arange(start, start + 50_000)))
+    assert abs(sketch.result() - 200_000) / 200_000 < 0.03
+
+
+def test_merge_matches_single_sketch():
+    values = Series(np.arange(30_000).astype(str).astype(object))
+    single = HyperLogLog(precision=10)
+    single.update(values)
+
+    first = HyperLogLog(precision=10)
+    first.update(values[:10_000])
+    second = HyperLogLog(precision=10)
+    second.update(values[5_000:])
+    first.merge(second)
+
+    tm.assert_numpy_array_equal(first._registers, single._registers)
+    assert first.result() == single.result()
+
+
+def test_dropna():
+    sketch = HyperLogLog()
+    sketch.update(Series([1.0, np.nan, 2.0]))
+    assert sketch.result() == 2
+    assert sketch.result(dropna=False) == 3
+
+
+def test_empty():
+    assert HyperLogLog().result() == 0
+
+
+def test_merge_different_precision_raises():
+    with pytest.raises(ValueError, match="same precision"):
+        HyperLogLog(precision=10).merge(HyperLogLog(precision=12))
+
+
+def test_merge_wrong_type_raises():
+    with pytest.raises(TypeError, match="Can only merge HyperLogLog"):
+        HyperLogLog().merge(object())
+
+
+def test_invalid_precision():
+    with pytest.raises(ValueError, match="precision must be an integer"):
+        HyperLogLog(precision=20)
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from pandas import (
+    DataFrame,
+    DatetimeIndex,
+    NaT,
+    Series,
+    Timestamp,
+    concat,
+    date_range,
+)
+import pandas._testing as tm
+from pandas.api.accumulators import StreamingResampler
+
+
+@pytest.fixture
+def frame():
+    # irregular timestamps with duplicates and gaps spanning several bins
+    rng = np.random.default_rng(2)
+    seconds = np.sort(rng.integers(0, 3 * 86400, 300))
+    seconds[50:60] = seconds[50]
+    index = DatetimeIndex(Timestamp("2020-03-05 07:13:11").value + seconds * 10**9)
+    return DataFrame(
+        {"a": rng.standard_normal(300), "b": rng.integers(0, 10, 300)}, index=index
+    )
+
+
+def _stream(resampler, obj, chunksize):
+    results = [
+        resampler.update(obj.iloc[i : i + chunksize])
+        for i in range(0, len(obj), chunksize)
+    ]
+    results.append(resampler.flush())
+    return concat(results)
+
+
+@pytest.mark.parametrize("rule", ["7min", "1h", "2D", "W"])
+@pytest.mark.parametrize("closed", ["left", "right"])
+@pytest.mark.parametrize("origin", ["start_day", "start", "epoch"])
+@pytest.mark.parametrize("chunksize", [7, 37, 300])
+def test_matches_resample(frame, rule, closed, origin, chunksize):
+    kwargs = {"closed": closed}
+    if rule.endswith(("min", "h")):
+        # origin only applies to Tick-like frequencies
+        kwargs["origin"] = origin
+    resampler = StreamingResampler(rule, "sum", **kwargs)
+    result = _stream(resampler, frame, chunksize)
+    expected = frame.resample(rule, **kwargs).sum()
+    tm.assert_frame_equal(result, expected, check_freq=False)
+
+
+@pytest.mark.parametrize(
+    "func", ["mean", ["min", "max"], {"a": "last", "b": "count"}, "ohlc"]
+)
+def test_aggregations(frame, func):
+    resampler = StreamingResampler("1h", func, label="right")
+    result = _stream(resampler, frame, 23)
+    expected = frame.resample("1h", label="right").agg(func)
+    tm.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_series_tz_aware(frame):
+    ser = frame["a"].tz_localize("UTC").tz_convert("US/Eastern")
+    resampler = StreamingResampler("3h", "max", offset="10min")
+    result = _stream(resampler, ser, 40)
+    expected = ser.resample("3h", offset="10min").max()
+    tm.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_on(frame):
+    df = frame.reset_index(names="time")
+    resampler = StreamingResampler("1h", "sum", on="time")
+    result = _stream(resampler, df, 50)
+    expected = df.resample("1h", on="time").sum()
+    tm.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_only_complete_bins():
+    ser = Series(range(6), index=date_range("2020-01-01", periods=6, freq="20s"))
+    resampler = StreamingResampler("1min", "sum")
+    tm.assert_series_equal(
+        resampler.update(ser.iloc[:4]),
+        Series([3], index=DatetimeIndex(["2020-01-01"], freq="min")),
+    )
+    # the second bin is still open
+    assert resampler.update(ser.iloc[4:]).empty
+    tm.assert_series_equal(
+        resampler.flush(),
+        Series([12], index=DatetimeIndex(["2020-01-01 00:01"], freq="min")),
+    )
+    assert resampler.flush() is None
+
+
+def test_missing_timestamps_dropped():
+    index = DatetimeIndex(["2020-01-01 00:00", NaT, "2020-01-01 00:02", NaT])
+    ser = Series([1.0, 2.0, 3.0, 4.0], index=index)
+    resampler = StreamingResampler("1min", "sum")
+    result = concat([resampler.update(ser.iloc[:2]), resampler.update(ser.iloc[2:])])
+    result = concat([result, resampler.flush()])
+    expected = Series(
+        [1.0, 0.0, 3.0], index=date_range("2020-01-01", periods=3, freq="min")
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_unsorted_raises():
+    ser = Series(range(4), index=date_range("2020-01-01", periods=4, freq="min"))
+    resampler = StreamingResampler("2min", "sum")
+    with pytest.raises(ValueError, match="must be sorted by time"):
+        resampler.update(ser.iloc[::-1])
+    resampler.update(ser.iloc[2:])
+    with pytest.raises(ValueError, match="must be sorted by time"):
+        resampler.update(ser.iloc[:2])
+
+
+def test_invalid():
+    with pytest.raises(ValueError, match="origin='end' is not supported"):
+        StreamingResampler("1min", "sum", origin="end")
+    with pytest.raises(ValueError, match="Unsupported value middle for `closed`"):
+        StreamingResampler("1min", "sum", closed="middle")
+    with pytest.raises(TypeError, match="only supports datetime64 data"):
+        StreamingResampler("1min", "sum").update(Series([1, 2]))
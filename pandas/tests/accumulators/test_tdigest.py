@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    Series,
+    concat,
+)
+import pandas._testing as tm
+from pandas.api.accumulators import TDigest
+
+
+def _sketch_chunks(chunks, compression=200):
+    sketch = TDigest(compression)
+    for chunk in chunks:
+        sketch.update(chunk)
+    return sketch
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [Series([3, 1, 2]), Series([5, 4])],
+        [Series([1.5, np.nan]), Series([np.nan, 0.5, 2.5])],
+        [Series([1, None, 2], dtype="Int64"), Series([2, 3, None], dtype="Int64")],
+        [Series([True, False]), Series([True, True])],
+    ],
+)
+def test_small_is_exact(chunks):
+    sketch = _sketch_chunks(chunks)
+    ser = concat(chunks, ignore_index=True).astype(float)
+    qs = [0.0, 0.1, 0.25, 0.5, 0.75, 1.0]
+
+    tm.assert_series_equal(sketch.quantile(qs), ser.quantile(qs), check_names=False)
+    assert sketch.quantile(0.3) == ser.quantile(0.3)
+    assert sketch.count == ser.count()
+
+
+def test_chunked_relative_error():
+    values = np.random.default_rng(2).lognormal(size=200_000)
+    sketch = _sketch_chunks(np.array_split(values, 50))
+    qs = [0.01, 0.5, 0.9, 0.99, 0.999]
+    result = sketch.quantile(qs).to_numpy()
+    expected = np.quantile(values, qs)
+    tm.assert_almost_equal(result, expected, rtol=0.02)
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+    # the sketch stays small
+    assert len(sketch._means) <= 200
+
+
+def test_merge():
+    values = np.random.default_rng(2).normal(size=20_000)
+    first = _sketch_chunks([values[:5_000]])
+    second = _sketch_chunks([values[5_000:]], compression=100)
+    first.merge(second)
+    assert first.count == len(values)
+    tm.assert_almost_equal(first.quantile(0.5), np.median(values), atol=0.02)
+    assert first.quantile(1) == values.max()
+
+
+def test_merge_invalid():
+    with pytest.raises(TypeError, match="Can only merge TDigest sketches"):
+        TDigest().merge(pd.Series([1]))
+
+
+def test_empty():
+    sketch = TDigest()
+    assert np.isnan(sketch.quantile(0.5))
+    assert sketch.count == 0
+
+
+@pytest.mark.parametrize("compression", [0, -1, "a"])
+def test_invalid_compression(compression):
+    with pytest.raises(ValueError, match="compression must be a positive number"):
+        TDigest(compression)
+
+
+def test_non_numeric_raises():
+    with pytest.raises(TypeError, match="TDigest only supports numeric data"):
+        TDigest().update(Series(["a", "b"]))
+
+
+def test_update_list_raises():
+    with pytest.raises(TypeError, match="update requires a Series"):
+        TDigest().update([1, 2, 3])
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    Series,
+    concat,
+)
+import pandas._testing as tm
+from pandas.api.accumulators import ValueCounter
+
+
+def _count_chunks(chunks):
+    counter = ValueCounter()
+    for chunk in chunks:
+        counter.update(chunk)
+    return counter
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [Series([1, 2, 1]), Series([3, 1, 2, 4])],
+        [Series([1.5, np.nan, 1.5]), Series([np.nan, 0.5, 2.5])],
+        [Series(["a", "b"], dtype=object), Series(["c", None, "a"], dtype=object)],
+        [Series(["a", "b"]), Series(["c", None, "a"])],
+        [
+            Series(["a", "b"], dtype="string"),
+            Series(["c", None, "a"], dtype="string"),
+        ],
+        [Series([1, None, 2], dtype="Int64"), Series([2, 3, None], dtype="Int64")],
+        [Series([True, False]), Series([True, True])],
+        [
+            Series(pd.to_datetime(["2020-01-01", None])),
+            Series(pd.to_datetime(["2020-01-02", "2020-01-01"])),
+        ],
+        [
+            Series(pd.Categorical(["a", "b"], categories=["a", "b", "c"])),
+            Series(pd.Categorical(["c", None], categories=["a", "b", "c"])),
+        ],
+        [
+            Series(pd.Categorical(["b", None], categories=["d", "a", "b"])),
+            Series(pd.Categorical(["b", "a"], categories=["d", "a", "b"])),
+        ],
+    ],
+)
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("sort", [True, False])
+def test_matches_value_counts(chunks, dropna, sort):
+    counter = _count_chunks(chunks)
+    ser = concat(chunks, ignore_index=True)
+
+    result = counter.result(sort=sort, dropna=dropna)
+    expected = ser.value_counts(sort=sort, dropna=dropna)
+    tm.assert_series_equal(result, expected, check_index_type=False)
+    tm.assert_index_equal(result.index, expected.index, exact=False)
+
+    assert counter.nunique(dropna=dropna) == ser.nunique(dropna=dropna)
+    tm.assert_extension_array_equal(pd.array(counter.unique()), pd.array(ser.unique()))
+
+
+def test_normalize():
+    counter = _count_chunks([Series([1, 2, 2]), Series([2, 3])])
+    result = counter.result(normalize=True)
+    expected = Series([0.6, 0.2, 0.2], index=[2, 1, 3], name="proportion")
+    tm.assert_series_equal(result, expected)
+
+
+def test_name_from_first_chunk():
+    counter = _count_chunks([Series([1], name="a"), Series([1], name="b")])
+    assert counter.result().index.name == "a"
+
+
+def test_dtype_change_between_chunks():
+    # e.g. read_csv infers float64 once a chunk contains missing values
+    counter = _count_chunks([Series([1, 2, 1]), Series([2.0, np.nan, 2.5])])
+    result = counter.result(sort=False, dropna=False)
+    expected = Series(
+        [2, 2, 1, 1], index=[1.0, 2.0, np.nan, 2.5], name="count", dtype=np.int64
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_unused_categories():
+    # like Categorical.value_counts, unobserved categories get a count of 0
+    dtype = pd.CategoricalDtype(["a", "b", "c"])
+    counter = _count_chunks(
+        [Series(["b", "a"], dtype=dtype), Series(["b"], dtype=dtype)]
+    )
+    result = counter.result(sort=False)
+    expected = Series(
+        [1, 2, 0],
+        index=pd.CategoricalIndex(["a", "b", "c"], dtype=dtype),
+        name="count",
+        dtype=np.int64,
+    )
+    tm.assert_series_equal(result, expected)
+    assert counter.nunique() == 2
+
+
+def test_empty():
+    counter = ValueCounter()
+    assert counter.nunique() == 0
+    assert len(counter.result()) == 0
+
+
+def test_update_list_raises():
+    counter = ValueCounter()
+    with pytest.raises(TypeError, match="update requires a Series"):
+        counter.update([1, 2, 3])
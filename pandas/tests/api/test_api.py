@@ -11,6 +11,7 @@ import pandas as pd
 from pandas import api
 import pandas._testing as tm
 from pandas.api import (
+    accumulators as api_accumulators,
     executors as api_executors,
     extensions as api_extensions,
     indexers as api_indexers,
@@ -114,6 +115,7 @@ class TestPDApi(Base):
         "array",
         "bdate_range",
         "col",
+        "compile_expr",
         "concat",
         "crosstab",
         "cut",
@@ -253,6 +255,7 @@ class TestPDApi(Base):
 
 class TestApi(Base):
     allowed_api_dirs = [
+        "accumulators",
         "executors",
         "types",
         "extensions",
@@ -262,6 +265,7 @@ class TestApi(Base):
         "internals",
     ]
     allowed_typing = [
+        "CompiledExpression",
         "DataFrameGroupBy",
         "DatetimeIndexResamplerGroupby",
         "Expanding",
@@ -352,6 +356,12 @@ class TestApi(Base):
         "ExtensionScalarOpsMixin",
     ]
     allowed_api_executors = ["BaseExecutionEngine"]
+    allowed_api_accumulators = [
+        "HyperLogLog",
+        "StreamingResampler",
+        "TDigest",
+        "ValueCounter",
+    ]
     allowed_api_aliases = [
         "AggFuncType",
         "AlignJoin",
@@ -446,6 +456,9 @@ class TestApi(Base):
     def test_api_executors(self):
         self.check(api_executors, self.allowed_api_executors)
 
+    def test_api_accumulators(self):
+        self.check(api_accumulators, self.allowed_api_accumulators)
+
     def test_api_typing_aliases(self):
         self.check(api_aliases, self.allowed_api_aliases)
 
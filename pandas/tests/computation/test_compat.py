@@ -25,8 +25,8 @@ def test_compat():
 @pytest.mark.parametrize("engine", ENGINES)
 @pytest.mark.parametrize("parser", expr.PARSERS)
 def test_invalid_numexpr_version(engine, parser):
-    if engine == "numexpr":
-        pytest.importorskip("numexpr")
+    if engine in ("numexpr", "numba"):
+        pytest.importorskip(engine)
     a, b = 1, 2  # noqa: F841
     res = pd.eval("a + b", engine=engine, parser=parser)
     assert res == 3
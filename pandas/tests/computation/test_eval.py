@@ -75,7 +75,9 @@ numexpr = import_optional_dependency("numexpr", errors="ignore")
                 td.skip_if_no("numexpr"),
             ],
         )
+        # the numba engine is tested in test_numba.py
         for engine in ENGINES
+        if engine != "numba"
     )
 )
 def engine(request):
@@ -2042,3 +2044,52 @@ def test_method_calls_on_binop():
     result = pd.eval("(x + y).dropna().reset_index(drop=True)")
     expected = (x + y).dropna().reset_index(drop=True)
     tm.assert_series_equal(result, expected)
+
+
+def test_compile_expr(engine, parser):
+    compiled = pd.compile_expr("x + y * 2", parser=parser)
+    for x, y in [(Series([1, 2, 3]), 2), (Series([1.5, 2.5]), Series([3.0, 4.0]))]:
+        result = pd.eval(compiled, engine=engine)
+        tm.assert_series_equal(result, x + y * 2)
+
+
+def test_compile_expr_multiline(engine, parser):
+    df = DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    compiled = pd.compile_expr("c = a + b\nd = c * 2", parser=parser)
+    result = df.eval(compiled, engine=engine)
+    expected = df.assign(c=df.a + df.b, d=(df.a + df.b) * 2)
+    tm.assert_frame_equal(result, expected)
+    with pytest.raises(ValueError, match="multi-line expressions are only valid"):
+        pd.eval(compiled, engine=engine)
+
+
+def test_compile_expr_invalid(parser):
+    with pytest.raises(ValueError, match="expr cannot be an empty string"):
+        pd.compile_expr("", parser=parser)
+    with pytest.raises(SyntaxError, match="invalid syntax"):
+        pd.compile_expr("a +* b", parser=parser)
+    with pytest.raises(TypeError, match="expr must be a string to be compiled"):
+        pd.compile_expr(1, parser=parser)
+    with pytest.raises(KeyError, match="Invalid parser 'foo' passed"):
+        pd.compile_expr("a + b", parser="foo")
+
+
+@td.skip_if_installed("numba")
+def test_numba_engine_not_installed():
+    with pytest.raises(ImportError, match="numba"):
+        pd.eval("1 + 2", engine="numba")
+
+
+def test_where(engine, parser):
+    ser = Series([1.0, -2.0, 3.0])  # noqa: F841
+    result = pd.eval("where(ser > 0, ser, 0)", engine=engine, parser=parser)
+    tm.assert_numpy_array_equal(np.asarray(result), np.array([1.0, 0.0, 3.0]))
+
+
+def test_where_column(engine, parser):
+    # a column named "where" is still a variable
+    df = DataFrame({"where": [1, 2, 3], "b": [2, 2, 2]})
+    result = df.query("where > b", engine=engine, parser=parser)
+    tm.assert_frame_equal(result, df.iloc[[2]])
+    result = df.eval("where + b", engine=engine, parser=parser)
+    tm.assert_series_equal(result, Series([3, 4, 5]))
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    NA,
+    DataFrame,
+    NaT,
+    Series,
+    Timestamp,
+    date_range,
+)
+import pandas._testing as tm
+
+pytestmark = [pytest.mark.single_cpu]
+
+numba = pytest.importorskip("numba")
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "a": rng.standard_normal(50),
+            "b": rng.integers(-5, 5, 50),
+            "c": pd.array(rng.integers(0, 4, 50), dtype="Int64"),
+            "d": pd.array(rng.standard_normal(50) > 0, dtype="boolean"),
+            "t": date_range("2020-01-01", periods=50, freq="h"),
+        }
+    )
+    df.loc[::3, "c"] = NA
+    df.loc[::4, "d"] = NA
+    df.loc[5, "t"] = NaT
+    return df
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "a * 2 + b - a / 3",
+        "(a > @x) & (b < 3)",
+        "sin(a) ** 2 + cos(a) ** 2",
+        "b // 2 + b % 3",
+        "-a + abs(b)",
+        "~(a > 0) | (b == 1)",
+        "arctan2(a, b)",
+    ],
+)
+def test_numpy(frame, expr):
+    x = 0.5  # noqa: F841
+    result = frame.eval(expr, engine="numba")
+    expected = frame.eval(expr, engine="python")
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["c * 2 + b", "c > 1", "d | (a > 0)", "d & (a > 0)", "c ** 0", "1 ** c"],
+)
+def test_masked(frame, expr):
+    result = frame.eval(expr, engine="numba")
+    expected = frame.eval(expr, engine="python")
+    tm.assert_series_equal(result, expected)
+
+
+def test_where(frame):
+    result = frame.eval("where(a > 0, c, b)", engine="numba")
+    expected = frame["c"].where(frame["a"] > 0, frame["b"])
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+@pytest.mark.parametrize("op", ["<", "<=", ">", ">=", "==", "!="])
+def test_datetime_comparison(frame, op):
+    ts = Timestamp("2020-01-01 05:00")  # noqa: F841
+    result = frame.eval(f"(t {op} @ts) & (a > 0)", engine="numba")
+    expected = frame.eval(f"(t {op} @ts) & (a > 0)", engine="python")
+    tm.assert_series_equal(result, expected)
+
+
+def test_datetime_comparison_units():
+    ser = Series(date_range("2020-01-01", periods=3, freq="s", unit="s"))  # noqa: F841
+    ts = Timestamp("2020-01-01 00:00:01.5")  # noqa: F841
+    result = pd.eval("ser < ts", engine="numba")
+    tm.assert_series_equal(result, Series([True, True, False]))
+
+
+def test_frame():
+    df = DataFrame(np.arange(12.0).reshape(4, 3))
+    result = pd.eval("df * 2 + df ** 2", engine="numba")
+    tm.assert_frame_equal(result, df * 2 + df**2)
+
+
+def test_query(frame):
+    x = 0.5  # noqa: F841
+    result = frame.query("a > @x and b < 3", engine="numba")
+    expected = frame[(frame["a"] > 0.5) & (frame["b"] < 3)]
+    tm.assert_frame_equal(result, expected)
+
+
+def test_unsupported():
+    df = DataFrame({"a": pd.Categorical([1, 2]), "b": [1, 2]})
+    with pytest.raises(NotImplementedError, match="not supported with engine='numba'"):
+        df.eval("a + b", engine="numba")
@@ -937,3 +937,25 @@ def test_quantile_empty_datetimelike(typ, unit):
     result = df.quantile()
     expected = Series([pd.NaT], name=0.5, dtype=dtype)
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_quantile_tdigest_small_is_exact(axis):
+    df = DataFrame({"a": [1, 4, 2, 3], "b": [2.5, np.nan, 0.5, 1.5], "c": [2, 0, 1, 1]})
+    result = df.quantile([0.1, 0.5, 1.0], axis=axis, method="tdigest")
+    expected = df.astype(float).quantile([0.1, 0.5, 1.0], axis=axis)
+    tm.assert_frame_equal(result, expected)
+
+    result = df.quantile(0.5, axis=axis, method="tdigest")
+    expected = df.astype(float).quantile(0.5, axis=axis)
+    tm.assert_series_equal(result, expected)
+
+
+def test_quantile_tdigest_numeric_only():
+    df = DataFrame({"a": [1, 2, 3], "b": list("xyz")})
+    result = df.quantile(0.5, numeric_only=True, method="tdigest")
+    expected = Series([2.0], index=["a"], name=0.5)
+    tm.assert_series_equal(result, expected)
+
+    with pytest.raises(TypeError, match="only supports numeric data"):
+        df.quantile(0.5, method="tdigest")
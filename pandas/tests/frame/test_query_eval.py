@@ -159,6 +159,17 @@ class TestDataFrameEval:
         with pytest.raises(ValueError, match=msg):
             df.query("")
 
+    def test_query_compiled(self, engine, parser):
+        # the compiled expression is reused across frames and local values
+        skip_if_no_pandas_parser(parser)
+        compiled = pd.compile_expr("a > @x and `b b` < 3", parser=parser)
+        df1 = DataFrame({"a": [1, 2, 3, 4], "b b": [1, 2, 5, 1]})
+        df2 = DataFrame({"b b": [0.5, 4.0], "a": [10.0, 20.0]}, index=["p", "q"])
+        for df, x in [(df1, 1), (df1, 3), (df2, 0)]:
+            result = df.query(compiled, engine=engine)
+            expected = df[(df["a"] > x) & (df["b b"] < 3)]
+            tm.assert_frame_equal(result, expected)
+
     def test_query_duplicate_column_name(self, engine, parser):
         df = DataFrame({"A": range(3), "B": range(3), "C": range(3)}).rename(
             columns={"B": "A"}
@@ -413,3 +413,47 @@ def test_cython_agg_EA_known_dtypes(data, op_name, action, with_na):
 
     result = grouped["col"].aggregate(op_name)
     assert result.dtype == expected_dtype
+
+
+@pytest.mark.parametrize(
+    "funcs",
+    [
+        ["count", "sum", "mean", "var", "std", "sem", "min", "max"],
+        ["sum", "mean", "std"],
+        ["min", "max", "median"],
+    ],
+)
+@pytest.mark.parametrize(
+    "keys, kwargs",
+    [
+        ("key", {}),
+        ("key", {"dropna": False, "sort": False}),
+        ("cat", {"observed": False}),
+    ],
+)
+def test_cython_agg_list_fused(funcs, keys, kwargs):
+    # lists of moment reductions are computed in a single pass
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "key": rng.integers(0, 10, 200).astype(float),
+            "a": rng.standard_normal(200) * 1000,
+            "b": rng.standard_normal(200),
+        }
+    )
+    df.loc[::7, "a"] = np.nan
+    df.loc[::11, "key"] = np.nan
+    df.loc[5, "b"] = np.inf
+    df["key"] = df["key"].where(df["key"] != 3)
+    df["cat"] = pd.Categorical(rng.integers(0, 3, 200), categories=range(5))
+    grouped = df.groupby(keys, **kwargs)
+
+    result = grouped.agg({"a": funcs, "b": funcs})
+    expected = pd.concat(
+        {(col, func): getattr(grouped[col], func)() for col in "ab" for func in funcs},
+        axis=1,
+    )
+    tm.assert_frame_equal(result, expected, check_exact=True)
+
+    result = grouped["a"].agg(funcs)
+    tm.assert_frame_equal(result, expected["a"], check_exact=True)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from pandas import (
+    DataFrame,
+    Series,
+)
+import pandas._testing as tm
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("groupby_dropna", [True, False])
+def test_nunique_approx_small_groups(dropna, groupby_dropna):
+    df = DataFrame(
+        {
+            "key": ["a", "a", "b", "b", "b", None, "c"],
+            "val": [1, 2, 3, 3, np.nan, 4, np.nan],
+        }
+    )
+    gb = df.groupby("key", dropna=groupby_dropna)
+    result = gb["val"].nunique(dropna=dropna, approx=True)
+    expected = gb["val"].nunique(dropna=dropna)
+    tm.assert_series_equal(result, expected)
+
+    result = gb.nunique(dropna=dropna, approx=True)
+    expected = gb.nunique(dropna=dropna)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_nunique_approx_large_groups():
+    rng = np.random.default_rng(2)
+    cardinalities = np.array([10, 1_000, 30_000])
+    keys = np.repeat(np.arange(3), 60_000)
+    values = rng.integers(0, cardinalities[keys])
+    ser = Series(values)
+
+    result = ser.groupby(keys).nunique(approx=True)
+    expected = ser.groupby(keys).nunique()
+    assert ((result - expected).abs() / expected < 0.03).all()
+
+
+def test_nunique_approx_as_index_false():
+    df = DataFrame({"key": [1, 1, 2], "val": ["x", "y", "x"]})
+    result = df.groupby("key", as_index=False)["val"].nunique(approx=True)
+    expected = DataFrame({"key": [1, 2], "val": [2, 1]})
+    tm.assert_frame_equal(result, expected)
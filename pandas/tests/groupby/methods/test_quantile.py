@@ -457,3 +457,50 @@ def test_groupby_quantile_nonmulti_levels_order():
     # We need to check that index levels are not sorted
     expected_levels = pd.core.indexes.frozen.FrozenList([["B", "A"], [0.2, 0.8]])
     tm.assert_equal(result.index.levels, expected_levels)
+
+
+@pytest.mark.parametrize("q", [0.5, [0.0, 0.2, 0.75, 1.0]])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_groupby_quantile_tdigest_small_is_exact(q, dropna):
+    df = DataFrame(
+        {
+            "key": ["a", "b", "a", None, "b", "a", "c"],
+            "x": [1.0, 2.0, 3.0, 4.0, np.nan, 6.0, np.nan],
+            "y": pd.array([5, 1, None, 3, 4, 2, 7], dtype="Int64"),
+        }
+    )
+    gb = df.groupby("key", dropna=dropna)
+    result = gb.quantile(q, method="tdigest")
+    expected = gb.quantile(q).astype(np.float64)
+    tm.assert_frame_equal(result, expected)
+
+    result = gb["x"].quantile(q, method="tdigest")
+    tm.assert_series_equal(result, expected["x"])
+
+
+def test_groupby_quantile_tdigest_relative_error():
+    rng = np.random.default_rng(2)
+    ser = pd.Series(rng.lognormal(size=100_000))
+    keys = rng.integers(0, 5, size=len(ser))
+    qs = [0.01, 0.5, 0.99, 0.999]
+    result = ser.groupby(keys).quantile(qs, method="tdigest")
+    expected = ser.groupby(keys).quantile(qs)
+    tm.assert_series_equal(result, expected, rtol=0.02)
+
+
+def test_groupby_quantile_tdigest_mixed_group_sizes():
+    # small groups keep every value, large ones are compressed
+    rng = np.random.default_rng(2)
+    keys = np.concatenate([np.repeat(np.arange(50), 20), np.full(50_000, 50)])
+    ser = pd.Series(rng.lognormal(size=len(keys)))
+    qs = [0.01, 0.3, 0.5, 0.99]
+    result = ser.groupby(keys).quantile(qs, method="tdigest")
+    expected = ser.groupby(keys).quantile(qs)
+    tm.assert_series_equal(result[:50], expected[:50])
+    tm.assert_series_equal(result, expected, rtol=0.02)
+
+
+def test_groupby_quantile_invalid_method():
+    gb = DataFrame({"key": [1, 1], "x": [1, 2]}).groupby("key")
+    with pytest.raises(ValueError, match="Invalid method: foo"):
+        gb.quantile(method="foo")
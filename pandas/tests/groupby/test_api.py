@@ -192,7 +192,7 @@ def test_frame_consistency(groupby_func):
     elif groupby_func in ("rank",):
         exclude_expected = {"numeric_only"}
     elif groupby_func in ("quantile",):
-        exclude_expected = {"method", "axis"}
+        exclude_expected = {"axis"}
     elif groupby_func in ["corrwith"]:
         exclude_expected = {"min_periods"}
     if groupby_func not in ["pct_change", "size"]:
@@ -1214,3 +1214,32 @@ def test_groupby_any_with_timedelta():
     expected.index = expected.index.astype(np.int64)
 
     tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("sort", [True, False])
+def test_grouping_presorted_keys(ascending, sort):
+    # keys that are already sorted are grouped without hashing, and their
+    # groups are contiguous slices of the input
+    df = DataFrame(
+        {
+            "a": [1, 1, 2, 4, 4, 4, 7],
+            "b": date_range("2020-01-01", periods=7, tz="UTC"),
+            "c": [0, 1, 2, 3, 4, 5, 6],
+        }
+    ).sort_values("a", ascending=ascending)
+    gb = df.groupby("a", sort=sort)
+    assert gb._grouper._is_sorted is (ascending or not sort)
+
+    # object keys are factorized with a hashtable
+    expected_gb = df.groupby(df["a"].astype(object), sort=sort)
+    for func in [
+        lambda x: x.agg(c=("c", "sum"), b=("b", "first"), n=("c", "size")),
+        lambda x: x["c"].apply(list),
+        lambda x: x.ngroup(),
+    ]:
+        result = func(gb)
+        expected = func(expected_gb)
+        if expected.index.dtype == object:
+            expected.index = expected.index.astype(np.int64)
+        tm.assert_equal(result, expected)
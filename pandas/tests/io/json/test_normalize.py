@@ -593,6 +593,88 @@ class TestJSONNormalize:
         result = json_normalize(series, "counties")
         tm.assert_index_equal(result.index, idx.repeat([3, 2]))
 
+    @pytest.mark.parametrize("max_level", [None, 0, 1])
+    @pytest.mark.parametrize("sep", [".", "_"])
+    def test_schema_matches_inference(self, deep_nested, max_level, sep):
+        data = [*deep_nested, {"country": "Spain", "info": None}]
+        expected = json_normalize(data, sep=sep, max_level=max_level)
+        result = json_normalize(
+            data, sep=sep, max_level=max_level, schema=list(expected.columns)
+        )
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("max_level", [None, 1])
+    def test_schema_flattened_keys(self, max_level):
+        # literal keys containing sep and non-str keys, which are flattened as
+        #  their str
+        data = [
+            {"a.b": 1, 5: "x", "c": {"d.e": 2, "f": {7: 3}}},
+            {"a.b": 4, 5: "y", "c": {"d.e": 5, "f": {7: 6}}},
+        ]
+        expected = json_normalize(data, max_level=max_level)
+        expected.columns = [str(col) for col in expected.columns]
+        result = json_normalize(
+            data, max_level=max_level, schema=list(expected.columns)
+        )
+        tm.assert_frame_equal(result, expected)
+
+    def test_schema_record_path(self, state_data):
+        kwargs = {
+            "record_path": "counties",
+            "meta": ["state", "shortname", ["info", "governor"]],
+            "record_prefix": "r_",
+            "meta_prefix": "m_",
+        }
+        expected = json_normalize(state_data, **kwargs)
+        result = json_normalize(state_data, **kwargs, schema=list(expected.columns))
+        tm.assert_frame_equal(result, expected)
+
+    def test_schema_dtypes(self, state_data):
+        result = json_normalize(
+            state_data,
+            "counties",
+            ["state", ["info", "governor"]],
+            schema={"population": "int32", "state": "category", "name": None},
+        )
+        expected = DataFrame(
+            {
+                "population": np.array([12345, 40000, 60000, 1234, 1337], "int32"),
+                "name": ["Dade", "Broward", "Palm Beach", "Summit", "Cuyahoga"],
+                "state": Series(["Florida"] * 3 + ["Ohio"] * 2, dtype="category"),
+                "info.governor": ["Rick Scott"] * 3 + ["John Kasich"] * 2,
+            }
+        )
+        tm.assert_frame_equal(result, expected)
+
+    def test_schema_missing_keys(self):
+        data = [{"a": {"b": 1}, "c": "x"}, {"a": None}, {"a": {"b": None}}]
+        result = json_normalize(
+            data, schema={"a.b": "Int64", "c": None, "d": "float64"}
+        )
+        expected = DataFrame(
+            {
+                "a.b": Series([1, None, None], dtype="Int64"),
+                "c": ["x", np.nan, np.nan],
+                "d": [np.nan] * 3,
+            }
+        )
+        tm.assert_frame_equal(result, expected)
+
+    def test_schema_empty(self):
+        result = json_normalize([], schema={"a": "int64", "b": None})
+        expected = DataFrame(
+            {"a": np.array([], dtype="int64"), "b": np.array([], dtype=object)}
+        )
+        tm.assert_frame_equal(result, expected)
+
+    def test_schema_invalid(self, state_data):
+        with pytest.raises(TypeError, match="schema must be a dict"):
+            json_normalize(state_data, schema="state")
+        with pytest.raises(TypeError, match="must be strings"):
+            json_normalize(state_data, schema=[1])
+        with pytest.raises(ValueError, match="doesn't start with the record_prefix"):
+            json_normalize(state_data, "counties", record_prefix="r_", schema=["name"])
+
 
 class TestNestedToRecord:
     def test_flat_stays_flat(self):
@@ -94,6 +94,48 @@ def test_read_jsonl_unicode_chars():
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.fixture
+def mixed_lines():
+    return "\n".join(
+        [
+            '{"int": 1, "float": 1.5, "bool": true, "str": "a", "nested": {"a": [1]}}',
+            '{"float": 2, "int": 18446744073709551615, "mixed": 1, "str": null}',
+            "",
+            '{"bool": false, "mixed": "b", "nested": [null], "str": "c", "str": "é"}',
+            '{"int": -1, "float": null, "bool": true, "mixed": [], "int_null": null}',
+            "{}",
+        ]
+    )
+
+
+def test_read_jsonl_matches_records(mixed_lines):
+    result = read_json(StringIO(mixed_lines), lines=True)
+    records = f"[{','.join(line for line in mixed_lines.splitlines() if line)}]"
+    expected = read_json(StringIO(records))
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_jsonl_threaded(monkeypatch, mixed_lines):
+    json = "\n".join([mixed_lines] * 20)
+    with pd.option_context("compute.num_threads", 1):
+        expected = read_json(StringIO(json), lines=True)
+    monkeypatch.setattr(pd.io.json._json, "_MINIMUM_PARALLEL_LINES_LEN", 100)
+    with pd.option_context("compute.num_threads", 4):
+        result = read_json(StringIO(json), lines=True)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_jsonl_arrays():
+    result = read_json(StringIO("[1, 2]\n[3, 4]\n"), lines=True)
+    expected = DataFrame([[1, 2], [3, 4]])
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_jsonl_values_on_one_line():
+    with pytest.raises(ValueError, match="Trailing data"):
+        read_json(StringIO('{"a": 1} {"a": 2}\n'), lines=True)
+
+
 def test_to_jsonl():
     # GH9180
     df = DataFrame([[1, 2], [1, 2]], columns=["a", "b"])
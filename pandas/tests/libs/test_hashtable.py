@@ -719,6 +719,38 @@ def test_unique_label_indices():
     tm.assert_numpy_array_equal(left, right, check_dtype=False)
 
 
+@pytest.mark.parametrize("xnull", [True, False])
+def test_factorize_rows(writable, xnull):
+    codes = np.array(
+        [[1, 0, 1, -1, 1, 2, 0, -1], [3, 3, 3, 0, 4, 3, 3, 0]], dtype=np.int64
+    )
+    codes.flags.writeable = writable
+    labels, first_rows = ht.factorize_rows(codes, xnull)
+    if xnull:
+        expected_labels = np.array([0, 1, 0, -1, 2, 3, 1, -1], dtype=np.intp)
+        expected_first_rows = np.array([0, 1, 4, 5], dtype=np.intp)
+    else:
+        expected_labels = np.array([0, 1, 0, 2, 3, 4, 1, 2], dtype=np.intp)
+        expected_first_rows = np.array([0, 1, 3, 4, 5], dtype=np.intp)
+    tm.assert_numpy_array_equal(labels, expected_labels)
+    tm.assert_numpy_array_equal(first_rows, expected_first_rows)
+
+
+def test_factorize_rows_many_groups():
+    # the table grows past its initial size
+    codes = np.random.default_rng(2).integers(0, 300, (3, 1 << 16))
+    labels, first_rows = ht.factorize_rows(codes, True)
+
+    _, expected_first_rows, expected_labels = np.unique(
+        codes.T, axis=0, return_index=True, return_inverse=True
+    )
+    order = np.argsort(expected_first_rows)
+    tm.assert_numpy_array_equal(first_rows, expected_first_rows[order])
+    tm.assert_numpy_array_equal(
+        labels, np.argsort(order)[expected_labels.ravel()], check_dtype=False
+    )
+
+
 @pytest.mark.parametrize(
     "dtype",
     [
@@ -356,3 +356,39 @@ def test_item_from_zerodim_for_subclasses():
     expected = test_arr_1_dim
     assert np.all(result == expected)
     assert isinstance(result, TestArray)
+
+
+@pytest.mark.parametrize(
+    "method, func",
+    [
+        (lib.StrLen(), len),
+        (lib.StrContains("an"), lambda x: "an" in x),
+        (lib.StrFind("a", 1), lambda x: x.find("a", 1)),
+        (lib.StrFind("a", -3, -1, reverse=True), lambda x: x.rfind("a", -3, -1)),
+        (lib.StrStartsWith("ba"), lambda x: x.startswith("ba")),
+        (
+            lib.StrStartsWith(("na", "x"), suffix=True),
+            lambda x: x.endswith(("na", "x")),
+        ),
+    ],
+)
+def test_map_infer_mask_string_method(method, func):
+    # StringMethods are applied to str values through the C API and must
+    # match the Python method
+    arr = np.array(
+        ["", "banana", "bändana", "x", np.str_("banana"), None], dtype=object
+    )
+    mask = np.array([False] * 5 + [True], dtype=np.uint8)
+    result = lib.map_infer_mask(arr, method, mask, convert=False)
+    expected = lib.map_infer_mask(arr, func, mask, convert=False)
+    tm.assert_numpy_array_equal(result, expected)
+
+
+def test_map_infer_mask_string_method_non_str():
+    # values which are not str are passed to __call__ like to the Python method
+    arr = np.array([["a", "b"], b"ab", "abc"], dtype=object)
+    mask = np.zeros(3, dtype=np.uint8)
+    result = lib.map_infer_mask(arr, lib.StrLen(), mask, convert=False)
+    tm.assert_numpy_array_equal(result, np.array([2, 2, 3], dtype=object))
+    with pytest.raises(TypeError, match="a bytes-like object is required"):
+        lib.map_infer_mask(arr[1:], lib.StrContains("a"), mask[1:])
@@ -209,6 +209,37 @@ def test_resample_how(downsample_method, unit):
     tm.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize("how", ["sum", "mean", "min", "max"])
+@pytest.mark.parametrize("min_count", [0, 1])
+@pytest.mark.parametrize("closed", ["left", "right"])
+def test_resample_regular_index(how, min_count, closed, unit):
+    # all bins but the first and last one have the same number of rows, which
+    #  are reduced as a 2-D view, with the same results as the groupby kernels
+    index = date_range("2000-01-01 00:00:17", periods=2000, freq="s", unit=unit)
+    rng = np.random.default_rng(2)
+    values = rng.standard_normal(len(index)) * 10.0 ** rng.integers(-8, 8, len(index))
+    values[::7] = np.nan
+    values[60:100] = np.nan
+    values[[300, 301, 345]] = [np.inf, -np.inf, np.inf]
+    df = DataFrame({"a": values, "b": np.arange(len(index))}, index=index)
+
+    kwargs = {} if how == "mean" else {"min_count": min_count}
+    result = getattr(df.resample("20s", closed=closed), how)(**kwargs)
+    binner = df.index.floor("20s") if closed == "left" else df.index.ceil("20s")
+    if closed == "right":
+        binner -= Timedelta("20s")
+    expected = getattr(df.groupby(binner), how)(**kwargs)
+    expected.index = expected.index.as_unit(unit)
+    expected.index.freq = "20s"
+    tm.assert_frame_equal(result, expected, check_exact=True)
+    for col in ["a", "b"]:
+        tm.assert_series_equal(
+            getattr(df[col].resample("20s", closed=closed), how)(**kwargs),
+            expected[col],
+            check_exact=True,
+        )
+
+
 def test_resample_how_ohlc(unit):
     index = date_range("1/1/2000 00:00:00", "1/1/2000 00:13:00", freq="Min")
     s = Series(range(len(index)), index=index)
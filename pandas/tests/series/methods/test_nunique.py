@@ -1,5 +1,7 @@
 import numpy as np
+import pytest
 
+import pandas as pd
 from pandas import (
     Categorical,
     Series,
@@ -22,3 +24,40 @@ def test_nunique_categorical():
 
     ser = Series(Categorical([np.nan]))
     assert ser.nunique() == 0
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.arange(50_000),
+        np.arange(50_000).astype(str).astype(object),
+        pd.date_range("2000-01-01", periods=50_000, freq="s"),
+        pd.array(np.arange(50_000), dtype="Int64"),
+    ],
+)
+def test_nunique_approx(values):
+    ser = Series(values).repeat(3)
+    result = ser.nunique(approx=True)
+    assert abs(result - 50_000) / 50_000 < 0.03
+
+
+def test_nunique_approx_small_exact():
+    # linear counting is exact in practice for tiny cardinalities
+    ser = Series([1, 2, 2, np.nan, 3])
+    assert ser.nunique(approx=True) == 3
+    assert ser.nunique(approx=True, dropna=False) == 4
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "Float64", "complex128"])
+def test_nunique_approx_signed_zero(dtype):
+    nan_payload = np.array([0x7FF8000000000001], dtype=np.int64).view(np.float64)
+    ser = Series(np.array([0.0, -0.0, 1.0, np.nan, nan_payload[0]]), dtype=dtype)
+    assert ser.nunique(approx=True) == ser.nunique() == 2
+    assert ser.nunique(approx=True, dropna=False) == ser.nunique(dropna=False) == 3
+
+
+@pytest.mark.parametrize("precision", [3, 19, 14.0])
+def test_nunique_approx_invalid_precision(precision):
+    ser = Series([1, 2])
+    with pytest.raises(ValueError, match="precision must be an integer"):
+        ser.nunique(approx=True, precision=precision)
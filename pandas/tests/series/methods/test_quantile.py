@@ -252,3 +252,29 @@ def test_quantile_empty_datetimelike(typ, unit):
     ser = Series([], dtype=f"{typ}[{unit}]")
     result = ser.quantile()
     assert result is pd.NaT
+
+
+class TestTDigestQuantile:
+    def test_small_is_exact(self):
+        ser = Series([4, 1, np.nan, 3, 2])
+        qs = [0.0, 0.1, 0.25, 0.5, 0.9, 1.0]
+        result = ser.quantile(qs, method="tdigest")
+        tm.assert_series_equal(result, ser.quantile(qs))
+        assert ser.quantile(0.3, method="tdigest") == ser.quantile(0.3)
+
+    def test_relative_error(self):
+        ser = Series(np.random.default_rng(2).lognormal(size=100_000))
+        qs = [0.01, 0.5, 0.9, 0.99, 0.999]
+        result = ser.quantile(qs, method="tdigest")
+        expected = ser.quantile(qs)
+        tm.assert_series_equal(result, expected, rtol=0.02)
+        assert ser.quantile(0.0, method="tdigest") == ser.min()
+        assert ser.quantile(1.0, method="tdigest") == ser.max()
+
+    def test_empty(self):
+        assert np.isnan(Series([], dtype=float).quantile(method="tdigest"))
+
+    def test_non_numeric_raises(self):
+        ser = Series(pd.date_range("2020", periods=3))
+        with pytest.raises(TypeError, match="only supports numeric data"):
+            ser.quantile(method="tdigest")
@@ -8,6 +8,8 @@ _any_string_method = [
     ("cat", (Series(list("zyx")),), {"sep": ",", "join": "left"}),
     ("center", (10,), {}),
     ("contains", ("a",), {}),
+    ("contains_any", (["a", "b"],), {}),
+    ("contains_any", (["a", "b"],), {"regex": False}),
     ("count", ("a",), {}),
     ("decode", ("UTF-8",), {}),
     ("encode", ("UTF-8",), {}),
@@ -20,6 +22,8 @@ _any_string_method = [
     ("endswith", ("a",), {"na": False}),
     ("extract", ("([a-z]*)",), {"expand": False}),
     ("extract", ("([a-z]*)",), {"expand": True}),
+    ("extract_any", (["[a-z]+", "b"],), {}),
+    ("extract_any", (["a", "b"],), {"regex": False}),
     ("extractall", ("([a-z]*)",), {}),
     ("find", ("a",), {}),
     ("findall", ("a",), {}),
@@ -46,6 +50,7 @@ _any_string_method = [
     ("slice_replace", (0, 1, "z"), {}),
     ("split", (" ",), {"expand": False}),
     ("split", (" ",), {"expand": True}),
+    ("split_to_frame", (" ",), {}),
     ("startswith", ("a",), {}),
     ("startswith", (("a",),), {}),
     ("startswith", (("a", "b"),), {}),
@@ -3,6 +3,8 @@ import weakref
 import numpy as np
 import pytest
 
+from pandas.core.dtypes.dtypes import ArrowDtype
+
 from pandas import (
     CategoricalDtype,
     DataFrame,
@@ -11,6 +13,7 @@ from pandas import (
     Series,
     _testing as tm,
 )
+from pandas.core.arrays import ArrowExtensionArray
 from pandas.core.strings.accessor import StringMethods
 
 # subset of the full set from pandas/conftest.py
@@ -171,7 +174,7 @@ def test_api_per_method(
     # allowed data types, just returning NaN for entries that error.
     # This could be changed with an 'errors'-kwarg to the `str`-accessor,
     # see discussion in GH 13877
-    mixed_allowed = method_name not in ["cat"]
+    mixed_allowed = method_name not in ["cat", "split_to_frame"]
 
     allowed_types = (
         ["empty"]
@@ -214,3 +217,55 @@ def test_api_for_categorical(any_string_method, any_string_dtype):
     else:
         # str.cat(others=None) returns string, for example
         assert result == expected
+
+
+def test_api_for_categorical_unused_categories(any_string_method):
+    # methods are applied to the categories in use only, so unused categories
+    # must not add e.g. columns to expanded results
+    s = Series(["a b", "b", "a b", "b"], dtype=object)
+    c = s.astype(CategoricalDtype(Index(["a b", "b", "a b c d e"], dtype=object)))
+
+    method_name, args, kwargs = any_string_method
+
+    result = getattr(c.str, method_name)(*args, **kwargs)
+    expected = getattr(s.str, method_name)(*args, **kwargs)
+
+    if isinstance(result, DataFrame):
+        tm.assert_frame_equal(result, expected)
+    elif isinstance(result, Series):
+        tm.assert_series_equal(result, expected)
+    else:
+        assert result == expected
+
+
+def test_categorical_expand_with_na(index_or_series):
+    box = index_or_series
+    values = box(["a_b", np.nan, "c", "a_b", np.nan], dtype="category")
+    rows = [("a", "b"), (np.nan, np.nan), ("c", np.nan), ("a", "b"), (np.nan, np.nan)]
+
+    result = values.str.split("_", expand=True)
+    if box is Series:
+        expected = DataFrame(rows, dtype=values.dtype.categories.dtype)
+        tm.assert_frame_equal(result, expected)
+    else:
+        tm.assert_index_equal(result, MultiIndex.from_tuples(rows))
+
+    result = values.str.extract("(?P<first>[a-z])_?(?P<second>[a-z])?")
+    expected = DataFrame(rows, columns=["first", "second"], dtype=object)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_arrow_dictionary():
+    pa = pytest.importorskip("pyarrow")
+    arr = pa.array(["a_b", None, "c", "a_b"]).dictionary_encode()
+    ser = Series(ArrowExtensionArray(arr), name="x")
+
+    result = ser.str.upper()
+    expected = Series(
+        ["A_B", None, "C", "A_B"], dtype=ArrowDtype(pa.string()), name="x"
+    )
+    tm.assert_series_equal(result, expected)
+
+    result = ser.str.contains("_")
+    expected = Series([True, None, False, True], dtype=ArrowDtype(pa.bool_()), name="x")
+    tm.assert_series_equal(result, expected)
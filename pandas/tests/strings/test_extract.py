@@ -782,3 +782,34 @@ def test_extract_end_of_string(any_string_dtype):
     result = ser.str.extract(r"([ab]+)\\Z")
     expected = Series(["aa", np.nan, "bb"], dtype=any_string_dtype).to_frame()
     tm.assert_frame_equal(result, expected)
+
+
+def test_extract_any_literals(any_string_dtype):
+    # the longest literal matching at the leftmost position is extracted
+    ser = Series(
+        ["a cat", "catalog cat", "dogcat", "CAT", "bird", np.nan],
+        dtype=any_string_dtype,
+    )
+    patterns = ["cat", "catalog", "dog", "c+t"]
+    result = ser.str.extract_any(patterns, regex=False)
+    expected = Series(
+        ["cat", "catalog", "dog", np.nan, np.nan, np.nan], dtype=any_string_dtype
+    )
+    tm.assert_series_equal(result, expected)
+
+    result = ser.str.extract_any(patterns, case=False, regex=False)
+    expected = Series(
+        ["cat", "catalog", "dog", "CAT", np.nan, np.nan], dtype=any_string_dtype
+    )
+    tm.assert_series_equal(result, expected)
+
+
+def test_extract_any_regex(any_string_dtype):
+    # patterns with their own groups are extracted as a whole
+    ser = Series(["a1", "b22", "c", np.nan], dtype=any_string_dtype, name="x")
+    result = ser.str.extract_any([r"(b)\d+", r"a(\d)"])
+    expected = Series(["a1", "b22", np.nan, np.nan], dtype=any_string_dtype, name="x")
+    tm.assert_series_equal(result, expected)
+
+    result = Index(ser).str.extract_any([r"(b)\d+", r"a(\d)"])
+    tm.assert_index_equal(result, Index(expected))
@@ -414,6 +414,71 @@ def test_contains_end_of_string(any_string_dtype):
     tm.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize("regex", [True, False])
+@pytest.mark.parametrize("case", [True, False])
+def test_contains_any(any_string_dtype, regex, case):
+    ser = Series(
+        ["cat", "Dog", "a.b", "axb", "", np.nan, "catalog"], dtype=any_string_dtype
+    )
+    patterns = ["dog", "a.b", "catalog", "cat"]
+    result = ser.str.contains_any(patterns, case=case, na=False, regex=regex)
+    expected = ser.str.contains(patterns[0], case=case, na=False, regex=regex)
+    for pat in patterns[1:]:
+        expected |= ser.str.contains(pat, case=case, na=False, regex=regex)
+    tm.assert_series_equal(result, expected)
+
+
+def test_contains_any_na(any_string_dtype):
+    ser = Series(["ab", np.nan, "c"], dtype=any_string_dtype)
+    result = ser.str.contains_any(["b", "+"], na=True, regex=False)
+    expected_dtype = (
+        np.bool_ if is_object_or_nan_string_dtype(any_string_dtype) else "boolean"
+    )
+    expected = Series([True, True, False], dtype=expected_dtype)
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "patterns, msg",
+    [
+        ("abc", "patterns must be a list-like of strings, not str"),
+        (["a", 1], "patterns must be a list-like of strings"),
+    ],
+)
+def test_contains_any_invalid(patterns, msg):
+    with pytest.raises(TypeError, match=msg):
+        Series(["a"]).str.contains_any(patterns)
+
+
+@pytest.mark.parametrize("method", ["contains_any", "extract_any"])
+@pytest.mark.parametrize(
+    "pat", [r"(b)\1", r"(?P<x>b)", r"(?P<x>b)(?P=x)", "(?i)b", r"(b)?(?(1)c|d)"]
+)
+def test_contains_any_unsupported_regex(method, pat):
+    # group numbers and global flags would refer to the combined pattern
+    with pytest.raises(ValueError, match="patterns cannot use named groups"):
+        getattr(Series(["bb"]).str, method)(["a", pat])
+
+
+def test_contains_any_scoped_flags_and_groups(any_string_dtype):
+    ser = Series(["ab", "AB", "cd"], dtype=any_string_dtype)
+    result = ser.str.contains_any(["(?i:b)", "c"])
+    expected_dtype = (
+        np.bool_ if is_object_or_nan_string_dtype(any_string_dtype) else "boolean"
+    )
+    expected = Series([True, True, True], dtype=expected_dtype)
+    tm.assert_series_equal(result, expected)
+    # groups without backreferences are fine
+    result = ser.str.contains_any([r"(c)\w", "(x)"])
+    expected = Series([False, False, True], dtype=expected_dtype)
+    tm.assert_series_equal(result, expected)
+
+
+def test_contains_any_empty():
+    with pytest.raises(ValueError, match="patterns must not be empty"):
+        Series(["a"]).str.contains_any([])
+
+
 # --------------------------------------------------------------------------------------
 # str.startswith
 # --------------------------------------------------------------------------------------
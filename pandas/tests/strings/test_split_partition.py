@@ -770,3 +770,57 @@ def test_get_strings(any_string_dtype):
     result = ser.str.get(2)
     expected = Series([np.nan, np.nan, np.nan, "c"], dtype=any_string_dtype)
     tm.assert_series_equal(result, expected)
+
+
+def test_split_to_frame(any_string_dtype):
+    values = Series(
+        ["a|1|2.5", "b|2|", np.nan, "c|3|1e3"],
+        index=list("wxyz"),
+        dtype=any_string_dtype,
+    )
+    result = values.str.split_to_frame("|")
+    expected = DataFrame(
+        {
+            0: ["a", "b", np.nan, "c"],
+            1: [1, 2, np.nan, 3],
+            2: [2.5, np.nan, np.nan, 1e3],
+        },
+        index=list("wxyz"),
+    )
+    expected[0] = expected[0].astype(any_string_dtype)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_split_to_frame_dtype_names():
+    values = Series(["1_a", "2", "3_c"], name="x")
+    result = values.str.split_to_frame(
+        "_", dtype={"id": "Int64", "code": "string"}, names=["id", "code", "extra"]
+    )
+    expected = DataFrame(
+        {
+            "id": pd.array([1, 2, 3], dtype="Int64"),
+            "code": pd.array(["a", pd.NA, "c"], dtype="string"),
+            "extra": [np.nan] * 3,
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_split_to_frame_matches_split():
+    # quotes have no special meaning and each string is one row
+    values = Index(['"a,b",c', "", "d", '"', "e,f,g"])
+    result = values.str.split_to_frame(",")
+    expected = values.str.split(",", expand=True).to_frame(index=False)
+    expected.columns = range(3)
+    expected = expected.replace("", np.nan)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_split_to_frame_invalid():
+    values = Series(["a,b,c", "a"])
+    with pytest.raises(ValueError, match="3 fields, but 2 names were given"):
+        values.str.split_to_frame(",", names=["x", "y"])
+    with pytest.raises(ValueError, match="single ASCII character"):
+        values.str.split_to_frame(", ")
+    with pytest.raises(ValueError, match="strings with line breaks"):
+        Series(["a\nb"]).str.split_to_frame(",")
@@ -1796,6 +1796,61 @@ class TestHashTable:
         tm.assert_numpy_array_equal(result_reconstruct, expected_reconstruct)
 
 
+class TestThreadedHashing:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        # exercise the threaded code paths without allocating huge arrays
+        monkeypatch.setattr(algos, "_MINIMUM_PARALLEL_HASH_LEN", 10)
+        with pd.option_context("compute.num_threads", 4):
+            yield
+
+    @pytest.fixture(
+        params=[
+            np.array([3, 1, 3, 2, 5, 1, 7, 2, 9, 9] * 5 + list(range(20)), dtype="i8"),
+            np.array([1.5, np.nan, 0.0, -0.0, 2.5, np.nan, 1.5] * 10, dtype="f8"),
+            np.array(list("bacbdaecfg") * 7, dtype=object),
+            np.array([True, False, True] * 25),
+            np.array(["2020-01-02", "NaT", "2020-01-01"] * 25, dtype="M8[s]"),
+        ],
+        ids=["int64", "float64", "string", "bool", "datetime64"],
+    )
+    def values(self, request):
+        return request.param
+
+    def test_factorize(self, values):
+        with pd.option_context("compute.num_threads", 1):
+            expected_codes, expected_uniques = algos.factorize_array(values)
+        assert algos._get_num_hash_chunks(values, ht.Int64HashTable) == 4
+
+        codes, uniques = algos.factorize_array(values)
+        tm.assert_numpy_array_equal(codes, expected_codes)
+        tm.assert_numpy_array_equal(uniques, expected_uniques)
+
+    def test_factorize_na_not_sentinel(self):
+        values = np.array([np.nan, 1.0, 2.0, np.nan, 1.0, 3.0] * 10)
+        codes, uniques = algos.factorize_array(values, use_na_sentinel=False)
+        tm.assert_numpy_array_equal(codes, np.array([0, 1, 2, 0, 1, 3] * 10))
+        tm.assert_numpy_array_equal(uniques, np.array([np.nan, 1.0, 2.0, 3.0]))
+
+    def test_unique(self, values):
+        with pd.option_context("compute.num_threads", 1):
+            expected = pd.unique(values)
+        result = pd.unique(values)
+        tm.assert_numpy_array_equal(result, expected)
+
+    @pytest.mark.parametrize("dropna", [True, False])
+    def test_value_counts(self, values, dropna):
+        ser = Series(values)
+        with pd.option_context("compute.num_threads", 1):
+            expected = ser.value_counts(dropna=dropna, sort=False)
+        result = ser.value_counts(dropna=dropna, sort=False)
+        tm.assert_series_equal(result, expected)
+
+    def test_object_not_threaded(self):
+        values = np.array([1, "a", None] * 30, dtype=object)
+        assert algos._get_num_hash_chunks(values, ht.PyObjectHashTable) == 1
+
+
 class TestRank:
     @pytest.mark.parametrize(
         "arr",
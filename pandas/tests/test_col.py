@@ -4,10 +4,12 @@ import numpy as np
 import pytest
 
 from pandas._libs.properties import cache_readonly
+import pandas.util._test_decorators as td
 
 import pandas as pd
 import pandas._testing as tm
 from pandas.api.typing import Expression
+from pandas.core import col as col_module
 from pandas.tests.test_register_accessor import ensure_removed
 
 
@@ -291,3 +293,92 @@ def test_where() -> None:
     result = df.assign(c=expr)
     expected = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "c": [2, 2, 4]})
     tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_no("numexpr")
+@pytest.mark.parametrize(
+    "expr",
+    [
+        pd.col("a") * pd.col("b") + pd.col("c"),
+        (pd.col("b") - 1) / pd.col("c") * 2,
+        1 - pd.col("b") * 3,
+        -(pd.col("b") + pd.col("c")),
+        abs(pd.col("a") - 1) * 2,
+        (pd.col("a") > 0) & (pd.col("b") < pd.col("c")),
+        ~(pd.col("a") > 0) | pd.col("d"),
+        (pd.col("a") + 1).round(2) * 2 + pd.col("a").sum(),
+        (pd.col("b") * pd.col("c")) // 2 + 1,
+    ],
+)
+def test_fused(monkeypatch, expr: Expression) -> None:
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(
+        {
+            "a": rng.standard_normal(20),
+            "b": rng.integers(-5, 5, 20),
+            "c": rng.integers(0, 3, 20),
+            "d": rng.standard_normal(20) > 0,
+        }
+    )
+    with pd.option_context("compute.use_numexpr", False):
+        expected = df.assign(e=expr)
+    monkeypatch.setattr(col_module, "_MIN_FUSED_ROWS", 0)
+    result = df.assign(e=expr)
+    tm.assert_frame_equal(result, expected)
+    tm.assert_frame_equal(df.loc[expr > 0], df.loc[expected["e"] > 0])
+
+
+@td.skip_if_no("numexpr")
+def test_fused_int64_abs() -> None:
+    # abs keeps int64 and is exact for large integers
+    n = 2 * col_module._MIN_FUSED_ROWS
+    df = pd.DataFrame(
+        {"a": np.arange(n, dtype="int64") + 2**53, "b": np.arange(n, dtype="int64")}
+    )
+    result = df.assign(c=abs(pd.col("a") - 1) - pd.col("b"), d=-abs(pd.col("b") - 1))
+    expected = df.assign(c=abs(df["a"] - 1) - df["b"], d=-abs(df["b"] - 1))
+    assert result["c"].dtype == "int64"
+    tm.assert_frame_equal(result, expected)
+
+
+def test_assign_repeated_subexpression() -> None:
+    calls = []
+
+    def func(ser):
+        calls.append(ser)
+        return ser * 2
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    doubled = pd.col("a").pipe(func)
+    result = df.assign(b=doubled + 1, c=(doubled + 1) * 2, d=doubled)
+    expected = pd.DataFrame(
+        {"a": [1, 2, 3], "b": [3, 5, 7], "c": [6, 10, 14], "d": [2, 4, 6]}
+    )
+    tm.assert_frame_equal(result, expected)
+    assert len(calls) == 1
+
+
+def test_assign_equal_operands() -> None:
+    # operands which compare equal must not share a cached result
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    result = df.assign(x=1 / (pd.col("a") * 0.0), y=1 / (pd.col("a") * -0.0))
+    expected = pd.DataFrame(
+        {"a": [1.0, 2.0], "x": [np.inf, np.inf], "y": [-np.inf, -np.inf]}
+    )
+    tm.assert_frame_equal(result, expected)
+
+    # equal Timestamps in different time zones
+    df = pd.DataFrame({"a": [pd.Timedelta(0)]})
+    ts = pd.Timestamp("2020-01-01", tz="UTC")
+    result = df.assign(x=pd.col("a") + ts, y=pd.col("a") + ts.tz_convert("Asia/Tokyo"))
+    assert result["x"].dtype == "M8[ns, UTC]"
+    assert result["y"].dtype == "M8[ns, Asia/Tokyo]"
+
+
+def test_assign_overwritten_column() -> None:
+    # later items must see the columns assigned by earlier items
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    expr = pd.col("a") * 2 + 1
+    result = df.assign(b=expr, a=pd.col("a") * 10, c=expr)
+    expected = pd.DataFrame({"a": [10, 20, 30], "b": [3, 5, 7], "c": [21, 41, 61]})
+    tm.assert_frame_equal(result, expected)
@@ -6,7 +6,14 @@ import pytest
 
 from pandas.compat._optional import import_optional_dependency
 
-from pandas import option_context
+from pandas import (
+    NA,
+    NaT,
+    Series,
+    Timestamp,
+    date_range,
+    option_context,
+)
 import pandas._testing as tm
 from pandas.core.api import DataFrame
 from pandas.core.computation import expressions as expr
@@ -473,3 +480,56 @@ class TestExpressions:
                     pass
                 else:
                     assert scalar_result == expected
+
+    @pytest.mark.parametrize("dtype", ["Int64", "Float64", "boolean"])
+    def test_masked_comparison(self, dtype, comparison_op, monkeypatch):
+        data = np.random.default_rng(2).integers(0, 2, 100)
+        left = Series(data, dtype=dtype)
+        left[::7] = NA
+        right = Series(data[::-1], dtype=dtype)
+        right[::5] = NA
+        with option_context("compute.use_numexpr", False):
+            expected = comparison_op(left, right)
+            expected_scalar = comparison_op(left, 1)
+
+        with monkeypatch.context() as m:
+            m.setattr(expr, "_MIN_ELEMENTS", 0)
+            expr.set_test_mode(True)
+            result = comparison_op(left, right)
+            result_scalar = comparison_op(left, 1)
+            assert expr.get_test_result(), "Did not use numexpr as expected."
+            expr.set_test_mode(False)
+
+        tm.assert_series_equal(result, expected)
+        tm.assert_series_equal(result_scalar, expected_scalar)
+
+    def test_masked_comparison_out_of_bounds(self, monkeypatch):
+        # numexpr can't handle Python integers beyond int64
+        monkeypatch.setattr(expr, "_MIN_ELEMENTS", 0)
+        ser = Series([1, NA, 3], dtype="Int64")
+        result = ser < 2**70
+        tm.assert_series_equal(result, Series([True, NA, True], dtype="boolean"))
+
+    @pytest.mark.parametrize("tz", [None, "US/Eastern"])
+    def test_datetimelike_comparison(self, tz, comparison_op, monkeypatch):
+        left = Series(date_range("2020-01-01", periods=100, freq="h", tz=tz))
+        left[::7] = NaT
+        right = left.sample(frac=1, random_state=2).reset_index(drop=True)
+        ts = Timestamp("2020-01-02", tz=tz)
+        with option_context("compute.use_numexpr", False):
+            expected = comparison_op(left, right)
+            expected_scalar = comparison_op(left, ts)
+            expected_td = comparison_op(left - left[1], right - left[1])
+
+        with monkeypatch.context() as m:
+            m.setattr(expr, "_MIN_ELEMENTS", 0)
+            expr.set_test_mode(True)
+            result = comparison_op(left, right)
+            result_scalar = comparison_op(left, ts)
+            result_td = comparison_op(left - left[1], right - left[1])
+            assert expr.get_test_result(), "Did not use numexpr as expected."
+            expr.set_test_mode(False)
+
+        tm.assert_series_equal(result, expected)
+        tm.assert_series_equal(result_scalar, expected_scalar)
+        tm.assert_series_equal(result_td, expected_td)
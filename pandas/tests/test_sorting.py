@@ -12,13 +12,22 @@ from pandas import (
     Series,
     array,
     concat,
+    date_range,
     merge,
+    timedelta_range,
 )
 import pandas._testing as tm
-from pandas.core.algorithms import safe_sort
+from pandas.core.algorithms import (
+    factorize,
+    safe_sort,
+)
 import pandas.core.common as com
 from pandas.core.sorting import (
     _decons_group_index,
+    compress_group_codes,
+    compress_group_index,
+    decons_obs_group_ids,
+    factorize_sorted,
     get_group_index,
     is_int64_overflow_possible,
     lexsort_indexer,
@@ -349,6 +358,60 @@ def test_decons(codes_list, shape):
         tm.assert_numpy_array_equal(a, b)
 
 
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize("xnull", [True, False])
+def test_compress_group_codes(sort, xnull):
+    # same as the int64 offset based functions, also without overflow
+    rng = np.random.default_rng(2)
+    labels = [rng.integers(-1, size, 1000) for size in [3, 50, 7]]
+    shape = (3, 50, 7)
+    comp_ids, obs_labels = compress_group_codes(labels, shape, sort=sort, xnull=xnull)
+
+    group_index = get_group_index(labels, shape, sort=True, xnull=xnull)
+    expected_ids, obs_ids = compress_group_index(group_index, sort=sort)
+    expected_obs = decons_obs_group_ids(
+        expected_ids, obs_ids, shape, labels, xnull=xnull
+    )
+    tm.assert_numpy_array_equal(comp_ids, expected_ids, check_dtype=False)
+    for result, expected in zip(obs_labels, expected_obs, strict=True):
+        tm.assert_numpy_array_equal(result, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([1, 1, 2, 5, 5, 5, 7], dtype=np.int64),
+        np.array([7, 5, 5, 2, 1, 1], dtype=np.uint8),
+        np.array([-1.5, -0.0, 0.0, 2.5, 2.5]),
+        np.array([3], dtype=np.float32),
+        date_range("2020-01-01", periods=3, tz="US/Eastern").repeat(2)._values,
+        timedelta_range("1D", periods=3)[::-1].repeat(3)._values,
+        np.array(["2020-01-02", "2020-01-01"], dtype="M8[s]"),
+    ],
+)
+@pytest.mark.parametrize("sort", [True, False])
+def test_factorize_sorted(values, sort):
+    codes, uniques = factorize_sorted(values, sort=sort)
+    expected_codes, expected_uniques = factorize(values, sort=sort)
+    tm.assert_numpy_array_equal(codes, expected_codes)
+    tm.assert_equal(uniques, expected_uniques)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([], dtype=np.int64),
+        np.array([1, 3, 2]),
+        np.array([1.0, 2.0, np.nan]),
+        np.array(["2020-01-01", "NaT"], dtype="M8[ns]"),
+        np.array(["a", "b"], dtype=object),
+        np.array([False, True]),
+    ],
+)
+def test_factorize_sorted_unsupported(values):
+    assert factorize_sorted(values) is None
+
+
 class TestSafeSort:
     @pytest.mark.parametrize(
         "arg, exp",
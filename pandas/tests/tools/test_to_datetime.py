@@ -3410,6 +3410,81 @@ class TestShouldCache:
         assert tools.should_cache(listlike) is True
 
 
+class TestParseCache:
+    @pytest.fixture(autouse=True)
+    def clear_parse_cache(self):
+        tools._parse_cache.clear()
+        yield
+        tools._parse_cache.clear()
+
+    def test_reuses_parsed_strings(self, monkeypatch):
+        first = Series(["2020-01-01 10:00:00", "2020-01-02 11:00:00"] * 30)
+        second = Series(["2020-01-02 11:00:00", "2020-01-01 10:00:00", None] * 20)
+        to_datetime(first, format="%Y-%m-%d %H:%M:%S")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("strings should not be parsed again")
+
+        monkeypatch.setattr(tools, "array_strptime", fail)
+        result = to_datetime(second, format="%Y-%m-%d %H:%M:%S")
+        expected = Series(
+            [Timestamp("2020-01-02 11:00:00"), Timestamp("2020-01-01 10:00:00"), NaT]
+            * 20,
+            dtype="M8[us]",
+        )
+        tm.assert_series_equal(result, expected)
+
+    def test_unique_strings_across_calls(self, monkeypatch):
+        # strings that only repeat across calls are remembered as well
+        dates = date_range("2020-01-01", periods=120, freq="h")
+        strings = Series(dates.strftime("%Y-%m-%d %H:%M:%S"))
+        to_datetime(strings)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("strings should not be parsed again")
+
+        monkeypatch.setattr(tools, "array_strptime", fail)
+        result = to_datetime(strings[::-1])
+        tm.assert_series_equal(result, Series(dates[::-1], index=strings.index[::-1]))
+
+    @pytest.mark.parametrize("utc", [True, False])
+    def test_resolution_independent_of_earlier_calls(self, utc):
+        coarse = ["2020-01-01 00:00:00.000001", "2020-01-02 00:00:00.000002"] * 30
+        fine = ["2020-01-01 00:00:00.000001", "2020-01-03 00:00:00.000000001"] * 30
+
+        expected_coarse = to_datetime(coarse, utc=utc, cache=False)
+        expected_fine = to_datetime(fine, utc=utc, cache=False)
+        assert expected_coarse.unit == "us"
+        assert expected_fine.unit == "ns"
+        for arg, expected in [
+            (coarse, expected_coarse),
+            (fine, expected_fine),
+            (coarse, expected_coarse),
+            (fine, expected_fine),
+        ]:
+            tm.assert_index_equal(to_datetime(arg, utc=utc), expected)
+
+    def test_mixed_offsets_across_calls_raises(self):
+        to_datetime(["2020-01-01 00:00:00+01:00"] * 60)
+        msg = "Mixed timezones detected"
+        with pytest.raises(ValueError, match=msg):
+            to_datetime(["2020-01-01 00:00:00+01:00", "2020-01-01 00:00:00+02:00"] * 30)
+
+    def test_warns_every_call(self):
+        arg = Series(["13/02/2019", "14/02/2019"] * 30)
+        msg = "Parsing dates in %d/%m/%Y format"
+        for _ in range(2):
+            with tm.assert_produces_warning(UserWarning, match=msg):
+                to_datetime(arg)
+
+    def test_bounded(self, monkeypatch):
+        monkeypatch.setattr(tools._DatetimeParseCache, "maxsize", 3)
+        dates = date_range("2020-01-01", periods=60, freq="D")
+        result = to_datetime(Series(dates.strftime("%Y-%m-%d")))
+        tm.assert_series_equal(result, Series(dates, dtype="M8[us]"))
+        assert sum(len(t.keys) for t in tools._parse_cache._tables.values()) <= 3
+
+
 def test_nullable_integer_to_datetime():
     # Test for #30050
     ser = Series([1, 2, None, 2**61, None], dtype="Int64")
@@ -3,8 +3,12 @@ import zoneinfo
 import numpy as np
 import pytest
 
+from pandas._libs.tslibs import timezones
 from pandas._libs.tslibs.tzconversion import tz_localize_to_utc
 
+import pandas as pd
+import pandas._testing as tm
+
 
 class TestTZLocalizeToUTC:
     def test_tz_localize_to_utc_ambiguous_infer(self):
@@ -24,3 +28,60 @@ class TestTZLocalizeToUTC:
         msg = "There are 2 dst switches when there should only be 1"
         with pytest.raises(ValueError, match=msg):
             tz_localize_to_utc(vals, zoneinfo.ZoneInfo("US/Eastern"), ambiguous="infer")
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+@pytest.mark.parametrize(
+    "spring, fall", [("2021-03-14", "2021-11-07"), ("2250-03-10", "2250-11-03")]
+)
+def test_zoneinfo_matches_tzinfo_api(unit, spring, fall):
+    # transitions of zoneinfo timezones are read into tables up to a horizon,
+    #  later times go through the tzinfo API
+    tz = zoneinfo.ZoneInfo("America/New_York")
+    utc = pd.date_range(
+        spring, pd.Timestamp(fall) + pd.Timedelta(days=1), freq="37min", unit=unit
+    )
+    result = utc.tz_localize("UTC").tz_convert(tz)
+    expected = [ts.astimezone(tz) for ts in utc.tz_localize("UTC").to_pydatetime()]
+    assert [ts.to_pydatetime() for ts in result] == expected
+    assert [ts.fold for ts in result] == [dt.fold for dt in expected]
+
+    is_dst = np.array([bool(dt.dst()) for dt in expected])
+    tm.assert_index_equal(result.tz_localize(None).tz_localize(tz, is_dst), result)
+
+    ambiguous = pd.DatetimeIndex([f"{fall} 01:30"]).as_unit(unit)
+    assert ambiguous.tz_localize(tz, ambiguous="NaT").isna().all()
+    nonexistent = pd.DatetimeIndex([f"{spring} 02:30"]).as_unit(unit)
+    result = nonexistent.tz_localize(tz, nonexistent="shift_forward")
+    assert result[0] == pd.Timestamp(f"{spring} 03:00", tz=tz)
+
+
+def test_zoneinfo_subclass():
+    # the transitions of subclasses are not read, these use the tzinfo API
+    class Zone(zoneinfo.ZoneInfo):
+        pass
+
+    tz = Zone.no_cache("Europe/Berlin")
+    dti = pd.date_range("2021-03-28", periods=5, freq="h")
+    result = dti.tz_localize(tz, nonexistent="NaT")
+    expected = dti.tz_localize(zoneinfo.ZoneInfo("Europe/Berlin"), nonexistent="NaT")
+    tm.assert_numpy_array_equal(result.asi8, expected.asi8)
+    tm.assert_index_equal(result.tz_convert("UTC"), expected.tz_convert("UTC"))
+
+
+def test_zoneinfo_without_pure_python_implementation(monkeypatch):
+    # without zoneinfo._zoneinfo the transitions are not read into a table,
+    #  the tzinfo API is used instead
+    monkeypatch.setattr(timezones, "_PyZoneInfo", None)
+    monkeypatch.setattr(timezones, "zoneinfo_dst_cache", {})
+    tz = zoneinfo.ZoneInfo("Europe/Berlin")
+    dti = pd.date_range("2021-03-28", periods=5, freq="h")
+    result = dti.tz_localize(tz, nonexistent="NaT")
+    assert timezones.zoneinfo_dst_cache == {"Europe/Berlin": None}
+
+    utc = pd.DatetimeIndex(
+        ["2021-03-28 00:30", "2021-03-28 01:30", "2021-10-31 00:30", "2021-10-31 01:30"]
+    ).tz_localize("UTC")
+    expected = [ts.astimezone(tz) for ts in utc.to_pydatetime()]
+    assert [ts.to_pydatetime() for ts in utc.tz_convert(tz)] == expected
+    assert result[2] is pd.NaT
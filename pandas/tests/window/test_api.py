@@ -352,6 +352,64 @@ def test_multiple_agg_funcs(func, window_size, expected_vals):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "funcs",
+    [
+        ["count", "sum", "mean", "var", "std", "sem"],
+        ["mean", "std"],
+        ["sem", "sum"],
+        ["count", "max", "sum"],
+    ],
+)
+@pytest.mark.parametrize(
+    "window",
+    [
+        lambda obj: obj.rolling(3),
+        lambda obj: obj.rolling(5, min_periods=1, center=True),
+        lambda obj: obj.rolling("2h", closed="both"),
+        lambda obj: obj.rolling(4, step=3),
+        lambda obj: obj.expanding(),
+        lambda obj: obj.groupby(obj["b"] % 2).rolling(3),
+        lambda obj: obj.groupby(obj["b"] % 2).expanding(2),
+    ],
+)
+def test_agg_list_fused(funcs, window):
+    # aggregations computed in one pass match those computed one by one
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        {
+            "a": rng.standard_normal(60) * 100,
+            "b": rng.integers(0, 5, 60),
+            "c": [1.5] * 20 + list(rng.standard_normal(40)),
+        },
+        index=date_range("2020-01-01", periods=60, freq="17min"),
+    )
+    df.iloc[::7, 0] = np.nan
+
+    result = window(df).agg(funcs)
+    expected = concat(
+        {
+            col: concat(
+                [getattr(window(df)[col], func)() for func in funcs],
+                keys=funcs,
+                axis=1,
+            )
+            for col in result.columns.levels[0]
+        },
+        axis=1,
+    )
+    tm.assert_frame_equal(result, expected)
+
+    result = window(df)["a"].agg(funcs)
+    tm.assert_frame_equal(result, expected["a"])
+
+
+def test_agg_list_fused_non_numeric():
+    ser = Series(["a", "b", "c"])
+    with pytest.raises(DataError, match="No numeric types to aggregate"):
+        ser.rolling(2).agg(["sum", "mean"])
+
+
 def test_dont_modify_attributes_after_methods(
     arithmetic_win_operators, closed, center, min_periods, step
 ):
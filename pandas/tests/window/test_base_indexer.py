@@ -1,10 +1,16 @@
+import warnings
+
 import numpy as np
 import pytest
 
+from pandas.errors import PerformanceWarning
+
 from pandas import (
     DataFrame,
+    DatetimeIndex,
     MultiIndex,
     Series,
+    Timestamp,
     concat,
     date_range,
 )
@@ -19,7 +25,11 @@ from pandas.core.indexers.objects import (
     VariableOffsetWindowIndexer,
 )
 
-from pandas.tseries.offsets import BusinessDay
+from pandas.tseries.offsets import (
+    BusinessDay,
+    CustomBusinessDay,
+    Week,
+)
 
 
 def test_bad_get_window_bounds_signature():
@@ -268,6 +278,30 @@ def test_non_fixed_variable_window_indexer(closed, expected_data):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("closed", ["right", "left", "both", "neither"])
+@pytest.mark.parametrize("unit", ["s", "ns"])
+@pytest.mark.parametrize(
+    "offset",
+    [BusinessDay(2), CustomBusinessDay(holidays=["2020-01-06"]), Week(weekday=2)],
+)
+def test_variable_offset_window_bounds(closed, unit, offset):
+    rng = np.random.default_rng(2)
+    seconds = np.unique(rng.integers(0, 30 * 86400, 200)) * 1_000_000_000
+    index = DatetimeIndex(Timestamp("2020-01-01").value + seconds).as_unit(unit)
+    indexer = VariableOffsetWindowIndexer(index=index, offset=offset)
+    start, end = indexer.get_window_bounds(len(index), closed=closed)
+
+    side = "left" if closed in ["left", "both"] else "right"
+    # window starts never move backwards, even where the offset is not monotonic
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PerformanceWarning)
+        start_bounds = index - offset
+    expected_start = np.maximum.accumulate(index.searchsorted(start_bounds, side=side))
+    expected_end = np.arange(len(index)) + (closed in ["right", "both"])
+    tm.assert_numpy_array_equal(start, expected_start.astype(np.int64))
+    tm.assert_numpy_array_equal(end, expected_end.astype(np.int64))
+
+
 def test_variableoffsetwindowindexer_not_dti():
     # GH 54379
     with pytest.raises(ValueError, match="index must be a DatetimeIndex."):
@@ -112,3 +112,45 @@ def test_rolling_aggregation_with_unused_elements(rolling_aggregation):
     )
     assert np.isfinite(expected.values).all(), "Not all expected values are finite"
     tm.assert_equal(expected, result)
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ([0, 0, 0, 1, 2, 3, 4, 5, 7, 9], [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]),
+        # non-monotonic bounds
+        ([0, 3, 1, 5, 0, 8, 2, 4, 6, 9], [2, 6, 4, 9, 10, 10, 3, 8, 7, 10]),
+    ],
+)
+@pytest.mark.parametrize("minp", [0, 1, 3])
+@pytest.mark.parametrize("ddof", [0, 1])
+def test_roll_moments(start, end, minp, ddof):
+    values = np.array([1.5, np.nan, 3.0, 3.0, 3.0, -2.0, np.nan, 1e10, 4.0, 4.5])
+    start = np.array(start, dtype=np.int64)
+    end = np.array(end, dtype=np.int64)
+    result = window_aggregations.roll_moments(values, start, end, minp, ddof=ddof)
+
+    mask = (~np.isnan(values)).astype(np.float64)
+    expected = np.array(
+        [
+            window_aggregations.roll_sum(mask, start, end, minp),
+            window_aggregations.roll_sum(values, start, end, minp),
+            window_aggregations.roll_mean(values, start, end, minp),
+            window_aggregations.roll_var(values, start, end, minp, ddof=ddof),
+        ]
+    )
+    tm.assert_numpy_array_equal(result, expected)
+
+    computed = [False, True, False, True]
+    result = window_aggregations.roll_moments(
+        values,
+        start,
+        end,
+        minp,
+        ddof=ddof,
+        compute_count=computed[0],
+        compute_sum=computed[1],
+        compute_mean=computed[2],
+        compute_var=computed[3],
+    )
+    tm.assert_numpy_array_equal(result, expected[computed])
@@ -0,0 +1,206 @@
+import numpy as np
+import pytest
+
+from pandas.errors import DataError
+
+from pandas import (
+    DataFrame,
+    NaT,
+    Series,
+    concat,
+    date_range,
+)
+import pandas._testing as tm
+from pandas.api.indexers import FixedForwardWindowIndexer
+
+AGGREGATIONS = [
+    ("count", {}),
+    ("sum", {}),
+    ("mean", {}),
+    ("var", {"ddof": 1}),
+    ("std", {"ddof": 0}),
+    ("min", {}),
+    ("max", {}),
+]
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        rng.standard_normal((40, 2)) * 100 + 5,
+        columns=["a", "b"],
+        index=date_range("2020-01-01", periods=40, freq="7h"),
+    )
+    df.iloc[::5, 1] = np.nan
+    return df
+
+
+def _run_online(online, name, kwargs, obj, chunks):
+    results = [getattr(online, name)(**kwargs)]
+    for start, stop in chunks:
+        results.append(getattr(online, name)(update=obj.iloc[start:stop], **kwargs))
+    return concat(results)
+
+
+CHUNKS = [(3, 4), (4, 15), (15, 15), (15, 40)]
+
+
+class TestRolling:
+    @pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+    @pytest.mark.parametrize(
+        "window, min_periods, closed",
+        [
+            (4, None, None),
+            (4, 2, "both"),
+            (4, 0, "left"),
+            ("1D", None, None),
+            ("1D", 2, "neither"),
+        ],
+    )
+    def test_online_vs_non_online(
+        self, frame, name, kwargs, window, min_periods, closed
+    ):
+        online = frame.head(3).rolling(window, min_periods, closed=closed).online()
+        result = _run_online(online, name, kwargs, frame, CHUNKS)
+        expected = getattr(frame.rolling(window, min_periods, closed=closed), name)(
+            **kwargs
+        )
+        tm.assert_frame_equal(result, expected, check_exact=True)
+
+    @pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+    def test_decreasing_index(self, frame, name, kwargs):
+        frame = frame.iloc[::-1]
+        online = frame.head(3).rolling("1D").online()
+        result = _run_online(online, name, kwargs, frame, CHUNKS)
+        expected = getattr(frame.rolling("1D"), name)(**kwargs)
+        tm.assert_frame_equal(result, expected, check_exact=True)
+
+    def test_update_index_not_monotonic(self, frame):
+        online = frame.head(10).rolling("1D").online()
+        online.sum()
+        with pytest.raises(ValueError, match="index values must be monotonic"):
+            online.sum(update=frame.iloc[5:15])
+        with pytest.raises(ValueError, match="index values must not have NaT"):
+            online.sum(update=frame.iloc[10:15].set_axis([NaT] * 5))
+
+    def test_series(self, frame):
+        ser = frame["b"]
+        online = ser.head(3).rolling(3, min_periods=1).online()
+        result = _run_online(online, "mean", {}, ser, CHUNKS)
+        tm.assert_series_equal(result, ser.rolling(3, min_periods=1).mean())
+
+    def test_aggregations_share_state(self, frame):
+        online = frame.head(10).rolling(3).online()
+        online.sum()
+        online.max(update=frame.iloc[10:20])
+        result = online.mean(update=frame.iloc[20:])
+        tm.assert_frame_equal(result, frame.rolling(3).mean().iloc[20:])
+
+    def test_mixed_aggregations(self, frame):
+        # aggregations of the same rows don't add them again
+        online = frame.head(10).rolling(3).online()
+        rolling = frame.rolling(3)
+        for start, stop in [(0, 10), (10, 20), (20, 40)]:
+            update = None if start == 0 else frame.iloc[start:stop]
+            for name, kwargs in AGGREGATIONS:
+                result = getattr(online, name)(update=update, **kwargs)
+                expected = getattr(rolling, name)(**kwargs).iloc[start:stop]
+                tm.assert_frame_equal(result, expected, check_exact=True)
+
+    def test_mixed_aggregations_series(self):
+        ser = Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        online = ser.head(3).rolling(2).online()
+        online.sum()
+        online.max()
+        update = ser.tail(3)
+        online.mean(update=update)
+        result = online.max(update=update)
+        tm.assert_series_equal(result, Series([4.0, 5.0, 6.0], index=[3, 4, 5]))
+
+    def test_reset(self, frame):
+        online = frame.head(10).rolling(3).online()
+        expected = online.sum()
+        online.sum(update=frame.iloc[10:])
+        online.reset()
+        with pytest.raises(ValueError, match="Must call sum with update=None"):
+            online.sum(update=frame.iloc[10:])
+        tm.assert_frame_equal(online.sum(), expected)
+
+    def test_invalid_update(self, frame):
+        online = frame.head(10).rolling(3).online()
+        with pytest.raises(ValueError, match="Must call sum with update=None"):
+            online.sum(update=frame.iloc[10:])
+        online.sum()
+        with pytest.raises(ValueError, match="update must have the same columns"):
+            online.sum(update=frame.iloc[10:, ::-1])
+
+    @pytest.mark.parametrize(
+        "kwargs, msg",
+        [
+            ({"window": 2, "center": True}, "center"),
+            ({"window": 2, "step": 2}, "step"),
+            ({"window": 2, "method": "table"}, "method='table'"),
+            ({"window": FixedForwardWindowIndexer(window_size=2)}, "BaseIndexer"),
+        ],
+    )
+    def test_not_implemented(self, frame, kwargs, msg):
+        with pytest.raises(NotImplementedError, match=msg):
+            frame.rolling(**kwargs).online()
+
+
+class TestExpanding:
+    @pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+    @pytest.mark.parametrize("min_periods", [0, 1, 5])
+    def test_online_vs_non_online(self, frame, name, kwargs, min_periods):
+        online = frame.head(3).expanding(min_periods).online()
+        result = _run_online(online, name, kwargs, frame, CHUNKS)
+        expected = getattr(frame.expanding(min_periods), name)(**kwargs)
+        tm.assert_frame_equal(result, expected, check_exact=True)
+
+    @pytest.mark.parametrize("name", ["sum", "mean"])
+    def test_compensated_over_updates(self, name):
+        # the compensation of the Kahan summation is kept between updates
+        ser = Series(np.full(100, 0.1))
+        online = ser.head(1).expanding().online()
+        chunks = [(i, i + 7) for i in range(1, 100, 7)]
+        result = _run_online(online, name, {}, ser, chunks)
+        tm.assert_series_equal(
+            result, getattr(ser.expanding(), name)(), check_exact=True
+        )
+
+    def test_series(self):
+        ser = Series([np.nan, 1.5, 2.0, np.nan, 4.0, 4.0, -3.0], name="foo")
+        online = ser.head(2).expanding().online()
+        result = _run_online(online, "var", {}, ser, [(2, 4), (4, 7)])
+        tm.assert_series_equal(result, ser.expanding().var())
+
+    def test_mixed_aggregations(self, frame):
+        online = frame.head(10).expanding().online()
+        expanding = frame.expanding()
+        for start, stop in [(0, 10), (10, 20), (20, 40)]:
+            update = None if start == 0 else frame.iloc[start:stop]
+            for name, kwargs in AGGREGATIONS:
+                result = getattr(online, name)(update=update, **kwargs)
+                expected = getattr(expanding, name)(**kwargs).iloc[start:stop]
+                tm.assert_frame_equal(result, expected, check_exact=True)
+
+    def test_reset(self, frame):
+        online = frame.head(10).expanding().online()
+        expected = online.mean()
+        online.mean(update=frame.iloc[10:])
+        online.reset()
+        tm.assert_frame_equal(online.mean(), expected)
+
+    def test_invalid_update(self, frame):
+        online = frame.head(10).expanding().online()
+        with pytest.raises(ValueError, match="Must call max with update=None"):
+            online.max(update=frame.iloc[10:])
+        online.max()
+        with pytest.raises(ValueError, match="update must have the same columns"):
+            online.max(update=frame.iloc[10:, :1])
+
+    def test_non_numeric_raises(self):
+        online = DataFrame({"a": ["x", "y"]}).expanding().online()
+        with pytest.raises(DataError, match="No numeric types to aggregate"):
+            online.sum()
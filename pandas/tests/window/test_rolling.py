@@ -366,6 +366,33 @@ def test_variable_offset_window_nonunique(closed, expected, frame_or_series):
     tm.assert_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "make_window",
+    [
+        lambda df: df.rolling("2D"),
+        lambda df: df.groupby("key").rolling(2),
+        lambda df: df.rolling(
+            VariableOffsetWindowIndexer(index=df.index, offset=BusinessDay(2))
+        ),
+    ],
+)
+def test_window_bounds_cached(make_window):
+    index = date_range("2020-01-01", periods=10, freq="D")
+    df = DataFrame({"a": range(10), "b": 1.0, "key": [1, 2] * 5}, index=index)
+    window = make_window(df)
+    result = window.sum()
+    assert len(window._window_bounds) == 1
+    bounds = next(iter(window._window_bounds.values()))
+
+    # further aggregations, also of selected columns, reuse the bounds
+    tm.assert_equal(window.mean(), make_window(df).mean())
+    selected = window["a"]
+    assert selected._window_bounds is window._window_bounds
+    tm.assert_equal(selected.max(), make_window(df)["a"].max())
+    assert next(iter(window._window_bounds.values())) is bounds
+    tm.assert_equal(result, make_window(df).sum())
+
+
 def test_even_number_window_alignment():
     # see discussion in GH 38780
     s = Series(range(3), index=date_range(start="2020-01-01", freq="D", periods=3))
@@ -0,0 +1,150 @@
+import threading
+
+import numpy as np
+import pytest
+
+import pandas._libs.window.aggregations as window_aggregations
+
+import pandas as pd
+from pandas import (
+    DataFrame,
+    date_range,
+)
+import pandas._testing as tm
+from pandas.core.window import common
+
+AGGREGATIONS = [
+    ("count", {}),
+    ("sum", {}),
+    ("mean", {}),
+    ("median", {}),
+    ("var", {"ddof": 1}),
+    ("std", {}),
+    ("min", {}),
+    ("max", {}),
+    ("skew", {}),
+    ("kurt", {}),
+    ("sem", {}),
+    ("first", {}),
+    ("last", {}),
+    ("quantile", {"q": 0.3}),
+    ("rank", {}),
+    ("nunique", {}),
+]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # exercise the threaded code paths without allocating huge frames
+    monkeypatch.setattr(common, "_MINIMUM_PARALLEL_WINDOW_LEN", 10)
+    with pd.option_context("compute.num_threads", 4):
+        yield
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(2)
+    df = DataFrame(
+        rng.standard_normal((120, 5)).round(1) * 100,
+        columns=list("abcde"),
+        index=date_range("2020-01-01", periods=120, freq="37min"),
+    )
+    df.iloc[::7, 1] = np.nan
+    df["key"] = rng.integers(0, 6, len(df))
+    return df
+
+
+def _single_threaded(func):
+    with pd.option_context("compute.num_threads", 1):
+        return func()
+
+
+@pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+@pytest.mark.parametrize("window", [3, "2h"])
+def test_rolling_columns(frame, name, kwargs, window):
+    rolling = frame.rolling(window, min_periods=1)
+    expected = _single_threaded(lambda: getattr(rolling, name)(**kwargs))
+    result = getattr(rolling, name)(**kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+def test_expanding_columns(frame, name, kwargs):
+    expanding = frame.expanding()
+    expected = _single_threaded(lambda: getattr(expanding, name)(**kwargs))
+    result = getattr(expanding, name)(**kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+@pytest.mark.parametrize("window", [3, "2h"])
+def test_groupby_rolling(frame, name, kwargs, window):
+    rolling = frame.groupby("key").rolling(window, min_periods=1)
+    expected = _single_threaded(lambda: getattr(rolling, name)(**kwargs))
+    result = getattr(rolling, name)(**kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("name, kwargs", AGGREGATIONS)
+def test_groupby_expanding(frame, name, kwargs):
+    expanding = frame.groupby("key")["a"].expanding()
+    expected = _single_threaded(lambda: getattr(expanding, name)(**kwargs))
+    result = getattr(expanding, name)(**kwargs)
+    tm.assert_series_equal(result, expected)
+
+
+def test_groupby_ewm(frame):
+    ewm = frame.groupby("key").ewm(com=0.5)
+    expected = _single_threaded(ewm.mean)
+    tm.assert_frame_equal(ewm.mean(), expected)
+
+
+def test_split_between_groups():
+    # bounds of a window of size 2 over groups of length 4, 5 and 3
+    start = np.array([0, 0, 1, 2, 4, 4, 5, 6, 7, 9, 9, 10], dtype=np.int64)
+    end = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dtype=np.int64)
+    values = np.arange(12, dtype=np.float64)
+    calls = []
+
+    def func(values, start, end, minp):
+        calls.append(len(start))
+        return window_aggregations.roll_sum(values, start, end, minp)
+
+    result = common.apply_threaded(func, 3, values, start, end, 1)
+    expected = window_aggregations.roll_sum(values, start, end, 1)
+    tm.assert_numpy_array_equal(result, expected)
+    assert sorted(calls) == [3, 4, 5]
+
+
+def test_overlapping_windows_not_split():
+    calls = []
+
+    def func(values, start, end, minp):
+        calls.append(len(start))
+        return np.zeros(len(start))
+
+    start = np.array([0, 0, 1, 2, 3, 4], dtype=np.int64)
+    end = np.array([1, 2, 3, 4, 5, 6], dtype=np.int64)
+    common.apply_threaded(func, 4, np.zeros(6), start, end, 1)
+    assert calls == [6]
+
+
+def test_apply_not_threaded(frame):
+    thread_ids = set()
+
+    def func(x):
+        thread_ids.add(threading.get_ident())
+        return x.sum()
+
+    frame.groupby("key").rolling(3).apply(func, raw=True)
+    frame.rolling(3).apply(func, raw=True)
+    assert thread_ids == {threading.get_ident()}
+
+
+def test_num_threads():
+    assert common.get_num_window_threads("sum", 1000) == 4
+    assert common.get_num_window_threads("sum", 30) == 3
+    assert common.get_num_window_threads("sum", 19) == 1
+    assert common.get_num_window_threads("apply", 1000) == 1
+    with pd.option_context("compute.num_threads", 1):
+        assert common.get_num_window_threads("sum", 1000) == 1